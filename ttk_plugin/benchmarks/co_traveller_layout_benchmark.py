@@ -0,0 +1,176 @@
+"""
+Co-traveller write latency of the embedded, dual and per-traveller storage layouts.
+
+For each traveller count, saves that many co-travellers of a new order with TTKStorage,
+then measures the latency of saving a changed field of one traveller, one at a time
+and for all the travellers of the order at once. Each layout runs in a fresh
+interpreter, as TTKStorage reads $TTK_CO_TRAVELLER_LAYOUT once. Needs a MongoDB
+server; the benchmark database is dropped afterwards.
+
+Run from the ttk_plugin directory, with the plugin installed:
+
+    python benchmarks/co_traveller_layout_benchmark.py --db-url mongodb://localhost:27017
+    python benchmarks/co_traveller_layout_benchmark.py --travellers 1 10 100 --output out.json
+"""
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+from typing import Dict
+
+DEFAULT_DB_URL = os.getenv("TTK_BENCHMARK_DB_URL", "mongodb://localhost:27017")
+BENCHMARK_DB = "ttk_layout_benchmark"
+COLLECTION = "co_travellers"
+LAYOUTS = ("embedded", "dual", "per_traveller")
+
+_PROBE = """
+import asyncio, json, logging, statistics, sys, time
+logging.basicConfig(level=logging.CRITICAL)
+from lyik.ttk.ttk_storage_util.ttk_storage import TTKStorage
+
+db_url, db_name, collection, record_kb, updates = sys.argv[1:6]
+counts = [int(count) for count in sys.argv[6:]]
+record_kb, updates = int(record_kb), int(updates)
+
+
+def record(traveller, version):
+    sections = {
+        f"section_{i}": {"value": "x" * 1000, "number": i} for i in range(record_kb)
+    }
+    return {"traveller": traveller, "version": version, **sections}
+
+
+def percentile(samples, fraction):
+    ordered = sorted(samples)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * fraction))]
+
+
+async def main():
+    storage = TTKStorage(db_url)
+    await storage.get_db(db_name)[collection].drop()
+    results = {}
+    for count in counts:
+        order_id = f"order-{count}"
+        travellers = [f"traveller-{i}" for i in range(count)]
+        for traveller in travellers:
+            await storage.save_or_update_co_traveller(
+                db_name, order_id, traveller, record(traveller, 0), collection
+            )
+        sequential = []
+        for version in range(1, updates + 1):
+            traveller = travellers[version % count]
+            started = time.perf_counter()
+            await storage.save_or_update_co_traveller(
+                db_name, order_id, traveller, record(traveller, version), collection
+            )
+            sequential.append((time.perf_counter() - started) * 1000)
+
+        async def save(traveller):
+            started = time.perf_counter()
+            await storage.save_or_update_co_traveller(
+                db_name, order_id, traveller, record(traveller, -1), collection
+            )
+            return (time.perf_counter() - started) * 1000
+
+        started = time.perf_counter()
+        concurrent = await asyncio.gather(*(save(t) for t in travellers))
+        results[count] = {
+            "update_p50_ms": statistics.median(sequential),
+            "update_p95_ms": percentile(sequential, 0.95),
+            "concurrent_p50_ms": statistics.median(concurrent),
+            "concurrent_p95_ms": percentile(concurrent, 0.95),
+            "concurrent_total_ms": (time.perf_counter() - started) * 1000,
+        }
+    print(json.dumps(results))
+
+
+asyncio.run(main())
+"""
+
+
+def probe(layout: str, args: argparse.Namespace) -> Dict[str, Dict[str, float]]:
+    env = {
+        **os.environ,
+        "TTK_CO_TRAVELLER_LAYOUT": layout,
+        "TTK_CONFIG_WARMUP": "false",
+    }
+    output = subprocess.run(
+        [
+            sys.executable,
+            "-c",
+            _PROBE,
+            args.db_url,
+            BENCHMARK_DB,
+            COLLECTION,
+            str(args.record_kb),
+            str(args.updates),
+            *(str(count) for count in args.travellers),
+        ],
+        check=True,
+        capture_output=True,
+        text=True,
+        env=env,
+    ).stdout
+    return json.loads(output.strip().splitlines()[-1])
+
+
+def drop_database(db_url: str) -> None:
+    from pymongo import MongoClient
+
+    client = MongoClient(db_url)
+    try:
+        client.drop_database(BENCHMARK_DB)
+    finally:
+        client.close()
+
+
+def print_report(summary: Dict[str, Dict[str, Dict[str, float]]]) -> None:
+    print(
+        f"{'layout':<14} {'travellers':>10} {'update p50':>11} {'update p95':>11} "
+        f"{'concurrent p50':>15} {'concurrent p95':>15} {'all at once':>12}"
+    )
+    for layout, results in summary.items():
+        for count, result in results.items():
+            print(
+                f"{layout:<14} {count:>10} {result['update_p50_ms']:>11.2f} "
+                f"{result['update_p95_ms']:>11.2f} {result['concurrent_p50_ms']:>15.2f} "
+                f"{result['concurrent_p95_ms']:>15.2f} "
+                f"{result['concurrent_total_ms']:>12.1f}"
+            )
+    print("(ms)")
+
+
+def main(args: argparse.Namespace) -> None:
+    summary = {}
+    try:
+        for layout in LAYOUTS:
+            print(f"measuring {layout}", file=sys.stderr)
+            summary[layout] = probe(layout, args)
+    finally:
+        drop_database(args.db_url)
+    print_report(summary)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(summary, f, indent=2)
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--db-url", default=DEFAULT_DB_URL)
+    parser.add_argument(
+        "--travellers", type=int, nargs="+", default=[1, 10, 50, 100, 250]
+    )
+    parser.add_argument(
+        "--record-kb", type=int, default=20, help="Approximate size of a traveller"
+    )
+    parser.add_argument(
+        "--updates", type=int, default=50, help="Sequential updates per count"
+    )
+    parser.add_argument("--output", help="Write the summary as JSON to this file")
+    return parser.parse_args()
+
+
+if __name__ == "__main__":
+    main(parse_args())
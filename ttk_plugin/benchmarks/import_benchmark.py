@@ -0,0 +1,142 @@
+"""
+Import time of the plugin entry points.
+
+Imports each module of the LYIK entry points of pyproject.toml, then all of them, in a
+fresh interpreter per run, and reports the median wall time of the import and of the
+first validation of the universal model (which builds its schema when the models are
+built lazily). The config warm-up runs as configured by $TTK_CONFIG_WARMUP (on by
+default), as in production; --no-warmup leaves it out.
+
+Run from the ttk_plugin directory, with the plugin installed:
+
+    python benchmarks/import_benchmark.py --runs 5
+    python benchmarks/import_benchmark.py --output before.json
+    python benchmarks/import_benchmark.py --compare before.json
+    python benchmarks/import_benchmark.py --no-warmup
+"""
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+from typing import Dict, List
+
+BENCHMARK_DIR = os.path.dirname(os.path.abspath(__file__))
+PYPROJECT = os.path.join(BENCHMARK_DIR, "..", "pyproject.toml")
+ENTRY_POINT_GROUP = "LYIK"
+
+_PROBE = """
+import json, logging, sys, time
+logging.basicConfig(level=logging.CRITICAL)
+started = time.perf_counter()
+for module in sys.argv[1:]:
+    __import__(module)
+imported = time.perf_counter()
+from lyik.ttk.models.generated.universal_model import UniversalModel
+loaded = time.perf_counter()
+UniversalModel.model_validate({})
+validated = time.perf_counter()
+print(json.dumps({
+    "import_ms": (imported - started) * 1000,
+    "first_validation_ms": (validated - loaded) * 1000,
+    "modules": len([m for m in sys.modules if m.startswith("lyik.ttk")]),
+}))
+"""
+
+
+def entry_point_modules() -> List[str]:
+    try:
+        import tomllib
+
+        with open(PYPROJECT, "rb") as f:
+            entry_points = tomllib.load(f)["project"]["entry-points"][ENTRY_POINT_GROUP]
+        values = entry_points.values()
+    except ImportError:
+        from importlib.metadata import entry_points as installed_entry_points
+
+        values = [ep.value for ep in installed_entry_points(group=ENTRY_POINT_GROUP)]
+    modules = [value.split(":")[0] for value in values]
+    return [m for m in dict.fromkeys(modules) if m.startswith("lyik.ttk")]
+
+
+def probe(modules: List[str], runs: int, warmup: bool) -> Dict[str, float]:
+    env = dict(os.environ)
+    if not warmup:
+        env["TTK_CONFIG_WARMUP"] = "false"
+    samples = []
+    for _ in range(runs):
+        output = subprocess.run(
+            [sys.executable, "-c", _PROBE, *modules],
+            check=True,
+            capture_output=True,
+            text=True,
+            env=env,
+        ).stdout
+        samples.append(json.loads(output.strip().splitlines()[-1]))
+    return {
+        key: statistics.median(sample[key] for sample in samples) for key in samples[0]
+    }
+
+
+def _delta(before: float, after: float) -> str:
+    if not before:
+        return ""
+    return f"{(after - before) / before * 100:+.0f}%"
+
+
+def print_report(summary: Dict[str, Dict[str, float]], baseline: Dict | None) -> None:
+    print(f"{'target':<72} {'import ms':>10} {'1st valid. ms':>14} {'modules':>8}")
+    for target, result in summary.items():
+        line = (
+            f"{target:<72} {result['import_ms']:>10.0f} "
+            f"{result['first_validation_ms']:>14.1f} {result['modules']:>8.0f}"
+        )
+        if baseline and target in baseline:
+            line += (
+                f"  import {_delta(baseline[target]['import_ms'], result['import_ms'])}"
+            )
+        print(line)
+
+
+def main(args: argparse.Namespace) -> None:
+    modules = entry_point_modules()
+    targets = {"lyik.ttk": ["lyik.ttk"]}
+    if not args.package_only:
+        targets.update({module: [module] for module in modules})
+        targets["all entry points"] = modules
+
+    summary = {}
+    for target, target_modules in targets.items():
+        print(f"measuring {target}", file=sys.stderr)
+        summary[target] = probe(target_modules, args.runs, not args.no_warmup)
+
+    baseline = None
+    if args.compare:
+        with open(args.compare, encoding="utf-8") as f:
+            baseline = json.load(f)
+    print_report(summary, baseline)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(summary, f, indent=2)
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--runs", type=int, default=3)
+    parser.add_argument(
+        "--package-only",
+        action="store_true",
+        help="Only measure the import of the lyik.ttk package",
+    )
+    parser.add_argument(
+        "--no-warmup", action="store_true", help="Disable the config warm-up"
+    )
+    parser.add_argument("--output", help="Write the summary as JSON to this file")
+    parser.add_argument("--compare", help="Summary JSON of an earlier run to compare")
+    return parser.parse_args()
+
+
+if __name__ == "__main__":
+    main(parse_args())
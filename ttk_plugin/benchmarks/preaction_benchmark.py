@@ -0,0 +1,512 @@
+"""
+Benchmark of the unified pre-action pipeline (Central_Preaction.pre_action_processor).
+
+Drives the pipeline with synthetic form records for SCHENGEN and every individual-country
+form indicator, varying the number of co-travellers, filled infopanes and attachments.
+Every record is saved twice: as built, and unchanged with the section fingerprints
+returned by the first save, as when a user saves the form again.
+Mongo and the TTK appointment API are replaced by in-process stand-ins, nothing leaves
+the process.
+
+Reports latency percentiles per processor and for the whole pipeline (from the pipeline
+metrics), and the peak memory of each processor (measured with tracemalloc in a separate,
+sequential pass, so concurrent processors do not blur each other).
+
+Run from the ttk_plugin directory, with the plugin installed:
+
+    python benchmarks/preaction_benchmark.py --indicators SCHENGEN,GBR --iterations 20
+    python benchmarks/preaction_benchmark.py --output before.json
+    python benchmarks/preaction_benchmark.py --compare before.json
+"""
+
+import argparse
+import asyncio
+import json
+import logging
+import os
+import sys
+import time
+import tracemalloc
+from types import SimpleNamespace
+from typing import Any, Dict, List, Tuple
+
+import httpx
+import jwt
+
+BENCHMARK_DIR = os.path.dirname(os.path.abspath(__file__))
+os.environ.setdefault(
+    "CRED_FILES_MOUNT_PATH",
+    os.path.join(BENCHMARK_DIR, "..", "..", "deployment_templates", "plugin_files"),
+)
+os.environ.setdefault("TTK_API_BASE_URL", "http://ttk-api.local")
+os.environ.setdefault("TTK_APPOINTMENT_API_ROUTE", "/api/v2/appointments")
+# Before the plugin imports, so their own logging.basicConfig calls are no-ops
+logging.basicConfig(level=logging.CRITICAL)
+
+from lyikpluginmanager import ContextModel, GenericFormRecordModel
+
+from lyik.ttk.preaction_unified import central_preaction
+from lyik.ttk.preaction_unified._record_context import PreActionRecordContext
+from lyik.ttk.preaction_unified.impl_preaction_processors import (
+    invoke_appointment_api,
+    save_traveller,
+)
+from lyik.ttk.utils.form_indicator import FormIndicator
+from lyik.ttk.utils.metrics import InMemoryMetricsSink, set_metrics_sink
+
+logger = logging.getLogger("preaction_benchmark")
+
+# Infopanes filled when the form config of the indicator cannot be loaded
+DEFAULT_PANES = [
+    "passport",
+    "photograph",
+    "residential_address",
+    "work_address",
+    "itinerary_accomodation",
+    "accomodation",
+    "ticketing",
+    "travel_insurance",
+    "previous_visas",
+    "additional_details",
+    "salary_slip",
+    "bank_statement",
+    "itr_acknowledgement",
+    "cover_letter_info",
+    "invitation",
+]
+FIELDS_PER_PANE = 12
+PERCENTILES = (50, 90, 99)
+PIPELINE = "PIPELINE"
+
+
+# ----------------------------------------------------------------------
+# In-process stand-ins
+# ----------------------------------------------------------------------
+class InMemoryTTKStorage:
+    """
+    Stand-in for TTKStorage, used by the traveller save processors.
+    """
+
+    primary: Dict[Tuple[str, str], Dict[str, Any]] = {}
+    co_travellers: Dict[Tuple[str, str, str], Dict[str, Any]] = {}
+
+    def __init__(self, db_conn_url: str, db_name: str | None = None):
+        pass
+
+    async def save_primary_info(
+        self, org_id: str, order_id: str, data: Dict[str, Any], collection_name: str
+    ):
+        # Stay a real await point, like the driver
+        await asyncio.sleep(0)
+        self.primary[(org_id, order_id)] = data
+        return order_id
+
+    async def save_or_update_co_traveller(
+        self,
+        org_id: str,
+        order_id: str,
+        traveller_id: str,
+        traveller_data: Dict[str, Any],
+        collection_name: str,
+    ):
+        await asyncio.sleep(0)
+        self.co_travellers[(org_id, order_id, traveller_id)] = traveller_data
+        return traveller_id
+
+
+def _appointment_api_client_factory(latency_seconds: float):
+    """
+    httpx.AsyncClient replacement answering the appointment API in process.
+    """
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        if latency_seconds:
+            await asyncio.sleep(latency_seconds)
+        cities = ["Bengaluru", "Chennai", "Delhi", "Kolkata", "Mumbai", "Pune"]
+        return httpx.Response(
+            200,
+            json={
+                "status": "success",
+                "returnData": [
+                    {
+                        "city": city,
+                        "appointmentDate": "2025-10-08",
+                        "businessDays": 10,
+                    }
+                    for city in cities
+                ],
+            },
+        )
+
+    def factory(*args, **kwargs) -> httpx.AsyncClient:
+        kwargs["transport"] = httpx.MockTransport(handler)
+        return httpx.AsyncClient(*args, **kwargs)
+
+    return factory
+
+
+def install_stand_ins(api_latency_seconds: float) -> None:
+    save_traveller.TTKStorage = InMemoryTTKStorage
+    invoke_appointment_api.httpx = SimpleNamespace(
+        AsyncClient=_appointment_api_client_factory(api_latency_seconds)
+    )
+
+
+def make_context() -> ContextModel:
+    token = jwt.encode(
+        {
+            "user_metadata": {"permissions": {"persona": ["CONSULTANT"]}},
+            "provider_info": {"token": "benchmark-ttk-token"},
+        },
+        "benchmark",
+        algorithm="HS256",
+    )
+    return ContextModel(
+        config=SimpleNamespace(DB_CONN_URL="mongodb://benchmark.local"),
+        token=token,
+        org_id="benchmark-org",
+        form_name="Benchmark Visa Form",
+    )
+
+
+# ----------------------------------------------------------------------
+# Synthetic records
+# ----------------------------------------------------------------------
+def _relevant_panes(form_indicator: FormIndicator) -> List[str]:
+    plan = central_preaction._PIPELINE_PLANS.get(form_indicator)
+    if plan.form_config:
+        return [
+            pane
+            for pane in plan.form_config.relevant_infopanes
+            if pane not in ("visa_request_information", "appointment")
+        ]
+    return DEFAULT_PANES
+
+
+def _document(index: int) -> Dict[str, Any]:
+    return {
+        "doc_id": f"doc-{index:05d}",
+        "doc_name": f"attachment_{index}.pdf",
+        "doc_type": "application/pdf",
+        "doc_size": 250_000 + index,
+    }
+
+
+def build_record(
+    form_indicator: FormIndicator,
+    to_country: str,
+    traveller_index: int,
+    filled_panes: int,
+    attachments: int,
+) -> Dict[str, Any]:
+    """
+    A form record of one traveller. Index 0 is the primary traveller.
+    """
+    is_primary = traveller_index == 0
+    record: Dict[str, Any] = {
+        "lets_get_started": {"_ver_status": {"status": "success"}},
+        "visa_request_information": {
+            "_ver_status": {"status": "success"},
+            "visa_request": {
+                "from_country": "IND",
+                "to_country": to_country,
+                "arrival_date": "2025-11-01",
+                "departure_date": "2025-11-15",
+                "visa_type": "Tourist",
+                "visa_mode": "Paper",
+                "traveller_type": "Primary" if is_primary else "Co-traveller",
+                "traveller_id": f"traveller-{traveller_index}",
+                "order_id": "benchmark-order",
+                "form_indicator": form_indicator.value,
+                "email_id": "traveller@example.com",
+                "phone_number": "+919999999999",
+            },
+        },
+        "passport": {
+            "passport_details": {
+                "first_name": f"Traveller{traveller_index}",
+                "surname": "Benchmark",
+                "passport_number": f"Z{traveller_index:07d}",
+                "address_line_1": "12 MG Road",
+                "city": "Bengaluru",
+                "state": "Karnataka",
+                "pin_code": "560001",
+                "country": "IND",
+            }
+        },
+    }
+    if not is_primary:
+        record["shared_travell_info"] = {
+            "shared": {
+                "accommodation_same": "ACCOMMODATION",
+                "flight_ticket_same": "FLIGHT_TICKET",
+            }
+        }
+
+    for pane in _relevant_panes(form_indicator)[:filled_panes]:
+        section = record.setdefault(pane, {})
+        section["_ver_status"] = {"status": "success"}
+        section[f"{pane}_details"] = {
+            f"field_{i}": f"{pane} value {i}" for i in range(FIELDS_PER_PANE)
+        }
+
+    if attachments:
+        record["additional_documents_pane"] = {
+            **record.get("additional_documents_pane", {}),
+            "additional_documents": [_document(i) for i in range(attachments)],
+        }
+    return record
+
+
+# ----------------------------------------------------------------------
+# Runs
+# ----------------------------------------------------------------------
+async def run_latency(
+    scenarios: List[Dict[str, Any]], iterations: int, context: ContextModel
+) -> InMemoryMetricsSink:
+    sink = InMemoryMetricsSink()
+    set_metrics_sink(sink)
+    preaction = central_preaction.Central_Preaction()
+    try:
+        for scenario in scenarios:
+            for _ in range(iterations):
+                for record in scenario["records"]:
+                    saved = await preaction.pre_action_processor(
+                        context=context,
+                        action="save",
+                        current_state="save",
+                        new_state="save",
+                        payload=GenericFormRecordModel.model_validate(record),
+                    )
+                    # Save the unchanged record again with the section fingerprints
+                    # of the first save, where processors may be skipped
+                    await preaction.pre_action_processor(
+                        context=context,
+                        action="save",
+                        current_state="save",
+                        new_state="save",
+                        payload=GenericFormRecordModel.model_validate(
+                            saved.model_dump()
+                        ),
+                    )
+    finally:
+        set_metrics_sink(None)
+    return sink
+
+
+async def run_memory(
+    scenarios: List[Dict[str, Any]], context: ContextModel
+) -> Dict[str, int]:
+    """
+    Peak memory above the starting point of each processor, run one at a time in plan order,
+    and of the whole pipeline of a record under the `PIPELINE` key.
+    """
+    peaks: Dict[str, int] = {}
+    tracemalloc.start()
+    try:
+        for scenario in scenarios:
+            plan = central_preaction._PIPELINE_PLANS.get(scenario["form_indicator"])
+            for record in scenario["records"]:
+                tracemalloc.reset_peak()
+                record_start, _ = tracemalloc.get_traced_memory()
+                pipeline_peak = 0
+                record_context = PreActionRecordContext(
+                    payload=GenericFormRecordModel.model_validate(record)
+                )
+                for step in plan.steps:
+                    name = type(step.processor).__name__
+                    tracemalloc.reset_peak()
+                    start, _ = tracemalloc.get_traced_memory()
+                    try:
+                        patches = await step.processor.unified_pre_action_processor_impl(
+                            context=context,
+                            action="save",
+                            current_state="save",
+                            new_state="save",
+                            form_indicator=scenario["form_indicator"],
+                            record_context=record_context,
+                        )
+                    except Exception as e:
+                        logger.debug("%s failed in the memory pass: %s", name, e)
+                        patches = None
+                    _, peak = tracemalloc.get_traced_memory()
+                    peaks[name] = max(peaks.get(name, 0), peak - start)
+                    pipeline_peak = max(pipeline_peak, peak - record_start)
+                    record_context.stage(source=name, patches=patches)
+                tracemalloc.reset_peak()
+                record_context.to_payload()
+                _, peak = tracemalloc.get_traced_memory()
+                pipeline_peak = max(pipeline_peak, peak - record_start)
+                peaks[PIPELINE] = max(peaks.get(PIPELINE, 0), pipeline_peak)
+    finally:
+        tracemalloc.stop()
+    return peaks
+
+
+def build_scenarios(args: argparse.Namespace) -> List[Dict[str, Any]]:
+    if args.indicators:
+        indicators = [FormIndicator(value) for value in args.indicators.split(",")]
+    else:
+        indicators = list(FormIndicator)
+
+    scenarios = []
+    for form_indicator in indicators:
+        to_country = "FRA" if form_indicator == FormIndicator.SCHENGEN else form_indicator.value
+        for co_travellers in _ints(args.co_travellers):
+            for filled_panes in _ints(args.filled_panes):
+                for attachments in _ints(args.attachments):
+                    scenarios.append(
+                        {
+                            "form_indicator": form_indicator,
+                            "co_travellers": co_travellers,
+                            "filled_panes": filled_panes,
+                            "attachments": attachments,
+                            "records": [
+                                build_record(
+                                    form_indicator,
+                                    to_country,
+                                    traveller_index,
+                                    filled_panes,
+                                    attachments,
+                                )
+                                for traveller_index in range(co_travellers + 1)
+                            ],
+                        }
+                    )
+    return scenarios
+
+
+def _ints(value: str) -> List[int]:
+    return [int(part) for part in value.split(",") if part.strip()]
+
+
+# ----------------------------------------------------------------------
+# Report
+# ----------------------------------------------------------------------
+def summarize(sink: InMemoryMetricsSink, peaks: Dict[str, int]) -> Dict[str, Any]:
+    processors = sorted(
+        {
+            dict(series)["processor"]
+            for name, series in sink.histograms
+            if name == "preaction_processor_latency_seconds"
+        }
+    )
+    summary: Dict[str, Any] = {"processors": {}, "pipeline": {}}
+    for processor in processors:
+        values = sink.values("preaction_processor_latency_seconds", processor=processor)
+        summary["processors"][processor] = {
+            "runs": len(values),
+            "skipped": sink.count(
+                "preaction_processor_total", processor=processor, outcome="skipped"
+            ),
+            **{
+                f"p{pct}_ms": sink.percentile(
+                    "preaction_processor_latency_seconds", pct, processor=processor
+                )
+                * 1000
+                for pct in PERCENTILES
+            },
+            "peak_kib": peaks.get(processor, 0) / 1024,
+        }
+    summary["pipeline"] = {
+        "runs": len(sink.values("preaction_pipeline_latency_seconds")),
+        **{
+            f"p{pct}_ms": (
+                sink.percentile("preaction_pipeline_latency_seconds", pct) or 0
+            )
+            * 1000
+            for pct in PERCENTILES
+        },
+        "peak_kib": peaks.get(PIPELINE, 0) / 1024,
+    }
+    return summary
+
+
+def print_report(summary: Dict[str, Any], baseline: Dict[str, Any] | None) -> None:
+    header = f"{'processor':<32}{'runs':>7}{'skip':>6}" + "".join(
+        f"{f'p{pct} ms':>11}" for pct in PERCENTILES
+    ) + f"{'peak KiB':>11}"
+    print(header)
+    print("-" * len(header))
+    rows = list(summary["processors"].items()) + [(PIPELINE, summary["pipeline"])]
+    for name, row in rows:
+        line = f"{name:<32}{row['runs']:>7}{row.get('skipped', 0):>6}"
+        line += "".join(f"{row[f'p{pct}_ms']:>11.2f}" for pct in PERCENTILES)
+        line += f"{row['peak_kib']:>11.1f}"
+        print(line)
+        if baseline:
+            before = (
+                baseline["pipeline"]
+                if name == PIPELINE
+                else baseline["processors"].get(name)
+            )
+            if before:
+                deltas = "".join(
+                    f"{_delta(before[f'p{pct}_ms'], row[f'p{pct}_ms']):>11}"
+                    for pct in PERCENTILES
+                )
+                print(
+                    f"{'  vs baseline':<45}{deltas}"
+                    f"{_delta(before['peak_kib'], row['peak_kib']):>11}"
+                )
+
+
+def _delta(before: float, after: float) -> str:
+    if not before:
+        return "n/a"
+    return f"{(after - before) / before * 100:+.1f}%"
+
+
+async def main(args: argparse.Namespace) -> None:
+    install_stand_ins(api_latency_seconds=args.api_latency_ms / 1000)
+    context = make_context()
+    scenarios = build_scenarios(args)
+    records = sum(len(s["records"]) for s in scenarios)
+    print(
+        f"{len(scenarios)} scenarios, {records} records, {args.iterations} iterations",
+        file=sys.stderr,
+    )
+
+    # Warm up the plans, models and caches before measuring
+    await run_latency(scenarios, 1, context)
+
+    started = time.perf_counter()
+    sink = await run_latency(scenarios, args.iterations, context)
+    print(f"latency pass: {time.perf_counter() - started:.1f} s", file=sys.stderr)
+    peaks = await run_memory(scenarios, context)
+
+    summary = summarize(sink, peaks)
+    baseline = None
+    if args.compare:
+        with open(args.compare, encoding="utf-8") as f:
+            baseline = json.load(f)
+    print_report(summary, baseline)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(summary, f, indent=2)
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument(
+        "--indicators",
+        default="",
+        help="Comma separated form indicators, e.g. SCHENGEN,GBR. Default: all",
+    )
+    parser.add_argument("--co-travellers", default="0,3", help="e.g. 0,3,8")
+    parser.add_argument("--filled-panes", default="0,6,18", help="e.g. 0,6,18")
+    parser.add_argument("--attachments", default="0,25", help="e.g. 0,25,100")
+    parser.add_argument("--iterations", type=int, default=3)
+    parser.add_argument(
+        "--api-latency-ms",
+        type=float,
+        default=0.0,
+        help="Latency of the appointment API stand-in",
+    )
+    parser.add_argument("--output", help="Write the summary as JSON to this file")
+    parser.add_argument("--compare", help="Summary JSON of an earlier run to compare")
+    return parser.parse_args()
+
+
+if __name__ == "__main__":
+    asyncio.run(main(parse_args()))
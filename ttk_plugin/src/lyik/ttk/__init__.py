@@ -1,34 +1,70 @@
-#1.  SPECIFIC: (Hrni) To schengen? Is this specific to schengen or not? lot of checks for checkbox, more info box, etc. (Hrni)
-from .additional_travel_details_verifier.additional_travel_details_verifier import AdditionalTravelDetailsVerifier
-#2.  Universalized
-from .passport_verifier.verifier import PassportVerificationPlugin
-#3.  Universalized
-from .passport_verifier.passport_ip_verifier import PassportIPVerifier
-#4.  SPECIFIC: (Hrni) To schengen?  is previous visas same?
-from .previous_visas_verifier.previous_visas_verifier import PreviousVisasVerifier
-#5.  Universalized 
-from .visa_request_summary_verifier.visa_request_summary_verifier import VisaRequestVerifier
-#6.  Universalized  
-from .appointment_details_verifier.appointment_verifier import AppointmentDetailsVerifier
-#7.  Universalized   
-from .submit_application_verifier.submit_application_verifier import SumbitApplicationVerifier
-#8.  Universalized 
-from .financial_verifiers.financial_verifiers import SalarySlipVerifier
-#9.  Universalized 
-from .financial_verifiers.financial_verifiers import BankStatementVerifier
-#10. Universalized 
-from .financial_verifiers.financial_verifiers import ITRAcknowledgeVerifier
-#11. SPECIFIC: (Hrni) To schengen?
-from .travel_insurance_verifier.travel_insurance_verifier import TravelInsuranceVerifier
-#12. Universalized 
-from .cover_letter_verifier.cover_letter_verifier import CoverLetterVerifier
-#13. Universalized  
-from .invitation_letter_verifier.invitation_letter_verifier import InvitationLetterVerifier
-#14. Universalized
-from .appointment_api_verifier.appointment_api_verifier import AppointmentAPIVerifier
-#15. SPECIFIC: (Hrni) Some Countries does not have additional documents? Why is that? (Saudi)
-from .additional_documents.additional_documents_traveller_verifier import AdditionalDocumentsTravellerVerifier
-#16. SPECIFIC: (Hrni) Some Countries does not have comments section? Why is that? (Singapore)
-from .comments.comments_verifier import CommentsVerifier
-#17. Universalized
-from .notification.notification_verifier import NotificationVerifier
\ No newline at end of file
+import importlib
+from typing import Any, Dict
+
+# The plugins are imported on first access (PEP 562), together with the models they
+# use. The platform loads them through the entry points of pyproject.toml, so a process
+# only imports the plugins, and builds the models, it actually runs.
+_PLUGINS: Dict[str, str] = {
+    #1.  SPECIFIC: (Hrni) To schengen? Is this specific to schengen or not? lot of checks for checkbox, more info box, etc. (Hrni)
+    "AdditionalTravelDetailsVerifier": "additional_travel_details_verifier.additional_travel_details_verifier",
+    #2.  Universalized
+    "PassportVerificationPlugin": "passport_verifier.verifier",
+    #3.  Universalized
+    "PassportIPVerifier": "passport_verifier.passport_ip_verifier",
+    #4.  SPECIFIC: (Hrni) To schengen?  is previous visas same?
+    "PreviousVisasVerifier": "previous_visas_verifier.previous_visas_verifier",
+    #5.  Universalized
+    "VisaRequestVerifier": "visa_request_summary_verifier.visa_request_summary_verifier",
+    #6.  Universalized
+    "AppointmentDetailsVerifier": "appointment_details_verifier.appointment_verifier",
+    #7.  Universalized
+    "SumbitApplicationVerifier": "submit_application_verifier.submit_application_verifier",
+    #8.  Universalized
+    "SalarySlipVerifier": "financial_verifiers.financial_verifiers",
+    #9.  Universalized
+    "BankStatementVerifier": "financial_verifiers.financial_verifiers",
+    #10. Universalized
+    "ITRAcknowledgeVerifier": "financial_verifiers.financial_verifiers",
+    #11. SPECIFIC: (Hrni) To schengen?
+    "TravelInsuranceVerifier": "travel_insurance_verifier.travel_insurance_verifier",
+    #12. Universalized
+    "CoverLetterVerifier": "cover_letter_verifier.cover_letter_verifier",
+    #13. Universalized
+    "InvitationLetterVerifier": "invitation_letter_verifier.invitation_letter_verifier",
+    #14. Universalized
+    "AppointmentAPIVerifier": "appointment_api_verifier.appointment_api_verifier",
+    #15. SPECIFIC: (Hrni) Some Countries does not have additional documents? Why is that? (Saudi)
+    "AdditionalDocumentsTravellerVerifier": "additional_documents.additional_documents_traveller_verifier",
+    #16. SPECIFIC: (Hrni) Some Countries does not have comments section? Why is that? (Singapore)
+    "CommentsVerifier": "comments.comments_verifier",
+    #17. Universalized
+    "NotificationVerifier": "notification.notification_verifier",
+}
+
+__all__ = list(_PLUGINS)
+
+
+def __getattr__(name: str) -> Any:
+    module_name = _PLUGINS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f".{module_name}", __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_PLUGINS))
+
+
+# Load and check the mounted plugin files at import, not on the first request.
+# Broken files are logged. Set TTK_CONFIG_WARMUP=strict to fail the import on them
+# instead, or TTK_CONFIG_WARMUP=false to skip.
+from .utils.config_warmup import (
+    is_config_warmup_enabled,
+    is_config_warmup_strict,
+    warm_up_plugin_config,
+)
+
+if is_config_warmup_enabled():
+    warm_up_plugin_config(fail_fast=is_config_warmup_strict())
@@ -31,6 +31,7 @@ import logging
 import base64
 from lyik.ttk.utils.encode import decode_base64_to_str
 from lyik.ttk.utils.message import get_error_message
+from lyik.ttk.utils.record_sections import RecordSections
 
 from lyik.ttk.models.payment.addon_models import AddonSummaryItem
 from lyik.ttk.utils.payment import (
@@ -62,7 +63,7 @@ class AddOnPaymentInitializeVerifier(VerifyHandlerSpec):
         VerifyHandlerResponseModel,
         Doc("Response including the payment html"),
     ]:
-        full_form_record = Schengentouristvisa.model_validate(context.record)
+        full_form_record = RecordSections(context.record, Schengentouristvisa)
         full_form_record.addons.addon_service_initialization
         record_id = full_form_record.addons.record_id
 
@@ -18,6 +18,7 @@ from lyik.ttk.utils.verifier_util import check_if_verified
 from typing import Annotated, Optional, Dict, Any, Union
 from typing_extensions import Doc
 from lyik.ttk.utils.message import get_error_message
+from lyik.ttk.utils.record_sections import RecordSections
 import logging
 import os
 import httpx
@@ -94,7 +95,9 @@ class AppointmentAPIVerifier(VerifyHandlerSpec):
                 )
 
             try:
-                form = UniversalModelWithAppointment(**context.record)
+                form = RecordSections(context.record, UniversalModelWithAppointment)
+                # The visa request is the only section read, validated here
+                form.visa_request_information
             except Exception as e:
                 raise PluginException(
                     message=get_error_message(
@@ -15,6 +15,7 @@ from datetime import datetime
 from lyik.ttk.utils.verifier_util import check_if_verified, validate_phone, validate_email
 from lyik.ttk.utils.message import get_error_message
 from lyik.ttk.utils.utils import format_date_to_string
+from lyik.ttk.utils.record_sections import RecordSections
 from datetime import date
 from lyik.ttk.models.generated.universal_model_with_appointment import RootAppointment, ADDONSERVICEAPPOINTMENT
 from lyik.ttk.models.generated.universal_model import UniversalModel
@@ -75,7 +76,7 @@ class AppointmentDetailsVerifier(VerifyHandlerSpec):
             and payload.appointment_scheduled.scheduled_date
         )
 
-        full_form_record = UniversalModel.model_validate(context.record)
+        full_form_record = RecordSections(context.record, UniversalModel)
 
         departure_date = (
             full_form_record.visa_request_information
@@ -39,6 +39,7 @@ from lyik.ttk.models.generated.universal_model_with_all_shared_sections import (
 )
 from lyik.ttk.models.forms.schengentouristvisa import Schengentouristvisa
 from lyik.ttk.ttk_storage_util.ttk_storage import TTKStorage
+from lyik.ttk.utils.record_sections import RecordSections
 from lyik.ttk.utils.operation_html_message import get_docket_operation_html_message
 from lyik.ttk.utils.message import get_error_message
 from lyik.ttk.docket_operation.docket_utilities.map_form_rec_to_schengen_pdf import (
@@ -52,8 +53,6 @@ from lyik.ttk.docket_operation.docket_utilities.mexico_pdf_mapping import map_me
 from lyik.ttk.docket_operation.docket_utilities.japan_pdf_mapping import map_japan_pdf
 from lyik.ttk.models.pdf.schengen_pdf_model import SchengenPDFModel
 from typing import Annotated, Dict, List, Any
-import csv
-from functools import lru_cache
 from typing_extensions import Doc
 import logging
 import os
@@ -63,7 +62,7 @@ import rarfile
 import py7zr
 from datetime import datetime
 from lyik.ttk.utils.form_indicator import FormIndicator, get_form_indicator
-from lyik.ttk.utils.csv_utils import load_csv_rows
+from lyik.ttk.docket_operation.docket_sequence_plan import get_docket_sequence_plan
 
 
 logger = logging.getLogger(__name__)
@@ -73,6 +72,8 @@ impl = pluggy.HookimplMarker(getProjectName())
 PRIMARY_TRAVELLER = "Primary"
 CO_TRAVELLER = "Co-traveller"
 COLLECTION_NAME = "primary_travellers"
+# The sections a co-traveller can share with the primary traveller
+PRIMARY_SHARED_SECTIONS = ("itinerary_accomodation", "accomodation", "ticketing")
 CODES = [
     "BEL",
     "HRV",
@@ -150,9 +151,7 @@ class DocketOperation(OperationPluginSpec):
                     detailed_message="org_id is missing in the context.",
                 )
 
-            form_indicator: FormIndicator = get_form_indicator(
-                form_rec=form_record.model_dump(mode="json")
-            )
+            form_indicator: FormIndicator = get_form_indicator(form_rec=form_record)
 
             parsed_form_model = UniversalModelWithAllSharedSections(
                 **form_record.model_dump()
@@ -186,6 +185,7 @@ class DocketOperation(OperationPluginSpec):
                             collection_name=COLLECTION_NAME,
                             org_id=org_id,
                             order_id=order_id,
+                            projection=PRIMARY_SHARED_SECTIONS,
                         )
                     )
 
@@ -197,8 +197,8 @@ class DocketOperation(OperationPluginSpec):
                             detailed_message="Failed to fetch the Primary traveller details.",
                         )
 
-                    primary_traveller_data = UniversalModelWithAllSharedSections(
-                        **fetched_data.model_dump(mode="json")
+                    primary_traveller_data = RecordSections(
+                        fetched_data, UniversalModelWithAllSharedSections
                     )
 
                     shared_traveller_info = parsed_form_model.shared_travell_info
@@ -570,58 +570,6 @@ class DocketOperation(OperationPluginSpec):
 
         return None
 
-    @staticmethod
-    def load_csv(file_path: str) -> List[Dict[str, str]]:
-        """
-        Docket-sequence specific loader.
-
-        - Uses the generic `load_csv_rows`
-        - Sorts rows by the 'order' column (default 0 if missing/invalid)
-        """
-        rows = load_csv_rows(file_path)
-
-        def _order_key(row: Dict[str, str]) -> int:
-            raw = row.get("order", 0)
-            try:
-                return int(raw)
-            except (TypeError, ValueError):
-                return 0
-
-        # Return a new sorted list so we don't mutate the cached `rows`
-        return sorted(rows, key=_order_key)
-
-    def _resolve_path(self, obj, path: str):
-        """Safely resolve dotted path like a.b.c supporting Pydantic models and dicts."""
-        try:
-            for part in path.split("."):
-                if obj is None:
-                    return None
-
-                # Handle list index: something.0.name
-                if isinstance(obj, list) and part.isdigit():
-                    idx = int(part)
-                    if idx < 0 or idx >= len(obj):
-                        return None
-                    obj = obj[idx]
-                    continue
-
-                # Handle dict keys
-                if isinstance(obj, dict):
-                    obj = obj.get(part)
-                    continue
-
-                # Handle Pydantic model attributes (incl. model_extra)
-                if hasattr(obj, part):
-                    obj = getattr(obj, part)
-                    continue
-
-                # Nothing matched → path broken
-                return None
-
-            return obj
-        except Exception:
-            return None
-
     def _find_upload_dict(self, obj):
         """Recursively find the dict that contains a real uploaded file (doc_id)."""
         if obj is None:
@@ -705,51 +653,11 @@ class DocketOperation(OperationPluginSpec):
         next_index = 1
         visa_type = parsed_form_model.visa_request_information.visa_request.visa_type
 
-        mount_path = os.getenv("CRED_FILES_MOUNT_PATH")
-
-        if not mount_path:
-            raise ValueError(
-                f"Missing mount_path: '{mount_path}'. Cannot import CSV file."
-            )
-
-        docket_seq_files_path = os.path.join(mount_path, "docket_sequence")
-
-        if not os.path.exists(docket_seq_files_path):
-            raise FileNotFoundError(
-                f"Docket Sequence directory not found: {docket_seq_files_path}"
-            )
-
-        # Build the expected filename
-        expected_file_name = f"{form_indicator.value}.csv"
-        seq_file_path = os.path.join(
-            mount_path, docket_seq_files_path, expected_file_name
-        )
-
-        if not os.path.exists(seq_file_path) or not os.path.isfile(seq_file_path):
-            raise FileNotFoundError(
-                f"Docket Sequence CSV file not found: {seq_file_path}"
-            )
-
-        for row in self.load_csv(seq_file_path):
-            file_name = row["Name of the Document"]
-            path = row["Upload Field Attribute"]
-            row_visa_type = row["Type of Visa"]
-            repeatable = (
-                row["Is this Field Repeatable?"].lower() == "yes"
-                if row["Is this Field Repeatable?"]
-                else False
-            )
-            naming_template = row["Default Placeholder Name"]
-
-            # Visa type check
-            if (
-                row_visa_type
-                and str(row_visa_type).strip().lower() != str(visa_type).strip().lower()
-            ):
-                continue
+        plan = get_docket_sequence_plan(form_indicator)
 
+        for row in plan.rows_for(visa_type):
             # SPECIAL case for PDF
-            if path == "**FILLED_APPLICATION_DOC**":
+            if row.is_application_doc:
                 if application_doc_model:
                     files[application_doc_model.doc_name] = (
                         application_doc_model.model_dump()
@@ -757,12 +665,16 @@ class DocketOperation(OperationPluginSpec):
                 continue
 
             # Regular path evaluation
-            value = self._resolve_path(parsed_form_model, path)
+            value = row.accessor(parsed_form_model)
             if not value:
+                if row.mandatory:
+                    logger.warning(
+                        "Mandatory docket document %s is missing", row.file_name
+                    )
                 continue
 
             # Handle repeatable dynamic entries
-            if repeatable and isinstance(value, list):
+            if row.repeatable and isinstance(value, list):
                 for item in value:
                     if not item:
                         continue
@@ -776,7 +688,9 @@ class DocketOperation(OperationPluginSpec):
                     doc_name = self._find_document_name(item)
 
                     # 3) Fallback to placeholder
-                    final_name = doc_name or naming_template.format(index=next_index)
+                    final_name = doc_name or row.naming_template.format(
+                        index=next_index
+                    )
 
                     # 4) Add file
                     files[final_name] = upload_dict
@@ -784,7 +698,7 @@ class DocketOperation(OperationPluginSpec):
 
                 continue
 
-            files[file_name] = value
+            files[row.file_name] = value
 
         return files
 
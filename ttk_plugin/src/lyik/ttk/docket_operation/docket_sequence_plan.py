@@ -0,0 +1,268 @@
+import logging
+import os
+import types
+import typing
+from functools import lru_cache
+from typing import Any, Callable, Dict, List, Sequence, Tuple, Type
+
+from pydantic import BaseModel, ConfigDict
+
+from lyik.ttk.models.generated.universal_model_with_all_shared_sections import (
+    UniversalModelWithAllSharedSections,
+)
+from lyik.ttk.utils.csv_utils import load_csv_rows
+from lyik.ttk.utils.form_indicator import FormIndicator
+
+logger = logging.getLogger(__name__)
+
+DOCKET_SEQUENCE_DIR = "docket_sequence"
+# Path of the row which takes the generated application document
+FILLED_APPLICATION_DOC = "**FILLED_APPLICATION_DOC**"
+# Optional column, rows without it are not mandatory
+MANDATORY_COLUMN = "Is this Field Mandatory?"
+
+Accessor = Callable[[Any], Any]
+
+
+def resolve_parts(obj: Any, parts: Sequence[str]) -> Any:
+    """
+    Safely resolve the parts of a dotted path like a.b.c supporting Pydantic models,
+    dicts and list indexes. None if the path is broken.
+    """
+    try:
+        for part in parts:
+            if obj is None:
+                return None
+
+            # Handle list index: something.0.name
+            if isinstance(obj, list) and part.isdigit():
+                idx = int(part)
+                if idx < 0 or idx >= len(obj):
+                    return None
+                obj = obj[idx]
+                continue
+
+            # Handle dict keys
+            if isinstance(obj, dict):
+                obj = obj.get(part)
+                continue
+
+            # Handle Pydantic model attributes (incl. model_extra)
+            if hasattr(obj, part):
+                obj = getattr(obj, part)
+                continue
+
+            # Nothing matched → path broken
+            return None
+
+        return obj
+    except Exception:
+        return None
+
+
+def _unwrap_annotation(annotation: Any) -> Any:
+    """
+    The type inside Optional[...] and Annotated[...].
+    """
+    origin = typing.get_origin(annotation)
+    if origin is typing.Annotated:
+        return _unwrap_annotation(typing.get_args(annotation)[0])
+    if origin in (typing.Union, types.UnionType):
+        args = [arg for arg in typing.get_args(annotation) if arg is not type(None)]
+        if len(args) == 1:
+            return _unwrap_annotation(args[0])
+    return annotation
+
+
+def _declared_prefix(model: Type[BaseModel], parts: Sequence[str]) -> Tuple[int, bool]:
+    """
+    How many leading parts of the path are declared model fields, and whether the whole
+    path exists on the model. Below an untyped value (a dict or Any, e.g. an upload) any
+    path is accepted.
+    """
+    annotation: Any = model
+    for index, part in enumerate(parts):
+        annotation = _unwrap_annotation(annotation)
+        if typing.get_origin(annotation) in (list, List):
+            return index, part.isdigit()
+        if not (isinstance(annotation, type) and issubclass(annotation, BaseModel)):
+            return index, True
+        field = annotation.model_fields.get(part)
+        if field is None:
+            return index, False
+        annotation = field.annotation
+    return len(parts), True
+
+
+def _build_accessor(parts: Tuple[str, ...], declared: int) -> Accessor:
+    """
+    Reads the path from a parsed record. The declared fields are plain attribute reads,
+    the rest is resolved like `resolve_parts`.
+    """
+    attributes = parts[:declared]
+    rest = parts[declared:]
+
+    def accessor(obj: Any) -> Any:
+        try:
+            for attribute in attributes:
+                if obj is None:
+                    return None
+                obj = getattr(obj, attribute)
+        except AttributeError:
+            return None
+        return resolve_parts(obj, rest) if rest else obj
+
+    return accessor
+
+
+def _parse_yes(value: str | None) -> bool:
+    return bool(value) and value.strip().lower() == "yes"
+
+
+def _parse_order(value: str | None) -> int:
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        return 0
+
+
+class DocketSequenceRow(BaseModel):
+    """
+    One document of the docket, compiled from a row of the docket_sequence CSV.
+    """
+
+    model_config = ConfigDict(frozen=True, arbitrary_types_allowed=True)
+
+    order: int
+    file_name: str
+    path: str
+    # Lower case 'Type of Visa', None for all visa types
+    visa_type: str | None = None
+    repeatable: bool = False
+    mandatory: bool = False
+    # 'Default Placeholder Name', the fallback name of repeatable documents without a name
+    naming_template: str = ""
+    # The row of the generated application document
+    is_application_doc: bool = False
+    # False if the path is not declared on the universal model, it is then looked up
+    # in the extra fields of the record
+    on_model: bool = True
+    accessor: Accessor | None = None
+
+    @property
+    def has_fallback_name(self) -> bool:
+        return self.repeatable and bool(self.naming_template)
+
+
+class DocketSequencePlan(BaseModel):
+    """
+    The docket_sequence CSV of a form indicator, compiled into the ordered rows of each
+    visa type.
+    """
+
+    model_config = ConfigDict(frozen=True)
+
+    form_indicator: FormIndicator
+    rows: Tuple[DocketSequenceRow, ...] = ()
+    # Rows of the visa types named in the CSV, by lower case visa type
+    rows_by_visa_type: Dict[str, Tuple[DocketSequenceRow, ...]] = {}
+    # Rows of every other visa type
+    default_rows: Tuple[DocketSequenceRow, ...] = ()
+
+    def rows_for(self, visa_type: Any) -> Tuple[DocketSequenceRow, ...]:
+        return self.rows_by_visa_type.get(
+            str(visa_type).strip().lower(), self.default_rows
+        )
+
+
+def _compile_row(row: Dict[str, str], model: Type[BaseModel]) -> DocketSequenceRow:
+    path = row["Upload Field Attribute"]
+    visa_type = (row["Type of Visa"] or "").strip().lower() or None
+    compiled = dict(
+        order=_parse_order(row.get("order")),
+        file_name=row["Name of the Document"],
+        path=path,
+        visa_type=visa_type,
+        repeatable=_parse_yes(row["Is this Field Repeatable?"]),
+        mandatory=_parse_yes(row.get(MANDATORY_COLUMN)),
+        naming_template=row["Default Placeholder Name"] or "",
+    )
+    if path == FILLED_APPLICATION_DOC:
+        return DocketSequenceRow(**compiled, is_application_doc=True)
+
+    parts = tuple(path.split("."))
+    declared, on_model = _declared_prefix(model, parts)
+    return DocketSequenceRow(
+        **compiled,
+        on_model=on_model,
+        accessor=_build_accessor(parts, declared),
+    )
+
+
+@lru_cache(maxsize=64)
+def _compile_docket_sequence_plan(
+    file_path: str, mtime_ns: int, form_indicator: FormIndicator
+) -> DocketSequencePlan:
+    logger.info("Compiling docket sequence plan of %s", form_indicator.value)
+    rows = sorted(
+        (
+            _compile_row(row, UniversalModelWithAllSharedSections)
+            for row in load_csv_rows(file_path)
+        ),
+        key=lambda row: row.order,
+    )
+    undeclared = [row.path for row in rows if not row.on_model]
+    if undeclared:
+        logger.warning(
+            "%d docket paths in %s are not on %s, they are read from the extra fields: %s",
+            len(undeclared),
+            file_path,
+            UniversalModelWithAllSharedSections.__name__,
+            undeclared,
+        )
+    visa_types = {row.visa_type for row in rows if row.visa_type}
+    return DocketSequencePlan(
+        form_indicator=form_indicator,
+        rows=tuple(rows),
+        rows_by_visa_type={
+            visa_type: tuple(
+                row for row in rows if row.visa_type in (None, visa_type)
+            )
+            for visa_type in visa_types
+        },
+        default_rows=tuple(row for row in rows if row.visa_type is None),
+    )
+
+
+def get_docket_sequence_file_path(form_indicator: FormIndicator) -> str:
+    """
+    Path of the docket_sequence CSV of the form indicator. Raises if it does not exist.
+    """
+    mount_path = os.getenv("CRED_FILES_MOUNT_PATH")
+
+    if not mount_path:
+        raise ValueError(f"Missing mount_path: '{mount_path}'. Cannot import CSV file.")
+
+    docket_seq_files_path = os.path.join(mount_path, DOCKET_SEQUENCE_DIR)
+
+    if not os.path.exists(docket_seq_files_path):
+        raise FileNotFoundError(
+            f"Docket Sequence directory not found: {docket_seq_files_path}"
+        )
+
+    seq_file_path = os.path.join(docket_seq_files_path, f"{form_indicator.value}.csv")
+
+    if not os.path.isfile(seq_file_path):
+        raise FileNotFoundError(f"Docket Sequence CSV file not found: {seq_file_path}")
+
+    return seq_file_path
+
+
+def get_docket_sequence_plan(form_indicator: FormIndicator) -> DocketSequencePlan:
+    """
+    The compiled docket sequence of the form indicator. Compiled again when the CSV changes.
+    """
+    file_path = get_docket_sequence_file_path(form_indicator)
+    return _compile_docket_sequence_plan(
+        file_path, os.stat(file_path).st_mtime_ns, form_indicator
+    )
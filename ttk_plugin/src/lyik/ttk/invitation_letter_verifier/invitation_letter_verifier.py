@@ -22,6 +22,7 @@ from lyikpluginmanager.annotation import RequiredEnv
 from typing import Annotated, List, Dict, Any, Union
 from typing_extensions import Doc
 from lyik.ttk.utils.message import get_error_message
+from lyik.ttk.utils.record_sections import RecordSections
 import os
 import jwt
 import base64
@@ -99,7 +100,9 @@ class InvitationLetterVerifier(VerifyHandlerSpec):
                     )
 
                 # Step 3: Get the order_id from the record
-                full_form_record = UniversalModelWithCoverInvitationLetter(**context.record)
+                full_form_record = RecordSections(
+                    context.record, UniversalModelWithCoverInvitationLetter
+                )
                 order_id = (
                     full_form_record.visa_request_information.visa_request.order_id
                 )
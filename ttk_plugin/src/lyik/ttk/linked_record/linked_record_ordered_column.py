@@ -38,27 +38,13 @@ class LinkRecordColumnOrderPlugin(LinkRecordOrderSpec):
 
             file_path = os.path.join(mount_path, file_name)
             loader = LinkRecordOrderedMappingLoader(file_path=file_path)
-            config_data = loader.load_link_record_mapping_config()
+            ordered_mapping = loader.load_ordered_column_mapping()
 
-            if not config_data.get("enable", False):
-                logger.info("Link record column mapping is globally disabled.")
+            if ordered_mapping is None:
                 return None
 
-            ordered_fields = sorted(
-                [
-                    (entry["order"], entry["link_attribute"], entry["title"])
-                    for entry in config_data.get("order", [])
-                    if entry.get("enable", False)
-                    and not entry["link_attribute"].startswith("_")
-                ],
-                key=lambda x: x[0],
-            )
-
-            if not ordered_fields:
-                logger.info("No valid enabled fields found in the config.")
-                return None
-
-            return OrderedDict((field, title) for _, field, title in ordered_fields)
+            # The loader's mapping is shared between requests
+            return OrderedDict(ordered_mapping)
 
         except Exception as e:
             logger.exception(f"Error while building ordered mapping: {e}")
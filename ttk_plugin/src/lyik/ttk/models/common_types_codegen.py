@@ -0,0 +1,263 @@
+"""
+Hoists the enums and sub-models which are defined identically in several generated model
+modules into one shared module, which the modules then import.
+
+datamodel-code-generator writes every model file self-contained, so the same COUNTRY3,
+OPTION, GENDER, ... enums and Root* sub-models are created once per module. Run after
+generating the model files (`create_universal_model.run` does it for models/generated):
+
+    python -m lyik.ttk.models.common_types_codegen ttk_plugin/src/lyik/ttk/models/generated
+
+A class is hoisted when at least two modules define it with the same structure (its
+syntax tree, so quotes and formatting do not matter) and the classes it refers to are
+hoisted with it. Other variants of a class stay in their module.
+"""
+
+import argparse
+import ast
+import re
+from collections import defaultdict
+from pathlib import Path
+from typing import Dict, List, Set, Tuple
+
+from pydantic import BaseModel
+
+COMMON_MODULE = "_common_types"
+
+COMMON_MODULE_HEADER = """# generated by common_types_codegen, do not edit.
+# Enums and models defined identically in several modules of this package.
+"""
+
+
+class ClassSource(BaseModel):
+    name: str
+    source: str
+    # Syntax tree dump, equal for structurally identical classes
+    structure: str
+    # Names of the other top level classes of the module it refers to
+    dependencies: Tuple[str, ...] = ()
+
+
+class ModelModule(BaseModel):
+    path: Path
+    header: str
+    classes: List[ClassSource]
+
+
+class HoistReport(BaseModel):
+    common_module: Path
+    # Module path -> names now imported from the common module
+    hoisted: Dict[str, List[str]] = {}
+
+    @property
+    def class_count(self) -> int:
+        return len({name for names in self.hoisted.values() for name in names})
+
+    @property
+    def definitions_removed(self) -> int:
+        return sum(len(names) for names in self.hoisted.values()) - self.class_count
+
+
+def _referenced_names(node: ast.AST) -> Set[str]:
+    names = set()
+    for child in ast.walk(node):
+        if isinstance(child, ast.Name):
+            names.add(child.id)
+        elif isinstance(child, ast.Constant) and isinstance(child.value, str):
+            # Quoted forward references
+            names.update(re.findall(r"[A-Za-z_][A-Za-z0-9_]*", child.value))
+    return names
+
+
+def parse_module(path: Path) -> ModelModule:
+    text = path.read_text(encoding="utf-8")
+    lines = text.splitlines(keepends=True)
+    tree = ast.parse(text)
+    class_nodes = [node for node in tree.body if isinstance(node, ast.ClassDef)]
+    others = [
+        node
+        for node in tree.body
+        if not isinstance(node, (ast.ClassDef, ast.Import, ast.ImportFrom))
+        and not (isinstance(node, ast.Expr) and isinstance(node.value, ast.Constant))
+    ]
+    if others:
+        raise ValueError(
+            f"{path}: only imports and classes are supported at the top level, "
+            f"found {type(others[0]).__name__} on line {others[0].lineno}"
+        )
+    if not class_nodes:
+        return ModelModule(path=path, header=text, classes=[])
+
+    class_names = {node.name for node in class_nodes}
+    classes = []
+    for node in class_nodes:
+        start = (node.decorator_list[0] if node.decorator_list else node).lineno
+        source = "".join(lines[start - 1 : node.end_lineno]).rstrip() + "\n"
+        dependencies = (_referenced_names(node) & class_names) - {node.name}
+        classes.append(
+            ClassSource(
+                name=node.name,
+                source=source,
+                structure=ast.dump(node),
+                dependencies=tuple(sorted(dependencies)),
+            )
+        )
+    first = class_nodes[0]
+    header_end = (first.decorator_list[0] if first.decorator_list else first).lineno
+    header = "".join(lines[: header_end - 1]).rstrip() + "\n"
+    return ModelModule(path=path, header=header, classes=classes)
+
+
+def _choose_shared_classes(modules: List[ModelModule]) -> Dict[str, str]:
+    """
+    Name -> structure of the classes to hoist: the most common variant of each name, if at
+    least two modules can use it along with everything it refers to.
+    """
+    variants: Dict[str, Dict[str, int]] = defaultdict(lambda: defaultdict(int))
+    for module in modules:
+        for cls in module.classes:
+            variants[cls.name][cls.structure] += 1
+    chosen = {}
+    for name, counts in variants.items():
+        structure, count = max(counts.items(), key=lambda item: item[1])
+        if count >= 2:
+            chosen[name] = structure
+
+    by_module = [{cls.name: cls for cls in module.classes} for module in modules]
+    while True:
+        users: Dict[str, int] = defaultdict(int)
+        for classes in by_module:
+            for name in _hoistable(classes, chosen):
+                users[name] += 1
+        dropped = [name for name in chosen if users[name] < 2]
+        if not dropped:
+            return chosen
+        for name in dropped:
+            del chosen[name]
+
+
+def _hoistable(classes: Dict[str, ClassSource], chosen: Dict[str, str]) -> Set[str]:
+    """
+    The classes of one module which match the chosen variant, and so does everything
+    they refer to.
+    """
+    hoistable = {
+        name for name, cls in classes.items() if chosen.get(name) == cls.structure
+    }
+    changed = True
+    while changed:
+        changed = False
+        for name in list(hoistable):
+            if any(dep not in hoistable for dep in classes[name].dependencies):
+                hoistable.discard(name)
+                changed = True
+    return hoistable
+
+
+def _ordered(chosen: Dict[str, str], modules: List[ModelModule]) -> List[ClassSource]:
+    """
+    The first definition of each chosen class in order of appearance, each after the
+    classes it refers to.
+    """
+    definitions: Dict[str, ClassSource] = {}
+    for module in modules:
+        for cls in module.classes:
+            if chosen.get(cls.name) == cls.structure and cls.name not in definitions:
+                definitions[cls.name] = cls
+    ordered: List[ClassSource] = []
+    done: Set[str] = set()
+
+    def visit(name: str, path: Tuple[str, ...] = ()) -> None:
+        if name in done or name in path:
+            return
+        for dep in definitions[name].dependencies:
+            visit(dep, path + (name,))
+        done.add(name)
+        ordered.append(definitions[name])
+
+    for name in definitions:
+        visit(name)
+    return ordered
+
+
+def _import_header(header: str) -> str:
+    """
+    The import statements of a module header, without the generator comments.
+    """
+    lines = header.splitlines()
+    for index, line in enumerate(lines):
+        if line.startswith(("from ", "import ")):
+            return "\n".join(lines[index:]).rstrip() + "\n"
+    return ""
+
+
+def _render_module(header: str, imported: List[str], classes: List[str]) -> str:
+    parts = [header.rstrip() + "\n"]
+    if imported:
+        names = "".join(f"    {name},\n" for name in imported)
+        parts.append(f"\nfrom .{COMMON_MODULE} import (\n{names})\n")
+    for source in classes:
+        parts.append("\n\n" + source)
+    return "".join(parts)
+
+
+def hoist_common_types(paths: List[Path], common_module: Path) -> HoistReport:
+    """
+    Moves the classes shared by the modules at `paths` to `common_module` and rewrites
+    the modules which use them to import them. Run on freshly generated modules, an
+    existing `common_module` is overwritten.
+    """
+    modules = [parse_module(path) for path in paths if path != common_module]
+    chosen = _choose_shared_classes(modules)
+    report = HoistReport(common_module=common_module)
+    if not chosen:
+        return report
+
+    rewritten = []
+    for module in modules:
+        classes = {cls.name: cls for cls in module.classes}
+        hoisted = _hoistable(classes, chosen)
+        imported = [cls.name for cls in module.classes if cls.name in hoisted]
+        if not imported:
+            continue
+        report.hoisted[str(module.path)] = imported
+        kept = [cls.source for cls in module.classes if cls.name not in hoisted]
+        rewritten.append((module.path, _render_module(module.header, imported, kept)))
+
+    common = _render_module(
+        COMMON_MODULE_HEADER + "\n" + _import_header(modules[0].header),
+        [],
+        [cls.source for cls in _ordered(chosen, modules)],
+    )
+    common_module.write_text(common, encoding="utf-8")
+    for path, text in rewritten:
+        path.write_text(text, encoding="utf-8")
+    return report
+
+
+def hoist_package_common_types(package_dir: Path) -> HoistReport:
+    """
+    `hoist_common_types` for the model modules of a package directory.
+    """
+    common_module = package_dir / f"{COMMON_MODULE}.py"
+    paths = sorted(
+        path
+        for path in package_dir.glob("*.py")
+        if path.name != "__init__.py" and path != common_module
+    )
+    if common_module.exists():
+        raise ValueError(
+            f"{common_module} exists, regenerate the modules of {package_dir} first"
+        )
+    return hoist_common_types(paths, common_module)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("package_dir", type=Path)
+    args = parser.parse_args()
+    report = hoist_package_common_types(args.package_dir)
+    print(
+        f"Hoisted {report.class_count} classes into {report.common_module}, "
+        f"{report.definitions_removed} duplicate definitions removed"
+    )
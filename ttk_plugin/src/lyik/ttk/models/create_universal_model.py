@@ -1,7 +1,15 @@
 from typing import List, Type, Dict, Any, get_origin, get_args, Optional, Union, Tuple
-from pydantic import BaseModel, create_model, Field
+from pydantic import BaseModel, ConfigDict, create_model, Field
+import argparse
+import hashlib
+import importlib
+import importlib.util
 import os
 import json
+import shutil
+import time
+from concurrent.futures import ProcessPoolExecutor
+from importlib.metadata import version
 from pathlib import Path
 from enum import Enum
 
@@ -9,14 +17,7 @@ from importlib.resources import files, as_file
 import lyik.ttk.models.pydantic_v2 as py_template_pkg
 from datamodel_code_generator import generate
 from datamodel_code_generator import InputFileType, DataModelType
-
-from lyik.ttk.models.forms.schengentouristvisa import Schengentouristvisa
-from lyik.ttk.models.forms.indonesiaapplicationform import Indonesiaapplicationform
-from lyik.ttk.models.forms.saudiarabiaapplicationform import Saudiarabiaapplicationform
-from lyik.ttk.models.forms.singaporevisaapplicationform import (
-    Singaporevisaapplicationform,
-)
-from lyik.ttk.models.forms.uaevisaapplicationform import Uaevisaapplicationform
+from lyik.ttk.models.common_types_codegen import COMMON_MODULE, hoist_common_types
 
 
 class PydanticIntersectionBuilder:
@@ -343,120 +344,279 @@ class PydanticIntersectionBuilder:
         return Model.model_json_schema()
 
 
-def run():
-    # Step 1: Build the intersection model
-    UniversalModel = PydanticIntersectionBuilder.build_intersection_model(
-        models=[
-            Schengentouristvisa,
-            Indonesiaapplicationform,
-            Saudiarabiaapplicationform,
-            Singaporevisaapplicationform,
-            Uaevisaapplicationform,
-        ],
-        model_name="UniversalModel",
-    )
 
-    # Step 2: Save the generated model to a Python file using datamodel-code-generator
-    PydanticIntersectionBuilder.save_model_to_file_using_codegen(
-        UniversalModel,
-        output_path="ttk_plugin/src/lyik/ttk/models/generated/universal_model.py",
-    )
 
+# ------------------------- OUTPUTS -------------------------
+class UniversalModelOutput(BaseModel):
+    """
+    One generated universal model: the intersection of `forms`, written to `output_path`.
+    """
+
+    model_config = ConfigDict(frozen=True)
+
+    model_name: str
+    # "module:Class" of the forms, in lyik.ttk.models.forms
+    forms: Tuple[str, ...]
+    output_path: str
+
+
+FORMS_PACKAGE = "lyik.ttk.models.forms"
+GENERATED_DIR = "ttk_plugin/src/lyik/ttk/models/generated"
+
+SCHENGEN = "schengentouristvisa:Schengentouristvisa"
+INDONESIA = "indonesiavisaapplicationform:Indonesiavisaapplicationform"
+SAUDI_ARABIA = "saudiarabiaapplicationform:Saudiarabiavisaapplicationform"
+SINGAPORE = "singaporevisaapplicationform:Singaporevisaapplicationform"
+UAE = "uaevisaapplicationform:Uaevisaapplicationform"
+
+UNIVERSAL_MODEL_OUTPUTS: Tuple[UniversalModelOutput, ...] = (
+    UniversalModelOutput(
+        model_name="UniversalModel",
+        forms=(SCHENGEN, INDONESIA, SAUDI_ARABIA, SINGAPORE, UAE),
+        output_path=f"{GENERATED_DIR}/universal_model.py",
+    ),
     # Universal Models with specific fields to be required
-    # =============
     # Forms with Appointment Section
-    # =============
-    UniversalModelWithAppointment = PydanticIntersectionBuilder.build_intersection_model(
-        models=[
-            Schengentouristvisa,
-            # Indonesiaapplicationform,
-            Saudiarabiaapplicationform,
-            # Singaporevisaapplicationform,
-            # Uaevisaapplicationform,
-        ],
+    UniversalModelOutput(
         model_name="UniversalModelWithAppointment",
-    )
-
-    PydanticIntersectionBuilder.save_model_to_file_using_codegen(
-        UniversalModelWithAppointment,
-        output_path="ttk_plugin/src/lyik/ttk/models/generated/universal_model_with_appointment.py",
-    )
-
-    # =============
+        forms=(SCHENGEN, SAUDI_ARABIA),
+        output_path=f"{GENERATED_DIR}/universal_model_with_appointment.py",
+    ),
     # Forms with Submission Requires Docket status to be enabled
-    # =============
-    UniversalModelWithSubmissionRequiresDocketStatus = PydanticIntersectionBuilder.build_intersection_model(
-        models=[
-            Schengentouristvisa,
-            Indonesiaapplicationform,
-            # Saudiarabiaapplicationform,
-            Singaporevisaapplicationform,
-            # Uaevisaapplicationform,
-        ],
+    UniversalModelOutput(
         model_name="UniversalModelWithSubmissionRequiresDocketStatus",
-    )
-
-    PydanticIntersectionBuilder.save_model_to_file_using_codegen(
-        UniversalModelWithSubmissionRequiresDocketStatus,
-        output_path="ttk_plugin/src/lyik/ttk/models/generated/universal_model_with_submission_requires_docket_status.py",
-    )
-
-    # =============
+        forms=(SCHENGEN, INDONESIA, SINGAPORE),
+        output_path=f"{GENERATED_DIR}/universal_model_with_submission_requires_docket_status.py",
+    ),
     # Forms with Covering and Invitation Letter
-    # =============
-    UniversalModelWithCoverInvitationLetter = PydanticIntersectionBuilder.build_intersection_model(
-        models=[
-            Schengentouristvisa,
-            # Indonesiaapplicationform,
-            # Saudiarabiaapplicationform,
-            Singaporevisaapplicationform,
-            # Uaevisaapplicationform,
-        ],
+    UniversalModelOutput(
         model_name="UniversalModelWithCoverInvitationLetter",
-    )
-
-    PydanticIntersectionBuilder.save_model_to_file_using_codegen(
-        UniversalModelWithCoverInvitationLetter,
-        output_path="ttk_plugin/src/lyik/ttk/models/generated/universal_model_with_cover_invitation_letter.py",
-    )
-
-    # =============
+        forms=(SCHENGEN, SINGAPORE),
+        output_path=f"{GENERATED_DIR}/universal_model_with_cover_invitation_letter.py",
+    ),
     # Forms with Salary, Bank and ITR sections (Financial Documents)
-    # =============
-    UniversalModelWithAllFinancialDocuments = PydanticIntersectionBuilder.build_intersection_model(
-        models=[
-            Schengentouristvisa,
-            # Indonesiaapplicationform,
-            # Saudiarabiaapplicationform,
-            # Singaporevisaapplicationform,
-            # Uaevisaapplicationform,
-        ],
+    UniversalModelOutput(
         model_name="UniversalModelWithAllFinancialDocuments",
+        forms=(SCHENGEN,),
+        output_path=f"{GENERATED_DIR}/universal_model_with_all_financial_documents.py",
+    ),
+    # Forms with Itinerary, Accomodation and Ticketing (Shared Sections across primary and co-traveller)
+    UniversalModelOutput(
+        model_name="UniversalModelWithAllSharedSections",
+        forms=(SCHENGEN,),
+        output_path=f"{GENERATED_DIR}/universal_model_with_all_shared_sections.py",
+    ),
+)
+
+# Raw datamodel-code-generator output of each model, before the common types are
+# hoisted, and the fingerprints of the inputs it was generated from
+CODEGEN_CACHE_DIR_ENV = "TTK_CODEGEN_CACHE_DIR"
+DEFAULT_CODEGEN_CACHE_DIR = "ttk_plugin/build/universal_models"
+CODEGEN_WORKERS_ENV = "TTK_CODEGEN_WORKERS"
+MANIFEST_FILE = "manifest.json"
+
+
+# ------------------------- FINGERPRINTS -------------------------
+def _module_file(module_name: str) -> Path:
+    spec = importlib.util.find_spec(module_name)
+    if spec is None or not spec.origin:
+        raise ValueError(f"Module {module_name} not found")
+    return Path(spec.origin)
+
+
+def _input_files(output: UniversalModelOutput) -> List[Path]:
+    """
+    The files the output is generated from: its forms, the code generator templates
+    and this builder.
+    """
+    form_files = [
+        _module_file(f"{FORMS_PACKAGE}.{form.split(':')[0]}") for form in output.forms
+    ]
+    with as_file(files(py_template_pkg)) as path:
+        template_files = sorted(Path(os.fspath(path)).glob("*.jinja2"))
+    return [*form_files, *template_files, Path(__file__)]
+
+
+def output_fingerprint(output: UniversalModelOutput) -> str:
+    """
+    Hash of everything the generated file depends on. An output whose fingerprint did
+    not change since the last generation does not need to be generated again.
+    """
+    digest = hashlib.sha256()
+    digest.update(output.model_dump_json().encode())
+    digest.update(version("datamodel-code-generator").encode())
+    for path in _input_files(output):
+        digest.update(path.name.encode())
+        digest.update(path.read_bytes())
+    return digest.hexdigest()
+
+
+def _load_manifest(cache_dir: Path) -> Dict[str, str]:
+    try:
+        with open(cache_dir / MANIFEST_FILE, encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def _save_manifest(cache_dir: Path, manifest: Dict[str, str]) -> None:
+    with open(cache_dir / MANIFEST_FILE, "w", encoding="utf-8") as f:
+        json.dump(manifest, f, indent=2, sort_keys=True)
+
+
+# ------------------------- GENERATION -------------------------
+def _import_form(form: str) -> Type[BaseModel]:
+    module_name, class_name = form.split(":")
+    module = importlib.import_module(f"{FORMS_PACKAGE}.{module_name}")
+    return getattr(module, class_name)
+
+
+def generate_output(output: UniversalModelOutput, raw_path: str) -> Dict[str, float]:
+    """
+    Builds the intersection model of one output and writes its generated file to
+    `raw_path`. Runs in a worker process; returns the duration of each phase in ms.
+    """
+    timings = {}
+    started = time.perf_counter()
+    models = [_import_form(form) for form in output.forms]
+    timings["import"] = (time.perf_counter() - started) * 1000
+
+    # Nested model names are numbered per output, independent of the other outputs
+    PydanticIntersectionBuilder._nested_model_counter = 0
+    started = time.perf_counter()
+    model = PydanticIntersectionBuilder.build_intersection_model(
+        models=models, model_name=output.model_name
     )
+    timings["merge"] = (time.perf_counter() - started) * 1000
 
+    started = time.perf_counter()
     PydanticIntersectionBuilder.save_model_to_file_using_codegen(
-        UniversalModelWithAllFinancialDocuments,
-        output_path="ttk_plugin/src/lyik/ttk/models/generated/universal_model_with_all_financial_documents.py",
+        model, output_path=raw_path
     )
+    timings["codegen"] = (time.perf_counter() - started) * 1000
+    return timings
 
-    # =============
-    # Forms with Itinerary, Accomodation and Ticketing (Shared Sections across primary and co-traveller)
-    # =============
-    UniversalModelWithAllSharedSections = PydanticIntersectionBuilder.build_intersection_model(
-        models=[
-            Schengentouristvisa,
-            # Indonesiaapplicationform,
-            # Saudiarabiaapplicationform,
-            # Singaporevisaapplicationform,
-            # Uaevisaapplicationform,
-        ],
-        model_name="UniversalModelWithAllSharedSections",
+
+def _raw_path(cache_dir: Path, output: UniversalModelOutput) -> Path:
+    return cache_dir / Path(output.output_path).name
+
+
+def _generate_all(
+    outputs: List[UniversalModelOutput], cache_dir: Path, workers: int
+) -> Dict[str, Dict[str, float]]:
+    """
+    Generates the outputs, in parallel worker processes when there are several.
+    Returns the timings by model name.
+    """
+    raw_paths = {
+        output.model_name: str(_raw_path(cache_dir, output)) for output in outputs
+    }
+    if workers <= 1 or len(outputs) <= 1:
+        return {
+            output.model_name: generate_output(output, raw_paths[output.model_name])
+            for output in outputs
+        }
+    with ProcessPoolExecutor(max_workers=min(workers, len(outputs))) as executor:
+        futures = {
+            output.model_name: executor.submit(
+                generate_output, output, raw_paths[output.model_name]
+            )
+            for output in outputs
+        }
+        return {name: future.result() for name, future in futures.items()}
+
+
+def _print_timings(phases: Dict[str, float], outputs: Dict[str, Dict[str, float]]):
+    for name, timings in outputs.items():
+        details = ", ".join(f"{phase} {ms:.0f} ms" for phase, ms in timings.items())
+        print(f"  {name}: {details}")
+    for phase, ms in phases.items():
+        print(f"{phase}: {ms:.0f} ms")
+
+
+def run(force: bool = False, workers: Optional[int] = None):
+    """
+    Generates the universal models whose inputs changed since the last run, then
+    hoists the types they have in common into the generated package, on every run.
+    Paths are relative to the repository root.
+    """
+    phases: Dict[str, float] = {}
+    started = time.perf_counter()
+    cache_dir = Path(os.getenv(CODEGEN_CACHE_DIR_ENV, DEFAULT_CODEGEN_CACHE_DIR))
+    cache_dir.mkdir(parents=True, exist_ok=True)
+    if workers is None:
+        workers = int(os.getenv(CODEGEN_WORKERS_ENV, str(os.cpu_count() or 1)))
+
+    # Step 1: Fingerprint the inputs of each output and find the outdated ones
+    fingerprint_started = time.perf_counter()
+    manifest = _load_manifest(cache_dir)
+    fingerprints = {
+        output.model_name: output_fingerprint(output)
+        for output in UNIVERSAL_MODEL_OUTPUTS
+    }
+    outdated = [
+        output
+        for output in UNIVERSAL_MODEL_OUTPUTS
+        if force
+        or manifest.get(output.model_name) != fingerprints[output.model_name]
+        or not _raw_path(cache_dir, output).exists()
+    ]
+    phases["fingerprint"] = (time.perf_counter() - fingerprint_started) * 1000
+    for output in UNIVERSAL_MODEL_OUTPUTS:
+        if output not in outdated:
+            print(f"{output.model_name} is up to date")
+
+    # Step 2: Build the intersection models and generate their files with
+    # datamodel-code-generator
+    generate_started = time.perf_counter()
+    output_timings = {}
+    if outdated:
+        try:
+            output_timings = _generate_all(outdated, cache_dir, workers)
+        finally:
+            # Record the outputs which were generated, even if another one failed
+            for output in outdated:
+                if output.model_name in output_timings:
+                    manifest[output.model_name] = fingerprints[output.model_name]
+            _save_manifest(cache_dir, manifest)
+    phases["generate"] = (time.perf_counter() - generate_started) * 1000
+
+    # Step 3: Move the enums and sub-models common to the generated files to _common_types.py.
+    # Always run, from the cached raw files: it is cheap, and the hoister is not part of
+    # the fingerprints, so a change to it alone is applied too.
+    hoist_started = time.perf_counter()
+    generated_dir = Path(GENERATED_DIR)
+    common_module = generated_dir / f"{COMMON_MODULE}.py"
+    output_paths = [Path(output.output_path) for output in UNIVERSAL_MODEL_OUTPUTS]
+    for output, path in zip(UNIVERSAL_MODEL_OUTPUTS, output_paths):
+        shutil.copyfile(_raw_path(cache_dir, output), path)
+    report = hoist_common_types(paths=output_paths, common_module=common_module)
+    print(
+        f"Hoisted {report.class_count} classes into {report.common_module}, "
+        f"{report.definitions_removed} duplicate definitions removed"
     )
+    phases["hoist"] = (time.perf_counter() - hoist_started) * 1000
 
-    PydanticIntersectionBuilder.save_model_to_file_using_codegen(
-        UniversalModelWithAllSharedSections,
-        output_path="ttk_plugin/src/lyik/ttk/models/generated/universal_model_with_all_shared_sections.py",
+    phases["total"] = (time.perf_counter() - started) * 1000
+    print(
+        f"Generated {len(outdated)} of {len(UNIVERSAL_MODEL_OUTPUTS)} universal models"
     )
+    _print_timings(phases, output_timings)
+
 
 if __name__ == "__main__":
-    run()
+    parser = argparse.ArgumentParser(
+        description="Generates the universal models of models/generated"
+    )
+    parser.add_argument(
+        "--force",
+        action="store_true",
+        help="Generate all the models, even those whose inputs did not change",
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        help=f"Worker processes, defaults to ${CODEGEN_WORKERS_ENV} or the CPU count",
+    )
+    args = parser.parse_args()
+    run(force=args.force, workers=args.workers)
@@ -0,0 +1,28 @@
+import importlib
+from typing import Any, Dict
+
+# The form models are imported on first access (PEP 562), so unused forms cost nothing
+_MODELS: Dict[str, str] = {
+    "Indonesiavisaapplicationform": "indonesiavisaapplicationform",
+    "Japanvisaapplicationform": "japanvisaapplicationform",
+    "Mexicovisaapplicationform": "mexicovisaapplicationform",
+    "Saudiarabiavisaapplicationform": "saudiarabiaapplicationform",
+    "Schengentouristvisa": "schengentouristvisa",
+    "Singaporevisaapplicationform": "singaporevisaapplicationform",
+    "Uaevisaapplicationform": "uaevisaapplicationform",
+}
+
+__all__ = list(_MODELS)
+
+
+def __getattr__(name: str) -> Any:
+    module_name = _MODELS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f".{module_name}", __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_MODELS))
@@ -1,2 +1,28 @@
-from .universal_model import UniversalModel
-from .universal_model_with_appointment import UniversalModelWithAppointment
\ No newline at end of file
+import importlib
+from typing import Any, Dict
+
+# The generated models are imported on first access (PEP 562). Their schemas are
+# built on first validation (defer_build), so unused models cost nothing.
+_MODELS: Dict[str, str] = {
+    "UniversalModel": "universal_model",
+    "UniversalModelWithAppointment": "universal_model_with_appointment",
+    "UniversalModelWithSubmissionRequiresDocketStatus": "universal_model_with_submission_requires_docket_status",
+    "UniversalModelWithCoverInvitationLetter": "universal_model_with_cover_invitation_letter",
+    "UniversalModelWithAllFinancialDocuments": "universal_model_with_all_financial_documents",
+    "UniversalModelWithAllSharedSections": "universal_model_with_all_shared_sections",
+}
+
+__all__ = list(_MODELS)
+
+
+def __getattr__(name: str) -> Any:
+    module_name = _MODELS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f".{module_name}", __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_MODELS))
@@ -10,289 +10,57 @@ from typing import Any, Dict, List, Optional, Union
 
 from pydantic import BaseModel, ConfigDict, Field
 
-
-class ACCOMMODATIONARRANGEMENT(Enum):
-    BOOKED = 'BOOKED'
-    TTK_ASSITANCE = 'TTK_ASSITANCE'
-    WITH_FAMILY = 'WITH_FAMILY'
-
-
-class ADDONSERVICEAPPOINTMENT(Enum):
-    YES = 'YES'
-
-
-class ADDRESSPROOFTYPE(Enum):
-    AADHAAR = 'AADHAAR'
-    DL = 'DL'
-    ELECTRICITY = 'ELECTRICITY'
-    GAS = 'GAS'
-    HR_LETTER = 'HR_LETTER'
-    RATION = 'RATION'
-    RENTAL_NOTARY = 'RENTAL_NOTARY'
-
-
-class CIVILMARITALSTATUS(Enum):
-    DIVORCED = 'DIVORCED'
-    MARRIED = 'MARRIED'
-    OTHER = 'OTHER'
-    SEPARATED = 'SEPARATED'
-    SINGLE = 'SINGLE'
-    WIDOWED = 'WIDOWED'
-
-
-class CONFIRMVIEWEDDATA(Enum):
-    YES = 'YES'
-
-
-class COUNTRY3(Enum):
-    ABW = 'ABW'
-    AFG = 'AFG'
-    AGO = 'AGO'
-    AIA = 'AIA'
-    ALB = 'ALB'
-    AND = 'AND'
-    ARE = 'ARE'
-    ARG = 'ARG'
-    ARM = 'ARM'
-    ASM = 'ASM'
-    ATA = 'ATA'
-    ATF = 'ATF'
-    ATG = 'ATG'
-    AUS = 'AUS'
-    AUT = 'AUT'
-    AZE = 'AZE'
-    BDI = 'BDI'
-    BEL = 'BEL'
-    BEN = 'BEN'
-    BES = 'BES'
-    BFA = 'BFA'
-    BGD = 'BGD'
-    BGR = 'BGR'
-    BHR = 'BHR'
-    BHS = 'BHS'
-    BIH = 'BIH'
-    BLM = 'BLM'
-    BLR = 'BLR'
-    BLZ = 'BLZ'
-    BMU = 'BMU'
-    BOL = 'BOL'
-    BRA = 'BRA'
-    BRB = 'BRB'
-    BRN = 'BRN'
-    BTN = 'BTN'
-    BVT = 'BVT'
-    BWA = 'BWA'
-    CAF = 'CAF'
-    CAN = 'CAN'
-    CCK = 'CCK'
-    CHE = 'CHE'
-    CHL = 'CHL'
-    CHN = 'CHN'
-    CIV = 'CIV'
-    CMR = 'CMR'
-    COD = 'COD'
-    COG = 'COG'
-    COK = 'COK'
-    COL = 'COL'
-    COM = 'COM'
-    CPV = 'CPV'
-    CRI = 'CRI'
-    CUB = 'CUB'
-    CUW = 'CUW'
-    CXR = 'CXR'
-    CYM = 'CYM'
-    CYP = 'CYP'
-    CZE = 'CZE'
-    DEU = 'DEU'
-    DJI = 'DJI'
-    DMA = 'DMA'
-    DNK = 'DNK'
-    DOM = 'DOM'
-    DZA = 'DZA'
-    ECU = 'ECU'
-    EGY = 'EGY'
-    ERI = 'ERI'
-    ESH = 'ESH'
-    ESP = 'ESP'
-    EST = 'EST'
-    ETH = 'ETH'
-    FIN = 'FIN'
-    FJI = 'FJI'
-    FLK = 'FLK'
-    FRA = 'FRA'
-    FRO = 'FRO'
-    FSM = 'FSM'
-    GAB = 'GAB'
-    GBR = 'GBR'
-    GEO = 'GEO'
-    GGY = 'GGY'
-    GHA = 'GHA'
-    GIB = 'GIB'
-    GIN = 'GIN'
-    GLP = 'GLP'
-    GMB = 'GMB'
-    GNB = 'GNB'
-    GNQ = 'GNQ'
-    GRC = 'GRC'
-    GRD = 'GRD'
-    GRL = 'GRL'
-    GTM = 'GTM'
-    GUF = 'GUF'
-    GUM = 'GUM'
-    GUY = 'GUY'
-    HKG = 'HKG'
-    HMD = 'HMD'
-    HND = 'HND'
-    HRV = 'HRV'
-    HTI = 'HTI'
-    HUN = 'HUN'
-    IDN = 'IDN'
-    IMN = 'IMN'
-    IND = 'IND'
-    IOT = 'IOT'
-    IRL = 'IRL'
-    IRN = 'IRN'
-    IRQ = 'IRQ'
-    ISL = 'ISL'
-    ISR = 'ISR'
-    ITA = 'ITA'
-    JAM = 'JAM'
-    JEY = 'JEY'
-    JOR = 'JOR'
-    JPN = 'JPN'
-    KAZ = 'KAZ'
-    KEN = 'KEN'
-    KGZ = 'KGZ'
-    KHM = 'KHM'
-    KIR = 'KIR'
-    KNA = 'KNA'
-    KOR = 'KOR'
-    KWT = 'KWT'
-    LAO = 'LAO'
-    LBN = 'LBN'
-    LBR = 'LBR'
-    LBY = 'LBY'
-    LCA = 'LCA'
-    LIE = 'LIE'
-    LKA = 'LKA'
-    LSO = 'LSO'
-    LTU = 'LTU'
-    LUX = 'LUX'
-    LVA = 'LVA'
-    MAC = 'MAC'
-    MAF = 'MAF'
-    MAR = 'MAR'
-    MCO = 'MCO'
-    MDA = 'MDA'
-    MDG = 'MDG'
-    MDV = 'MDV'
-    MEX = 'MEX'
-    MHL = 'MHL'
-    MKD = 'MKD'
-    MLI = 'MLI'
-    MLT = 'MLT'
-    MMR = 'MMR'
-    MNE = 'MNE'
-    MNG = 'MNG'
-    MNP = 'MNP'
-    MOZ = 'MOZ'
-    MRT = 'MRT'
-    MSR = 'MSR'
-    MTQ = 'MTQ'
-    MUS = 'MUS'
-    MWI = 'MWI'
-    MYS = 'MYS'
-    MYT = 'MYT'
-    NAM = 'NAM'
-    NCL = 'NCL'
-    NER = 'NER'
-    NFK = 'NFK'
-    NGA = 'NGA'
-    NIC = 'NIC'
-    NIU = 'NIU'
-    NLD = 'NLD'
-    NOR = 'NOR'
-    NPL = 'NPL'
-    NRU = 'NRU'
-    NZL = 'NZL'
-    OMN = 'OMN'
-    PAK = 'PAK'
-    PAN = 'PAN'
-    PCN = 'PCN'
-    PER = 'PER'
-    PHL = 'PHL'
-    PLW = 'PLW'
-    PNG = 'PNG'
-    POL = 'POL'
-    PRI = 'PRI'
-    PRK = 'PRK'
-    PRT = 'PRT'
-    PRY = 'PRY'
-    PSE = 'PSE'
-    PYF = 'PYF'
-    QAT = 'QAT'
-    REU = 'REU'
-    ROU = 'ROU'
-    RUS = 'RUS'
-    RWA = 'RWA'
-    SAU = 'SAU'
-    SDN = 'SDN'
-    SEN = 'SEN'
-    SGP = 'SGP'
-    SGS = 'SGS'
-    SHN = 'SHN'
-    SJM = 'SJM'
-    SLB = 'SLB'
-    SLE = 'SLE'
-    SLV = 'SLV'
-    SMR = 'SMR'
-    SOM = 'SOM'
-    SPM = 'SPM'
-    SRB = 'SRB'
-    SSD = 'SSD'
-    STP = 'STP'
-    SUR = 'SUR'
-    SVK = 'SVK'
-    SVN = 'SVN'
-    SWE = 'SWE'
-    SWZ = 'SWZ'
-    SXM = 'SXM'
-    SYC = 'SYC'
-    SYR = 'SYR'
-    TCA = 'TCA'
-    TCD = 'TCD'
-    TGO = 'TGO'
-    THA = 'THA'
-    TJK = 'TJK'
-    TKL = 'TKL'
-    TKM = 'TKM'
-    TLS = 'TLS'
-    TON = 'TON'
-    TTO = 'TTO'
-    TUN = 'TUN'
-    TUR = 'TUR'
-    TUV = 'TUV'
-    TWN = 'TWN'
-    TZA = 'TZA'
-    UGA = 'UGA'
-    UKR = 'UKR'
-    UMI = 'UMI'
-    URY = 'URY'
-    USA = 'USA'
-    UZB = 'UZB'
-    VAT = 'VAT'
-    VCT = 'VCT'
-    VEN = 'VEN'
-    VGB = 'VGB'
-    VIR = 'VIR'
-    VNM = 'VNM'
-    VUT = 'VUT'
-    WLF = 'WLF'
-    WSM = 'WSM'
-    YEM = 'YEM'
-    ZAF = 'ZAF'
-    ZMB = 'ZMB'
-    ZWE = 'ZWE'
+from ._common_types import (
+    ACCOMMODATIONARRANGEMENT,
+    ADDONSERVICEAPPOINTMENT,
+    ADDRESSPROOFTYPE,
+    CIVILMARITALSTATUS,
+    CONFIRMVIEWEDDATA,
+    COUNTRY3,
+    HOURSELECT,
+    MINUTESELECT,
+    OPTION,
+    PHOTOGRAPHAPPOINTMENT,
+    RootAccomodationAccommodationChoice,
+    RootAccomodationAddOnService,
+    RootAccomodationInvitationDetails,
+    RootAppointmentAppointmentScheduled,
+    RootAppointmentEarliestAppointmentDate,
+    RootBankStatementUpload,
+    RootConsultantInfoAdditionalDocumentsAdditionaldocumentgroupAdditionalDocumentsCard,
+    RootDocketInfoOperationCard,
+    RootLetsGetStarted,
+    RootPhotographAddOnServicePhoto,
+    RootPhotographPassportPhoto,
+    RootResidentialAddressResidentInOtherCountry,
+    RootResidentialAddressResidentialAddressCardV1,
+    RootResidentialAddressResidentialAddressCardV2,
+    RootSalarySlipUpload,
+    RootScratchPad,
+    RootSubmitInfoConfirm,
+    RootTicketingAddOnService,
+    RootTicketingFlightTickets,
+    SAMEACCOMMODATIONASPRIMARY,
+    SAMEASPASSADDR,
+    SAMEFLIGHTTICKETASPRIMARY,
+    SKIPBANKSTATEMENTS,
+    SKIPSALARYSLIPS,
+    TICKETS,
+    VISAMODE,
+    VISATYPE,
+    RootAppointment,
+    RootBankStatement,
+    RootConsultantInfoAdditionalDocumentsAdditionaldocumentgroup,
+    RootDocketInfo,
+    RootPhotograph,
+    RootResidentialAddress,
+    RootSalarySlip,
+    RootSharedTravellInfoShared,
+    RootTicketingTickets,
+    FieldGrpRootConsultantInfoAdditionalDocuments,
+    RootSharedTravellInfo,
+    RootTicketing,
+)
 
 
 class GENDER(Enum):
@@ -302,48 +70,12 @@ class GENDER(Enum):
     T = 'T'
 
 
-class HOURSELECT(Enum):
-    integer_10 = 10
-    integer_11 = 11
-    integer_12 = 12
-    integer_13 = 13
-    integer_14 = 14
-    integer_15 = 15
-    integer_16 = 16
-    integer_17 = 17
-    integer_18 = 18
-    integer_19 = 19
-    integer_20 = 20
-    integer_8 = 8
-    integer_9 = 9
-
-
-class MINUTESELECT(Enum):
-    integer_1 = 1
-    integer_10 = 10
-    integer_15 = 15
-    integer_20 = 20
-    integer_25 = 25
-    integer_30 = 30
-    integer_35 = 35
-    integer_40 = 40
-    integer_45 = 45
-    integer_5 = 5
-    integer_50 = 50
-    integer_55 = 55
-
-
 class NUMBEROFENTRIES(Enum):
     Multiple = 'Multiple'
     Single = 'Single'
     Two = 'Two'
 
 
-class OPTION(Enum):
-    NO = 'NO'
-    YES = 'YES'
-
-
 class PASSPORTTYPE(Enum):
     DIPLOMATIC = 'DIPLOMATIC'
     NORMAL = 'NORMAL'
@@ -355,32 +87,6 @@ class PASSPORTTYPE(Enum):
     TRAVEL_CERTIFICATE = 'TRAVEL_CERTIFICATE'
 
 
-class PHOTOGRAPHAPPOINTMENT(Enum):
-    YES = 'YES'
-
-
-class RootAccomodationAccommodationChoice(BaseModel):
-    accommodation_option: Optional[Union[ACCOMMODATIONARRANGEMENT, str]] = Field(
-        None,
-        description='Select Option',
-        title='Please let us know how your stay is arranged:',
-    )
-    model_config = ConfigDict(
-        extra="allow", serialize_by_alias=True, use_enum_values=True
-    )
-
-
-class RootAccomodationAddOnService(BaseModel):
-    display_add_on: Optional[str] = Field(
-        None,
-        description='<!-- <div style="\n  display: flex;\n  align-items: left;\n  justify-content: left;\n  text-align: left;\n  margin-left: 15px;\n">\nTo know the cost, please refer to the <strong>&nbsp;Add-On Cart Section</strong>.\n</div> -->\n<!DOCTYPE html>\n<html lang="en">\n<head>\n  <meta charset="UTF-8">\n  <title>Centered Paragraph</title>\n  <style>\n    .message-box {\n      font-family: \'Inter\', sans-serif;\n      font-weight: 425;\n      font-size: 16px;\n      text-align: left;\n      \n    }\n  </style>\n</head>\n<body>\n    <div class="message-box">\n      <span>\n        <span style="font-weight: 600;"><b>Dummy Accommodation Assistance</b></span> <br>\n        Need help booking your dummy accommodation?  Visit the <b>Add-On Services</b> Cart to avail this service for a small fee.\n      </span>\n    </div>\n</body>\n</html>',
-        title='Display Field',
-    )
-    model_config = ConfigDict(
-        extra="allow", serialize_by_alias=True, use_enum_values=True
-    )
-
-
 class RootAccomodationBookedAppointment(BaseModel):
     booking_upload: Optional[Union[str, Dict[str, Any]]] = Field(
         None, description='Upload a PDF', title='Accommodation Booking'
@@ -416,22 +122,10 @@ class RootAccomodationBookedAppointment(BaseModel):
         None, description='DD/MM/YYYY', title='End Date / Check-out Date'
     )
     model_config = ConfigDict(
-        extra="allow", serialize_by_alias=True, use_enum_values=True
-    )
-
-
-class RootAccomodationInvitationDetails(BaseModel):
-    passport_bio_page: Optional[Union[str, Dict[str, Any]]] = Field(
-        None, description='Upload a Image/PDF', title="Front Page of Inviter's Passport"
-    )
-    visa_copy_permit: Optional[Union[str, Dict[str, Any]]] = Field(
-        None, description='Upload a Image/PDF', title='Visa Copy / Resident Permit Card'
-    )
-    accommodation_proof: Optional[Union[str, Dict[str, Any]]] = Field(
-        None, description='Upload a Image/PDF', title="Inviter's Accommodation Proof"
-    )
-    model_config = ConfigDict(
-        extra="allow", serialize_by_alias=True, use_enum_values=True
+        extra="allow",
+        serialize_by_alias=True,
+        use_enum_values=True,
+        defer_build=True,
     )
 
 
@@ -440,114 +134,10 @@ class RootAdditionalDetailsTravelInfo(BaseModel):
         None, description='Select Option', title='Country of Travel'
     )
     model_config = ConfigDict(
-        extra="allow", serialize_by_alias=True, use_enum_values=True
-    )
-
-
-class RootAppointmentAppointmentScheduled(BaseModel):
-    scheduled_location: Optional[str] = Field(
-        None,
-        description='Enter Scheduled Location (City)',
-        title='Scheduled Location (City)',
-    )
-    scheduled_date: Optional[date] = Field(
-        None, description='DD/MM/YYYY', title='Scheduled Date'
-    )
-    scheduled_hour: Optional[Union[HOURSELECT, str]] = Field(
-        None, description='Select Option', title='Scheduled Time (Hour)'
-    )
-    scheduled_minute: Optional[Union[MINUTESELECT, str]] = Field(
-        None, description='Select Option', title='Scheduled Time (Minutes)'
-    )
-    upload_appointment: Optional[Union[str, Dict[str, Any]]] = Field(
-        None, description='Upload a Image/PDF', title='Appointment Document'
-    )
-    model_config = ConfigDict(
-        extra="allow", serialize_by_alias=True, use_enum_values=True
-    )
-
-
-class RootAppointmentEarliestAppointmentDate(BaseModel):
-    location_city: Optional[str] = Field(
-        None, description='Enter Location (City)', title='Location (City)'
-    )
-    earliest_available_date: Optional[str] = Field(
-        None,
-        description='Select location to see Earliest Date',
-        title='Earliest Available Date',
-    )
-    cta_get_dropdown_values: Optional[str] = Field(
-        None, description='Refresh dropdown values', title='Refresh'
-    )
-    appointment_city_dropdown_values: Optional[str] = Field(None, title='')
-    appointment_city_dates: Optional[str] = Field(None, title='')
-    business_days: Optional[str] = Field(None, title='')
-    model_config = ConfigDict(
-        extra="allow", serialize_by_alias=True, use_enum_values=True
-    )
-
-
-class RootBankStatementUpload(BaseModel):
-    display_bank_statements_instructions: Optional[str] = Field(
-        None,
-        description='<!-- <div style="\n  display: flex;\n  justify-content: center;\n  align-items: center;\n  text-align: center;\n  width: 100%;\n  padding: 16px;\n  font-size: 14px;\n  font-weight: 400;\n  color: #000;\n  line-height: 1.5;\n">\n  <p style="margin: 0;">\n    If you’d like us to review your Salary Slips to make sure it meets the guidelines, please upload it here.\n    If your current employment is under 3 months, submit the payslip from your previous employer\n  </p>\n</div> -->\n<!DOCTYPE html>\n<html lang="en">\n<head>\n  <meta charset="UTF-8">\n  <title>Centered Paragraph</title>\n  <style>\n    .center-wrapper {\n      display: flex;\n      justify-content: center;\n      align-items: center;\n    }\n\n    .message-box {\n      /* width: 1060px; */\n      font-family: \'Inter\', sans-serif;\n      font-weight: 500;\n      font-size: 16px;\n      line-height: 32px;\n      color: #000000;\n      text-align: center;\n    }\n  </style>\n</head>\n<body>\n  <div class="center-wrapper">\n    <div class="message-box">\n        If you’d like us to <strong> review </strong> your Bank Statements to make sure it meets the guidelines, please upload it here.\n    </div>\n  </div>\n</body>\n</html>',
-        title='Display Field',
-    )
-    bank_statements: Optional[Union[str, Dict[str, Any]]] = Field(
-        None, description='Upload a file', title='Bank Statements (Optional)'
-    )
-    model_config = ConfigDict(
-        extra="allow", serialize_by_alias=True, use_enum_values=True
-    )
-
-
-class RootConsultantInfoAdditionalDocumentsAdditionaldocumentgroupAdditionalDocumentsCard(
-    BaseModel
-):
-    display_card_9: Optional[str] = Field(
-        None,
-        description='<div style="\ndisplay: flex;\njustify-content: center;\nalign-items: center;">\n\n<div style="\n  text-align: center;\n  /* width: 1060px; */\n  font-family: \'Inter\', sans-serif;\n  font-weight: 500;\n  font-size: 16px;\n  line-height: 32px;\n  color: #000000;\n  text-align: center;\n">\nUpload an additional document required for the application:\n</div>\n\n</div> ',
-        title='Display Field',
-    )
-    document_name: Optional[str] = Field(
-        None, description='Enter Name of the document', title='Name of the document'
-    )
-    document_description: Optional[str] = Field(
-        None, description='Enter Document Description', title='Document Description'
-    )
-    file_upload: Optional[Union[str, Dict[str, Any]]] = Field(
-        None, description='Upload a Image/PDF', title='File Upload'
-    )
-    model_config = ConfigDict(
-        extra="allow", serialize_by_alias=True, use_enum_values=True
-    )
-
-
-class RootDocketInfoOperationCard(BaseModel):
-    operation_type: Optional[str] = Field(
-        None, description='Select Operation type', title='Select Operation'
-    )
-    model_config = ConfigDict(
-        extra="allow", serialize_by_alias=True, use_enum_values=True
-    )
-
-
-class RootLetsGetStarted(BaseModel):
-    traveler_details_header: Optional[str] = Field(None, title='')
-    instruction_display: Optional[str] = Field(
-        None,
-        description='<!DOCTYPE html>\n<html lang="en">\n<head>\n  <meta charset="UTF-8">\n  <title>Visa Application Journey</title>\n</head>\n<body>\n  <div style="margin:0 auto; padding:40px 20px;color:#333;">\n    <div style="margin-left: 3vh;">\n      <!-- Top row: SVG + headlines -->\n      <div style="display:flex; align-items:flex-start;align-items: center;margin: auto;justify-content: center;margin-left: auto;">\n        <div style="margin-left: 3vh;">\n          <svg width="162" height="148" viewBox="0 0 162 148" fill="none" xmlns="http://www.w3.org/2000/svg">\n            <g clip-path="url(#clip0_25384_203626)">\n              <path d="M109.203 2.3816L14.3616 15.1878C10.5764 15.6989 7.92215 19.1818 8.43327 22.9671L19.4375 104.463C19.9486 108.248 23.4315 110.903 27.2168 110.391L122.058 97.5852C125.844 97.0741 128.498 93.5912 127.987 89.8059L116.982 8.30998C116.471 4.52471 112.988 1.87049 109.203 2.3816Z" fill="white" stroke="black" style="fill:white;fill-opacity:1;stroke:black;stroke-opacity:1;" stroke-width="1.98347" stroke-miterlimit="10"/>\n              <path d="M108.25 1.06129L13.4085 13.8675C9.62325 14.3786 6.96903 17.8615 7.48014 21.6468L18.4843 103.143C18.9955 106.928 22.4784 109.582 26.2636 109.071L121.105 96.2649C124.89 95.7538 127.545 92.2709 127.034 88.4856L116.029 6.98967C115.518 3.2044 112.035 0.550174 108.25 1.06129Z" fill="white" stroke="#1C4BA0" style="fill:white;fill-opacity:1;stroke:#1C4BA0;stroke:color(display-p3 0.1098 0.2941 0.6275);stroke-opacity:1;" stroke-width="1.98347" stroke-miterlimit="10"/>\n              <path d="M64.8799 65.1856C78.556 65.1856 89.6427 54.099 89.6427 40.4229C89.6427 26.7468 78.556 15.6602 64.8799 15.6602C51.2038 15.6602 40.1172 26.7468 40.1172 40.4229C40.1172 54.099 51.2038 65.1856 64.8799 65.1856Z" stroke="#1D6ECE" style="stroke:#1D6ECE;stroke:color(display-p3 0.1137 0.4314 0.8078);stroke-opacity:1;" stroke-width="1.20052" stroke-miterlimit="10"/>\n              <path d="M61.5469 15.875L68.169 64.9475" stroke="#1D6ECE" style="stroke:#1D6ECE;stroke:color(display-p3 0.1137 0.4314 0.8078);stroke-opacity:1;" stroke-width="1.20052" stroke-miterlimit="10"/>\n              <path d="M89.4103 37.0977L40.3594 43.7197" stroke="#1D6ECE" style="stroke:#1D6ECE;stroke:color(display-p3 0.1137 0.4314 0.8078);stroke-opacity:1;" stroke-width="1.20052" stroke-miterlimit="10"/>\n              <path d="M61.5613 15.875C60.9358 16.4143 49.1368 26.7249 51.5311 42.6438C53.8391 58.0234 67.2343 64.4945 68.1834 64.9259" stroke="#1D6ECE" style="stroke:#1D6ECE;stroke:color(display-p3 0.1137 0.4314 0.8078);stroke-opacity:1;" stroke-width="1.20052" stroke-miterlimit="10"/>\n              <path d="M61.5469 15.875C62.3018 16.2201 76.4088 23.0364 78.3286 39.0415C80.1836 54.4859 68.9671 64.2788 68.169 64.9475" stroke="#1D6ECE" style="stroke:#1D6ECE;stroke:color(display-p3 0.1137 0.4314 0.8078);stroke-opacity:1;" stroke-width="1.20052" stroke-miterlimit="10"/>\n              <path d="M40.6484 34.968C45.2861 32.7031 51.4983 29.0362 63.0816 27.4831C73.2628 26.1242 81.6105 27.5694 86.7011 28.7558" stroke="#1D6ECE" style="stroke:#1D6ECE;stroke:color(display-p3 0.1137 0.4314 0.8078);stroke-opacity:1;" stroke-width="1.25272" stroke-miterlimit="10"/>\n              <path d="M43 52.1498C48.069 53.1204 55.0362 54.997 66.6195 53.4224C76.7791 52.0419 84.4582 48.4397 89.0527 45.9375" stroke="#1D6ECE" style="stroke:#1D6ECE;stroke:color(display-p3 0.1137 0.4314 0.8078);stroke-opacity:1;" stroke-width="1.25272" stroke-miterlimit="10"/>\n              <path d="M47.6363 76.9762L53.0901 88.4945L53.2371 88.4746L55.4484 75.9214L59.1611 75.4201L55.8393 91.9981L51.5233 92.5809L43.9159 77.4786L47.6363 76.9762ZM64.4168 74.7104L66.5557 90.5511L63.2066 91.0033L61.0677 75.1626L64.4168 74.7104ZM76.3807 77.7338C76.2346 77.1182 75.9036 76.6693 75.3877 76.3872C74.8718 76.1051 74.2117 76.0183 73.4072 76.1269C72.8607 76.2007 72.4096 76.3404 72.0541 76.5459C71.6978 76.7463 71.4373 76.9941 71.2724 77.2894C71.1126 77.584 71.0557 77.9015 71.1017 78.2418C71.1297 78.5268 71.2224 78.7663 71.3799 78.9603C71.5425 79.1536 71.7502 79.312 72.0032 79.4353C72.2554 79.5535 72.5413 79.6488 72.8608 79.7212C73.1797 79.7884 73.5171 79.8373 73.873 79.868L75.3422 80.0162C76.054 80.0776 76.7161 80.1982 77.3285 80.378C77.9408 80.5579 78.4838 80.8075 78.9575 81.1268C79.4311 81.4461 79.8184 81.8454 80.1194 82.3245C80.4255 82.803 80.6257 83.3719 80.72 84.0312C80.8458 85.0013 80.7117 85.8753 80.318 86.653C79.9286 87.4249 79.3015 88.0688 78.4366 88.5846C77.5761 89.0946 76.5013 89.4366 75.2122 89.6106C73.9334 89.7833 72.7931 89.7378 71.7914 89.474C70.7948 89.2095 69.9791 88.729 69.3443 88.0324C68.7139 87.3299 68.3088 86.4106 68.1292 85.2745L71.37 84.8369C71.4778 85.3632 71.6898 85.7861 72.006 86.1057C72.3267 86.4194 72.7261 86.6359 73.2042 86.7551C73.6868 86.8685 74.2169 86.8861 74.7944 86.8082C75.3616 86.7316 75.8429 86.5826 76.2383 86.3612C76.6388 86.1391 76.9353 85.8654 77.1276 85.5401C77.32 85.2149 77.3904 84.8615 77.3389 84.4799C77.2909 84.1241 77.1448 83.8393 76.9006 83.6255C76.6616 83.411 76.3296 83.2458 75.9044 83.13C75.4843 83.0134 74.9762 82.9245 74.3798 82.8633L72.5965 82.663C71.2171 82.5185 70.094 82.153 69.2273 81.5664C68.3605 80.9799 67.8507 80.101 67.6978 78.9298C67.5631 77.9714 67.7052 77.099 68.1241 76.3126C68.5481 75.5256 69.1867 74.8697 70.04 74.3449C70.8932 73.8202 71.8973 73.4798 73.0524 73.3238C74.2281 73.1651 75.2814 73.2276 76.2123 73.5115C77.1483 73.7946 77.9097 74.2615 78.4963 74.9121C79.083 75.5627 79.4477 76.3588 79.5906 77.3003L76.3807 77.7338ZM85.9525 87.932L82.3636 88.4166L85.6931 71.8375L90.0091 71.2547L97.6087 86.3581L94.0198 86.8427L88.4017 75.1576L88.278 75.1743L85.9525 87.932ZM84.8874 81.7358L93.3647 80.5912L93.7177 83.2055L85.2404 84.3502L84.8874 81.7358Z" fill="#20166D" style="fill:#20166D;fill:color(display-p3 0.1255 0.0863 0.4275);fill-opacity:1;"/>\n              <path d="M158.026 40.3742C161.236 43.1668 161.549 48.0471 158.757 51.2572L140.671 71.9792L149.231 123.419L142.654 130.961L122.115 93.2493L110.527 106.533L112.85 124.411L108.648 128.926L96.8778 110.5L77.0171 101.34L80.9057 96.5637L98.9135 96.4333L110.501 83.1493L70.3359 67.934L76.9127 60.3916L129.031 61.9053L147.117 41.1833C149.909 37.9732 154.79 37.6339 158 40.4264L158.026 40.3742Z" fill="white" stroke="#1C4BA0" style="fill:white;fill-opacity:1;stroke:#1C4BA0;stroke:color(display-p3 0.1098 0.2941 0.6275);stroke-opacity:1;" stroke-width="2.60982" stroke-miterlimit="10"/>\n              <path d="M92.204 120.426C92.0735 120.608 91.943 120.765 91.8125 120.948" stroke="#1C4BA0" style="stroke:#1C4BA0;stroke:color(display-p3 0.1098 0.2941 0.6275);stroke-opacity:1;" stroke-width="1.30491" stroke-linecap="round" stroke-linejoin="round" stroke-dasharray="2.61 2.61"/>\n              <path d="M88.5436 124.913C81.5754 132.612 72.5715 138.484 62.6803 141.642C50.7534 145.453 31.3624 148.715 21.0536 139.32C17.6608 136.24 15.312 128.776 21.3668 126.871C22.75 126.427 24.603 126.845 25.0727 128.202C25.6469 129.846 23.9244 131.386 22.2802 131.934C19.0962 132.978 15.4947 132.273 12.7022 130.446C8.70914 127.836 6.72567 123.321 5.49905 118.885C2.68044 108.602 2.02799 93.9347 10.014 85.6094" stroke="#1C4BA0" style="stroke:#1C4BA0;stroke:color(display-p3 0.1098 0.2941 0.6275);stroke-opacity:1;" stroke-width="1.30491" stroke-linecap="round" stroke-linejoin="round" stroke-dasharray="2.61 2.61"/>\n              <path d="M11.8828 83.911C12.0655 83.7805 12.2221 83.65 12.4048 83.5195" stroke="#1C4BA0" style="stroke:#1C4BA0;stroke:color(display-p3 0.1098 0.2941 0.6275);stroke-opacity:1;" stroke-width="1.30491" stroke-linecap="round" stroke-linejoin="round" stroke-dasharray="2.61 2.61"/>\n            </g>\n            <defs>\n              <clipPath id="clip0_25384_203626">\n                <rect width="161" height="147.325" fill="white" style="fill:white;fill-opacity:1;" transform="translate(0.96875)"/>\n              </clipPath>\n            </defs>\n          </svg>\n        </div>\n        \n        \n        <!-- Text beside SVG -->\n        <div style="line-height: 2.21vh;font-family: \'Inter\', sans-serif;font-size:1.66vh;text-align: center;">\n          <h3 style="margin:0 15px; color:#2862A9;">\n            Excited for Your Trip?\n          </h3>\n          <p style="margin:8px 0 15px 15px; color:#2862A9;">\n            Let’s Make Your Visa Process Easy!\n          </p>\n        </div>\n      </div>\n      \n      <!-- Welcome subtitle -->\n      <h2 style="line-height: 2.21vh;font-family: \'Inter\', sans-serif;font-size:1.66vh;color:#3B83DB; text-align:center;">\n        Welcome to your Visa Application Journey!\n      </h2>\n      \n      <!-- Intro paragraph with manual line break -->\n      <p style="margin:0 0 30px 0; font-size:1.66vh; line-height: 2.21vh; font-weight: 500;font-family: \'Inter\', sans-serif;text-align: center;">\n        Our guided process, along with the support of a TTK Visa Consultant will help you complete this journey with ease.\n      </p>\n      \n      <!-- Welcome subtitle -->\n      <h2 style="line-height: 2.21vh;font-family: \'Inter\', sans-serif;font-size:1.66vh; color:#3B83DB; text-align:center;">\n        What to expect at the end of this process\n      </h2>\n    </div>\n      \n    <!-- Bullet list -->\n     <div style="margin:0 0 30px 0;justify-content: center;align-items: center;display: flex;line-height: 2.21vh;" >\n\n       <ul style="margin:0;  font-size:1.66vh; line-height: 2.5vh; font-weight: 500;font-family: \'Inter\', sans-serif;">\n         <li style="margin-bottom:2vh;">\n           Look for your downloadable Docket. Your filled Visa Application Form will be automatically generated, ready for you to print and sign.\n         </li>\n         <li style="margin-bottom:2vh;">\n           An instruction sheet in the Docket will tell you exactly what to carry, including originals, copies, <br>and any additional documents.\n         </li>\n         <li style="margin-bottom:2vh;">\n           Our team will continuously review your details and documents to ensure everything is in order.<br> if you need anything at any time, our consultant will always be there to help you.\n         </li>\n         <li style="margin-bottom:2vh;">\n           A dedicated Visa Consultant will be assigned to assist and guide you at every step.\n         </li>\n         <li style="margin-bottom:2vh;">\n           For added convenience, you can choose from a range of Add-On Services during your application journey.\n         </li>\n         <li>\n           All your traveller details will be submitted and saved securely.\n         </li>\n       </ul>\n     </div>\n\n  </div>\n</body>\n</html>\n',
-        title='Display Field',
-    )
-    pct_completion: Optional[str] = Field(None, title='')
-    infopanes_completed: Optional[int] = Field(None, title='')
-    infopanes_total: Optional[int] = Field(None, title='')
-    form_status: Optional[str] = Field(
-        None, description='Used for form status', title=''
-    )
-    field_ver_status: Optional[Dict[str, Any]] = Field(None, title='Ver Status')
-    model_config = ConfigDict(
-        extra="allow", serialize_by_alias=True, use_enum_values=True
+        extra="allow",
+        serialize_by_alias=True,
+        use_enum_values=True,
+        defer_build=True,
     )
 
 
@@ -556,7 +146,10 @@ class RootPassportOtherDetails(BaseModel):
         None, description='Select Option', title='Civil/Marital Status'
     )
     model_config = ConfigDict(
-        extra="allow", serialize_by_alias=True, use_enum_values=True
+        extra="allow",
+        serialize_by_alias=True,
+        use_enum_values=True,
+        defer_build=True,
     )
 
 
@@ -652,157 +245,10 @@ class RootPassportPassportDetails(BaseModel):
         title='',
     )
     model_config = ConfigDict(
-        extra="allow", serialize_by_alias=True, use_enum_values=True
-    )
-
-
-class RootPhotographAddOnServicePhoto(BaseModel):
-    display_add_on_service: Optional[str] = Field(
-        None,
-        description='<!-- <div style="\n  display: flex;\n  align-items: left;\n  justify-content: left;\n  text-align: left;\n  margin-left: 15px;\n">\n  To know the cost, please refer the <strong>&nbsp;Add-On Cart Section</strong>.\n</div> -->\n<!DOCTYPE html>\n<html lang="en">\n<head>\n  <meta charset="UTF-8">\n  <title>Centered Paragraph</title>\n  <style>\n    .message-box {\n      font-family: \'Inter\', sans-serif;\n      font-weight: 425;\n      font-size: 16px;\n      text-align: left;\n    }\n  </style>\n</head>\n<body>\n    <div class="message-box">\n      <span>\n        <span style="font-weight: 600;"><b>Visa Photo Printing Assistance</b></span> <br>\n        Need help printing your photograph for visa filing? Visit the <b>Add-On Services</b> Cart to avail this service for a small fee.\n      </span>\n    </div>\n</body>\n</html>',
-        title='Display Field',
-    )
-    model_config = ConfigDict(
-        extra="allow", serialize_by_alias=True, use_enum_values=True
-    )
-
-
-class RootPhotographPassportPhoto(BaseModel):
-    upload_photo_display: Optional[str] = Field(
-        None,
-        description='<!-- <div style="\n  display: flex;\n  align-items: center;\n  justify-content: center;\n  text-align: center;\n">\n  If you’d like us to review your photo to make sure your photo meets the guidelines, \n  please upload it here.\n</div> -->\n<div style="\ndisplay: flex;\njustify-content: center;\nalign-items: center;">\n\n<div style="\n  text-align: center;\n  /* width: 1060px; */\n  font-family: \'Inter\', sans-serif;\n  font-weight: 500;\n  font-size: 16px;\n  line-height: 32px;\n  color: #000000;\n  text-align: center;\n">\nIf you’d like us to <strong>review</strong> your photo to make sure your photo meets the guidelines, <br>\nplease upload it here.\n</div>\n</div>',
-        title='Display Field',
-    )
-    photo: Optional[Union[str, Dict[str, Any]]] = Field(
-        None, description='Upload a Image/PDF', title='Passport-Size Photo (Optional)'
-    )
-    model_config = ConfigDict(
-        extra="allow", serialize_by_alias=True, use_enum_values=True
-    )
-
-
-class RootResidentialAddressResidentInOtherCountry(BaseModel):
-    address_proof: Optional[Union[str, Dict[str, Any]]] = Field(
-        None, description='Upload a PDF', title='Overseas Address Proof'
-    )
-    residence_permit_number: Optional[str] = Field(
-        None,
-        description='Enter Residence Permit Number',
-        title='Residence Permit Number',
-    )
-    permit_date_of_expiry: Optional[date] = Field(
-        None, description='DD/MM/YYYY', title='Permit Date of Expiry'
-    )
-    model_config = ConfigDict(
-        extra="allow", serialize_by_alias=True, use_enum_values=True
-    )
-
-
-class RootResidentialAddressResidentialAddressCardV1(BaseModel):
-    type_of_proof: Optional[Union[ADDRESSPROOFTYPE, str]] = Field(
-        None, description='Select Option', title='Type of Proof'
-    )
-    address_proof_upload: Optional[Union[str, Dict[str, Any]]] = Field(
-        None, description='Upload a Image/PDF', title='Upload Address Proof'
-    )
-    address_line_1: Optional[str] = Field(
-        None, description='Enter Address Line 1', title='Address Line 1'
-    )
-    address_line_2: Optional[str] = Field(
-        None, description='Enter Address Line 2', title='Address Line 2'
-    )
-    city: Optional[str] = Field(None, description='Enter City', title='City')
-    state: Optional[str] = Field(None, description='Enter State', title='State')
-    country: Optional[str] = Field(None, description='Enter Country', title='Country')
-    pin_code: Optional[str] = Field(
-        None, description='Enter PIN Code/ Postal Code', title='PIN Code'
-    )
-    model_config = ConfigDict(
-        extra="allow", serialize_by_alias=True, use_enum_values=True
-    )
-
-
-class RootResidentialAddressResidentialAddressCardV2(BaseModel):
-    address_line_1: Optional[str] = Field(
-        None, description='Enter Address Line 1', title='Address Line 1'
-    )
-    address_line_2: Optional[str] = Field(
-        None, description='Enter Address Line 2', title='Address Line 2'
-    )
-    city: Optional[str] = Field(None, description='Enter City', title='City')
-    state: Optional[str] = Field(None, description='Enter State', title='State')
-    country: Optional[str] = Field(None, description='Enter Country', title='Country')
-    pin_code: Optional[str] = Field(
-        None, description='Enter PIN Code/ Postal Code', title='PIN Code'
-    )
-    model_config = ConfigDict(
-        extra="allow", serialize_by_alias=True, use_enum_values=True
-    )
-
-
-class RootSalarySlipUpload(BaseModel):
-    salary_slip: Optional[Union[str, Dict[str, Any]]] = Field(
-        None, description='Upload a file', title='Salary Slip (Optional)'
-    )
-    model_config = ConfigDict(
-        extra="allow", serialize_by_alias=True, use_enum_values=True
-    )
-
-
-class RootScratchPad(BaseModel):
-    form_title: Optional[str] = Field(None, title='')
-    form_sub_title: Optional[str] = Field(None, title='')
-    form_indicator: Optional[str] = Field(None, title='')
-    field_ver_status: Optional[Dict[str, Any]] = Field(None, title='Ver Status')
-    model_config = ConfigDict(
-        extra="allow", serialize_by_alias=True, use_enum_values=True
-    )
-
-
-class RootSubmitInfoConfirm(BaseModel):
-    viewed_data: Optional[Union[CONFIRMVIEWEDDATA, str]] = Field(
-        None, description='Select Option', title=''
-    )
-    model_config = ConfigDict(
-        extra="allow", serialize_by_alias=True, use_enum_values=True
-    )
-
-
-class RootTicketingAddOnService(BaseModel):
-    display_add_on: Optional[str] = Field(
-        None,
-        description='<!DOCTYPE html>\n<html lang="en">\n<head>\n  <meta charset="UTF-8">\n  <title>Centered Paragraph</title>\n  <style>\n    .message-box {\n      font-family: \'Inter\', sans-serif;\n      font-weight: 425;\n      font-size: 16px;\n      text-align: left;\n      \n    }\n  </style>\n</head>\n<body>\n    <div class="message-box">\n      <span>\n\n        <span style="font-weight: 600;"><b>Dummy Flight Ticket Assistance</b></span> <br>\n        Need help booking a dummy flight ticket? Visit the <b>Add-On Services</b> Cart to avail this service for a small fee.\n      </span>\n    </div>\n</body>\n</html>',
-        title='Display Field',
-    )
-    model_config = ConfigDict(
-        extra="allow", serialize_by_alias=True, use_enum_values=True
-    )
-
-
-class RootTicketingFlightTickets(BaseModel):
-    flight_tickets: Optional[Union[str, Dict[str, Any]]] = Field(
-        None, description='Upload a PDF', title='Flight Tickets'
-    )
-    name_of_traveller: Optional[str] = Field(
-        None, description='Enter Name of the Traveller', title='Name of the Traveller'
-    )
-    airline: Optional[str] = Field(
-        None, description='Enter Name of Airline', title='Name of Airline'
-    )
-    port_of_entry: Optional[str] = Field(
-        None, description='Enter Port of Entry', title='Port of Entry'
-    )
-    port_of_exit: Optional[str] = Field(
-        None, description='Enter Port of Exit', title='Port of Exit'
-    )
-    arrival_date: Optional[date] = Field(
-        None, description='DD/MM/YYYY', title='Arrival Date / Check-in Date'
-    )
-    departure_date: Optional[date] = Field(
-        None, description='DD/MM/YYYY', title='Departure Date / Check-out Date'
-    )
-    model_config = ConfigDict(
-        extra="allow", serialize_by_alias=True, use_enum_values=True
+        extra="allow",
+        serialize_by_alias=True,
+        use_enum_values=True,
+        defer_build=True,
     )
 
 
@@ -811,50 +257,13 @@ class RootWorkAddressWorkDetails(BaseModel):
         None, description='Enter Current Occupation', title='Current Occupation'
     )
     model_config = ConfigDict(
-        extra="allow", serialize_by_alias=True, use_enum_values=True
+        extra="allow",
+        serialize_by_alias=True,
+        use_enum_values=True,
+        defer_build=True,
     )
 
 
-class SAMEACCOMMODATIONASPRIMARY(Enum):
-    ACCOMMODATION = 'ACCOMMODATION'
-
-
-class SAMEASPASSADDR(Enum):
-    SAME_AS_PASS_ADDR = 'SAME_AS_PASS_ADDR'
-
-
-class SAMEFLIGHTTICKETASPRIMARY(Enum):
-    FLIGHT_TICKET = 'FLIGHT_TICKET'
-
-
-class SKIPBANKSTATEMENTS(Enum):
-    YES = 'YES'
-
-
-class SKIPSALARYSLIPS(Enum):
-    YES = 'YES'
-
-
-class TICKETS(Enum):
-    BOOKED = 'BOOKED'
-    TTK_ASSITANCE = 'TTK_ASSITANCE'
-
-
-class VISAMODE(Enum):
-    E_Visa = 'E-Visa'
-    Paper = 'Paper'
-
-
-class VISATYPE(Enum):
-    Business = 'Business'
-    Dependent = 'Dependent'
-    Sports = 'Sports'
-    Student = 'Student'
-    Tourist = 'Tourist'
-    Visitor = 'Visitor'
-    Work = 'Work'
-
-
 class RootAccomodation(BaseModel):
     lock_accommodation: Optional[str] = Field(None, title='')
     accommodation_choice: Optional[RootAccomodationAccommodationChoice] = Field(
@@ -871,7 +280,10 @@ class RootAccomodation(BaseModel):
     )
     field_ver_status: Optional[Dict[str, Any]] = Field(None, title='Ver Status')
     model_config = ConfigDict(
-        extra="allow", serialize_by_alias=True, use_enum_values=True
+        extra="allow",
+        serialize_by_alias=True,
+        use_enum_values=True,
+        defer_build=True,
     )
 
 
@@ -886,71 +298,10 @@ class RootAdditionalDetails(BaseModel):
     )
     field_ver_status: Optional[Dict[str, Any]] = Field(None, title='Ver Status')
     model_config = ConfigDict(
-        extra="allow", serialize_by_alias=True, use_enum_values=True
-    )
-
-
-class RootAppointment(BaseModel):
-    earliest_appointment_date: Optional[RootAppointmentEarliestAppointmentDate] = Field(
-        None, title='Find your Earliest Appointment Date'
-    )
-    display_appointment_details_header: Optional[str] = Field(
-        None,
-        description='<!-- <p style="font-size: 14px; font-weight: 500; color: #000; margin: 0; line-height: 1.3; text-align: left;">\n \n  Please upload the details of your\n    Booked Visa\n  appointment below.\n</p> -->\n<!DOCTYPE html>\n<html lang="en">\n<head>\n  <meta charset="UTF-8">\n  <title>Centered Visa Appointment Text</title>\n  <style>\n    .center-wrapper {\n      display: flex;\n      justify-content: center;\n      align-items: center;\n    }\n\n    .message-box {\n      /* width: 1060px; */\n      font-family: \'Inter\', sans-serif;\n      font-weight: 500;\n      font-size: 16px;\n      line-height: 32px;\n      color: #000000;\n      text-align: center;\n    }\n  </style>\n</head>\n<body>\n  <div class="center-wrapper">\n    <div class="message-box">\n        Please upload the details of your Booked Visa Appointment below.\n        <!-- <span style="font-weight: bold; font-size: 1em;">\n          Booked Visa\n        </span>\n        appointment below. -->\n    </div>\n  </div>\n</body>\n</html>\n',
-        title='Display Field',
-    )
-    add_on_service_option: Optional[Union[ADDONSERVICEAPPOINTMENT, str]] = Field(
-        None, description='Select Option', title=''
-    )
-    appointment_scheduled: Optional[RootAppointmentAppointmentScheduled] = Field(
-        None, title='My Scheduled Appointment Details'
-    )
-    lock_appointment: Optional[str] = Field(None, title='')
-    field_ver_status: Optional[Dict[str, Any]] = Field(None, title='Ver Status')
-    model_config = ConfigDict(
-        extra="allow", serialize_by_alias=True, use_enum_values=True
-    )
-
-
-class RootBankStatement(BaseModel):
-    display_bank_statements_header: Optional[str] = Field(
-        None,
-        description='<!-- <p style="font-size: 14px; font-weight: 500; color: #000; margin: 0; line-height: 1.3; text-align: left;">\nThe visa application requires you to carry your original Bank Statements covering the last 12 months with your Bank’s seal & signature. For detailed guideline, click on\n<span style="font-weight: 700; font-size: 1em;">\n    Instructions\n</span>\nin the top-right corner of this section.\n</p> -->\n<!DOCTYPE html>\n<html lang="en">\n<head>\n  <meta charset="UTF-8">\n  <title>Centered Bank Statement Text</title>\n  <style>\n    .center-wrapper {\n      display: flex;\n      justify-content: center;\n      align-items: center;\n    }\n\n    .message-box {\n      /* width: 1060px; */\n      font-family: \'Inter\', sans-serif;\n      font-weight: 500;\n      font-size: 16px;\n      line-height: 32px;\n      color: #000000;\n      text-align: center;\n    }\n  </style>\n</head>\n<body>\n  <div class="center-wrapper">\n    <div class="message-box">\n        The visa application requires you to carry your original Bank Statements covering the last 6 months with your Bank’s seal & signature.\n        For detailed guidelines on this, click on the\n        <span style="font-weight: 700; font-size: 1em;">\n          Instructions\n        </span>\n        in the top-right corner of this section.\n    </div>\n  </div>\n</body>\n</html>\n',
-        title='Display Field',
-    )
-    skip_bank_statements: Optional[Union[SKIPBANKSTATEMENTS, str]] = Field(
-        None, description='Select Option', title=''
-    )
-    upload: Optional[RootBankStatementUpload] = Field(
-        None, title='Bank Statements (Optional)'
-    )
-    field_ver_status: Optional[Dict[str, Any]] = Field(None, title='Ver Status')
-    model_config = ConfigDict(
-        extra="allow", serialize_by_alias=True, use_enum_values=True
-    )
-
-
-class RootConsultantInfoAdditionalDocumentsAdditionaldocumentgroup(BaseModel):
-    additional_documents_card: Optional[
-        RootConsultantInfoAdditionalDocumentsAdditionaldocumentgroupAdditionalDocumentsCard
-    ] = Field(None, title='Additional Document')
-    model_config = ConfigDict(
-        extra="allow", serialize_by_alias=True, use_enum_values=True
-    )
-
-
-class RootDocketInfo(BaseModel):
-    display_header_docket: Optional[str] = Field(
-        None,
-        description='<!-- <p style="font-size: 14px; font-weight: 500; color: #000; margin: 0; line-height: 1.3; text-align: left;">\nThe visa application requires you to carry your Original Salary Slips with your company’s seal and signature. \nFor detailed guideline on this, click on\n<span style="font-weight: 700; font-size: 1em;">\n    Instructions\n</span>\nin the top-right corner of this section.\n</p> -->\n\n<!DOCTYPE html>\n<html lang="en">\n  <head>\n    <meta charset="UTF-8" />\n    <title>Centered Paragraph</title>\n    <style>\n      .center-wrapper {\n        display: flex;\n        justify-content: center;\n        align-items: center;\n      }\n\n      .message-box {\n        /* width: 1060px; */\n        font-family: "Inter", sans-serif;\n        font-weight: 500;\n        font-size: 16px;\n        line-height: 32px;\n        color: #000000;\n        text-align: center;\n      }\n    </style>\n  </head>\n  <body>\n    <div class="center-wrapper">\n      <div class="message-box">\n        <p>Your Application Package (Docket), including the <b>Completed Application</b> and supporting documents (originals or copies), will be ready to download once our Visa Consultant has reviewed and validated everything. \n        If anything is missing, the Consultant will guide you.</p>\n        You\'ll receive a notification as soon as your package is ready.\n      </div>\n    </div>\n  </body>\n</html>\n',
-        title='Display Field',
-    )
-    operation_card: Optional[RootDocketInfoOperationCard] = Field(
-        None, title='Docket Operation'
-    )
-    field_ver_status: Optional[Dict[str, Any]] = Field(None, title='Ver Status')
-    model_config = ConfigDict(
-        extra="allow", serialize_by_alias=True, use_enum_values=True
+        extra="allow",
+        serialize_by_alias=True,
+        use_enum_values=True,
+        defer_build=True,
     )
 
 
@@ -968,87 +319,10 @@ class RootPassport(BaseModel):
     )
     field_ver_status: Optional[Dict[str, Any]] = Field(None, title='Ver Status')
     model_config = ConfigDict(
-        extra="allow", serialize_by_alias=True, use_enum_values=True
-    )
-
-
-class RootPhotograph(BaseModel):
-    display_photograph_header: Optional[str] = Field(
-        None,
-        description='<!-- <p style="font-size: 14px; font-weight: 500; color: #000; margin: 0; line-height: 1.3; text-align: left;">\n You can fill your address using your passport, or provide an alternative ID to verify your address.\nFor detailed guidelines on this\n<span style="font-weight: 700; font-size: 1em;">\n    Instructions\n</span>\nin the top-right corner of this section.\n</p> -->\n\n<!DOCTYPE html>\n<html lang="en">\n<head>\n  <meta charset="UTF-8">\n  <title>Centered Paragraph</title>\n  <style>\n    .center-wrapper {\n      display: flex;\n      justify-content: center;\n      align-items: center;\n    }\n\n    .message-box {\n      /* width: 1060px; */\n      font-family: \'Inter\', sans-serif;\n      font-weight: 500;\n      font-size: 16px;\n      line-height: 32px;\n      color: #000000;\n      text-align: center;\n    }\n  </style>\n</head>\n<body>\n\n  <div class="center-wrapper">\n    <div class="message-box" style="text-align: center;">\n        For your appointment, you must carry four recent colour photographs (35mm x 40mm) with a white background of yourself. For detailed guideline on this, click on the\n        <span style="font-weight: 700; font-size: 1em;">\n          Instructions \n        </span>\n        in the top-right corner of this section.\n    </div>\n  </div>\n\n</body>\n</html>\n',
-        title='Display Field',
-    )
-    appointment_photo_option: Optional[Union[PHOTOGRAPHAPPOINTMENT, str]] = Field(
-        None, description='Select Option', title=''
-    )
-    passport_photo: Optional[RootPhotographPassportPhoto] = Field(
-        None, title='Review my Passport-Sized Photo (Optional)'
-    )
-    add_on_service_photo: Optional[RootPhotographAddOnServicePhoto] = Field(
-        None, title='Add-On Service'
-    )
-    field_ver_status: Optional[Dict[str, Any]] = Field(None, title='Ver Status')
-    model_config = ConfigDict(
-        extra="allow", serialize_by_alias=True, use_enum_values=True
-    )
-
-
-class RootResidentialAddress(BaseModel):
-    display_residential_address_header: Optional[str] = Field(
-        None,
-        description='<!-- <p style="font-size: 14px; font-weight: 500; color: #000; margin: 0; line-height: 1.3; text-align: left;">\n You can fill your address using your passport, or provide an alternative ID to verify your address.\nFor detailed guidelines on this\n<span style="font-weight: 700; font-size: 1em;">\n    Instructions\n</span>\nin the top-right corner of this section.\n</p> -->\n\n<!DOCTYPE html>\n<html lang="en">\n<head>\n  <meta charset="UTF-8">\n  <title>Centered Paragraph</title>\n  <style>\n    .center-wrapper {\n      display: flex;\n      justify-content: center;\n      align-items: center;\n    }\n\n    .message-box {\n      /* width: 1060px; */\n      font-family: \'Inter\', sans-serif;\n      font-weight: 500;\n      font-size: 16px;\n      line-height: 32px;\n      color: #000000;\n      text-align: center;\n    }\n  </style>\n</head>\n<body>\n\n  <div class="center-wrapper">\n    <div class="message-box">\n        You can fill your address using your passport, or provide an alternative ID to verify your address.\n        For detailed guidelines on this,click on the\n        <span style="font-weight: 700; font-size: 1em;">\n          Instructions\n        </span>\n        in the top-right corner of this section.\n    </div>\n  </div>\n\n</body>\n</html>\n',
-        title='Display Field',
-    )
-    same_as_passport_address: Optional[Union[SAMEASPASSADDR, str]] = Field(
-        None, description='Select Option', title=''
-    )
-    residential_address_card_v1: Optional[
-        RootResidentialAddressResidentialAddressCardV1
-    ] = Field(None, title='Current Residential Address')
-    residential_address_card_v2: Optional[
-        RootResidentialAddressResidentialAddressCardV2
-    ] = Field(None, title='Current Residential Address')
-    other_nationality: Optional[Union[OPTION, str]] = Field(
-        None,
-        description='Select Option',
-        title='Are you residing in a country other than the country of current nationality?',
-    )
-    resident_in_other_country: Optional[
-        RootResidentialAddressResidentInOtherCountry
-    ] = Field(None, title='Residence in another Country')
-    field_ver_status: Optional[Dict[str, Any]] = Field(None, title='Ver Status')
-    model_config = ConfigDict(
-        extra="allow", serialize_by_alias=True, use_enum_values=True
-    )
-
-
-class RootSalarySlip(BaseModel):
-    display_salary_slips_header: Optional[str] = Field(
-        None,
-        description='<!-- <p style="font-size: 14px; font-weight: 500; color: #000; margin: 0; line-height: 1.3; text-align: left;">\nThe visa application requires you to carry your Original Salary Slips with your company’s seal and signature. \nFor detailed guideline on this, click on\n<span style="font-weight: 700; font-size: 1em;">\n    Instructions\n</span>\nin the top-right corner of this section.\n</p> -->\n\n<!DOCTYPE html>\n<html lang="en">\n  <head>\n    <meta charset="UTF-8" />\n    <title>Centered Paragraph</title>\n    <style>\n      .center-wrapper {\n        display: flex;\n        justify-content: center;\n        align-items: center;\n      }\n\n      .message-box {\n        /* width: 1060px; */\n        font-family: "Inter", sans-serif;\n        font-weight: 500;\n        font-size: 16px;\n        line-height: 32px;\n        color: #000000;\n        text-align: center;\n      }\n    </style>\n  </head>\n  <body>\n    <div class="center-wrapper">\n      <div class="message-box">\n        Visa Application requires you to carry your Salary Slip of last 6\n        months as part of the visa application filing process. For more detailed\n        information, click on the\n        <span style="font-weight: 700; font-size: 1em"> Instructions </span>\n        in the top-right corner of this section.\n      </div>\n    </div>\n  </body>\n</html>\n',
-        title='Display Field',
-    )
-    skip_salary_slips: Optional[Union[SKIPSALARYSLIPS, str]] = Field(
-        None, description='Select Option', title=''
-    )
-    upload: Optional[RootSalarySlipUpload] = Field(
-        None, title='Salary Slips (Optional)'
-    )
-    field_ver_status: Optional[Dict[str, Any]] = Field(None, title='Ver Status')
-    model_config = ConfigDict(
-        extra="allow", serialize_by_alias=True, use_enum_values=True
-    )
-
-
-class RootSharedTravellInfoShared(BaseModel):
-    accommodation_same: Optional[Union[SAMEACCOMMODATIONASPRIMARY, str]] = Field(
-        None, description='Select Option', title=''
-    )
-    flight_ticket_same: Optional[Union[SAMEFLIGHTTICKETASPRIMARY, str]] = Field(
-        None, description='Select Option', title=''
-    )
-    model_config = ConfigDict(
-        extra="allow", serialize_by_alias=True, use_enum_values=True
+        extra="allow",
+        serialize_by_alias=True,
+        use_enum_values=True,
+        defer_build=True,
     )
 
 
@@ -1061,18 +335,10 @@ class RootSubmitInfo(BaseModel):
     confirm: Optional[RootSubmitInfoConfirm] = Field(None, title='Confirm')
     field_ver_status: Optional[Dict[str, Any]] = Field(None, title='Ver Status')
     model_config = ConfigDict(
-        extra="allow", serialize_by_alias=True, use_enum_values=True
-    )
-
-
-class RootTicketingTickets(BaseModel):
-    ticket_options: Optional[Union[TICKETS, str]] = Field(
-        None,
-        description='Select Option',
-        title='Please let us know how your Tickets are arranged:',
-    )
-    model_config = ConfigDict(
-        extra="allow", serialize_by_alias=True, use_enum_values=True
+        extra="allow",
+        serialize_by_alias=True,
+        use_enum_values=True,
+        defer_build=True,
     )
 
 
@@ -1126,7 +392,10 @@ class RootVisaRequestInformationVisaRequest(BaseModel):
     visa_processing_type: Optional[str] = Field(None, title='')
     form_indicator: Optional[str] = Field(None, title='')
     model_config = ConfigDict(
-        extra="allow", serialize_by_alias=True, use_enum_values=True
+        extra="allow",
+        serialize_by_alias=True,
+        use_enum_values=True,
+        defer_build=True,
     )
 
 
@@ -1136,16 +405,10 @@ class RootWorkAddress(BaseModel):
     )
     field_ver_status: Optional[Dict[str, Any]] = Field(None, title='Ver Status')
     model_config = ConfigDict(
-        extra="allow", serialize_by_alias=True, use_enum_values=True
-    )
-
-
-class FieldGrpRootConsultantInfoAdditionalDocuments(BaseModel):
-    additionaldocumentgroup: Optional[
-        RootConsultantInfoAdditionalDocumentsAdditionaldocumentgroup
-    ] = Field(None, title='Additional Document')
-    model_config = ConfigDict(
-        extra="allow", serialize_by_alias=True, use_enum_values=True
+        extra="allow",
+        serialize_by_alias=True,
+        use_enum_values=True,
+        defer_build=True,
     )
 
 
@@ -1155,36 +418,10 @@ class RootConsultantInfo(BaseModel):
     ] = Field(None, title='Additional Document')
     field_ver_status: Optional[Dict[str, Any]] = Field(None, title='Ver Status')
     model_config = ConfigDict(
-        extra="allow", serialize_by_alias=True, use_enum_values=True
-    )
-
-
-class RootSharedTravellInfo(BaseModel):
-    instruction: Optional[str] = Field(
-        None,
-        description='You may have details in common with the Primary Traveller. Select the ones that apply to you below.',
-        title='Display Field',
-    )
-    shared: Optional[RootSharedTravellInfoShared] = Field(
-        None, title='Same as Primary Traveller'
-    )
-    field_ver_status: Optional[Dict[str, Any]] = Field(None, title='Ver Status')
-    model_config = ConfigDict(
-        extra="allow", serialize_by_alias=True, use_enum_values=True
-    )
-
-
-class RootTicketing(BaseModel):
-    tickets: Optional[RootTicketingTickets] = Field(None, title='Flight Tickets')
-    flight_tickets: Optional[RootTicketingFlightTickets] = Field(
-        None, title='Flight Tickets'
-    )
-    add_on_service: Optional[RootTicketingAddOnService] = Field(
-        None, title='Add-On Service'
-    )
-    field_ver_status: Optional[Dict[str, Any]] = Field(None, title='Ver Status')
-    model_config = ConfigDict(
-        extra="allow", serialize_by_alias=True, use_enum_values=True
+        extra="allow",
+        serialize_by_alias=True,
+        use_enum_values=True,
+        defer_build=True,
     )
 
 
@@ -1199,7 +436,10 @@ class RootVisaRequestInformation(BaseModel):
     )
     field_ver_status: Optional[Dict[str, Any]] = Field(None, title='Ver Status')
     model_config = ConfigDict(
-        extra="allow", serialize_by_alias=True, use_enum_values=True
+        extra="allow",
+        serialize_by_alias=True,
+        use_enum_values=True,
+        defer_build=True,
     )
 
 
@@ -1270,5 +510,8 @@ class UniversalModelWithAppointment(BaseModel):
     )
     scratch_pad: Optional[RootScratchPad] = Field(None, title='Scratch Pad')
     model_config = ConfigDict(
-        extra="allow", serialize_by_alias=True, use_enum_values=True
+        extra="allow",
+        serialize_by_alias=True,
+        use_enum_values=True,
+        defer_build=True,
     )
@@ -10,21 +10,80 @@ from typing import Any, Dict, List, Optional, Union
 
 from pydantic import BaseModel, ConfigDict, Field
 
-
-class ACCOMMODATIONARRANGEMENT(Enum):
-    BOOKED = 'BOOKED'
-    TTK_ASSITANCE = 'TTK_ASSITANCE'
-    WITH_FAMILY = 'WITH_FAMILY'
-
-
-class ADDRESSPROOFTYPE(Enum):
-    AADHAAR = 'AADHAAR'
-    DL = 'DL'
-    ELECTRICITY = 'ELECTRICITY'
-    GAS = 'GAS'
-    HR_LETTER = 'HR_LETTER'
-    RATION = 'RATION'
-    RENTAL_NOTARY = 'RENTAL_NOTARY'
+from ._common_types import (
+    ACCOMMODATIONARRANGEMENT,
+    ADDRESSPROOFTYPE,
+    CONFIRMVIEWEDDATA,
+    COUNTRY3,
+    COVER,
+    DOCKETSTATUS,
+    GENDER,
+    INSURANCEOPTION,
+    INSURANCEPLAN,
+    INVITATION,
+    NUMBEROFENTRIES,
+    OPTION,
+    PHOTOGRAPHAPPOINTMENT,
+    RELATIONSHIP,
+    RootAccomodationAccommodationChoice,
+    RootAccomodationAddOnService,
+    RootAccomodationBookedAppointment,
+    RootAdditionalDocumentsPaneAdditionalDocumentsConsultantGroupAdditionaldocumentgroupconsultantAdditionalDocumentsCardConsultant,
+    RootBankStatementUpload,
+    RootConsultantInfoAdditionalDocumentsAdditionaldocumentgroupAdditionalDocumentsCard,
+    RootConsultantInfoInstructionLetter,
+    RootCoverLetterInfoCoveringLetterCard,
+    RootCoverLetterInfoGenerateCoverLetter,
+    RootCoverLetterInfoSendEmail,
+    RootDocketInfoOperationCard,
+    RootInvitationInvitationLetterGenerate,
+    RootInvitationInvitationLetterUpload,
+    RootInvitationSendEmail,
+    RootLetsGetStarted,
+    RootPhotographAddOnServicePhoto,
+    RootPhotographPassportPhoto,
+    RootResidentialAddressResidentInOtherCountry,
+    RootResidentialAddressResidentialAddressCardV1,
+    RootResidentialAddressResidentialAddressCardV2,
+    RootSalarySlipUpload,
+    RootScratchPad,
+    RootSubmitInfoConfirm,
+    RootSubmitInfoDocket,
+    RootTicketingAddOnService,
+    RootTicketingFlightTickets,
+    RootTravelInsuranceAddOnCard,
+    RootTravelInsuranceAddOnService,
+    RootTravelInsuranceFlightReservationDetails,
+    RootTravelInsuranceInsuranceOptionsCard,
+    SAMEACCOMMODATIONASPRIMARY,
+    SAMEASPASSADDR,
+    SAMEFLIGHTTICKETASPRIMARY,
+    SKIPBANKSTATEMENTS,
+    SKIPSALARYSLIPS,
+    TICKETS,
+    VISAMODE,
+    VISATYPE,
+    RootAdditionalDocumentsPaneAdditionalDocumentsConsultantGroupAdditionaldocumentgroupconsultant,
+    RootBankStatement,
+    RootConsultantInfoAdditionalDocumentsAdditionaldocumentgroup,
+    RootCoverLetterInfo,
+    RootDocketInfo,
+    RootInvitation,
+    RootPhotograph,
+    RootResidentialAddress,
+    RootSalarySlip,
+    RootSharedTravellInfoShared,
+    RootSubmitInfo,
+    RootTicketingTickets,
+    RootTravelInsurance,
+    RootVisaRequestInformationVisaRequest,
+    FieldGrpRootAdditionalDocumentsPaneAdditionalDocumentsConsultantGroup,
+    FieldGrpRootConsultantInfoAdditionalDocuments,
+    RootConsultantInfo,
+    RootSharedTravellInfo,
+    RootTicketing,
+    RootVisaRequestInformation,
+)
 
 
 class CIVILMARITALSTATUS(Enum):
@@ -39,313 +98,6 @@ class CIVILMARITALSTATUS(Enum):
     WIDOWED = 'WIDOWED'
 
 
-class CONFIRMVIEWEDDATA(Enum):
-    YES = 'YES'
-
-
-class COUNTRY3(Enum):
-    ABW = 'ABW'
-    AFG = 'AFG'
-    AGO = 'AGO'
-    AIA = 'AIA'
-    ALB = 'ALB'
-    AND = 'AND'
-    ARE = 'ARE'
-    ARG = 'ARG'
-    ARM = 'ARM'
-    ASM = 'ASM'
-    ATA = 'ATA'
-    ATF = 'ATF'
-    ATG = 'ATG'
-    AUS = 'AUS'
-    AUT = 'AUT'
-    AZE = 'AZE'
-    BDI = 'BDI'
-    BEL = 'BEL'
-    BEN = 'BEN'
-    BES = 'BES'
-    BFA = 'BFA'
-    BGD = 'BGD'
-    BGR = 'BGR'
-    BHR = 'BHR'
-    BHS = 'BHS'
-    BIH = 'BIH'
-    BLM = 'BLM'
-    BLR = 'BLR'
-    BLZ = 'BLZ'
-    BMU = 'BMU'
-    BOL = 'BOL'
-    BRA = 'BRA'
-    BRB = 'BRB'
-    BRN = 'BRN'
-    BTN = 'BTN'
-    BVT = 'BVT'
-    BWA = 'BWA'
-    CAF = 'CAF'
-    CAN = 'CAN'
-    CCK = 'CCK'
-    CHE = 'CHE'
-    CHL = 'CHL'
-    CHN = 'CHN'
-    CIV = 'CIV'
-    CMR = 'CMR'
-    COD = 'COD'
-    COG = 'COG'
-    COK = 'COK'
-    COL = 'COL'
-    COM = 'COM'
-    CPV = 'CPV'
-    CRI = 'CRI'
-    CUB = 'CUB'
-    CUW = 'CUW'
-    CXR = 'CXR'
-    CYM = 'CYM'
-    CYP = 'CYP'
-    CZE = 'CZE'
-    DEU = 'DEU'
-    DJI = 'DJI'
-    DMA = 'DMA'
-    DNK = 'DNK'
-    DOM = 'DOM'
-    DZA = 'DZA'
-    ECU = 'ECU'
-    EGY = 'EGY'
-    ERI = 'ERI'
-    ESH = 'ESH'
-    ESP = 'ESP'
-    EST = 'EST'
-    ETH = 'ETH'
-    FIN = 'FIN'
-    FJI = 'FJI'
-    FLK = 'FLK'
-    FRA = 'FRA'
-    FRO = 'FRO'
-    FSM = 'FSM'
-    GAB = 'GAB'
-    GBR = 'GBR'
-    GEO = 'GEO'
-    GGY = 'GGY'
-    GHA = 'GHA'
-    GIB = 'GIB'
-    GIN = 'GIN'
-    GLP = 'GLP'
-    GMB = 'GMB'
-    GNB = 'GNB'
-    GNQ = 'GNQ'
-    GRC = 'GRC'
-    GRD = 'GRD'
-    GRL = 'GRL'
-    GTM = 'GTM'
-    GUF = 'GUF'
-    GUM = 'GUM'
-    GUY = 'GUY'
-    HKG = 'HKG'
-    HMD = 'HMD'
-    HND = 'HND'
-    HRV = 'HRV'
-    HTI = 'HTI'
-    HUN = 'HUN'
-    IDN = 'IDN'
-    IMN = 'IMN'
-    IND = 'IND'
-    IOT = 'IOT'
-    IRL = 'IRL'
-    IRN = 'IRN'
-    IRQ = 'IRQ'
-    ISL = 'ISL'
-    ISR = 'ISR'
-    ITA = 'ITA'
-    JAM = 'JAM'
-    JEY = 'JEY'
-    JOR = 'JOR'
-    JPN = 'JPN'
-    KAZ = 'KAZ'
-    KEN = 'KEN'
-    KGZ = 'KGZ'
-    KHM = 'KHM'
-    KIR = 'KIR'
-    KNA = 'KNA'
-    KOR = 'KOR'
-    KWT = 'KWT'
-    LAO = 'LAO'
-    LBN = 'LBN'
-    LBR = 'LBR'
-    LBY = 'LBY'
-    LCA = 'LCA'
-    LIE = 'LIE'
-    LKA = 'LKA'
-    LSO = 'LSO'
-    LTU = 'LTU'
-    LUX = 'LUX'
-    LVA = 'LVA'
-    MAC = 'MAC'
-    MAF = 'MAF'
-    MAR = 'MAR'
-    MCO = 'MCO'
-    MDA = 'MDA'
-    MDG = 'MDG'
-    MDV = 'MDV'
-    MEX = 'MEX'
-    MHL = 'MHL'
-    MKD = 'MKD'
-    MLI = 'MLI'
-    MLT = 'MLT'
-    MMR = 'MMR'
-    MNE = 'MNE'
-    MNG = 'MNG'
-    MNP = 'MNP'
-    MOZ = 'MOZ'
-    MRT = 'MRT'
-    MSR = 'MSR'
-    MTQ = 'MTQ'
-    MUS = 'MUS'
-    MWI = 'MWI'
-    MYS = 'MYS'
-    MYT = 'MYT'
-    NAM = 'NAM'
-    NCL = 'NCL'
-    NER = 'NER'
-    NFK = 'NFK'
-    NGA = 'NGA'
-    NIC = 'NIC'
-    NIU = 'NIU'
-    NLD = 'NLD'
-    NOR = 'NOR'
-    NPL = 'NPL'
-    NRU = 'NRU'
-    NZL = 'NZL'
-    OMN = 'OMN'
-    PAK = 'PAK'
-    PAN = 'PAN'
-    PCN = 'PCN'
-    PER = 'PER'
-    PHL = 'PHL'
-    PLW = 'PLW'
-    PNG = 'PNG'
-    POL = 'POL'
-    PRI = 'PRI'
-    PRK = 'PRK'
-    PRT = 'PRT'
-    PRY = 'PRY'
-    PSE = 'PSE'
-    PYF = 'PYF'
-    QAT = 'QAT'
-    REU = 'REU'
-    ROU = 'ROU'
-    RUS = 'RUS'
-    RWA = 'RWA'
-    SAU = 'SAU'
-    SDN = 'SDN'
-    SEN = 'SEN'
-    SGP = 'SGP'
-    SGS = 'SGS'
-    SHN = 'SHN'
-    SJM = 'SJM'
-    SLB = 'SLB'
-    SLE = 'SLE'
-    SLV = 'SLV'
-    SMR = 'SMR'
-    SOM = 'SOM'
-    SPM = 'SPM'
-    SRB = 'SRB'
-    SSD = 'SSD'
-    STP = 'STP'
-    SUR = 'SUR'
-    SVK = 'SVK'
-    SVN = 'SVN'
-    SWE = 'SWE'
-    SWZ = 'SWZ'
-    SXM = 'SXM'
-    SYC = 'SYC'
-    SYR = 'SYR'
-    TCA = 'TCA'
-    TCD = 'TCD'
-    TGO = 'TGO'
-    THA = 'THA'
-    TJK = 'TJK'
-    TKL = 'TKL'
-    TKM = 'TKM'
-    TLS = 'TLS'
-    TON = 'TON'
-    TTO = 'TTO'
-    TUN = 'TUN'
-    TUR = 'TUR'
-    TUV = 'TUV'
-    TWN = 'TWN'
-    TZA = 'TZA'
-    UGA = 'UGA'
-    UKR = 'UKR'
-    UMI = 'UMI'
-    URY = 'URY'
-    USA = 'USA'
-    UZB = 'UZB'
-    VAT = 'VAT'
-    VCT = 'VCT'
-    VEN = 'VEN'
-    VGB = 'VGB'
-    VIR = 'VIR'
-    VNM = 'VNM'
-    VUT = 'VUT'
-    WLF = 'WLF'
-    WSM = 'WSM'
-    YEM = 'YEM'
-    ZAF = 'ZAF'
-    ZMB = 'ZMB'
-    ZWE = 'ZWE'
-
-
-class COVER(Enum):
-    TRAVELLER = 'TRAVELLER'
-    TTK_VISA_CONSULTANT = 'TTK_VISA_CONSULTANT'
-
-
-class DOCKETSTATUS(Enum):
-    ADDITIONAL_REVIEW = 'ADDITIONAL_REVIEW'
-    ENABLE_DOWNLOAD = 'ENABLE_DOWNLOAD'
-    REVIEW = 'REVIEW'
-
-
-class GENDER(Enum):
-    F = 'F'
-    FEMALE = 'FEMALE'
-    M = 'M'
-    MALE = 'MALE'
-    O = 'O'
-    T = 'T'
-
-
-class INSURANCEOPTION(Enum):
-    HAVE_INSURANCE = 'HAVE_INSURANCE'
-    TTK_ASSITANCE = 'TTK_ASSITANCE'
-
-
-class INSURANCEPLAN(Enum):
-    USD100K = 'USD100K'
-    USD1M = 'USD1M'
-    USD500K = 'USD500K'
-    USD50K = 'USD50K'
-
-
-class INVITATION(Enum):
-    TRAVELLER = 'TRAVELLER'
-    TTK_VISA_CONSULTANT = 'TTK_VISA_CONSULTANT'
-
-
-class NUMBEROFENTRIES(Enum):
-    DOUBLE_JOURNEY = 'DOUBLE_JOURNEY'
-    MULTIPLE_JOURNEY = 'MULTIPLE_JOURNEY'
-    Multiple = 'Multiple'
-    SINGLE_JOURNEY = 'SINGLE_JOURNEY'
-    Single = 'Single'
-    TRIPLE_JOURNEY = 'TRIPLE_JOURNEY'
-    Two = 'Two'
-
-
-class OPTION(Enum):
-    NO = 'NO'
-    YES = 'YES'
-
-
 class PASSPORTTYPE(Enum):
     CERTIFICATE_OF_IDENTITY = 'CERTIFICATE_OF_IDENTITY'
     DIPLOMATIC = 'DIPLOMATIC'
@@ -362,80 +114,6 @@ class PASSPORTTYPE(Enum):
     SPECIAL = 'SPECIAL'
 
 
-class PHOTOGRAPHAPPOINTMENT(Enum):
-    YES = 'YES'
-
-
-class RELATIONSHIP(Enum):
-    BROTHER = 'BROTHER'
-    BROTHER_IN_LAW = 'BROTHER_IN_LAW'
-    DAUGHTER = 'DAUGHTER'
-    FATHER = 'FATHER'
-    FRIEND = 'FRIEND'
-    MOTHER = 'MOTHER'
-    OTHERS = 'OTHERS'
-    SISTER = 'SISTER'
-    SISTER_IN_LAW = 'SISTER_IN_LAW'
-    SON = 'SON'
-    SPOUSE = 'SPOUSE'
-
-
-class RootAccomodationAccommodationChoice(BaseModel):
-    accommodation_option: Optional[Union[ACCOMMODATIONARRANGEMENT, str]] = Field(
-        None,
-        description='Select Option',
-        title='Please let us know how your stay is arranged:',
-    )
-    model_config = ConfigDict(
-        extra="allow", serialize_by_alias=True, use_enum_values=True
-    )
-
-
-class RootAccomodationAddOnService(BaseModel):
-    display_add_on: Optional[str] = Field(
-        None,
-        description='<!-- <div style="\n  display: flex;\n  align-items: left;\n  justify-content: left;\n  text-align: left;\n  margin-left: 15px;\n">\nTo know the cost, please refer to the <strong>&nbsp;Add-On Cart Section</strong>.\n</div> -->\n<!DOCTYPE html>\n<html lang="en">\n<head>\n  <meta charset="UTF-8">\n  <title>Centered Paragraph</title>\n  <style>\n    .message-box {\n      font-family: \'Inter\', sans-serif;\n      font-weight: 425;\n      font-size: 16px;\n      text-align: left;\n      \n    }\n  </style>\n</head>\n<body>\n    <div class="message-box">\n      <span>\n        <span style="font-weight: 600;"><b>Dummy Accommodation Assistance</b></span> <br>\n        Need help booking your dummy accommodation?  Visit the <b>Add-On Services</b> Cart to avail this service for a small fee.\n      </span>\n    </div>\n</body>\n</html>',
-        title='Display Field',
-    )
-    model_config = ConfigDict(
-        extra="allow", serialize_by_alias=True, use_enum_values=True
-    )
-
-
-class RootAccomodationBookedAppointment(BaseModel):
-    booking_upload: Optional[Union[str, Dict[str, Any]]] = Field(
-        None, description='Upload a PDF', title='Accommodation Booking'
-    )
-    display_accommodation_instruction: Optional[str] = Field(
-        None,
-        description='<div style="\ndisplay: flex;\njustify-content: center;\nalign-items: center;">\n\n<div style="\n  text-align: center;\n  /* width: 1060px; */\n  font-family: \'Inter\', sans-serif;\n  font-weight: 500;\n  font-size: 16px;\n  line-height: 32px;\n  color: #000000;\n  text-align: center;\n">\n        Please provide the details of the dummy/confirmed Accommodation.\n    </div>\n  </div>\n       \n',
-        title='Display Field',
-    )
-    traveller_name: Optional[str] = Field(
-        None, description='Enter Name of the Traveller', title='Name of the Traveller'
-    )
-    num_of_passengers: Optional[str] = Field(
-        None, description='Enter Number of Passengers', title='Number of Passengers'
-    )
-    accommodation_name: Optional[str] = Field(
-        None,
-        description='Enter Name of Hotel/Accommodation',
-        title='Name of Hotel/Accommodation',
-    )
-    accommodation_email: Optional[str] = Field(
-        None, description='Select Option', title='Email ID of Hotel/Accommodation'
-    )
-    start_date: Optional[date] = Field(
-        None, description='DD/MM/YYYY', title='Start Date/ Check-in Date'
-    )
-    end_date: Optional[date] = Field(
-        None, description='DD/MM/YYYY', title='End Date / Check-out Date'
-    )
-    model_config = ConfigDict(
-        extra="allow", serialize_by_alias=True, use_enum_values=True
-    )
-
-
 class RootAccomodationInvitationDetails(BaseModel):
     display_accomodation: Optional[str] = Field(
         None,
@@ -468,7 +146,10 @@ class RootAccomodationInvitationDetails(BaseModel):
         None, description='Upload a Image/PDF', title="Inviter's Accommodation Proof"
     )
     model_config = ConfigDict(
-        extra="allow", serialize_by_alias=True, use_enum_values=True
+        extra="allow",
+        serialize_by_alias=True,
+        use_enum_values=True,
+        defer_build=True,
     )
 
 
@@ -477,24 +158,10 @@ class RootAdditionalDetailsTravelInfo(BaseModel):
         None, description='Select Option', title='Country of Travel'
     )
     model_config = ConfigDict(
-        extra="allow", serialize_by_alias=True, use_enum_values=True
-    )
-
-
-class RootAdditionalDocumentsPaneAdditionalDocumentsConsultantGroupAdditionaldocumentgroupconsultantAdditionalDocumentsCardConsultant(
-    BaseModel
-):
-    file_upload: Optional[Union[str, Dict[str, Any]]] = Field(
-        None, description='Upload a .docx file', title='Upload Template'
-    )
-    document_name: Optional[str] = Field(
-        None, description='Enter Name of the document', title='Name of the document'
-    )
-    document_description: Optional[str] = Field(
-        None, description='Enter Document Description', title='Document Description'
-    )
-    model_config = ConfigDict(
-        extra="allow", serialize_by_alias=True, use_enum_values=True
+        extra="allow",
+        serialize_by_alias=True,
+        use_enum_values=True,
+        defer_build=True,
     )
 
 
@@ -509,169 +176,10 @@ class RootAdditionalDocumentsPaneAdditionalDocumentsTravellerGroupAdditionaldocu
         None, description='Upload a PDF file', title='File Upload'
     )
     model_config = ConfigDict(
-        extra="allow", serialize_by_alias=True, use_enum_values=True
-    )
-
-
-class RootBankStatementUpload(BaseModel):
-    display_bank_statements_instructions: Optional[str] = Field(
-        None,
-        description='<!-- <div style="\n  display: flex;\n  justify-content: center;\n  align-items: center;\n  text-align: center;\n  width: 100%;\n  padding: 16px;\n  font-size: 14px;\n  font-weight: 400;\n  color: #000;\n  line-height: 1.5;\n">\n  <p style="margin: 0;">\n    If you’d like us to review your Salary Slips to make sure it meets the guidelines, please upload it here.\n    If your current employment is under 3 months, submit the payslip from your previous employer\n  </p>\n</div> -->\n<!DOCTYPE html>\n<html lang="en">\n<head>\n  <meta charset="UTF-8">\n  <title>Centered Paragraph</title>\n  <style>\n    .center-wrapper {\n      display: flex;\n      justify-content: center;\n      align-items: center;\n    }\n\n    .message-box {\n      /* width: 1060px; */\n      font-family: \'Inter\', sans-serif;\n      font-weight: 500;\n      font-size: 16px;\n      line-height: 32px;\n      color: #000000;\n      text-align: center;\n    }\n  </style>\n</head>\n<body>\n  <div class="center-wrapper">\n    <div class="message-box">\n        If you’d like us to <strong> review </strong> your Bank Statements to make sure it meets the guidelines, please upload it here.\n    </div>\n  </div>\n</body>\n</html>',
-        title='Display Field',
-    )
-    bank_statements: Optional[Union[str, Dict[str, Any]]] = Field(
-        None, description='Upload a file', title='Bank Statements (Optional)'
-    )
-    model_config = ConfigDict(
-        extra="allow", serialize_by_alias=True, use_enum_values=True
-    )
-
-
-class RootConsultantInfoAdditionalDocumentsAdditionaldocumentgroupAdditionalDocumentsCard(
-    BaseModel
-):
-    display_card_9: Optional[str] = Field(
-        None,
-        description='<div style="\ndisplay: flex;\njustify-content: center;\nalign-items: center;">\n\n<div style="\n  text-align: center;\n  /* width: 1060px; */\n  font-family: \'Inter\', sans-serif;\n  font-weight: 500;\n  font-size: 16px;\n  line-height: 32px;\n  color: #000000;\n  text-align: center;\n">\nUpload an additional document required for the application:\n</div>\n\n</div> ',
-        title='Display Field',
-    )
-    document_name: Optional[str] = Field(
-        None, description='Enter Name of the document', title='Name of the document'
-    )
-    document_description: Optional[str] = Field(
-        None, description='Enter Document Description', title='Document Description'
-    )
-    file_upload: Optional[Union[str, Dict[str, Any]]] = Field(
-        None, description='Upload a Image/PDF', title='File Upload'
-    )
-    model_config = ConfigDict(
-        extra="allow", serialize_by_alias=True, use_enum_values=True
-    )
-
-
-class RootConsultantInfoInstructionLetter(BaseModel):
-    display_card_3: Optional[str] = Field(
-        None,
-        description='<div style="\ndisplay: flex;\njustify-content: center;\nalign-items: center;">\n\n<div style="\n  text-align: center;\n  /* width: 1060px; */\n  font-family: \'Inter\', sans-serif;\n  font-weight: 500;\n  font-size: 16px;\n  line-height: 32px;\n  color: #000000;\n  text-align: center;\n">\nUpload the Instruction Sheet prepared for the Traveller.\n</div>\n\n</div> ',
-        title='Display Field',
-    )
-    upload_instruction: Optional[Union[str, Dict[str, Any]]] = Field(
-        None, description='Upload a Image/PDF', title='Instruction Sheet'
-    )
-    model_config = ConfigDict(
-        extra="allow", serialize_by_alias=True, use_enum_values=True
-    )
-
-
-class RootCoverLetterInfoCoveringLetterCard(BaseModel):
-    display_field: Optional[str] = Field(
-        None,
-        description='Please upload the Signed and Sealed Covering Letter.',
-        title='Display Field',
-    )
-    cover_upload: Optional[Union[str, Dict[str, Any]]] = Field(
-        None, description='Upload a file', title='Covering Letter'
-    )
-    model_config = ConfigDict(
-        extra="allow", serialize_by_alias=True, use_enum_values=True
-    )
-
-
-class RootCoverLetterInfoGenerateCoverLetter(BaseModel):
-    display_field_3: Optional[str] = Field(
-        None,
-        description='<!DOCTYPE html>\n<html lang="en">\n<head>\n    <meta charset="UTF-8" />\n    <meta name="viewport" content="width=device-width, initial-scale=1.0"/>\n    <title>Invitation Letter Guidelines</title>\n    <style>\n        .box10 {\n            font-family: Arial, sans-serif;\n            line-height: 1.6;\n            margin: 20px;\n            color: #000;\n            /* text-align: center; */\n        }\n\n        .box11 {\n            display: flex;\n            /* justify-content: center;  */\n            /* centers horizontally */\n        }\n\n        ol {\n            margin-left: 20px;\n        }\n\n        p {\n            margin-bottom: 1em;\n        }\n    </style>\n</head>\n<body>\n    <div class="box10">  \n    <p>Kindly generate the covering letter using the prescribed template, review the information carefully. Ensure the letter is:</p>\n        <div class="box11">\n \n        <ol>\n            <li><b>Printed</b> on the official company letterhead</li>\n            <li><b>Signed</b> by the authorized signatory</li>\n            <li>Affixed with the <b>Company\'s Round Seal</b> (where applicable)</li>\n        </ol>\n        </div>\n        \n    <p>This is a mandatory document and forms an integral part of your visa application package.</p>\n</div>\n</body>\n</html>\n',
-        title='Display Field',
-    )
-    generate_cover: Optional[str] = Field(
-        None,
-        description='Automatically generate Covering letter',
-        title='Generate Cover',
-    )
-    generation_info_display: Optional[str] = Field(None, title='')
-    model_config = ConfigDict(
-        extra="allow", serialize_by_alias=True, use_enum_values=True
-    )
-
-
-class RootCoverLetterInfoSendEmail(BaseModel):
-    notification_type: Optional[str] = Field(
-        None, description='Enter Notification Type', title='Notification Type'
-    )
-    email_notification: Optional[str] = Field(
-        None, description='Send Email', title='Send Email'
-    )
-    model_config = ConfigDict(
-        extra="allow", serialize_by_alias=True, use_enum_values=True
-    )
-
-
-class RootDocketInfoOperationCard(BaseModel):
-    operation_type: Optional[str] = Field(
-        None, description='Select Operation type', title='Select Operation'
-    )
-    model_config = ConfigDict(
-        extra="allow", serialize_by_alias=True, use_enum_values=True
-    )
-
-
-class RootInvitationInvitationLetterGenerate(BaseModel):
-    display_field_2: Optional[str] = Field(
-        None,
-        description='<!DOCTYPE html>\n<html lang="en">\n\n<head>\n    <meta charset="UTF-8" />\n    <meta name="viewport" content="width=device-width, initial-scale=1.0" />\n    <title>Invitation Letter Guidelines</title>\n    <style>\n        .box10 {\n            font-family: Arial, sans-serif;\n            line-height: 1.6;\n            margin: 20px;\n            color: #000;\n            /* text-align: center; */\n        }\n\n        .box11 {\n            display: flex;\n            /* justify-content: center;  */\n            /* centers horizontally */\n        }\n\n        ol {\n            margin-left: 20px;\n        }\n\n        p {\n            margin-bottom: 1em;\n        }\n    </style>\n</head>\n\n<body>\n    <div class="box10">\n        <p>Kindly generate the invitation letter using the prescribed template, review the information carefully, and\n            request the inviting company to:</p>\n\n        <div class="box11">\n            <ol>\n                <li><b>Print</b> the letter on their official company letterhead</li>\n                <li>Get it <b>Signed</b> by their authorized signatory</li>\n                <li>Affix the <b>Company\'s Round Seal</b> wherever applicable</li>\n            </ol>\n        </div>\n\n        <p>This is a mandatory document and forms an integral part of your visa application package.</p>\n    </div>\n</body>\n\n</html>',
-        title='Display Field',
-    )
-    generate_cover: Optional[str] = Field(
-        None,
-        description='Automatically generate Invitation letter',
-        title='Generate Cover',
-    )
-    generation_info_display: Optional[str] = Field(None, title='')
-    model_config = ConfigDict(
-        extra="allow", serialize_by_alias=True, use_enum_values=True
-    )
-
-
-class RootInvitationInvitationLetterUpload(BaseModel):
-    display_field_3: Optional[str] = Field(
-        None, description='Please upload the Invitation Letter', title='Display Field'
-    )
-    invite_upload: Optional[Union[str, Dict[str, Any]]] = Field(
-        None, description='Upload a file', title='Invitation Upload'
-    )
-    model_config = ConfigDict(
-        extra="allow", serialize_by_alias=True, use_enum_values=True
-    )
-
-
-class RootInvitationSendEmail(BaseModel):
-    notification_type: Optional[str] = Field(
-        None, description='Enter Notification Type', title='Notification Type'
-    )
-    email_notification: Optional[str] = Field(
-        None, description='Send Email', title='Send Email'
-    )
-    model_config = ConfigDict(
-        extra="allow", serialize_by_alias=True, use_enum_values=True
-    )
-
-
-class RootLetsGetStarted(BaseModel):
-    traveler_details_header: Optional[str] = Field(None, title='')
-    instruction_display: Optional[str] = Field(
-        None,
-        description='<!DOCTYPE html>\n<html lang="en">\n<head>\n  <meta charset="UTF-8">\n  <title>Visa Application Journey</title>\n</head>\n<body>\n  <div style="margin:0 auto; padding:40px 20px;color:#333;">\n    <div style="margin-left: 3vh;">\n      <!-- Top row: SVG + headlines -->\n      <div style="display:flex; align-items:flex-start;align-items: center;margin: auto;justify-content: center;margin-left: auto;">\n        <div style="margin-left: 3vh;">\n          <svg width="162" height="148" viewBox="0 0 162 148" fill="none" xmlns="http://www.w3.org/2000/svg">\n            <g clip-path="url(#clip0_25384_203626)">\n              <path d="M109.203 2.3816L14.3616 15.1878C10.5764 15.6989 7.92215 19.1818 8.43327 22.9671L19.4375 104.463C19.9486 108.248 23.4315 110.903 27.2168 110.391L122.058 97.5852C125.844 97.0741 128.498 93.5912 127.987 89.8059L116.982 8.30998C116.471 4.52471 112.988 1.87049 109.203 2.3816Z" fill="white" stroke="black" style="fill:white;fill-opacity:1;stroke:black;stroke-opacity:1;" stroke-width="1.98347" stroke-miterlimit="10"/>\n              <path d="M108.25 1.06129L13.4085 13.8675C9.62325 14.3786 6.96903 17.8615 7.48014 21.6468L18.4843 103.143C18.9955 106.928 22.4784 109.582 26.2636 109.071L121.105 96.2649C124.89 95.7538 127.545 92.2709 127.034 88.4856L116.029 6.98967C115.518 3.2044 112.035 0.550174 108.25 1.06129Z" fill="white" stroke="#1C4BA0" style="fill:white;fill-opacity:1;stroke:#1C4BA0;stroke:color(display-p3 0.1098 0.2941 0.6275);stroke-opacity:1;" stroke-width="1.98347" stroke-miterlimit="10"/>\n              <path d="M64.8799 65.1856C78.556 65.1856 89.6427 54.099 89.6427 40.4229C89.6427 26.7468 78.556 15.6602 64.8799 15.6602C51.2038 15.6602 40.1172 26.7468 40.1172 40.4229C40.1172 54.099 51.2038 65.1856 64.8799 65.1856Z" stroke="#1D6ECE" style="stroke:#1D6ECE;stroke:color(display-p3 0.1137 0.4314 0.8078);stroke-opacity:1;" stroke-width="1.20052" stroke-miterlimit="10"/>\n              <path d="M61.5469 15.875L68.169 64.9475" stroke="#1D6ECE" style="stroke:#1D6ECE;stroke:color(display-p3 0.1137 0.4314 0.8078);stroke-opacity:1;" stroke-width="1.20052" stroke-miterlimit="10"/>\n              <path d="M89.4103 37.0977L40.3594 43.7197" stroke="#1D6ECE" style="stroke:#1D6ECE;stroke:color(display-p3 0.1137 0.4314 0.8078);stroke-opacity:1;" stroke-width="1.20052" stroke-miterlimit="10"/>\n              <path d="M61.5613 15.875C60.9358 16.4143 49.1368 26.7249 51.5311 42.6438C53.8391 58.0234 67.2343 64.4945 68.1834 64.9259" stroke="#1D6ECE" style="stroke:#1D6ECE;stroke:color(display-p3 0.1137 0.4314 0.8078);stroke-opacity:1;" stroke-width="1.20052" stroke-miterlimit="10"/>\n              <path d="M61.5469 15.875C62.3018 16.2201 76.4088 23.0364 78.3286 39.0415C80.1836 54.4859 68.9671 64.2788 68.169 64.9475" stroke="#1D6ECE" style="stroke:#1D6ECE;stroke:color(display-p3 0.1137 0.4314 0.8078);stroke-opacity:1;" stroke-width="1.20052" stroke-miterlimit="10"/>\n              <path d="M40.6484 34.968C45.2861 32.7031 51.4983 29.0362 63.0816 27.4831C73.2628 26.1242 81.6105 27.5694 86.7011 28.7558" stroke="#1D6ECE" style="stroke:#1D6ECE;stroke:color(display-p3 0.1137 0.4314 0.8078);stroke-opacity:1;" stroke-width="1.25272" stroke-miterlimit="10"/>\n              <path d="M43 52.1498C48.069 53.1204 55.0362 54.997 66.6195 53.4224C76.7791 52.0419 84.4582 48.4397 89.0527 45.9375" stroke="#1D6ECE" style="stroke:#1D6ECE;stroke:color(display-p3 0.1137 0.4314 0.8078);stroke-opacity:1;" stroke-width="1.25272" stroke-miterlimit="10"/>\n              <path d="M47.6363 76.9762L53.0901 88.4945L53.2371 88.4746L55.4484 75.9214L59.1611 75.4201L55.8393 91.9981L51.5233 92.5809L43.9159 77.4786L47.6363 76.9762ZM64.4168 74.7104L66.5557 90.5511L63.2066 91.0033L61.0677 75.1626L64.4168 74.7104ZM76.3807 77.7338C76.2346 77.1182 75.9036 76.6693 75.3877 76.3872C74.8718 76.1051 74.2117 76.0183 73.4072 76.1269C72.8607 76.2007 72.4096 76.3404 72.0541 76.5459C71.6978 76.7463 71.4373 76.9941 71.2724 77.2894C71.1126 77.584 71.0557 77.9015 71.1017 78.2418C71.1297 78.5268 71.2224 78.7663 71.3799 78.9603C71.5425 79.1536 71.7502 79.312 72.0032 79.4353C72.2554 79.5535 72.5413 79.6488 72.8608 79.7212C73.1797 79.7884 73.5171 79.8373 73.873 79.868L75.3422 80.0162C76.054 80.0776 76.7161 80.1982 77.3285 80.378C77.9408 80.5579 78.4838 80.8075 78.9575 81.1268C79.4311 81.4461 79.8184 81.8454 80.1194 82.3245C80.4255 82.803 80.6257 83.3719 80.72 84.0312C80.8458 85.0013 80.7117 85.8753 80.318 86.653C79.9286 87.4249 79.3015 88.0688 78.4366 88.5846C77.5761 89.0946 76.5013 89.4366 75.2122 89.6106C73.9334 89.7833 72.7931 89.7378 71.7914 89.474C70.7948 89.2095 69.9791 88.729 69.3443 88.0324C68.7139 87.3299 68.3088 86.4106 68.1292 85.2745L71.37 84.8369C71.4778 85.3632 71.6898 85.7861 72.006 86.1057C72.3267 86.4194 72.7261 86.6359 73.2042 86.7551C73.6868 86.8685 74.2169 86.8861 74.7944 86.8082C75.3616 86.7316 75.8429 86.5826 76.2383 86.3612C76.6388 86.1391 76.9353 85.8654 77.1276 85.5401C77.32 85.2149 77.3904 84.8615 77.3389 84.4799C77.2909 84.1241 77.1448 83.8393 76.9006 83.6255C76.6616 83.411 76.3296 83.2458 75.9044 83.13C75.4843 83.0134 74.9762 82.9245 74.3798 82.8633L72.5965 82.663C71.2171 82.5185 70.094 82.153 69.2273 81.5664C68.3605 80.9799 67.8507 80.101 67.6978 78.9298C67.5631 77.9714 67.7052 77.099 68.1241 76.3126C68.5481 75.5256 69.1867 74.8697 70.04 74.3449C70.8932 73.8202 71.8973 73.4798 73.0524 73.3238C74.2281 73.1651 75.2814 73.2276 76.2123 73.5115C77.1483 73.7946 77.9097 74.2615 78.4963 74.9121C79.083 75.5627 79.4477 76.3588 79.5906 77.3003L76.3807 77.7338ZM85.9525 87.932L82.3636 88.4166L85.6931 71.8375L90.0091 71.2547L97.6087 86.3581L94.0198 86.8427L88.4017 75.1576L88.278 75.1743L85.9525 87.932ZM84.8874 81.7358L93.3647 80.5912L93.7177 83.2055L85.2404 84.3502L84.8874 81.7358Z" fill="#20166D" style="fill:#20166D;fill:color(display-p3 0.1255 0.0863 0.4275);fill-opacity:1;"/>\n              <path d="M158.026 40.3742C161.236 43.1668 161.549 48.0471 158.757 51.2572L140.671 71.9792L149.231 123.419L142.654 130.961L122.115 93.2493L110.527 106.533L112.85 124.411L108.648 128.926L96.8778 110.5L77.0171 101.34L80.9057 96.5637L98.9135 96.4333L110.501 83.1493L70.3359 67.934L76.9127 60.3916L129.031 61.9053L147.117 41.1833C149.909 37.9732 154.79 37.6339 158 40.4264L158.026 40.3742Z" fill="white" stroke="#1C4BA0" style="fill:white;fill-opacity:1;stroke:#1C4BA0;stroke:color(display-p3 0.1098 0.2941 0.6275);stroke-opacity:1;" stroke-width="2.60982" stroke-miterlimit="10"/>\n              <path d="M92.204 120.426C92.0735 120.608 91.943 120.765 91.8125 120.948" stroke="#1C4BA0" style="stroke:#1C4BA0;stroke:color(display-p3 0.1098 0.2941 0.6275);stroke-opacity:1;" stroke-width="1.30491" stroke-linecap="round" stroke-linejoin="round" stroke-dasharray="2.61 2.61"/>\n              <path d="M88.5436 124.913C81.5754 132.612 72.5715 138.484 62.6803 141.642C50.7534 145.453 31.3624 148.715 21.0536 139.32C17.6608 136.24 15.312 128.776 21.3668 126.871C22.75 126.427 24.603 126.845 25.0727 128.202C25.6469 129.846 23.9244 131.386 22.2802 131.934C19.0962 132.978 15.4947 132.273 12.7022 130.446C8.70914 127.836 6.72567 123.321 5.49905 118.885C2.68044 108.602 2.02799 93.9347 10.014 85.6094" stroke="#1C4BA0" style="stroke:#1C4BA0;stroke:color(display-p3 0.1098 0.2941 0.6275);stroke-opacity:1;" stroke-width="1.30491" stroke-linecap="round" stroke-linejoin="round" stroke-dasharray="2.61 2.61"/>\n              <path d="M11.8828 83.911C12.0655 83.7805 12.2221 83.65 12.4048 83.5195" stroke="#1C4BA0" style="stroke:#1C4BA0;stroke:color(display-p3 0.1098 0.2941 0.6275);stroke-opacity:1;" stroke-width="1.30491" stroke-linecap="round" stroke-linejoin="round" stroke-dasharray="2.61 2.61"/>\n            </g>\n            <defs>\n              <clipPath id="clip0_25384_203626">\n                <rect width="161" height="147.325" fill="white" style="fill:white;fill-opacity:1;" transform="translate(0.96875)"/>\n              </clipPath>\n            </defs>\n          </svg>\n        </div>\n        \n        \n        <!-- Text beside SVG -->\n        <div style="line-height: 2.21vh;font-family: \'Inter\', sans-serif;font-size:1.66vh;text-align: center;">\n          <h3 style="margin:0 15px; color:#2862A9;">\n            Excited for Your Trip?\n          </h3>\n          <p style="margin:8px 0 15px 15px; color:#2862A9;">\n            Let’s Make Your Visa Process Easy!\n          </p>\n        </div>\n      </div>\n      \n      <!-- Welcome subtitle -->\n      <h2 style="line-height: 2.21vh;font-family: \'Inter\', sans-serif;font-size:1.66vh;color:#3B83DB; text-align:center;">\n        Welcome to your Visa Application Journey!\n      </h2>\n      \n      <!-- Intro paragraph with manual line break -->\n      <p style="margin:0 0 30px 0; font-size:1.66vh; line-height: 2.21vh; font-weight: 500;font-family: \'Inter\', sans-serif;text-align: center;">\n        Our guided process, along with the support of a TTK Visa Consultant will help you complete this journey with ease.\n      </p>\n      \n      <!-- Welcome subtitle -->\n      <h2 style="line-height: 2.21vh;font-family: \'Inter\', sans-serif;font-size:1.66vh; color:#3B83DB; text-align:center;">\n        What to expect at the end of this process\n      </h2>\n    </div>\n      \n    <!-- Bullet list -->\n     <div style="margin:0 0 30px 0;justify-content: center;align-items: center;display: flex;line-height: 2.21vh;" >\n\n       <ul style="margin:0;  font-size:1.66vh; line-height: 2.5vh; font-weight: 500;font-family: \'Inter\', sans-serif;">\n         <li style="margin-bottom:2vh;">\n           Look for your downloadable Docket. Your filled Visa Application Form will be automatically generated, ready for you to print and sign.\n         </li>\n         <li style="margin-bottom:2vh;">\n           An instruction sheet in the Docket will tell you exactly what to carry, including originals, copies, <br>and any additional documents.\n         </li>\n         <li style="margin-bottom:2vh;">\n           Our team will continuously review your details and documents to ensure everything is in order.<br> if you need anything at any time, our consultant will always be there to help you.\n         </li>\n         <li style="margin-bottom:2vh;">\n           A dedicated Visa Consultant will be assigned to assist and guide you at every step.\n         </li>\n         <li style="margin-bottom:2vh;">\n           For added convenience, you can choose from a range of Add-On Services during your application journey.\n         </li>\n         <li>\n           All your traveller details will be submitted and saved securely.\n         </li>\n       </ul>\n     </div>\n\n  </div>\n</body>\n</html>\n',
-        title='Display Field',
-    )
-    pct_completion: Optional[str] = Field(None, title='')
-    infopanes_completed: Optional[int] = Field(None, title='')
-    infopanes_total: Optional[int] = Field(None, title='')
-    form_status: Optional[str] = Field(
-        None, description='Used for form status', title=''
-    )
-    field_ver_status: Optional[Dict[str, Any]] = Field(None, title='Ver Status')
-    model_config = ConfigDict(
-        extra="allow", serialize_by_alias=True, use_enum_values=True
+        extra="allow",
+        serialize_by_alias=True,
+        use_enum_values=True,
+        defer_build=True,
     )
 
 
@@ -691,7 +199,10 @@ class RootPassportOtherDetails(BaseModel):
         None, description='Select Option', title='Are you a Minor?'
     )
     model_config = ConfigDict(
-        extra="allow", serialize_by_alias=True, use_enum_values=True
+        extra="allow",
+        serialize_by_alias=True,
+        use_enum_values=True,
+        defer_build=True,
     )
 
 
@@ -777,299 +288,10 @@ class RootPassportPassportDetails(BaseModel):
         None, description='Select Option', title='Country of Birth'
     )
     model_config = ConfigDict(
-        extra="allow", serialize_by_alias=True, use_enum_values=True
-    )
-
-
-class RootPhotographAddOnServicePhoto(BaseModel):
-    display_add_on_service: Optional[str] = Field(
-        None,
-        description='<!-- <div style="\n  display: flex;\n  align-items: left;\n  justify-content: left;\n  text-align: left;\n  margin-left: 15px;\n">\n  To know the cost, please refer the <strong>&nbsp;Add-On Cart Section</strong>.\n</div> -->\n<!DOCTYPE html>\n<html lang="en">\n<head>\n  <meta charset="UTF-8">\n  <title>Centered Paragraph</title>\n  <style>\n    .message-box {\n      font-family: \'Inter\', sans-serif;\n      font-weight: 425;\n      font-size: 16px;\n      text-align: left;\n    }\n  </style>\n</head>\n<body>\n    <div class="message-box">\n      <span>\n        <span style="font-weight: 600;"><b>Visa Photo Printing Assistance</b></span> <br>\n        Need help printing your photograph for visa filing? Visit the <b>Add-On Services</b> Cart to avail this service for a small fee.\n      </span>\n    </div>\n</body>\n</html>',
-        title='Display Field',
-    )
-    model_config = ConfigDict(
-        extra="allow", serialize_by_alias=True, use_enum_values=True
-    )
-
-
-class RootPhotographPassportPhoto(BaseModel):
-    upload_photo_display: Optional[str] = Field(
-        None,
-        description='<!-- <div style="\n  display: flex;\n  align-items: center;\n  justify-content: center;\n  text-align: center;\n">\n  If you’d like us to review your photo to make sure your photo meets the guidelines, \n  please upload it here.\n</div> -->\n<div style="\ndisplay: flex;\njustify-content: center;\nalign-items: center;">\n\n<div style="\n  text-align: center;\n  /* width: 1060px; */\n  font-family: \'Inter\', sans-serif;\n  font-weight: 500;\n  font-size: 16px;\n  line-height: 32px;\n  color: #000000;\n  text-align: center;\n">\nIf you’d like us to <strong>review</strong> your photo to make sure your photo meets the guidelines, <br>\nplease upload it here.\n</div>\n</div>',
-        title='Display Field',
-    )
-    photo: Optional[Union[str, Dict[str, Any]]] = Field(
-        None, description='Upload a Image/PDF', title='Passport-Size Photo (Optional)'
-    )
-    model_config = ConfigDict(
-        extra="allow", serialize_by_alias=True, use_enum_values=True
-    )
-
-
-class RootResidentialAddressResidentInOtherCountry(BaseModel):
-    address_proof: Optional[Union[str, Dict[str, Any]]] = Field(
-        None, description='Upload a PDF', title='Overseas Address Proof'
-    )
-    residence_permit_number: Optional[str] = Field(
-        None,
-        description='Enter Residence Permit Number',
-        title='Residence Permit Number',
-    )
-    permit_date_of_expiry: Optional[date] = Field(
-        None, description='DD/MM/YYYY', title='Permit Date of Expiry'
-    )
-    model_config = ConfigDict(
-        extra="allow", serialize_by_alias=True, use_enum_values=True
-    )
-
-
-class RootResidentialAddressResidentialAddressCardV1(BaseModel):
-    type_of_proof: Optional[Union[ADDRESSPROOFTYPE, str]] = Field(
-        None, description='Select Option', title='Type of Proof'
-    )
-    address_proof_upload: Optional[Union[str, Dict[str, Any]]] = Field(
-        None, description='Upload a Image/PDF', title='Upload Address Proof'
-    )
-    address_line_1: Optional[str] = Field(
-        None, description='Enter Address Line 1', title='Address Line 1'
-    )
-    address_line_2: Optional[str] = Field(
-        None, description='Enter Address Line 2', title='Address Line 2'
-    )
-    city: Optional[str] = Field(None, description='Enter City', title='City')
-    state: Optional[str] = Field(None, description='Enter State', title='State')
-    country: Optional[str] = Field(None, description='Enter Country', title='Country')
-    pin_code: Optional[str] = Field(
-        None, description='Enter PIN Code/ Postal Code', title='PIN Code'
-    )
-    model_config = ConfigDict(
-        extra="allow", serialize_by_alias=True, use_enum_values=True
-    )
-
-
-class RootResidentialAddressResidentialAddressCardV2(BaseModel):
-    address_line_1: Optional[str] = Field(
-        None, description='Enter Address Line 1', title='Address Line 1'
-    )
-    address_line_2: Optional[str] = Field(
-        None, description='Enter Address Line 2', title='Address Line 2'
-    )
-    city: Optional[str] = Field(None, description='Enter City', title='City')
-    state: Optional[str] = Field(None, description='Enter State', title='State')
-    country: Optional[str] = Field(None, description='Enter Country', title='Country')
-    pin_code: Optional[str] = Field(
-        None, description='Enter PIN Code/ Postal Code', title='PIN Code'
-    )
-    model_config = ConfigDict(
-        extra="allow", serialize_by_alias=True, use_enum_values=True
-    )
-
-
-class RootSalarySlipUpload(BaseModel):
-    salary_slip: Optional[Union[str, Dict[str, Any]]] = Field(
-        None, description='Upload a file', title='Salary Slip (Optional)'
-    )
-    model_config = ConfigDict(
-        extra="allow", serialize_by_alias=True, use_enum_values=True
-    )
-
-
-class RootScratchPad(BaseModel):
-    form_title: Optional[str] = Field(None, title='')
-    form_sub_title: Optional[str] = Field(None, title='')
-    form_indicator: Optional[str] = Field(None, title='')
-    field_ver_status: Optional[Dict[str, Any]] = Field(None, title='Ver Status')
-    model_config = ConfigDict(
-        extra="allow", serialize_by_alias=True, use_enum_values=True
-    )
-
-
-class RootSubmitInfoConfirm(BaseModel):
-    viewed_data: Optional[Union[CONFIRMVIEWEDDATA, str]] = Field(
-        None, description='Select Option', title=''
-    )
-    model_config = ConfigDict(
-        extra="allow", serialize_by_alias=True, use_enum_values=True
-    )
-
-
-class RootSubmitInfoDocket(BaseModel):
-    note: Optional[str] = Field(
-        None,
-        description='<div style="\ndisplay: flex;\njustify-content: center;\nalign-items: center;">\n\n<div style="\n  text-align: center;\n  /* width: 1060px; */\n  font-family: \'Inter\', sans-serif;\n  font-weight: 500;\n  font-size: 16px;\n  line-height: 32px;\n  color: #000000;\n  text-align: center;\n">\nNote : Enable the Docket for the Traveller only when all required documents are ready.\n</div>\n\n</div> ',
-        title='Display Field',
-    )
-    docket_status: Optional[Union[DOCKETSTATUS, str]] = Field(
-        None, description='Select Option', title=''
-    )
-    model_config = ConfigDict(
-        extra="allow", serialize_by_alias=True, use_enum_values=True
-    )
-
-
-class RootTicketingAddOnService(BaseModel):
-    display_add_on: Optional[str] = Field(
-        None,
-        description='<!DOCTYPE html>\n<html lang="en">\n<head>\n  <meta charset="UTF-8">\n  <title>Centered Paragraph</title>\n  <style>\n    .message-box {\n      font-family: \'Inter\', sans-serif;\n      font-weight: 425;\n      font-size: 16px;\n      text-align: left;\n      \n    }\n  </style>\n</head>\n<body>\n    <div class="message-box">\n      <span>\n\n        <span style="font-weight: 600;"><b>Dummy Flight Ticket Assistance</b></span> <br>\n        Need help booking a dummy flight ticket? Visit the <b>Add-On Services</b> Cart to avail this service for a small fee.\n      </span>\n    </div>\n</body>\n</html>',
-        title='Display Field',
-    )
-    model_config = ConfigDict(
-        extra="allow", serialize_by_alias=True, use_enum_values=True
-    )
-
-
-class RootTicketingFlightTickets(BaseModel):
-    flight_tickets: Optional[Union[str, Dict[str, Any]]] = Field(
-        None, description='Upload a PDF', title='Flight Tickets'
-    )
-    name_of_traveller: Optional[str] = Field(
-        None, description='Enter Name of the Traveller', title='Name of the Traveller'
-    )
-    airline: Optional[str] = Field(
-        None, description='Enter Name of Airline', title='Name of Airline'
-    )
-    port_of_entry: Optional[str] = Field(
-        None, description='Enter Port of Entry', title='Port of Entry'
-    )
-    port_of_exit: Optional[str] = Field(
-        None, description='Enter Port of Exit', title='Port of Exit'
-    )
-    arrival_date: Optional[date] = Field(
-        None, description='DD/MM/YYYY', title='Arrival Date / Check-in Date'
-    )
-    departure_date: Optional[date] = Field(
-        None, description='DD/MM/YYYY', title='Departure Date / Check-out Date'
-    )
-    model_config = ConfigDict(
-        extra="allow", serialize_by_alias=True, use_enum_values=True
-    )
-
-
-class RootTravelInsuranceAddOnCard(BaseModel):
-    instruction_display: Optional[str] = Field(
-        None,
-        description='<div style="\ndisplay: flex;\njustify-content: center;\nalign-items: center;">\n\n<div style="\n  text-align: center;\n  /* width: 1060px; */\n  font-family: \'Inter\', sans-serif;\n  font-weight: 500;\n  font-size: 16px;\n  line-height: 32px;\n  color: #000000;\n  text-align: center;\n">\n        To help us buy the insurance for you, kindly enter the details below.\n    </div>\n  </div>\n       \n',
-        title='Display Field',
-    )
-    nominee_name: Optional[str] = Field(
-        None, description='Enter Name of Nominee', title='Name of Nominee'
-    )
-    relationship_with_nominee: Optional[Union[RELATIONSHIP, str]] = Field(
-        None, description='Select Option', title='Relationship with Nominee'
-    )
-    pre_existing_disease: Optional[str] = Field(
-        None,
-        description='Enter Any pre-existing Disease?',
-        title='Any pre-existing Disease?',
-    )
-    pre_existing_disease_details: Optional[str] = Field(
-        None,
-        description='Enter Details of Pre-Existing Disease',
-        title='Details of Pre-Existing Disease',
-    )
-    plan_sum_insured: Optional[Union[INSURANCEPLAN, str]] = Field(
-        None, description='Select Option', title='Plan (Sum Insured)'
-    )
-    model_config = ConfigDict(
-        extra="allow", serialize_by_alias=True, use_enum_values=True
-    )
-
-
-class RootTravelInsuranceAddOnService(BaseModel):
-    display_add_on: Optional[str] = Field(
-        None,
-        description='<!-- <div style="\n  display: flex;\n  align-items: left;\n  justify-content: left;\n  text-align: left;\n  margin-left: 15px;\n">\nTo know the cost, please refer to the <strong>&nbsp;Add-On Cart Section</strong>.\n</div> -->\n<!DOCTYPE html>\n<html lang="en">\n<head>\n  <meta charset="UTF-8">\n  <title>Centered Paragraph</title>\n  <style>\n    .message-box {\n      font-family: \'Inter\', sans-serif;\n      font-weight: 425;\n      font-size: 16px;\n      text-align: left;\n      \n    }\n  </style>\n</head>\n<body>\n    <div class="message-box">\n      <span>\n\n        <span style="font-weight: 600;"><b>Travel Insurance Assistance</b></span> <br>\n        Looking for travel insurance?  Visit the <b>Add-On Services</b> Cart to avail this service for a small fee.\n      </span>\n    </div>\n</body>\n</html>',
-        title='Display Field',
-    )
-    model_config = ConfigDict(
-        extra="allow", serialize_by_alias=True, use_enum_values=True
-    )
-
-
-class RootTravelInsuranceFlightReservationDetails(BaseModel):
-    display_flight_reservation_details: Optional[str] = Field(
-        None,
-        description='<div style="\ndisplay: flex;\njustify-content: center;\nalign-items: center;">\n\n<div style="\n  text-align: center;\n  /* width: 1060px; */\n  font-family: \'Inter\', sans-serif;\n  font-weight: 500;\n  font-size: 16px;\n  line-height: 32px;\n  color: #000000;\n  text-align: center;\n">\nIf you’d like us to <strong> review </strong> your Travel Insurance to make sure it meets the guidelines, <br>\nplease upload it here. Make sure it includes all Schengen countries you\'re visiting.\n</div>\n</div>',
-        title='Display Field',
-    )
-    flight_reservation_tickets: Optional[Union[str, Dict[str, Any]]] = Field(
-        None, description='Upload a PDF', title='Insurance Document'
-    )
-    name_of_traveller: Optional[str] = Field(
-        None, description='Enter Name of the Traveller', title='Name of the Traveller'
-    )
-    passport_num: Optional[str] = Field(
-        None, description='Enter Passport Number', title='Passport Number'
-    )
-    dob: Optional[date] = Field(None, description='DD/MM/YYYY', title='Date of Birth')
-    address_of_travaller: Optional[str] = Field(
-        None, description='Enter Address of Traveller', title='Address of Traveller'
-    )
-    mobile_num: Optional[str] = Field(
-        None, description='Enter Mobile Number', title='Mobile Number'
-    )
-    email_id: Optional[str] = Field(None, description='Select Option', title='Email ID')
-    travel_start_date: Optional[date] = Field(
-        None,
-        description='DD/MM/YYYY',
-        title='Travel Start Date(Commencement Date / From)',
-    )
-    travel_end_date: Optional[date] = Field(
-        None, description='DD/MM/YYYY', title='Travel End Date (End Date / To)'
-    )
-    duration: Optional[str] = Field(
-        None, description='Enter Number of Days', title='Number of Days'
-    )
-    geographical_coverage: Optional[str] = Field(
-        None, description='Enter Geographical Coverage', title='Geographical Coverage'
-    )
-    name_of_insurance_company: Optional[str] = Field(
-        None,
-        description='Enter Name of the Insurance Company',
-        title='Name of the Insurance Company',
-    )
-    issue_date_of_travel: Optional[date] = Field(
-        None, description='DD/MM/YYYY', title='Issue Date of Travel Insurance'
-    )
-    travel_insurance_policy_num: Optional[str] = Field(
-        None,
-        description='Enter Travel Insurance Policy Number',
-        title='Travel Insurance Policy Number',
-    )
-    emergency_assitance_details: Optional[str] = Field(
-        None,
-        description='Enter Emergency Assistance Details',
-        title='Emergency Assistance Details',
-    )
-    sum_insured: Optional[str] = Field(
-        None, description='Enter Sum Insured', title='Sum Insured'
-    )
-    nominee_name: Optional[str] = Field(
-        None, description='Enter Name of Nominee', title='Name of Nominee'
-    )
-    relationship_with_nominee: Optional[str] = Field(
-        None,
-        description='Enter Relationship with Nominee',
-        title='Relationship with Nominee',
-    )
-    nominee_mobile: Optional[str] = Field(
-        None,
-        description='Enter Mobile Number of Nominee',
-        title='Mobile Number of Nominee',
-    )
-    model_config = ConfigDict(
-        extra="allow", serialize_by_alias=True, use_enum_values=True
-    )
-
-
-class RootTravelInsuranceInsuranceOptionsCard(BaseModel):
-    insurance_options: Optional[Union[INSURANCEOPTION, str]] = Field(
-        None,
-        description='Select Option',
-        title='Please let us know how your Travel Insurance is arranged:',
-    )
-    model_config = ConfigDict(
-        extra="allow", serialize_by_alias=True, use_enum_values=True
+        extra="allow",
+        serialize_by_alias=True,
+        use_enum_values=True,
+        defer_build=True,
     )
 
 
@@ -1078,50 +300,13 @@ class RootWorkAddressWorkDetails(BaseModel):
         None, description='Enter Current Occupation', title='Current Occupation'
     )
     model_config = ConfigDict(
-        extra="allow", serialize_by_alias=True, use_enum_values=True
+        extra="allow",
+        serialize_by_alias=True,
+        use_enum_values=True,
+        defer_build=True,
     )
 
 
-class SAMEACCOMMODATIONASPRIMARY(Enum):
-    ACCOMMODATION = 'ACCOMMODATION'
-
-
-class SAMEASPASSADDR(Enum):
-    SAME_AS_PASS_ADDR = 'SAME_AS_PASS_ADDR'
-
-
-class SAMEFLIGHTTICKETASPRIMARY(Enum):
-    FLIGHT_TICKET = 'FLIGHT_TICKET'
-
-
-class SKIPBANKSTATEMENTS(Enum):
-    YES = 'YES'
-
-
-class SKIPSALARYSLIPS(Enum):
-    YES = 'YES'
-
-
-class TICKETS(Enum):
-    BOOKED = 'BOOKED'
-    TTK_ASSITANCE = 'TTK_ASSITANCE'
-
-
-class VISAMODE(Enum):
-    E_Visa = 'E-Visa'
-    Paper = 'Paper'
-
-
-class VISATYPE(Enum):
-    Business = 'Business'
-    Dependent = 'Dependent'
-    Sports = 'Sports'
-    Student = 'Student'
-    Tourist = 'Tourist'
-    Visitor = 'Visitor'
-    Work = 'Work'
-
-
 class RootAccomodation(BaseModel):
     lock_accommodation: Optional[str] = Field(None, title='')
     accommodation_choice: Optional[RootAccomodationAccommodationChoice] = Field(
@@ -1138,7 +323,10 @@ class RootAccomodation(BaseModel):
     )
     field_ver_status: Optional[Dict[str, Any]] = Field(None, title='Ver Status')
     model_config = ConfigDict(
-        extra="allow", serialize_by_alias=True, use_enum_values=True
+        extra="allow",
+        serialize_by_alias=True,
+        use_enum_values=True,
+        defer_build=True,
     )
 
 
@@ -1153,18 +341,10 @@ class RootAdditionalDetails(BaseModel):
     )
     field_ver_status: Optional[Dict[str, Any]] = Field(None, title='Ver Status')
     model_config = ConfigDict(
-        extra="allow", serialize_by_alias=True, use_enum_values=True
-    )
-
-
-class RootAdditionalDocumentsPaneAdditionalDocumentsConsultantGroupAdditionaldocumentgroupconsultant(
-    BaseModel
-):
-    additional_documents_card_consultant: Optional[
-        RootAdditionalDocumentsPaneAdditionalDocumentsConsultantGroupAdditionaldocumentgroupconsultantAdditionalDocumentsCardConsultant
-    ] = Field(None, title='Template')
-    model_config = ConfigDict(
-        extra="allow", serialize_by_alias=True, use_enum_values=True
+        extra="allow",
+        serialize_by_alias=True,
+        use_enum_values=True,
+        defer_build=True,
     )
 
 
@@ -1175,93 +355,10 @@ class RootAdditionalDocumentsPaneAdditionalDocumentsTravellerGroupAdditionaldocu
         RootAdditionalDocumentsPaneAdditionalDocumentsTravellerGroupAdditionaldocumentgrouptravellerAdditionalDocumentsCardTraveller
     ] = Field(None, title='Additional Document')
     model_config = ConfigDict(
-        extra="allow", serialize_by_alias=True, use_enum_values=True
-    )
-
-
-class RootBankStatement(BaseModel):
-    display_bank_statements_header: Optional[str] = Field(
-        None,
-        description='<!-- <p style="font-size: 14px; font-weight: 500; color: #000; margin: 0; line-height: 1.3; text-align: left;">\nThe visa application requires you to carry your original Bank Statements covering the last 12 months with your Bank’s seal & signature. For detailed guideline, click on\n<span style="font-weight: 700; font-size: 1em;">\n    Instructions\n</span>\nin the top-right corner of this section.\n</p> -->\n<!DOCTYPE html>\n<html lang="en">\n<head>\n  <meta charset="UTF-8">\n  <title>Centered Bank Statement Text</title>\n  <style>\n    .center-wrapper {\n      display: flex;\n      justify-content: center;\n      align-items: center;\n    }\n\n    .message-box {\n      /* width: 1060px; */\n      font-family: \'Inter\', sans-serif;\n      font-weight: 500;\n      font-size: 16px;\n      line-height: 32px;\n      color: #000000;\n      text-align: center;\n    }\n  </style>\n</head>\n<body>\n  <div class="center-wrapper">\n    <div class="message-box">\n        The visa application requires you to carry your original Bank Statements covering the last 6 months with your Bank’s seal & signature.\n        For detailed guidelines on this, click on the\n        <span style="font-weight: 700; font-size: 1em;">\n          Instructions\n        </span>\n        in the top-right corner of this section.\n    </div>\n  </div>\n</body>\n</html>\n',
-        title='Display Field',
-    )
-    skip_bank_statements: Optional[Union[SKIPBANKSTATEMENTS, str]] = Field(
-        None, description='Select Option', title=''
-    )
-    upload: Optional[RootBankStatementUpload] = Field(
-        None, title='Bank Statements (Optional)'
-    )
-    field_ver_status: Optional[Dict[str, Any]] = Field(None, title='Ver Status')
-    model_config = ConfigDict(
-        extra="allow", serialize_by_alias=True, use_enum_values=True
-    )
-
-
-class RootConsultantInfoAdditionalDocumentsAdditionaldocumentgroup(BaseModel):
-    additional_documents_card: Optional[
-        RootConsultantInfoAdditionalDocumentsAdditionaldocumentgroupAdditionalDocumentsCard
-    ] = Field(None, title='Additional Document')
-    model_config = ConfigDict(
-        extra="allow", serialize_by_alias=True, use_enum_values=True
-    )
-
-
-class RootCoverLetterInfo(BaseModel):
-    display_field_1: Optional[str] = Field(
-        None,
-        description='The Visa Application requires the original Company Covering Letter.',
-        title='Display Field',
-    )
-    letter_option: Optional[Union[COVER, str]] = Field(
-        None, description='Select Option', title=''
-    )
-    generate_cover_letter: Optional[RootCoverLetterInfoGenerateCoverLetter] = Field(
-        None, title='Generate Covering Letter'
-    )
-    send_email: Optional[RootCoverLetterInfoSendEmail] = Field(None, title='')
-    covering_letter_card: Optional[RootCoverLetterInfoCoveringLetterCard] = Field(
-        None, title='Upload Covering Letter'
-    )
-    field_ver_status: Optional[Dict[str, Any]] = Field(None, title='Ver Status')
-    model_config = ConfigDict(
-        extra="allow", serialize_by_alias=True, use_enum_values=True
-    )
-
-
-class RootDocketInfo(BaseModel):
-    display_header_docket: Optional[str] = Field(
-        None,
-        description='<!-- <p style="font-size: 14px; font-weight: 500; color: #000; margin: 0; line-height: 1.3; text-align: left;">\nThe visa application requires you to carry your Original Salary Slips with your company’s seal and signature. \nFor detailed guideline on this, click on\n<span style="font-weight: 700; font-size: 1em;">\n    Instructions\n</span>\nin the top-right corner of this section.\n</p> -->\n\n<!DOCTYPE html>\n<html lang="en">\n  <head>\n    <meta charset="UTF-8" />\n    <title>Centered Paragraph</title>\n    <style>\n      .center-wrapper {\n        display: flex;\n        justify-content: center;\n        align-items: center;\n      }\n\n      .message-box {\n        /* width: 1060px; */\n        font-family: "Inter", sans-serif;\n        font-weight: 500;\n        font-size: 16px;\n        line-height: 32px;\n        color: #000000;\n        text-align: center;\n      }\n    </style>\n  </head>\n  <body>\n    <div class="center-wrapper">\n      <div class="message-box">\n        <p>Your Application Package (Docket), including the <b>Completed Application</b> and supporting documents (originals or copies), will be ready to download once our Visa Consultant has reviewed and validated everything. \n        If anything is missing, the Consultant will guide you.</p>\n        You\'ll receive a notification as soon as your package is ready.\n      </div>\n    </div>\n  </body>\n</html>\n',
-        title='Display Field',
-    )
-    operation_card: Optional[RootDocketInfoOperationCard] = Field(
-        None, title='Docket Operation'
-    )
-    field_ver_status: Optional[Dict[str, Any]] = Field(None, title='Ver Status')
-    model_config = ConfigDict(
-        extra="allow", serialize_by_alias=True, use_enum_values=True
-    )
-
-
-class RootInvitation(BaseModel):
-    display_field: Optional[str] = Field(
-        None,
-        description='The Visa Application requires an Invitation Letter from the Host Country (Inviting Company).',
-        title='Display Field',
-    )
-    letter_option: Optional[Union[INVITATION, str]] = Field(
-        None, description='Select Option', title=''
-    )
-    invitation_letter_generate: Optional[
-        RootInvitationInvitationLetterGenerate
-    ] = Field(None, title='Generate Invitation Letter')
-    send_email: Optional[RootInvitationSendEmail] = Field(None, title='')
-    invitation_letter_upload: Optional[RootInvitationInvitationLetterUpload] = Field(
-        None, title='Upload Invitation Letter'
-    )
-    field_ver_status: Optional[Dict[str, Any]] = Field(None, title='Ver Status')
-    model_config = ConfigDict(
-        extra="allow", serialize_by_alias=True, use_enum_values=True
+        extra="allow",
+        serialize_by_alias=True,
+        use_enum_values=True,
+        defer_build=True,
     )
 
 
@@ -1279,194 +376,10 @@ class RootPassport(BaseModel):
     )
     field_ver_status: Optional[Dict[str, Any]] = Field(None, title='Ver Status')
     model_config = ConfigDict(
-        extra="allow", serialize_by_alias=True, use_enum_values=True
-    )
-
-
-class RootPhotograph(BaseModel):
-    display_photograph_header: Optional[str] = Field(
-        None,
-        description='<!-- <p style="font-size: 14px; font-weight: 500; color: #000; margin: 0; line-height: 1.3; text-align: left;">\n You can fill your address using your passport, or provide an alternative ID to verify your address.\nFor detailed guidelines on this\n<span style="font-weight: 700; font-size: 1em;">\n    Instructions\n</span>\nin the top-right corner of this section.\n</p> -->\n\n<!DOCTYPE html>\n<html lang="en">\n<head>\n  <meta charset="UTF-8">\n  <title>Centered Paragraph</title>\n  <style>\n    .center-wrapper {\n      display: flex;\n      justify-content: center;\n      align-items: center;\n    }\n\n    .message-box {\n      /* width: 1060px; */\n      font-family: \'Inter\', sans-serif;\n      font-weight: 500;\n      font-size: 16px;\n      line-height: 32px;\n      color: #000000;\n      text-align: center;\n    }\n  </style>\n</head>\n<body>\n\n  <div class="center-wrapper">\n    <div class="message-box" style="text-align: center;">\n        For your appointment, you must carry four recent colour photographs (35mm x 40mm) with a white background of yourself. For detailed guideline on this, click on the\n        <span style="font-weight: 700; font-size: 1em;">\n          Instructions \n        </span>\n        in the top-right corner of this section.\n    </div>\n  </div>\n\n</body>\n</html>\n',
-        title='Display Field',
-    )
-    appointment_photo_option: Optional[Union[PHOTOGRAPHAPPOINTMENT, str]] = Field(
-        None, description='Select Option', title=''
-    )
-    passport_photo: Optional[RootPhotographPassportPhoto] = Field(
-        None, title='Review my Passport-Sized Photo (Optional)'
-    )
-    add_on_service_photo: Optional[RootPhotographAddOnServicePhoto] = Field(
-        None, title='Add-On Service'
-    )
-    field_ver_status: Optional[Dict[str, Any]] = Field(None, title='Ver Status')
-    model_config = ConfigDict(
-        extra="allow", serialize_by_alias=True, use_enum_values=True
-    )
-
-
-class RootResidentialAddress(BaseModel):
-    display_residential_address_header: Optional[str] = Field(
-        None,
-        description='<!-- <p style="font-size: 14px; font-weight: 500; color: #000; margin: 0; line-height: 1.3; text-align: left;">\n You can fill your address using your passport, or provide an alternative ID to verify your address.\nFor detailed guidelines on this\n<span style="font-weight: 700; font-size: 1em;">\n    Instructions\n</span>\nin the top-right corner of this section.\n</p> -->\n\n<!DOCTYPE html>\n<html lang="en">\n<head>\n  <meta charset="UTF-8">\n  <title>Centered Paragraph</title>\n  <style>\n    .center-wrapper {\n      display: flex;\n      justify-content: center;\n      align-items: center;\n    }\n\n    .message-box {\n      /* width: 1060px; */\n      font-family: \'Inter\', sans-serif;\n      font-weight: 500;\n      font-size: 16px;\n      line-height: 32px;\n      color: #000000;\n      text-align: center;\n    }\n  </style>\n</head>\n<body>\n\n  <div class="center-wrapper">\n    <div class="message-box">\n        You can fill your address using your passport, or provide an alternative ID to verify your address.\n        For detailed guidelines on this,click on the\n        <span style="font-weight: 700; font-size: 1em;">\n          Instructions\n        </span>\n        in the top-right corner of this section.\n    </div>\n  </div>\n\n</body>\n</html>\n',
-        title='Display Field',
-    )
-    same_as_passport_address: Optional[Union[SAMEASPASSADDR, str]] = Field(
-        None, description='Select Option', title=''
-    )
-    residential_address_card_v1: Optional[
-        RootResidentialAddressResidentialAddressCardV1
-    ] = Field(None, title='Current Residential Address')
-    residential_address_card_v2: Optional[
-        RootResidentialAddressResidentialAddressCardV2
-    ] = Field(None, title='Current Residential Address')
-    other_nationality: Optional[Union[OPTION, str]] = Field(
-        None,
-        description='Select Option',
-        title='Are you residing in a country other than the country of current nationality?',
-    )
-    resident_in_other_country: Optional[
-        RootResidentialAddressResidentInOtherCountry
-    ] = Field(None, title='Residence in another Country')
-    field_ver_status: Optional[Dict[str, Any]] = Field(None, title='Ver Status')
-    model_config = ConfigDict(
-        extra="allow", serialize_by_alias=True, use_enum_values=True
-    )
-
-
-class RootSalarySlip(BaseModel):
-    display_salary_slips_header: Optional[str] = Field(
-        None,
-        description='<!-- <p style="font-size: 14px; font-weight: 500; color: #000; margin: 0; line-height: 1.3; text-align: left;">\nThe visa application requires you to carry your Original Salary Slips with your company’s seal and signature. \nFor detailed guideline on this, click on\n<span style="font-weight: 700; font-size: 1em;">\n    Instructions\n</span>\nin the top-right corner of this section.\n</p> -->\n\n<!DOCTYPE html>\n<html lang="en">\n  <head>\n    <meta charset="UTF-8" />\n    <title>Centered Paragraph</title>\n    <style>\n      .center-wrapper {\n        display: flex;\n        justify-content: center;\n        align-items: center;\n      }\n\n      .message-box {\n        /* width: 1060px; */\n        font-family: "Inter", sans-serif;\n        font-weight: 500;\n        font-size: 16px;\n        line-height: 32px;\n        color: #000000;\n        text-align: center;\n      }\n    </style>\n  </head>\n  <body>\n    <div class="center-wrapper">\n      <div class="message-box">\n        Visa Application requires you to carry your Salary Slip of last 6\n        months as part of the visa application filing process. For more detailed\n        information, click on the\n        <span style="font-weight: 700; font-size: 1em"> Instructions </span>\n        in the top-right corner of this section.\n      </div>\n    </div>\n  </body>\n</html>\n',
-        title='Display Field',
-    )
-    skip_salary_slips: Optional[Union[SKIPSALARYSLIPS, str]] = Field(
-        None, description='Select Option', title=''
-    )
-    upload: Optional[RootSalarySlipUpload] = Field(
-        None, title='Salary Slips (Optional)'
-    )
-    field_ver_status: Optional[Dict[str, Any]] = Field(None, title='Ver Status')
-    model_config = ConfigDict(
-        extra="allow", serialize_by_alias=True, use_enum_values=True
-    )
-
-
-class RootSharedTravellInfoShared(BaseModel):
-    accommodation_same: Optional[Union[SAMEACCOMMODATIONASPRIMARY, str]] = Field(
-        None, description='Select Option', title=''
-    )
-    flight_ticket_same: Optional[Union[SAMEFLIGHTTICKETASPRIMARY, str]] = Field(
-        None, description='Select Option', title=''
-    )
-    model_config = ConfigDict(
-        extra="allow", serialize_by_alias=True, use_enum_values=True
-    )
-
-
-class RootSubmitInfo(BaseModel):
-    docket: Optional[RootSubmitInfoDocket] = Field(None, title='Docket')
-    instruction: Optional[str] = Field(
-        None,
-        description='<div style="\ndisplay: flex;\njustify-content: center;\nalign-items: center;">\n\n<div style="\n  text-align: center;\n  /* width: 1060px; */\n  font-family: \'Inter\', sans-serif;\n  font-weight: 500;\n  font-size: 16px;\n  line-height: 32px;\n  color: #000000;\n  text-align: center;\n">\nPlease confirm the following before submitting the application to the Checker.\n</div>\n\n</div> ',
-        title='Display Field',
-    )
-    confirm: Optional[RootSubmitInfoConfirm] = Field(None, title='Confirm')
-    field_ver_status: Optional[Dict[str, Any]] = Field(None, title='Ver Status')
-    model_config = ConfigDict(
-        extra="allow", serialize_by_alias=True, use_enum_values=True
-    )
-
-
-class RootTicketingTickets(BaseModel):
-    ticket_options: Optional[Union[TICKETS, str]] = Field(
-        None,
-        description='Select Option',
-        title='Please let us know how your Tickets are arranged:',
-    )
-    model_config = ConfigDict(
-        extra="allow", serialize_by_alias=True, use_enum_values=True
-    )
-
-
-class RootTravelInsurance(BaseModel):
-    display_header_travel_insurance: Optional[str] = Field(
-        None,
-        description='<!-- <p style="font-size: 14px; font-weight: 500; color: #000; margin: 0; line-height: 1.3; text-align: left;">\nThe visa application requires you to carry a copy of your Travel Insurance for the Schengen country you are visiting. For detailed guidelines on this,\n<span style="font-weight: 700; font-size: 1em;">\n    Instructions\n</span>\nin the top-right corner of this section.\n</p> -->\n\n<!DOCTYPE html>\n<html lang="en">\n<head>\n  <meta charset="UTF-8">\n  <title>Centered Paragraph</title>\n  <style>\n    .center-wrapper {\n      display: flex;\n      justify-content: center;\n      align-items: center;\n    }\n\n    .message-box {\n      /* width: 1060px; */\n      font-family: \'Inter\', sans-serif;\n      font-weight: 500;\n      font-size: 16px;\n      line-height: 32px;\n      color: #000000;\n      text-align: center;\n    }\n  </style>\n</head>\n<body>\n\n    <div class="center-wrapper">\n        <div class="message-box" style="text-align: center;">\n                The visa application requires you to carry a copy of your Travel Insurance for the Schengen country you are visiting.\n                For detailed guidelines on this,click on the\n                <span style="font-weight: 700; font-size: 1em;">\n                    Instructions\n                </span>\n                in the top-right corner of this section.\n        </div>\n    </div>\n</body>\n</html>',
-        title='Display Field',
-    )
-    insurance_options_card: Optional[RootTravelInsuranceInsuranceOptionsCard] = Field(
-        None, title='Insurance'
-    )
-    lock_travel_insurance: Optional[str] = Field(None, title='')
-    add_on_card: Optional[RootTravelInsuranceAddOnCard] = Field(
-        None, title='Details Required for Insurance'
-    )
-    flight_reservation_details: Optional[
-        RootTravelInsuranceFlightReservationDetails
-    ] = Field(None, title='Insurance Details')
-    add_on_service: Optional[RootTravelInsuranceAddOnService] = Field(
-        None, title='Add-On Service'
-    )
-    field_ver_status: Optional[Dict[str, Any]] = Field(None, title='Ver Status')
-    model_config = ConfigDict(
-        extra="allow", serialize_by_alias=True, use_enum_values=True
-    )
-
-
-class RootVisaRequestInformationVisaRequest(BaseModel):
-    phone_number: Optional[str] = Field(
-        None, description='Enter Phone Number', title='Phone Number'
-    )
-    email_id: Optional[str] = Field(
-        None, description='Enter Email ID', title='Email ID'
-    )
-    from_country: Optional[Union[COUNTRY3, str]] = Field(
-        None, description='Select Option', title='Travelling From'
-    )
-    to_country: Optional[Union[COUNTRY3, str]] = Field(
-        None, description='Select Option', title='Travelling To'
-    )
-    departure_date: Optional[date] = Field(
-        None, description='DD/MM/YYYY', title='Date of Departure'
-    )
-    arrival_date: Optional[date] = Field(
-        None, description='DD/MM/YYYY', title='Date of Return'
-    )
-    visa_type: Optional[Union[VISATYPE, str]] = Field(
-        None, description='Select Option', title='Type of Visa'
-    )
-    purpose_of_stay: Optional[str] = Field(
-        None,
-        description='Enter Additional Purpose of Stay',
-        title='Additional Purpose of Stay',
-    )
-    validity: Optional[int] = Field(
-        None,
-        description='Enter Validity of Visa (in Days)',
-        title='Validity of Visa (in Days)',
-    )
-    no_of_entries: Optional[Union[NUMBEROFENTRIES, str]] = Field(
-        None, description='Select Option', title='Number of Entries'
-    )
-    visa_mode: Optional[Union[VISAMODE, str]] = Field(
-        None, description='Select Option', title='Visa Mode (E-Visa/Paper)'
-    )
-    no_of_travellers: Optional[int] = Field(
-        None, description='Enter Number of Travellers', title='Number of Travellers'
-    )
-    from_country_full_name: Optional[str] = Field(None, title='')
-    to_country_full_name: Optional[str] = Field(None, title='')
-    departure_date_formatted: Optional[str] = Field(None, title='')
-    arrival_date_formatted: Optional[str] = Field(None, title='')
-    traveller_type: Optional[str] = Field(None, title='')
-    traveller_id: Optional[str] = Field(None, title='')
-    form_title: Optional[str] = Field(None, title='')
-    order_id: Optional[str] = Field(None, title='')
-    earliest_appointment_availability: Optional[str] = Field(None, title='')
-    visa_processing_type: Optional[str] = Field(None, title='')
-    form_indicator: Optional[str] = Field(None, title='')
-    model_config = ConfigDict(
-        extra="allow", serialize_by_alias=True, use_enum_values=True
+        extra="allow",
+        serialize_by_alias=True,
+        use_enum_values=True,
+        defer_build=True,
     )
 
 
@@ -1476,16 +389,10 @@ class RootWorkAddress(BaseModel):
     )
     field_ver_status: Optional[Dict[str, Any]] = Field(None, title='Ver Status')
     model_config = ConfigDict(
-        extra="allow", serialize_by_alias=True, use_enum_values=True
-    )
-
-
-class FieldGrpRootAdditionalDocumentsPaneAdditionalDocumentsConsultantGroup(BaseModel):
-    additionaldocumentgroupconsultant: Optional[
-        RootAdditionalDocumentsPaneAdditionalDocumentsConsultantGroupAdditionaldocumentgroupconsultant
-    ] = Field(None, title='Templates')
-    model_config = ConfigDict(
-        extra="allow", serialize_by_alias=True, use_enum_values=True
+        extra="allow",
+        serialize_by_alias=True,
+        use_enum_values=True,
+        defer_build=True,
     )
 
 
@@ -1494,16 +401,10 @@ class FieldGrpRootAdditionalDocumentsPaneAdditionalDocumentsTravellerGroup(BaseM
         RootAdditionalDocumentsPaneAdditionalDocumentsTravellerGroupAdditionaldocumentgrouptraveller
     ] = Field(None, title='Additional Documents')
     model_config = ConfigDict(
-        extra="allow", serialize_by_alias=True, use_enum_values=True
-    )
-
-
-class FieldGrpRootConsultantInfoAdditionalDocuments(BaseModel):
-    additionaldocumentgroup: Optional[
-        RootConsultantInfoAdditionalDocumentsAdditionaldocumentgroup
-    ] = Field(None, title='Additional Document')
-    model_config = ConfigDict(
-        extra="allow", serialize_by_alias=True, use_enum_values=True
+        extra="allow",
+        serialize_by_alias=True,
+        use_enum_values=True,
+        defer_build=True,
     )
 
 
@@ -1527,64 +428,10 @@ class RootAdditionalDocumentsPane(BaseModel):
     ] = Field(None, title='Additional Document')
     field_ver_status: Optional[Dict[str, Any]] = Field(None, title='Ver Status')
     model_config = ConfigDict(
-        extra="allow", serialize_by_alias=True, use_enum_values=True
-    )
-
-
-class RootConsultantInfo(BaseModel):
-    instruction_letter: Optional[RootConsultantInfoInstructionLetter] = Field(
-        None, title='Instruction Sheet'
-    )
-    additional_documents: Optional[
-        List[FieldGrpRootConsultantInfoAdditionalDocuments]
-    ] = Field(None, title='Additional Document')
-    field_ver_status: Optional[Dict[str, Any]] = Field(None, title='Ver Status')
-    model_config = ConfigDict(
-        extra="allow", serialize_by_alias=True, use_enum_values=True
-    )
-
-
-class RootSharedTravellInfo(BaseModel):
-    instruction: Optional[str] = Field(
-        None,
-        description='You may have details in common with the Primary Traveller. Select the ones that apply to you below.',
-        title='Display Field',
-    )
-    shared: Optional[RootSharedTravellInfoShared] = Field(
-        None, title='Same as Primary Traveller'
-    )
-    field_ver_status: Optional[Dict[str, Any]] = Field(None, title='Ver Status')
-    model_config = ConfigDict(
-        extra="allow", serialize_by_alias=True, use_enum_values=True
-    )
-
-
-class RootTicketing(BaseModel):
-    tickets: Optional[RootTicketingTickets] = Field(None, title='Flight Tickets')
-    flight_tickets: Optional[RootTicketingFlightTickets] = Field(
-        None, title='Flight Tickets'
-    )
-    add_on_service: Optional[RootTicketingAddOnService] = Field(
-        None, title='Add-On Service'
-    )
-    field_ver_status: Optional[Dict[str, Any]] = Field(None, title='Ver Status')
-    model_config = ConfigDict(
-        extra="allow", serialize_by_alias=True, use_enum_values=True
-    )
-
-
-class RootVisaRequestInformation(BaseModel):
-    display_info_header: Optional[str] = Field(
-        None,
-        description='<!-- <p style="font-size: 14px; font-weight: 500; color: #000; margin: 0; line-height: 1.3; text-align: left;">\n  Please review your\n  <span style="font-weight: bold; font-size: 1em;">\n    Visa Request\n  </span>\n  details below. If you have any questions, you can contact us.\n</p> -->\n<!DOCTYPE html>\n<html lang="en">\n<head>\n  <meta charset="UTF-8">\n  <title>Centered Paragraph</title>\n  <style>\n    .center-wrapper {\n      display: flex;\n      justify-content: center;\n      align-items: center;\n    }\n\n    .message-box {\n      /* width: 1060px; */\n      font-family: \'Inter\', sans-serif;\n      font-weight: 500;\n      font-size: 16px;\n      line-height: 32px;\n      color: #000000;\n      text-align: center;\n    }\n  </style>\n</head>\n<body>\n  <div class="center-wrapper">\n    <div class="message-box">\n        Please <strong> review </strong> your Visa Request details below.\n        <!-- <span style="font-weight: bold; font-size: 1em;">\n          Visa Request\n        </span>\n        details below. If you have any questions, you can contact us. -->\n    </div>\n  </div>\n</body>\n</html>\n',
-        title='Display Field',
-    )
-    visa_request: Optional[RootVisaRequestInformationVisaRequest] = Field(
-        None, title='Summary'
-    )
-    field_ver_status: Optional[Dict[str, Any]] = Field(None, title='Ver Status')
-    model_config = ConfigDict(
-        extra="allow", serialize_by_alias=True, use_enum_values=True
+        extra="allow",
+        serialize_by_alias=True,
+        use_enum_values=True,
+        defer_build=True,
     )
 
 
@@ -1662,5 +509,8 @@ class UniversalModelWithCoverInvitationLetter(BaseModel):
     )
     scratch_pad: Optional[RootScratchPad] = Field(None, title='Scratch Pad')
     model_config = ConfigDict(
-        extra="allow", serialize_by_alias=True, use_enum_values=True
+        extra="allow",
+        serialize_by_alias=True,
+        use_enum_values=True,
+        defer_build=True,
     )
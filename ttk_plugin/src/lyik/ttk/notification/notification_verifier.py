@@ -21,6 +21,7 @@ from lyik.ttk.models.generated.universal_model_with_cover_invitation_letter impo
 from lyikpluginmanager.annotation import RequiredEnv
 from typing_extensions import Doc
 from lyik.ttk.utils.message import get_error_message
+from lyik.ttk.utils.record_sections import RecordSections
 
 logger = logging.getLogger(__name__)
 impl = pluggy.HookimplMarker(getProjectName())
@@ -107,8 +108,8 @@ class NotificationVerifier(VerifyHandlerSpec):
             if context.record:
                 # Adjust the path below to your record structure if needed.
                 # Get the order_id from the record
-                full_form_record = UniversalModelWithCoverInvitationLetter(
-                    **context.record
+                full_form_record = RecordSections(
+                    context.record, UniversalModelWithCoverInvitationLetter
                 )
                 order_id = (
                     full_form_record.visa_request_information.visa_request.order_id
@@ -27,6 +27,7 @@ from dateutil.relativedelta import relativedelta
 import logging
 from lyik.ttk.utils.message import get_error_message
 from lyik.ttk.utils.utils import format_date_to_string
+from lyik.ttk.utils.record_sections import RecordSections
 
 logger = logging.getLogger(__name__)
 
@@ -57,7 +58,7 @@ class PassportIPVerifier(VerifyHandlerSpec):
         if ret:
             return ret
 
-        full_form_record = UniversalModel.model_validate(context.record)
+        full_form_record = RecordSections(context.record, UniversalModel)
 
         india_return_date = None
         if (
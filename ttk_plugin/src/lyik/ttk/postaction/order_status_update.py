@@ -20,7 +20,8 @@ import json
 from datetime import date, datetime, time
 
 from lyik.ttk.utils.form_indicator import FormIndicator, get_form_indicator
-from lyik.ttk.utils.form_utils import FormConfig
+from lyik.ttk.utils.form_utils import get_form_config
+from lyik.ttk.utils.record_sections import RecordSections
 from lyik.ttk.models.generated import UniversalModel, UniversalModelWithAppointment
 
 from lyik.ttk.models.forms.schengentouristvisa import DOCKETSTATUS
@@ -87,11 +88,13 @@ class OrderStatusUpdate(PostActionProcessorSpec):
                 # return payload
                 inner_ttk_token = "example_token"
 
-            frm_config = FormConfig(form_indicator=form_indicator)
+            frm_config = get_form_config(form_indicator=form_indicator)
             if frm_config.has_appointment_section():
-                parsed_form_rec = UniversalModelWithAppointment(**payload.model_dump())
+                parsed_form_rec = RecordSections(
+                    payload, UniversalModelWithAppointment
+                )
             else:
-                parsed_form_rec = UniversalModel(**payload.model_dump())
+                parsed_form_rec = RecordSections(payload, UniversalModel)
 
             makerConfirmation = False
             appointmentDetails = {}
@@ -1,13 +1,80 @@
 from abc import ABC, abstractmethod
+from typing import ClassVar, Set, Tuple, Type
+from pydantic import BaseModel
 from typing_extensions import Annotated, Doc
 from lyikpluginmanager import (
     ContextModel,
-    GenericFormRecordModel,
 )
 from lyik.ttk.utils.form_indicator import FormIndicator
+from ._form_config import PreActionFormConfig
+from ._record_context import PreActionRecordContext
+from ._record_patch import RecordPatchList
 
 
 class BaseUnifiedPreActionProcessor(ABC):
+    """
+    Base of the unified pre-action processors.
+
+    Each processor declares the record paths it reads and writes, in the dot separated
+    form used by `RecordPatch.path`, where a `*` part matches any key. A path covers
+    everything below it. The Central Preaction uses these to run processors whose paths
+    do not conflict concurrently, keeping the list order wherever they overlap.
+    The defaults conflict with everything, so an undeclared processor runs on its own.
+
+    Processors which only derive their writes from their reads can set `skip_if_unchanged`.
+    On save they are skipped when none of their input sections changed since the record
+    was last saved, as their previous results are still in the record.
+
+    Processors which are not `critical` (their results are not needed for the record to be
+    correct, e.g. calls to downstream services) run within a time budget: `timeout_seconds`
+    and what is left of the pipeline budget. On overrun they are cancelled and their changes
+    are dropped. Critical processors are always awaited.
+
+    Instances are created once per pipeline plan and shared by the requests using it,
+    so processors must not keep request state on `self`.
+    """
+
+    # The typed view of the record the processor works on
+    model: ClassVar[Type[BaseModel] | None] = None
+    reads: ClassVar[Tuple[str, ...]] = ("*",)
+    writes: ClassVar[Tuple[str, ...]] = ("*",)
+    skip_if_unchanged: ClassVar[bool] = False
+    critical: ClassVar[bool] = True
+    timeout_seconds: ClassVar[float | None] = None
+
+    @classmethod
+    def read_sections(cls) -> Set[str]:
+        """
+        The top level sections of the record the processor reads.
+        """
+        return {path.split(".")[0] for path in cls.reads}
+
+    @classmethod
+    def write_sections(cls) -> Set[str]:
+        """
+        The top level sections of the record the processor writes.
+        """
+        return {path.split(".")[0] for path in cls.writes}
+
+    def __init__(
+        self,
+        form_config: PreActionFormConfig | None = None,
+        form_config_error: Exception | None = None,
+    ):
+        self._form_config = form_config
+        self._form_config_error = form_config_error
+
+    @property
+    def form_config(self) -> PreActionFormConfig:
+        """
+        The form config of the pipeline plan.
+        Raises the error met while loading it, if it could not be loaded.
+        """
+        if self._form_config is None:
+            error = self._form_config_error or ValueError("Form config is not loaded")
+            raise type(error)(*error.args)
+        return self._form_config
+
     @abstractmethod
     async def unified_pre_action_processor_impl(
         self,
@@ -16,13 +83,17 @@ class BaseUnifiedPreActionProcessor(ABC):
         current_state: Annotated[str | None, Doc("Current saved state of the record")],
         new_state: Annotated[str | None, Doc("New incoming state of the record")],
         form_indicator: Annotated[FormIndicator | None, Doc("Form Indicator")],
-        payload: Annotated[
-            GenericFormRecordModel, Doc("Form record payload to process")
+        record_context: Annotated[
+            PreActionRecordContext,
+            Doc("Request scoped record shared by all the processors"),
         ],
     ) -> Annotated[
-        GenericFormRecordModel, Doc("The updated payload after processing.")
+        RecordPatchList | None,
+        Doc("The changes to the record, or None if nothing was modified"),
     ]:
         """
         Abstract method to be implemented by all preaction processors.
+        Processors read typed views from the record context and return the changes they make
+        as patches, which are applied by the Central Preaction.
         """
         pass
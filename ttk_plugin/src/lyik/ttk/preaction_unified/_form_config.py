@@ -0,0 +1,30 @@
+from typing import Tuple
+
+from pydantic import BaseModel, ConfigDict
+
+from lyik.ttk.utils import FormConfig
+
+
+class PreActionFormConfig(BaseModel):
+    """
+    The form config values used by the pre-action processors, read once per pipeline plan.
+    Immutable, as it is shared by all the requests using the plan.
+    """
+
+    model_config = ConfigDict(frozen=True)
+
+    has_appointment_section: bool = False
+    has_submission_docket_status_requirement: bool = False
+    relevant_infopanes: Tuple[str, ...] = ()
+    business_panes: Tuple[str, ...] = ()
+    common_infopanes: Tuple[str, ...] = ()
+
+    @classmethod
+    def from_form_config(cls, frm_config: FormConfig) -> "PreActionFormConfig":
+        return cls(
+            has_appointment_section=frm_config.has_appointment_section(),
+            has_submission_docket_status_requirement=frm_config.has_submission_docket_status_requirement(),
+            relevant_infopanes=tuple(frm_config.get_relevant_infopane_list()),
+            business_panes=tuple(frm_config.get_business_panes_list()),
+            common_infopanes=tuple(frm_config.get_common_infopanes_list()),
+        )
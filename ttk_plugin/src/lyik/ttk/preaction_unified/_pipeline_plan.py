@@ -0,0 +1,89 @@
+import logging
+import threading
+from typing import Callable, Dict, FrozenSet, Tuple
+
+from pydantic import BaseModel, ConfigDict
+
+from lyik.ttk.utils import get_form_config
+from lyik.ttk.utils.form_indicator import FormIndicator
+from ._base_preaction import BaseUnifiedPreActionProcessor
+from ._form_config import PreActionFormConfig
+
+logger = logging.getLogger(__name__)
+
+
+class PipelineStep(BaseModel):
+    """
+    One processor of a pipeline plan.
+    """
+
+    model_config = ConfigDict(frozen=True, arbitrary_types_allowed=True)
+
+    processor: BaseUnifiedPreActionProcessor
+    # Indexes of the earlier steps which have to be done before this one starts
+    dependencies: FrozenSet[int] = frozenset()
+    # Time budget of a non critical processor, None for no budget of its own
+    timeout_seconds: float | None = None
+
+
+class PipelinePlan(BaseModel):
+    """
+    The pre-action pipeline of a form indicator, compiled once and reused across requests.
+    """
+
+    model_config = ConfigDict(frozen=True, arbitrary_types_allowed=True)
+
+    form_indicator: FormIndicator | None = None
+    form_config: PreActionFormConfig | None = None
+    steps: Tuple[PipelineStep, ...] = ()
+    # Time budget of the non critical processors, counted from the start of the pipeline
+    timeout_seconds: float | None = None
+    # Content hash of the form_config CSV the plan was compiled from, None if missing
+    config_version: str | None = None
+
+
+def get_form_config_version(form_indicator: FormIndicator | None) -> str | None:
+    """
+    Content hash of the form_config CSV of the form indicator, None if there is none.
+    """
+    if form_indicator is None:
+        return None
+    try:
+        return get_form_config(form_indicator).version
+    except Exception:
+        return None
+
+
+class PipelinePlanCache:
+    """
+    Pipeline plans by form indicator. A plan is compiled on first use and compiled again
+    only when the form_config CSV of its form indicator changes.
+    """
+
+    def __init__(
+        self,
+        compile_plan: Callable[[FormIndicator | None, str | None], PipelinePlan],
+    ):
+        self._compile_plan = compile_plan
+        self._plans: Dict[FormIndicator | None, PipelinePlan] = {}
+        self._lock = threading.Lock()
+
+    def get(self, form_indicator: FormIndicator | None) -> PipelinePlan:
+        version = get_form_config_version(form_indicator)
+        plan = self._plans.get(form_indicator)
+        if plan is not None and plan.config_version == version:
+            return plan
+        with self._lock:
+            plan = self._plans.get(form_indicator)
+            if plan is None or plan.config_version != version:
+                logger.info(
+                    "Compiling pre-action pipeline plan for %s",
+                    form_indicator.value if form_indicator else None,
+                )
+                plan = self._compile_plan(form_indicator, version)
+                self._plans[form_indicator] = plan
+        return plan
+
+    def clear(self) -> None:
+        with self._lock:
+            self._plans.clear()
@@ -0,0 +1,285 @@
+import copy
+import logging
+import typing
+from typing import Any, Dict, Iterable, List, Set, Tuple, Type, TypeVar
+
+from pydantic import BaseModel
+from lyikpluginmanager import GenericFormRecordModel
+
+from lyik.ttk.utils.form_indicator import FormIndicator, get_form_indicator
+from lyik.ttk.utils.record_sections import get_field_adapter
+
+from ._record_patch import RecordPatch, RecordPatchList, any_paths_overlap
+from ._section_fingerprint import (
+    FINGERPRINT_KEY,
+    fingerprint,
+    is_section,
+    section_fingerprint,
+    serialize_section,
+)
+
+logger = logging.getLogger(__name__)
+
+ModelT = TypeVar("ModelT", bound=BaseModel)
+
+
+def _new_container(parent: Any, name: str) -> Any:
+    """
+    Create an empty value for a missing intermediate part of a patch path.
+    A sub-model if the parent model declares one for the field, else a dict.
+    """
+    if isinstance(parent, BaseModel):
+        field = type(parent).model_fields.get(name)
+        if field is not None:
+            for candidate in (field.annotation, *typing.get_args(field.annotation)):
+                if isinstance(candidate, type) and issubclass(candidate, BaseModel):
+                    return candidate()
+    return {}
+
+
+def _get_child(obj: Any, name: str) -> Any:
+    if isinstance(obj, list):
+        return obj[int(name)]
+    if isinstance(obj, dict):
+        return obj.get(name)
+    if isinstance(obj, BaseModel):
+        if name in type(obj).model_fields:
+            return getattr(obj, name)
+        return (obj.__pydantic_extra__ or {}).get(name)
+    return None
+
+
+def _set_child(obj: Any, name: str, value: Any, validate: bool) -> None:
+    if isinstance(obj, list):
+        obj[int(name)] = value
+    elif isinstance(obj, dict):
+        obj[name] = value
+    elif name in type(obj).model_fields:
+        if validate:
+            value = get_field_adapter(type(obj), name).validate_python(value)
+        setattr(obj, name, value)
+    else:
+        obj.__pydantic_extra__[name] = value
+
+
+def _remove_child(obj: Any, name: str) -> None:
+    if isinstance(obj, list):
+        del obj[int(name)]
+    elif isinstance(obj, dict):
+        obj.pop(name, None)
+    elif name in type(obj).model_fields:
+        setattr(obj, name, None)
+    else:
+        (obj.__pydantic_extra__ or {}).pop(name, None)
+
+
+def _apply_patch(root: Any, patch: RecordPatch, validate: bool) -> None:
+    """
+    Apply a patch to a record tree (plain dicts) or a typed view (pydantic models).
+    When `validate` is set, replaced model fields are validated against their annotation.
+
+    Copy-on-write: plain dicts and lists on the path may be shared with the incoming payload,
+    so they are shallow copied and relinked before being changed, never modified in place.
+    """
+    obj = root
+    *parents, leaf = patch.parts
+    for name in parents:
+        child = _get_child(obj, name)
+        if child is None:
+            if patch.op == "remove":
+                return
+            child = _new_container(obj, name) if validate else {}
+            _set_child(obj, name, child, validate=False)
+        elif isinstance(child, (dict, list)):
+            child = copy.copy(child)
+            _set_child(obj, name, child, validate=False)
+        obj = child
+    if patch.op == "remove":
+        _remove_child(obj, leaf)
+    else:
+        _set_child(obj, leaf, patch.value, validate=validate)
+
+
+class PreActionRecordContext:
+    """
+    Request scoped holder of the form record processed by the unified pre-action pipeline.
+
+    The record tree shares the sections of the incoming payload, which is never modified:
+    changes are applied copy-on-write, so the payload stays a valid snapshot to fall back
+    to without copying the record up front. Typed views such as `UniversalModel` or
+    `UniversalModelWithAppointment` are validated lazily from that tree the first time
+    a processor asks for them and are shared by all later processors.
+
+    Processors do not modify the views. They return `RecordPatch` changes which are staged
+    here: applied to the materialized views right away, so later processors observe them,
+    and kept in an ordered journal. The journal is merged into the record tree once,
+    when the outgoing payload is built by `to_payload`.
+
+    Every section of the outgoing record carries a fingerprint of its content. Comparing it
+    with the incoming content tells which sections changed since the record was last saved.
+    The incoming sections are only serialized and hashed when a processor asks whether they
+    changed; if none does, the stored fingerprints are dropped instead of being verified.
+    """
+
+    def __init__(self, payload: GenericFormRecordModel):
+        # Shallow: only the top level is owned, the sections are shared with the payload
+        self._record: Dict[str, Any] = {
+            name: value.model_dump() if isinstance(value, BaseModel) else value
+            for name, value in (payload.model_extra or {}).items()
+        }
+        self._views: Dict[Type[BaseModel], BaseModel] = {}
+        self._journal: List[Tuple[str, RecordPatchList]] = []
+        # section name -> fingerprint of the incoming content, computed on first use
+        self._fingerprints: Dict[str, str] | None = None
+        self._size: int = 0
+        # Resolved from the incoming record on first use
+        self._form_indicator: FormIndicator | None = None
+        self._form_indicator_resolved = False
+
+    @property
+    def record(self) -> Dict[str, Any]:
+        """
+        The record tree as received, without the staged changes. Must be treated as read-only.
+        """
+        return self._record
+
+    @property
+    def form_indicator(self) -> FormIndicator | None:
+        """
+        The form indicator of the incoming record, resolved once per request.
+        """
+        if not self._form_indicator_resolved:
+            self._form_indicator = get_form_indicator(self._record)
+            self._form_indicator_resolved = True
+        return self._form_indicator
+
+    @property
+    def changes(self) -> List[Tuple[str, RecordPatchList]]:
+        """
+        The staged changes in order, as (source, patches) pairs.
+        """
+        return list(self._journal)
+
+    def _get_fingerprints(self) -> Dict[str, str]:
+        if self._fingerprints is None:
+            self._fingerprints = {}
+            for name, value in self._record.items():
+                if is_section(name, value):
+                    serialized = serialize_section(value)
+                    self._fingerprints[name] = fingerprint(serialized)
+                    self._size += len(serialized)
+        return self._fingerprints
+
+    @property
+    def size(self) -> int | None:
+        """
+        Serialized size in bytes of the incoming sections, known once the fingerprints have
+        been computed, else None.
+        """
+        return self._size if self._fingerprints is not None else None
+
+    def sections_unchanged(self, sections: Iterable[str], allow_missing: bool) -> bool:
+        """
+        Whether the incoming sections match the fingerprints stored when the record was last
+        saved. `*` stands for all the sections present.
+        A missing section counts as changed, unless `allow_missing` is set and the record has
+        been saved with fingerprints before (sections are not removed from a saved record).
+        """
+        fingerprints = self._get_fingerprints()
+        sections = set(sections)
+        if "*" in sections:
+            sections = (sections - {"*"}) | fingerprints.keys()
+        for name in sections:
+            if name not in fingerprints:
+                if allow_missing and self._has_stored_fingerprints():
+                    continue
+                return False
+            if self._record[name].get(FINGERPRINT_KEY) != fingerprints[name]:
+                return False
+        return True
+
+    def _has_stored_fingerprints(self) -> bool:
+        return any(
+            FINGERPRINT_KEY in value
+            for name, value in self._record.items()
+            if is_section(name, value)
+        )
+
+    def is_modified(self, paths: Iterable[str]) -> bool:
+        """
+        Whether any staged change overlaps one of the paths.
+        """
+        paths = list(paths)
+        return any(
+            any_paths_overlap([patch.path], paths)
+            for _, patches in self._journal
+            for patch in patches
+        )
+
+    def view(self, model_cls: Type[ModelT]) -> ModelT:
+        """
+        Get the record, including the staged changes, as `model_cls`.
+        Validated on first access and cached for the request. Must be treated as read-only.
+        Raises the pydantic ValidationError if the record cannot be parsed into the model.
+        """
+        view = self._views.get(model_cls)
+        if view is None:
+            view = model_cls.model_validate(self._record)
+            for _, patches in self._journal:
+                for patch in patches:
+                    _apply_patch(view, patch, validate=True)
+            self._views[model_cls] = view
+        return view
+
+    def stage(self, source: str, patches: RecordPatchList | None) -> None:
+        """
+        Stage the changes made by `source` (usually the processor name).
+        """
+        if not patches:
+            return
+        for model_cls, view in list(self._views.items()):
+            try:
+                for patch in patches:
+                    _apply_patch(view, patch, validate=True)
+            except Exception as e:
+                # Drop the view, it is rebuilt from the tree and journal on next access.
+                logger.warning(
+                    "Dropping view %s after applying changes of %s failed: %s",
+                    model_cls.__name__,
+                    source,
+                    e,
+                )
+                del self._views[model_cls]
+        self._journal.append((source, list(patches)))
+
+    def to_payload(self) -> GenericFormRecordModel:
+        """
+        Merge the staged changes into the record tree and build the outgoing payload.
+        The fingerprints of the sections are brought up to date, or dropped if the incoming
+        sections were not hashed in this request.
+        """
+        fingerprints = self._fingerprints
+        touched: Set[str] = set()
+        for _, patches in self._journal:
+            for patch in patches:
+                _apply_patch(self._record, patch, validate=False)
+                touched.add(patch.parts[0])
+        self._journal.clear()
+
+        for name, value in list(self._record.items()):
+            if not is_section(name, value):
+                continue
+            if fingerprints is None:
+                # Unverified, it may no longer match the content
+                if FINGERPRINT_KEY in value:
+                    self._record[name] = {
+                        key: item
+                        for key, item in value.items()
+                        if key != FINGERPRINT_KEY
+                    }
+                continue
+            if name in touched or name not in fingerprints:
+                fingerprints[name] = section_fingerprint(value)
+            if value.get(FINGERPRINT_KEY) != fingerprints[name]:
+                self._record[name] = {**value, FINGERPRINT_KEY: fingerprints[name]}
+        return GenericFormRecordModel.model_validate(self._record)
@@ -0,0 +1,41 @@
+from typing import Any, Iterable, List, Literal
+
+from pydantic import BaseModel, Field
+
+
+class RecordPatch(BaseModel):
+    """
+    A single change to the form record, in the spirit of a JSON-Patch operation.
+
+    The path is a dot separated list of keys from the root of the record, for example
+    `lets_get_started.pct_completion`. Numeric parts index into lists.
+    Missing intermediate sections are created when a value is replaced.
+    """
+
+    op: Literal["replace", "remove"] = Field(
+        "replace", description="'replace' sets the value, 'remove' deletes the key"
+    )
+    path: str = Field(..., description="Dot separated path of the field")
+    value: Any = Field(None, description="Plain (dumped) value for 'replace'")
+
+    @property
+    def parts(self) -> List[str]:
+        return self.path.split(".")
+
+
+RecordPatchList = List[RecordPatch]
+
+
+def paths_overlap(path_a: str, path_b: str) -> bool:
+    """
+    Two record paths overlap if one is a prefix of the other. `*` matches any key.
+    """
+    for part_a, part_b in zip(path_a.split("."), path_b.split(".")):
+        if part_a != part_b and "*" not in (part_a, part_b):
+            return False
+    return True
+
+
+def any_paths_overlap(paths_a: Iterable[str], paths_b: Iterable[str]) -> bool:
+    paths_b = list(paths_b)
+    return any(paths_overlap(a, b) for a in paths_a for b in paths_b)
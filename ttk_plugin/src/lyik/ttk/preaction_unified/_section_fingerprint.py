@@ -0,0 +1,34 @@
+import hashlib
+import json
+from typing import Any, Dict
+
+# Stored in every section of the record, next to `_ver_status`
+FINGERPRINT_KEY = "_fingerprint"
+
+
+def is_section(name: str, value: Any) -> bool:
+    """
+    Sections are the top level infopanes of the record, e.g. `passport` or `visa_request_information`.
+    """
+    return not name.startswith("_") and isinstance(value, dict)
+
+
+def serialize_section(section: Dict[str, Any]) -> bytes:
+    """
+    Canonical JSON of a section, without its own stored fingerprint.
+    """
+    content = {key: value for key, value in section.items() if key != FINGERPRINT_KEY}
+    return json.dumps(
+        content, sort_keys=True, separators=(",", ":"), default=str
+    ).encode()
+
+
+def fingerprint(serialized: bytes) -> str:
+    return hashlib.blake2b(serialized, digest_size=16).hexdigest()
+
+
+def section_fingerprint(section: Dict[str, Any]) -> str:
+    """
+    Content hash of a section, without its own stored fingerprint.
+    """
+    return fingerprint(serialize_section(section))
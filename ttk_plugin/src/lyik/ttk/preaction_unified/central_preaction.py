@@ -1,5 +1,8 @@
+import asyncio
+import os
+import time
 from typing_extensions import Doc, Annotated
-from typing import List, Type
+from typing import Dict, List, Set, Type
 
 import apluggy as pluggy
 from lyikpluginmanager import (
@@ -11,16 +14,28 @@ from lyikpluginmanager import (
 )
 from lyikpluginmanager.annotation import RequiredVars
 import logging
-from lyik.ttk.utils import FormConfig
+from lyik.ttk.utils import get_form_config
+from lyik.ttk.utils.metrics import get_metrics_sink
+from lyik.ttk.utils.config_warmup import (
+    get_configured_form_indicators,
+    is_config_warmup_enabled,
+)
 
 logger = logging.getLogger(__name__)
 logging.basicConfig(level=logging.info)
 
 impl = pluggy.HookimplMarker(getProjectName())
 
+PREACTION_TIMEOUT_ENV = "TTK_PREACTION_TIMEOUT_SECONDS"
+DEFAULT_PREACTION_TIMEOUT_SECONDS = 8.0
+
 # Unified Base preaction processor
 from ._base_preaction import BaseUnifiedPreActionProcessor
-from lyik.ttk.utils.form_indicator import FormIndicator, get_form_indicator
+from ._record_context import PreActionRecordContext
+from ._record_patch import RecordPatchList, any_paths_overlap
+from ._form_config import PreActionFormConfig
+from ._pipeline_plan import PipelinePlan, PipelinePlanCache, PipelineStep
+from lyik.ttk.utils.form_indicator import FormIndicator
 
 # PREACTION PROCESSORS
 # 1 - Semi - Universal. Only for
@@ -84,21 +99,260 @@ BASIC_FORM_PREACTION_LIST = [
 PreactionCls = Type[BaseUnifiedPreActionProcessor]
 
 
-def _get_processors_for_form_indicator(
-    form_indicator: FormIndicator,
-) -> List[PreactionCls]:
+def _conflicts(earlier: PreactionCls, later: PreactionCls) -> bool:
+    """
+    The later processor has to wait for the earlier one if it reads or writes
+    what the earlier one writes, or writes what the earlier one reads.
+    """
+    return any_paths_overlap(
+        earlier.writes, later.reads + later.writes
+    ) or any_paths_overlap(earlier.reads, later.writes)
+
+
+def _metric_labels(form_indicator: FormIndicator | None, action: str) -> Dict[str, str]:
+    return {
+        "form_indicator": form_indicator.value if form_indicator else "unknown",
+        "action": (action or "").lower(),
+    }
+
+
+def _can_skip(
+    processor_cls: PreactionCls,
+    action: str,
+    record_context: PreActionRecordContext,
+) -> bool:
+    """
+    A processor can be skipped on save if it is marked `skip_if_unchanged`, the sections it
+    reads and writes are unchanged since the record was last saved, and no earlier processor
+    changed what it reads. The sections it writes must be present, they hold its results.
+    """
+    if not processor_cls.skip_if_unchanged or (action or "").lower() != "save":
+        return False
+    write_sections = processor_cls.write_sections()
+    return (
+        record_context.sections_unchanged(write_sections, allow_missing=False)
+        and record_context.sections_unchanged(
+            processor_cls.read_sections() - write_sections, allow_missing=True
+        )
+        and not record_context.is_modified(processor_cls.reads)
+    )
+
+
+def _get_dependencies(processors: List[PreactionCls]) -> List[Set[int]]:
+    """
+    For every processor, the indexes of the earlier processors it has to wait for.
+    """
+    return [
+        {j for j in range(i) if _conflicts(processors[j], processors[i])}
+        for i in range(len(processors))
+    ]
+
+
+def _compile_pipeline_plan(
+    form_indicator: FormIndicator | None, config_version: str | None
+) -> PipelinePlan:
+    """
+    Build the pipeline plan of the form indicator: the processors, created with the form
+    config, the processors each one has to wait for and the time budgets.
+
+    The pipeline budget is read from TTK_PREACTION_TIMEOUT_SECONDS, the budget of a
+    processor from TTK_PREACTION_TIMEOUT_SECONDS_<PROCESSOR CLASS NAME IN UPPER CASE>,
+    falling back to its `timeout_seconds`.
+    """
+    form_config: PreActionFormConfig | None = None
+    form_config_error: Exception | None = None
     try:
-        frm_config = FormConfig(form_indicator=form_indicator)
-        if frm_config.has_appointment_section():
-            return FORM_WITH_APPOINTMENT_PREACTION_LIST
+        form_config = PreActionFormConfig.from_form_config(
+            get_form_config(form_indicator=form_indicator)
+        )
+        if form_config.has_appointment_section:
+            processors = FORM_WITH_APPOINTMENT_PREACTION_LIST
         else:
-            return FORM_WITHOUT_APPOINTMENT_PREACTION_LIST
+            processors = FORM_WITHOUT_APPOINTMENT_PREACTION_LIST
     except Exception as e:
         logger.warning(
             "Unexpected exception during Form Config interpretation. Msg: %s", e
         )
-        return FORM_WITHOUT_APPOINTMENT_PREACTION_LIST
-        # return BASIC_FORM_PREACTION_LIST  # Return a default processor list on error
+        form_config_error = e
+        processors = FORM_WITHOUT_APPOINTMENT_PREACTION_LIST
+        # processors = BASIC_FORM_PREACTION_LIST  # Use a default processor list on error
+
+    dependencies = _get_dependencies(processors)
+    return PipelinePlan(
+        form_indicator=form_indicator,
+        form_config=form_config,
+        config_version=config_version,
+        timeout_seconds=_get_timeout(
+            PREACTION_TIMEOUT_ENV, DEFAULT_PREACTION_TIMEOUT_SECONDS
+        ),
+        steps=tuple(
+            PipelineStep(
+                processor=processor_cls(
+                    form_config=form_config, form_config_error=form_config_error
+                ),
+                dependencies=frozenset(dependencies[index]),
+                timeout_seconds=_get_timeout(
+                    f"{PREACTION_TIMEOUT_ENV}_{processor_cls.__name__.upper()}",
+                    processor_cls.timeout_seconds,
+                ),
+            )
+            for index, processor_cls in enumerate(processors)
+        ),
+    )
+
+
+def _get_timeout(env_name: str, default: float | None) -> float | None:
+    """
+    Time budget in seconds from the environment variable, else the default.
+    A value of 0 or less disables the budget.
+    """
+    value = os.getenv(env_name)
+    if not value:
+        return default
+    try:
+        timeout = float(value)
+    except ValueError:
+        logger.warning("Ignoring invalid %s value: %r", env_name, value)
+        return default
+    return timeout if timeout > 0 else None
+
+
+_PIPELINE_PLANS = PipelinePlanCache(compile_plan=_compile_pipeline_plan)
+
+if is_config_warmup_enabled():
+    for _form_indicator in get_configured_form_indicators():
+        _PIPELINE_PLANS.get(_form_indicator)
+
+
+async def _run_plan(
+    plan: PipelinePlan,
+    record_context: PreActionRecordContext,
+    action: str,
+    form_indicator: FormIndicator | None,
+    **kwargs,
+) -> None:
+    """
+    Run the processors of the plan, each as soon as the earlier processors it conflicts with are done.
+    The changes of a processor are staged before the processors waiting for it start,
+    so the result is the same as running the list in order.
+    If any processor fails, the remaining ones are cancelled and the error of the
+    first failed processor in list order is raised.
+
+    Non critical processors are given the smaller of their own budget and what is left of
+    the pipeline budget. On overrun they are cancelled and their changes dropped, and the
+    processors waiting for them go on.
+
+    Every processor reports its latency and the payload size as histograms, and its outcome
+    (modified, unchanged, skipped, timeout, error or cancelled) as a counter, to the metrics sink.
+    """
+    steps = plan.steps
+    loop = asyncio.get_running_loop()
+    deadline = (
+        loop.time() + plan.timeout_seconds if plan.timeout_seconds is not None else None
+    )
+    metrics = get_metrics_sink()
+    request_labels = _metric_labels(form_indicator, action)
+    tasks: List[asyncio.Task] = []
+
+    async def run(index: int) -> None:
+        step = steps[index]
+        if step.dependencies:
+            await asyncio.gather(*(tasks[j] for j in step.dependencies))
+        processor = step.processor
+        processor_cls = type(processor)
+        labels = {**request_labels, "processor": processor_cls.__name__}
+        if _can_skip(processor_cls, action, record_context):
+            metrics.increment(
+                "preaction_processor_total", {**labels, "outcome": "skipped"}
+            )
+            logger.info(
+                "Skipping %s, its input sections are unchanged: %s",
+                processor_cls.__name__,
+                sorted(processor_cls.read_sections() | processor_cls.write_sections()),
+            )
+            return
+        budget: float | None = None
+        if not processor_cls.critical:
+            budget = step.timeout_seconds
+            if deadline is not None:
+                remaining = deadline - loop.time()
+                budget = remaining if budget is None else min(budget, remaining)
+        if record_context.size is not None:
+            metrics.observe(
+                "preaction_processor_payload_bytes", record_context.size, labels
+            )
+        patches: RecordPatchList | None = None
+        outcome = "error"
+        start = time.perf_counter()
+        try:
+            if budget is not None and budget <= 0:
+                raise asyncio.TimeoutError()
+            patches = await asyncio.wait_for(
+                processor.unified_pre_action_processor_impl(
+                    record_context=record_context,
+                    action=action,
+                    form_indicator=form_indicator,
+                    **kwargs,
+                ),
+                timeout=budget,
+            )
+            outcome = "modified" if patches else "unchanged"
+        except asyncio.TimeoutError:
+            if budget is None:
+                # Raised by the processor itself, not an overrun of a budget
+                raise
+            outcome = "timeout"
+            logger.warning(
+                "%s overran its time budget of %.2f s, its changes are dropped.",
+                processor_cls.__name__,
+                max(budget, 0),
+            )
+            return
+        except asyncio.CancelledError:
+            outcome = "cancelled"
+            raise
+        finally:
+            elapsed = time.perf_counter() - start
+            metrics.observe("preaction_processor_latency_seconds", elapsed, labels)
+            metrics.increment("preaction_processor_total", {**labels, "outcome": outcome})
+            logger.debug(
+                "%s finished in %.1f ms (%s)",
+                processor_cls.__name__,
+                elapsed * 1000,
+                outcome,
+            )
+        if patches:
+            logger.info(
+                "%s modified: %s",
+                processor_cls.__name__,
+                [patch.path for patch in patches],
+            )
+            undeclared = [
+                patch.path
+                for patch in patches
+                if not any_paths_overlap([patch.path], processor_cls.writes)
+            ]
+            if undeclared:
+                logger.warning(
+                    "%s modified paths not declared in its writes: %s",
+                    processor_cls.__name__,
+                    undeclared,
+                )
+        record_context.stage(source=processor_cls.__name__, patches=patches)
+
+    for index in range(len(steps)):
+        tasks.append(asyncio.create_task(run(index)))
+
+    try:
+        await asyncio.gather(*tasks)
+    except BaseException:
+        for task in tasks:
+            task.cancel()
+        results = await asyncio.gather(*tasks, return_exceptions=True)
+        for result in results:
+            if isinstance(result, Exception):
+                raise result
+        raise
 
 
 class Central_Preaction(PreActionProcessorSpec):
@@ -138,30 +392,40 @@ class Central_Preaction(PreActionProcessorSpec):
         """
         This preaction processor will do all preaction processing required for TTK forms.
         """
-        # Parse to the form model
-        form_indicator = get_form_indicator(form_rec=payload)
+        start = time.perf_counter()
+        # Parse once, shared by all the processors
+        record_context = PreActionRecordContext(payload=payload)
 
-        payload_original = GenericFormRecordModel.model_validate(payload.model_dump())
+        form_indicator = record_context.form_indicator
 
-        processors_ordered_list = _get_processors_for_form_indicator(
-            form_indicator=form_indicator
-        )
+        plan = _PIPELINE_PLANS.get(form_indicator)
+        metrics = get_metrics_sink()
+        labels = _metric_labels(form_indicator, action)
+        outcome = "error"
         try:
-            for processor_cls in processors_ordered_list:
-                processor: BaseUnifiedPreActionProcessor = processor_cls()
-                payload = await processor.unified_pre_action_processor_impl(
-                    context=context,
-                    action=action,
-                    current_state=current_state,
-                    new_state=new_state,
-                    form_indicator=form_indicator,
-                    payload=payload,
-                )
+            await _run_plan(
+                plan,
+                record_context,
+                context=context,
+                action=action,
+                current_state=current_state,
+                new_state=new_state,
+                form_indicator=form_indicator,
+            )
+            # Merge all the staged changes once
+            result = record_context.to_payload()
+            outcome = "ok"
+            return result
         except PluginException as pe:
+            outcome = "rejected"
             logger.warning("Preaction hard-stop: %s", str(pe))
             raise  # bubble up explicit plugin exception
         except Exception as e:
             logger.error(f"Error processing payload: {e}")
-            return payload_original  # Return original payload on error to prevent data loss.
-
-        return payload
+            # The payload is never modified, return it as it came on error to prevent data loss.
+            return payload
+        finally:
+            metrics.observe(
+                "preaction_pipeline_latency_seconds", time.perf_counter() - start, labels
+            )
+            metrics.increment("preaction_pipeline_total", {**labels, "outcome": outcome})
@@ -5,7 +5,6 @@ from typing_extensions import Doc, Annotated
 import apluggy as pluggy
 from lyikpluginmanager import (
     ContextModel,
-    GenericFormRecordModel,
     PluginException,
 )
 from lyik.ttk.models.generated.universal_model import UniversalModel
@@ -16,6 +15,8 @@ logger = logging.getLogger(__name__)
 logging.basicConfig(level=logging.info)
 
 from .._base_preaction import BaseUnifiedPreActionProcessor
+from .._record_context import PreActionRecordContext
+from .._record_patch import RecordPatch, RecordPatchList
 
 
 class dbClient(BaseModel):
@@ -27,6 +28,10 @@ class dbClient(BaseModel):
 
 
 class AppendMakerId(BaseUnifiedPreActionProcessor):
+    model = UniversalModel
+    reads = ("travel.travel_details.maker_id", "_owner")
+    writes = ("_owner",)
+
     async def unified_pre_action_processor_impl(
         self,
         context: ContextModel,
@@ -52,47 +57,43 @@ class AppendMakerId(BaseUnifiedPreActionProcessor):
             FormIndicator,
             Doc("The form indicator for the form"),
         ],
-        payload: Annotated[
-            GenericFormRecordModel,
+        record_context: Annotated[
+            PreActionRecordContext,
             Doc(
-                "The payload of form record data to be pre processed to append maker_id in owner's list."
+                "The shared form record data to be pre processed to append maker_id in owner's list."
             ),
         ],
-    ) -> Annotated[
-        GenericFormRecordModel,
-        Doc("The updated form record data."),
-    ]:
+    ) -> Annotated[RecordPatchList | None, Doc("The updated _owner list, if any")]:
         """
         This preaction processor will append maker_id into the _owner list of the record.
         """
-        logger.debug(f"Entering preaction with payload: {payload}")
+        logger.debug(f"Entering preaction with payload: {record_context.record}")
         if not context or not hasattr(context, "token") or not context.token:
             logger.debug(
                 "No token found in context. Passing through AppendMakerId preaction."
             )
-            return payload
+            return None
         try:
-            record_payload = UniversalModel(**payload.model_dump())
+            record_payload = record_context.view(self.model)
             maker_id = record_payload.travel.travel_details.maker_id
 
             if maker_id:
-                new_record_payload = _set_owner(
-                    record_payload.model_dump(mode="json"), maker_id
-                )
-                return GenericFormRecordModel.model_validate(new_record_payload)
-            else:
-                return GenericFormRecordModel.model_validate(
-                    record_payload.model_dump(mode="json")
-                )
+                return [
+                    RecordPatch(
+                        path="_owner",
+                        value=_get_owners(record_context.record, maker_id),
+                    )
+                ]
+            return None
 
         except Exception as e:
             logger.error(f"Error processing payload: {e}")
-            return payload  # Important:  Return original payload on error to prevent data loss.
+            return None  # Important:  Leave the record untouched on error to prevent data loss.
 
 
-def _set_owner(rec: dict, client: str) -> dict:
+def _get_owners(rec: dict, client: str) -> list:
     """
-    Updates the record with current owner, if not already present.
+    Returns the owner list of the record with the current owner, if not already present.
     """
     owner_list = rec.get("_owner", [])
     current_owner = client
@@ -102,5 +103,4 @@ def _set_owner(rec: dict, client: str) -> dict:
     owner_set.add(current_owner)
 
     # Convert the set back to a list to update record
-    rec["_owner"] = list(owner_set)
-    return rec
+    return list(owner_set)
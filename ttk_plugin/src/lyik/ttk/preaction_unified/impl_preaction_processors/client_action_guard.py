@@ -7,7 +7,6 @@ from typing_extensions import Doc, Annotated
 
 from lyikpluginmanager import (
     ContextModel,
-    GenericFormRecordModel,
     PluginException,
 )
 import jwt
@@ -17,14 +16,17 @@ from lyik.ttk.models.generated.universal_model_with_submission_requires_docket_s
 )
 from lyik.ttk.utils.form_indicator import FormIndicator
 from .._base_preaction import BaseUnifiedPreActionProcessor
-
-from lyik.ttk.utils.form_utils import FormConfig
+from .._record_context import PreActionRecordContext
 
 logger = logging.getLogger(__name__)
 logging.basicConfig(level=logging.INFO)
 
 
 class ClientActionGuard(BaseUnifiedPreActionProcessor):
+    model = UniversalModelWithSubmissionRequiresDocketStatus
+    # May reject the whole request, so it keeps the default reads/writes and runs
+    # on its own: nothing listed after it starts before it has passed.
+
     async def unified_pre_action_processor_impl(
         self,
         context: ContextModel,
@@ -35,8 +37,8 @@ class ClientActionGuard(BaseUnifiedPreActionProcessor):
             FormIndicator,
             Doc("The form indicator for the form"),
         ],
-        payload: Annotated[GenericFormRecordModel, "entire form record model"],
-    ) -> Annotated[GenericFormRecordModel, "The (possibly unchanged) record"]:
+        record_context: Annotated[PreActionRecordContext, "shared form record"],
+    ) -> None:
         """
         1) If the current user is a CLIENT and the docket has been ENABLED for download,
            block any save/submit with an exception.
@@ -46,11 +48,10 @@ class ClientActionGuard(BaseUnifiedPreActionProcessor):
             logger.error(
                 "ContextModel or token is missing in the context. Passing through OrderStatusUpdate Preaction."
             )
-            return payload
+            return
         token = context.token
-        frm_config = FormConfig(form_indicator=form_indicator)
-        if not frm_config.has_submission_docket_status_requirement():
-            return payload
+        if not self.form_config.has_submission_docket_status_requirement:
+            return
 
         # Step 1: Decode outer token
         # --- decode outer JWT (no signature check) ---
@@ -58,7 +59,7 @@ class ClientActionGuard(BaseUnifiedPreActionProcessor):
             outer = self._decode_jwt(token)
         except Exception as e:
             logger.error("Failed to decode JWT: %s", e)
-            return payload
+            return
 
         # --- extract persona list ---
         persona_list = (
@@ -66,18 +67,16 @@ class ClientActionGuard(BaseUnifiedPreActionProcessor):
         )
         is_client = any(p in ("CLI", "CLIENT") for p in persona_list)
 
-        # 0) Parse incoming payload into our Pydantic form
+        # 0) Get the shared record as our Pydantic form
         try:
-            form = UniversalModelWithSubmissionRequiresDocketStatus(
-                **payload.model_dump()
-            )
+            form = record_context.view(self.model)
         except Exception as exc:
             logger.error("ClientActionGuard: cannot parse payload – %s", exc)
-            # fallback to original
-            return payload
+            # leave the record untouched
+            return
 
         # --- 1) freeze after docket enabled ---
-        if is_client and frm_config.has_submission_docket_status_requirement():
+        if is_client and self.form_config.has_submission_docket_status_requirement:
             ds = None
             if form.submit_info and form.submit_info.docket:
                 ds = form.submit_info.docket.docket_status
@@ -86,8 +85,7 @@ class ClientActionGuard(BaseUnifiedPreActionProcessor):
                     "Once your docket has been enabled for download, you may no longer save or submit this application."
                 )
 
-        # Nothing to modify – hand back the original record
-        return payload
+        # Nothing to modify – the record is left untouched
 
     def _decode_jwt(self, token: str) -> Dict[str, Any]:
         try:
@@ -3,13 +3,11 @@ from typing import Annotated, Callable, Dict, List, Tuple, Union
 import apluggy as pluggy
 from lyikpluginmanager import (
     ContextModel,
-    GenericFormRecordModel,
 )
 from lyik.ttk.models.generated.universal_model_with_appointment import (
     UniversalModelWithAppointment,
     RootPassportPassportDetails,
     RootResidentialAddressResidentialAddressCardV2,
-    RootResidentialAddress,
 )
 from typing_extensions import Doc
 from lyik.ttk.utils.form_indicator import FormIndicator
@@ -18,9 +16,16 @@ logger = logging.getLogger(__name__)
 logging.basicConfig(level=logging.INFO)
 
 from .._base_preaction import BaseUnifiedPreActionProcessor
+from .._record_context import PreActionRecordContext
+from .._record_patch import RecordPatch, RecordPatchList
 
 
 class CopyPassportAddress(BaseUnifiedPreActionProcessor):
+    model = UniversalModelWithAppointment
+    reads = ("passport.passport_details",)
+    writes = ("residential_address.residential_address_card_v2",)
+    skip_if_unchanged = True
+
     async def unified_pre_action_processor_impl(
         self,
         context: ContextModel,
@@ -31,19 +36,19 @@ class CopyPassportAddress(BaseUnifiedPreActionProcessor):
             FormIndicator,
             Doc("The form indicator for the form"),
         ],
-        payload: Annotated[GenericFormRecordModel, "entire form record model"],
-    ) -> Annotated[GenericFormRecordModel, "possibly modified record"]:
+        record_context: Annotated[PreActionRecordContext, "shared form record"],
+    ) -> Annotated[RecordPatchList | None, "changes to the record"]:
         """
         If `same_as_passport_address` is set, copy the values
         Country, State, City, PIN Code, Address Line 2, and Address Line 1
         from the passport address into the residential-address card V2.
         """
-        # Turn into our strong-typed form model
+        # Get the shared record as our strong-typed form model
         try:
-            form = UniversalModelWithAppointment(**payload.model_dump())
+            form = record_context.view(self.model)
         except Exception as e:
             logger.error("Failed to parse form payload for address copy: %s", e)
-            return payload
+            return None
 
         # Grab the passport details
         pp_addr: RootPassportPassportDetails | None = (
@@ -51,14 +56,14 @@ class CopyPassportAddress(BaseUnifiedPreActionProcessor):
         )
         if not pp_addr:
             logger.warning("no Passport Details found")
-            return payload
+            return None
 
         # Work with a dict version of passport details
         try:
             pp_addr_dict = pp_addr.model_dump()
         except Exception as e:
             logger.error("Failed to model_dump passport details: %s", e)
-            return payload
+            return None
 
         # Build new residential_address_card using the dict
         new_card = RootResidentialAddressResidentialAddressCardV2(
@@ -74,16 +79,13 @@ class CopyPassportAddress(BaseUnifiedPreActionProcessor):
             district=default_if_empty(pp_addr_dict.get("district"), default=""),
         )
 
-        # 1. Make sure the Pydantic model has a residential_address
-        if form.residential_address is None:
-            form.residential_address = RootResidentialAddress()
-
-        # 2. Assign the `RootResidentialAddressResidentialAddressCardV2` instance to it
-        form.residential_address.residential_address_card_v2 = new_card
-
-        # 3. Dump back to a dict and re-validate
-        new_payload_dict = form.model_dump()  # default is a dict
-        return GenericFormRecordModel.model_validate(new_payload_dict)
+        # Replace only the residential address card (residential_address is created if missing)
+        return [
+            RecordPatch(
+                path="residential_address.residential_address_card_v2",
+                value=new_card.model_dump(),
+            )
+        ]
 
 
 def default_if_empty(value, default="nil"):
@@ -14,13 +14,10 @@ from lyikpluginmanager.annotation import RequiredEnv
 import apluggy as pluggy
 from lyikpluginmanager import (
     ContextModel,
-    GenericFormRecordModel,
 )
 
 from lyik.ttk.models.generated.universal_model_with_appointment import (
     UniversalModelWithAppointment,
-    RootAppointment,
-    RootAppointmentEarliestAppointmentDate,
 )
 from lyik.ttk.utils.form_indicator import FormIndicator
 
@@ -28,6 +25,8 @@ logger = logging.getLogger(__name__)
 logging.basicConfig(level=logging.INFO)
 
 from .._base_preaction import BaseUnifiedPreActionProcessor
+from .._record_context import PreActionRecordContext
+from .._record_patch import RecordPatch, RecordPatchList
 
 
 # --- Utility to format a date object to 'YYYY-MM-DD' string ---
@@ -44,6 +43,17 @@ def format_date_to_string(date_str: str) -> Optional[str]:
 
 
 class InvokeAppointmentAPI(BaseUnifiedPreActionProcessor):
+    model = UniversalModelWithAppointment
+    reads = (
+        "appointment",
+        "visa_request_information.visa_request.to_country",
+        "visa_request_information.visa_request.visa_type",
+    )
+    writes = ("appointment.earliest_appointment_date",)
+    # The appointment dates are only a hint, a slow API must not hold up the save
+    critical = False
+    timeout_seconds = 5.0
+
     async def unified_pre_action_processor_impl(
         self,
         context: ContextModel,
@@ -54,20 +64,20 @@ class InvokeAppointmentAPI(BaseUnifiedPreActionProcessor):
             FormIndicator,
             Doc("The form indicator for the form"),
         ],
-        payload: Annotated[GenericFormRecordModel, "entire form record model"],
+        record_context: Annotated[PreActionRecordContext, "shared form record"],
     ) -> Annotated[
-        GenericFormRecordModel,
+        RecordPatchList | None,
         RequiredEnv(["TTK_API_BASE_URL", "TTK_APPOINTMENT_API_ROUTE"]),
-        Doc("possibly modified record"),
+        Doc("changes to the appointment section"),
     ]:
         RUN_API = True
         try:
             if not context:
                 logger.error("Context is missing. Skipping preaction.")
-                return payload
+                return None
             if not context.token:
                 logger.error("Token is missing in context. Skipping preaction.")
-                return payload
+                return None
 
             token = context.token
 
@@ -79,26 +89,21 @@ class InvokeAppointmentAPI(BaseUnifiedPreActionProcessor):
 
             if not ttk_token:
                 logger.error("TTK token is missing. Skipping preaction.")
-                return payload
+                return None
 
             try:
-                form = UniversalModelWithAppointment(**payload.model_dump())
+                form = record_context.view(self.model)
             except Exception as e:
                 logger.error(
                     "Failed to parse form payload for country normalization: %s", e
                 )
-                return payload
-
-            # Initialize appointment details if not present (The Case where a record was just created)
-            if not form.appointment:
-                form.appointment = RootAppointment()
-                if not form.appointment.earliest_appointment_date:
-                    form.appointment.earliest_appointment_date = RootAppointmentEarliestAppointmentDate()
+                return None
 
             appointment = form.appointment
 
             if (
-                appointment.earliest_appointment_date
+                appointment
+                and appointment.earliest_appointment_date
                 and appointment.earliest_appointment_date.appointment_city_dropdown_values
                 and appointment.earliest_appointment_date.appointment_city_dates
                 and appointment.earliest_appointment_date.business_days
@@ -106,7 +111,7 @@ class InvokeAppointmentAPI(BaseUnifiedPreActionProcessor):
                 logger.info(
                     "Appointment section already contains appointment data. Skipping API call."
                 )
-                return payload
+                return None
 
             try:
                 country_code: str = (
@@ -119,7 +124,7 @@ class InvokeAppointmentAPI(BaseUnifiedPreActionProcessor):
                 logger.error(
                     "Unable to fetch the country of departure or visa type from the form. Skipping preaction."
                 )
-                return payload
+                return None
 
             api_prefix = os.getenv("TTK_API_BASE_URL")
             api_route = os.getenv("TTK_APPOINTMENT_API_ROUTE")
@@ -127,7 +132,7 @@ class InvokeAppointmentAPI(BaseUnifiedPreActionProcessor):
                 logger.error(
                     "Api details missing. Skipping Appointment API Preaction process."
                 )
-                return payload
+                return None
 
             url = api_prefix + api_route
 
@@ -153,14 +158,14 @@ class InvokeAppointmentAPI(BaseUnifiedPreActionProcessor):
 
                 if data.get("status") != "success":
                     logger.error(f"Appointment API returned failure: {data}")
-                    return payload
+                    return None
 
                 return_data = data.get("returnData", [])
 
                 if not return_data:
                     if not current_state:  # Case when the record is new
                         logger.warning("Appointment API returned no appointment data.")
-                        return payload
+                        return None
                     else:
                         raise PluginException(
                             message=f"Appointment Information cannot be fetched for country '{country_code}'. Please try again later."
@@ -223,25 +228,38 @@ class InvokeAppointmentAPI(BaseUnifiedPreActionProcessor):
                 business_days = "10"
 
 
+            # Appointment details are created if not present (The Case where a record was just created)
+            earliest_date_path = "appointment.earliest_appointment_date"
+            patches: RecordPatchList = []
             if city_dropdown_values:
-                form.appointment.earliest_appointment_date.appointment_city_dropdown_values = json.dumps(
-                    city_dropdown_values
+                patches.append(
+                    RecordPatch(
+                        path=f"{earliest_date_path}.appointment_city_dropdown_values",
+                        value=json.dumps(city_dropdown_values),
+                    )
                 )
             if city_dates:
-                form.appointment.earliest_appointment_date.appointment_city_dates = (
-                    json.dumps(city_dates)
+                patches.append(
+                    RecordPatch(
+                        path=f"{earliest_date_path}.appointment_city_dates",
+                        value=json.dumps(city_dates),
+                    )
                 )
             if business_days is not None:
-                form.appointment.earliest_appointment_date.business_days = business_days
+                patches.append(
+                    RecordPatch(
+                        path=f"{earliest_date_path}.business_days",
+                        value=business_days,
+                    )
+                )
 
         except PluginException as pe:
             raise
         except Exception as ex:
             logger.error(f"Something went wrong. Skipping appointment preaction: {ex}")
-            return payload
+            return None
 
-        updated_data = form.model_dump(mode="json")
-        return GenericFormRecordModel.model_validate(updated_data)
+        return patches
 
     def _decode_jwt(self, token: str) -> Dict[str, Any]:
         try:
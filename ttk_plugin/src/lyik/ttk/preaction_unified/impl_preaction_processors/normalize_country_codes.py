@@ -4,42 +4,41 @@ from typing import Annotated
 import apluggy as pluggy
 from lyikpluginmanager import (
     ContextModel,
-    GenericFormRecordModel,
 )
 from lyik.ttk.models.generated.universal_model import (
     UniversalModel,
     RootVisaRequestInformationVisaRequest,
 )
 from .._base_preaction import BaseUnifiedPreActionProcessor
+from .._record_context import PreActionRecordContext
+from .._record_patch import RecordPatch, RecordPatchList
 from pydantic import BaseModel
-import country_converter as coco
 
 from typing_extensions import Doc
 from lyik.ttk.utils.form_indicator import FormIndicator
+from lyik.ttk.utils.country_index import to_iso3
 
 logger = logging.getLogger(__name__)
 logging.basicConfig(level=logging.INFO)
 
+
 # Utility model for conversion
 class CountryModel(BaseModel):
     country_input: str
-    _cc: coco.CountryConverter = coco.CountryConverter()
 
     def alpha3(self) -> str:
-        try:
-            result = self._cc.convert(
-                names=self.country_input,
-                to="ISO3",
-                not_found=None
-            )
-            if result and isinstance(result, str) and len(result) == 3:
-                return result.upper()
-        except Exception as e:
-            logger.warning(f"Country conversion failed for '{self.country_input}': {e}")
-        return self.country_input  # Fallback to original
+        return to_iso3(self.country_input)
 
 
 class NormalizeCountryCodes(BaseUnifiedPreActionProcessor):
+    model = UniversalModel
+    reads = (
+        "visa_request_information.visa_request.from_country",
+        "visa_request_information.visa_request.to_country",
+    )
+    writes = reads
+    skip_if_unchanged = True
+
     async def unified_pre_action_processor_impl(
         self,
         context: ContextModel,
@@ -50,40 +49,40 @@ class NormalizeCountryCodes(BaseUnifiedPreActionProcessor):
             FormIndicator,
             Doc("The form indicator for the form"),
         ],
-        payload: Annotated[GenericFormRecordModel, "entire form record model"],
-    ) -> Annotated[GenericFormRecordModel, "possibly modified record"]:
+        record_context: Annotated[PreActionRecordContext, "shared form record"],
+    ) -> Annotated[RecordPatchList | None, "changes to the record"]:
         """
         Convert 'from_country' and 'to_country' fields in the visa request to ISO3 format.
         """
         try:
-            form = UniversalModel(**payload.model_dump())
+            form = record_context.view(self.model)
         except Exception as e:
-            logger.error("Failed to parse form payload for country normalization: %s", e)
-            return payload
+            logger.error(
+                "Failed to parse form payload for country normalization: %s", e
+            )
+            return None
 
         visa_request: RootVisaRequestInformationVisaRequest | None = (
             form.visa_request_information.visa_request
-            if form.visa_request_information else None
+            if form.visa_request_information
+            else None
         )
 
         if not visa_request:
-            return payload
+            return None
 
-        modified = False
+        patches: RecordPatchList = []
 
         for attr in ["from_country", "to_country"]:
             val = getattr(visa_request, attr, None)
             if val:
                 iso3 = CountryModel(country_input=val).alpha3()
                 if iso3 != val:
-                    setattr(visa_request, attr, iso3)
-                    modified = True
-
-        if not modified:
-            return payload
-
-        updated_data = form.model_dump(mode="json")
-        return GenericFormRecordModel.model_validate(updated_data)
-
-
-
+                    patches.append(
+                        RecordPatch(
+                            path=f"visa_request_information.visa_request.{attr}",
+                            value=iso3,
+                        )
+                    )
+
+        return patches
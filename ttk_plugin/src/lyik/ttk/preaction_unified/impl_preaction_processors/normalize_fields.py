@@ -4,25 +4,25 @@ from typing import Annotated, Optional, List, ClassVar
 import apluggy as pluggy
 from lyikpluginmanager import (
     ContextModel,
-    GenericFormRecordModel,
 )
 from lyik.ttk.models.generated.universal_model import (
     UniversalModel,
     RootLetsGetStarted,
     RootVisaRequestInformationVisaRequest,
-    RootScratchPad,
 )
 from pydantic import BaseModel
-import country_converter as coco
 from datetime import date
 
 from typing_extensions import Doc
 from lyik.ttk.utils.form_indicator import FormIndicator
+from lyik.ttk.utils.country_index import USE_COUNTRY_FULL_NAME, country_name
 
 logger = logging.getLogger(__name__)
 logging.basicConfig(level=logging.INFO)
 
 from .._base_preaction import BaseUnifiedPreActionProcessor
+from .._record_context import PreActionRecordContext
+from .._record_patch import RecordPatch, RecordPatchList
 
 
 # --- Utility to format a date object to 'DD/MM/YYYY' string ---
@@ -38,32 +38,38 @@ def format_date_to_string(d: Optional[date]) -> Optional[str]:
 # --- Country converter to get full name from ISO3 code ---
 class ISO3ToCountryModel(BaseModel):
     iso3_input: str
-    _cc: coco.CountryConverter = coco.CountryConverter()
 
     # Some Countries full name should be used, for example 'Czechia' should be 'Czech Republic' instead.
-    USE_COUNTRY_FULL_NAME: ClassVar[List[str]] = ["CZE"]
+    USE_COUNTRY_FULL_NAME: ClassVar[List[str]] = sorted(USE_COUNTRY_FULL_NAME)
 
     def country_name(self) -> str:
         """
         Converts ISO3 code (e.g., 'IND') to full country name (e.g., 'India').
         Falls back to original input on failure.
         """
-        iso = (self.iso3_input or "").strip().upper()
-        to_field = "name_official" if iso in self.USE_COUNTRY_FULL_NAME else "name_short"
-        try:
-            result = self._cc.convert(
-                names=iso, to=to_field, not_found=None
-            )
-            if result and isinstance(result, str):
-                return result
-        except Exception as e:
-            logger.warning(
-                f"ISO3 to country name conversion failed for '{self.iso3_input}': {e}"
-            )
-        return self.iso3_input  # Fallback to original
+        return country_name(self.iso3_input)
 
 
 class NormalizeFields(BaseUnifiedPreActionProcessor):
+    model = UniversalModel
+    reads = (
+        "visa_request_information.visa_request",
+        "passport.passport_details.first_name",
+        "passport.passport_details.surname",
+    )
+    writes = (
+        "visa_request_information.visa_request.form_title",
+        "visa_request_information.visa_request.from_country_full_name",
+        "visa_request_information.visa_request.to_country_full_name",
+        "visa_request_information.visa_request.arrival_date_formatted",
+        "visa_request_information.visa_request.departure_date_formatted",
+        "lets_get_started",
+        "scratch_pad.form_title",
+        "scratch_pad.form_sub_title",
+    )
+    # Not skipped: the form subtitle also depends on the form name of the request
+    skip_if_unchanged = False
+
     async def unified_pre_action_processor_impl(
         self,
         context: ContextModel,
@@ -74,18 +80,18 @@ class NormalizeFields(BaseUnifiedPreActionProcessor):
             FormIndicator,
             Doc("The form indicator for the form"),
         ],
-        payload: Annotated[GenericFormRecordModel, "entire form record model"],
-    ) -> Annotated[GenericFormRecordModel, "modified record with normalize fields"]:
+        record_context: Annotated[PreActionRecordContext, "shared form record"],
+    ) -> Annotated[RecordPatchList | None, "changes with the normalized fields"]:
         """
         This plugin normalizes/enriches certain field values.
         - Converts ISO3 country codes to full country names in separate fields
         - Formats date fields to 'DD/MM/YYYY' string representations
         """
         try:
-            form = UniversalModel(**payload.model_dump())
+            form = record_context.view(self.model)
         except Exception as e:
             logger.error("Failed to parse form payload: %s", e)
-            return payload
+            return None
 
         visa_request: RootVisaRequestInformationVisaRequest | None = (
             form.visa_request_information.visa_request
@@ -115,7 +121,7 @@ class NormalizeFields(BaseUnifiedPreActionProcessor):
 
             traveller_full_name = " ".join(filter(None, [first_name, surname]))
         except Exception as e:
-             traveller_full_name = " "
+            traveller_full_name = " "
 
         sub_title: str | None = context.form_name
 
@@ -128,17 +134,21 @@ class NormalizeFields(BaseUnifiedPreActionProcessor):
             sub_title = form.visa_request_information.visa_request.to_country_full_name
 
         if not visa_request:
-            return payload
-
-        modified = False
+            return None
 
-        if form.visa_request_information and form.visa_request_information.visa_request:
-            form.visa_request_information.visa_request.form_title = traveller_full_name
+        visa_request_path = "visa_request_information.visa_request"
+        patches: RecordPatchList = [
+            RecordPatch(
+                path=f"{visa_request_path}.form_title", value=traveller_full_name
+            )
+        ]
 
         def convert_to_country_name(country_code: str) -> str:
             code = country_code.strip().upper()
             if len(code) == 3 and code.isalpha():
-                return ISO3ToCountryModel(iso3_input=code).country_name() or country_code
+                return (
+                    ISO3ToCountryModel(iso3_input=code).country_name() or country_code
+                )
             return country_code
 
         # From country full name converstion.
@@ -146,90 +156,78 @@ class NormalizeFields(BaseUnifiedPreActionProcessor):
         if from_country:
             new_name = convert_to_country_name(from_country)
             if new_name != from_country:
-                visa_request.from_country_full_name = new_name
-                modified = True
+                patches.append(
+                    RecordPatch(
+                        path=f"{visa_request_path}.from_country_full_name",
+                        value=new_name,
+                    )
+                )
 
         # To country full name converstion.
         to_country = visa_request.to_country
         if to_country:
             new_name = convert_to_country_name(to_country)
             if new_name != to_country:
-                visa_request.to_country_full_name = new_name
-                modified = True
+                patches.append(
+                    RecordPatch(
+                        path=f"{visa_request_path}.to_country_full_name",
+                        value=new_name,
+                    )
+                )
 
         # Arrival date formatting conversion.
         arrival_val = visa_request.arrival_date
         if arrival_val:
             formatted = format_date_to_string(arrival_val)
             if formatted and formatted != visa_request.arrival_date_formatted:
-                visa_request.arrival_date_formatted = formatted
-                modified = True
+                patches.append(
+                    RecordPatch(
+                        path=f"{visa_request_path}.arrival_date_formatted",
+                        value=formatted,
+                    )
+                )
 
         # Arrival date formatting conversion.
         departure_val = visa_request.departure_date
         if departure_val:
             formatted = format_date_to_string(departure_val)
             if formatted and formatted != visa_request.departure_date_formatted:
-                visa_request.departure_date_formatted = formatted
-                modified = True
-
+                patches.append(
+                    RecordPatch(
+                        path=f"{visa_request_path}.departure_date_formatted",
+                        value=formatted,
+                    )
+                )
 
         # --- ADD Traveler Details header ---
-        try:
-            if form.lets_get_started:
-                lets = form.lets_get_started
-            else:
-                lets = RootLetsGetStarted()
-            # lets = updated_data.get("lets_get_started", {})
-            if traveller_details:
-                lets.traveler_details_header = (
-                    f"<h2 style='text-align: center'>{traveller_details}</h2>"
+        if not traveller_details and form.lets_get_started is None:
+            # The section is created even when there is no header to show
+            patches.append(
+                RecordPatch(
+                    path="lets_get_started",
+                    value=RootLetsGetStarted().model_dump(),
                 )
-                # if sub_title:
-                #     lets["traveler_details_header"] = f"<h1 style='text-align: center'>{traveller_details} | {context.form_name}</h1>"
-                # else:
-                #     lets["traveler_details_header"] = f"<h1 style='text-align: center'>{traveller_details}</h1>"
-            form.lets_get_started = lets
-            modified = True
-        except Exception as e:
-            logger.error(f"Failed to set traveler_details_header: {e}")
-            form.lets_get_started = RootLetsGetStarted()
-            form.lets_get_started.traveler_details_header = ""
-            modified = True
+            )
+        if traveller_details:
+            patches.append(
+                RecordPatch(
+                    path="lets_get_started.traveler_details_header",
+                    value=f"<h2 style='text-align: center'>{traveller_details}</h2>",
+                )
+            )
+            # if sub_title:
+            #     lets["traveler_details_header"] = f"<h1 style='text-align: center'>{traveller_details} | {context.form_name}</h1>"
+            # else:
+            #     lets["traveler_details_header"] = f"<h1 style='text-align: center'>{traveller_details}</h1>"
 
         # --- UPDATE THE FORM TITLE ---
-        try:
-            if form.scratch_pad:
-                scratch = form.scratch_pad
-            else:
-                scratch = RootScratchPad()
-            scratch.form_title = traveller_full_name or ""
-            form.scratch_pad = scratch
-            modified = True
-        except Exception as e:
-            logger.error(f"Failed to set form_title: {e}")
-            # guarantee you still return a dict
-            form.scratch_pad = RootScratchPad()
-            form.scratch_pad.form_title = ""
-            modified = True
+        patches.append(
+            RecordPatch(path="scratch_pad.form_title", value=traveller_full_name or "")
+        )
 
         # --- UPDATE THE FORM SUBTITLE ---
-        try:
-            if form.scratch_pad:
-                scratch = form.scratch_pad
-            else:
-                scratch = RootScratchPad()
-            scratch.form_sub_title = sub_title or ""
-            form.scratch_pad = scratch
-            modified = True
-        except Exception as e:
-            logger.error(f"Failed to set form_sub_title: {e}")
-            form.scratch_pad = RootScratchPad()
-            form.scratch_pad.form_sub_title = ""
-            modified = True
-
-        # Return original payload if no change was made
-        if not modified:
-            return payload
+        patches.append(
+            RecordPatch(path="scratch_pad.form_sub_title", value=sub_title or "")
+        )
 
-        return GenericFormRecordModel.model_validate(form.model_dump())
+        return patches
@@ -7,18 +7,17 @@ from pydantic import BaseModel
 import apluggy as pluggy
 from lyikpluginmanager import (
     ContextModel,
-    GenericFormRecordModel,
 )
 from typing_extensions import Doc
 from lyik.ttk.models.generated.universal_model import (
     UniversalModel,
-    RootLetsGetStarted,
     VISATYPE,
 )
 from .._base_preaction import BaseUnifiedPreActionProcessor
+from .._record_context import PreActionRecordContext
+from .._record_patch import RecordPatch, RecordPatchList
 
 from lyik.ttk.utils.form_indicator import FormIndicator
-from lyik.ttk.utils.form_utils import FormConfig
 
 logger = logging.getLogger(__name__)
 
@@ -58,6 +57,21 @@ def _has_success_ver_status(data: dict) -> bool:
 class PctCompletion(BaseUnifiedPreActionProcessor):
     """Calculates traveller progress and writes it into ``pct_completion``."""
 
+    model = UniversalModel
+    reads = (
+        "visa_request_information.visa_request.visa_type",
+        "visa_request_information.visa_request.traveller_type",
+        "shared_travell_info.shared",
+        "*._ver_status",
+    )
+    writes = (
+        "lets_get_started.infopanes_total",
+        "lets_get_started.infopanes_completed",
+        "lets_get_started.pct_completion",
+    )
+    # Not skipped: the panes counted also depend on the form config
+    skip_if_unchanged = False
+
     async def unified_pre_action_processor_impl(
         self,
         context: ContextModel,
@@ -68,23 +82,22 @@ class PctCompletion(BaseUnifiedPreActionProcessor):
             FormIndicator,
             Doc("The form indicator for the form"),
         ],
-        payload: Annotated[GenericFormRecordModel, "entire form record model"],
+        record_context: Annotated[PreActionRecordContext, "shared form record"],
     ) -> Annotated[
-        GenericFormRecordModel,
-        Doc("form record with pct_completion refreshed"),
+        RecordPatchList | None,
+        Doc("changes refreshing pct_completion"),
     ]:
 
         try:
-            form: UniversalModel = UniversalModel(**payload.model_dump())
+            form: UniversalModel = record_context.view(self.model)
         except Exception as exc:  # defensive – don’t break save/submit
             logger.error("pct_completion: cannot parse payload – %s", exc)
-            record = payload.model_dump()
-            return GenericFormRecordModel.model_validate(record)
+            return None
 
-        frm_config = FormConfig(form_indicator=form_indicator)
+        frm_config = self.form_config
 
-        # Start with relevant panes from helper (so later can come from config)
-        panes_to_check = frm_config.get_relevant_infopane_list()
+        # Start with relevant panes from config
+        panes_to_check = list(frm_config.relevant_infopanes)
 
         if (
             form.visa_request_information
@@ -96,7 +109,7 @@ class PctCompletion(BaseUnifiedPreActionProcessor):
             )
             if visa_type and visa_type.lower() == "business":
                 # Add business panes via helper
-                panes_to_check += frm_config.get_business_panes_list()
+                panes_to_check += frm_config.business_panes
 
         # 1) Figure out share-flag mapping
         if (
@@ -118,7 +131,7 @@ class PctCompletion(BaseUnifiedPreActionProcessor):
 
         if vt and vt.lower() != "primary" and shared:
             # Only panes that are allowed to be shared (from common_infopanes_list)
-            common_infopanes = set(frm_config.get_common_infopanes_list())
+            common_infopanes = set(frm_config.common_infopanes)
 
             # Map pane name -> attribute name on `shared`
             pane_flag_attrs = {
@@ -146,7 +159,7 @@ class PctCompletion(BaseUnifiedPreActionProcessor):
 
         logger.info(
             "pct_completion: relevant_panes=%s | panes_to_check(after share)=%s | shared_removed=%s | shared_count=%d",
-            frm_config.get_relevant_infopane_list(),
+            frm_config.relevant_infopanes,
             panes_to_check,
             share_removed,
             shared_count,
@@ -202,11 +215,8 @@ class PctCompletion(BaseUnifiedPreActionProcessor):
         )
 
         # 6) Write back into lets_get_started
-        if not getattr(form, "lets_get_started", None):
-            form.lets_get_started = RootLetsGetStarted()
-
-        form.lets_get_started.infopanes_total = total
-        form.lets_get_started.infopanes_completed = completed
-        form.lets_get_started.pct_completion = pct_str
-
-        return GenericFormRecordModel.model_validate(form.model_dump())
+        return [
+            RecordPatch(path="lets_get_started.infopanes_total", value=total),
+            RecordPatch(path="lets_get_started.infopanes_completed", value=completed),
+            RecordPatch(path="lets_get_started.pct_completion", value=pct_str),
+        ]
@@ -4,7 +4,6 @@ import apluggy as pluggy
 from lyikpluginmanager.annotation import RequiredVars
 from lyikpluginmanager import (
     ContextModel,
-    GenericFormRecordModel,
 )
 
 from lyik.ttk.models.generated.universal_model import UniversalModel
@@ -14,6 +13,7 @@ logger = logging.getLogger(__name__)
 logging.basicConfig(level=logging.info)
 
 from .._base_preaction import BaseUnifiedPreActionProcessor
+from .._record_context import PreActionRecordContext
 from lyik.ttk.utils.form_indicator import FormIndicator
 
 
@@ -25,6 +25,13 @@ CO_TRAVELLER = "Co-traveller"
 
 
 class PreactionSavePrimaryTraveller(BaseUnifiedPreActionProcessor):
+    model = UniversalModel
+    # The whole record is persisted, including the changes of the earlier processors.
+    reads = ("*",)
+    writes = ()
+    # Always awaited: a write cancelled on a time budget would silently lose the copy
+    critical = True
+
     async def unified_pre_action_processor_impl(
         self,
         context: ContextModel,
@@ -50,14 +57,14 @@ class PreactionSavePrimaryTraveller(BaseUnifiedPreActionProcessor):
             FormIndicator,
             Doc("The form indicator for the form"),
         ],
-        payload: Annotated[
-            GenericFormRecordModel,
-            Doc("The payload of form record data."),
+        record_context: Annotated[
+            PreActionRecordContext,
+            Doc("The shared form record data."),
         ],
     ) -> Annotated[
-        GenericFormRecordModel,
+        None,
         RequiredVars(["DB_CONN_URL"]),
-        Doc("The updated form record data."),
+        Doc("The form record is only persisted, never modified."),
     ]:
         """
         This preaction processor will save the primary traveller into the primary_travellers collection.
@@ -67,15 +74,15 @@ class PreactionSavePrimaryTraveller(BaseUnifiedPreActionProcessor):
             logger.error(
                 "No context or config found in context. Passing through SavePrimaryTraveller preaction."
             )
-            return payload
+            return
         try:
-            record = UniversalModel(**payload.model_dump())
+            record = record_context.view(self.model)
             traveller_type = record.visa_request_information.visa_request.traveller_type
             if not traveller_type:
                 logger.warning(
                     "Traveller type is missing in payload. Skipping SavePrimaryTraveller preaction."
                 )
-                return payload
+                return
             if traveller_type == PRIMARY_TRAVELLER:
                 config = context.config
                 conn_url = config.DB_CONN_URL
@@ -83,13 +90,13 @@ class PreactionSavePrimaryTraveller(BaseUnifiedPreActionProcessor):
                     logger.error(
                         "Connection URL is missing in the config. Passing through SavePrimaryTraveller preaction."
                     )
-                    return payload
+                    return
                 org_id = context.org_id
                 if not org_id:
                     logger.error(
                         "No org_id found in the context. Passing through SavePrimaryTraveller preaction."
                     )
-                    return payload
+                    return
                 mongo = TTKStorage(db_conn_url=conn_url)
 
                 order_id = record.visa_request_information.visa_request.order_id
@@ -97,7 +104,7 @@ class PreactionSavePrimaryTraveller(BaseUnifiedPreActionProcessor):
                     logger.error(
                         "order_id missing in the payload. Passing through SavePrimaryTraveller preaction."
                     )
-                    return payload
+                    return
                 result_id = await mongo.save_primary_info(
                     collection_name=PRIMARY_COLLECTION_NAME,
                     org_id=org_id,
@@ -106,21 +113,28 @@ class PreactionSavePrimaryTraveller(BaseUnifiedPreActionProcessor):
                 )
                 if result_id:
                     logger.info("Saved the Primary Traveller data.")
-                    return payload
+                    return
                 else:
                     logger.warning("Failed to save Primay Traveller data.")
-                    return payload
+                    return
             else:
                 logger.info("Traveller is Co-traveller")
-                return payload
+                return
         except Exception as e:
             logger.error(
                 f"Failed to perform SavePrimaryTraveller pre-action. Error: {str(e)}"
             )
-            return payload
+            return
 
 
 class PreactionSaveCoTravellers(BaseUnifiedPreActionProcessor):
+    model = UniversalModel
+    # The whole record is persisted, including the changes of the earlier processors.
+    reads = ("*",)
+    writes = ()
+    # Always awaited: a write cancelled on a time budget would silently lose the copy
+    critical = True
+
     async def unified_pre_action_processor_impl(
         self,
         context: ContextModel,
@@ -146,34 +160,34 @@ class PreactionSaveCoTravellers(BaseUnifiedPreActionProcessor):
             FormIndicator,
             Doc("The form indicator for the form"),
         ],
-        payload: Annotated[
-            GenericFormRecordModel,
-            Doc("The payload of form record data."),
+        record_context: Annotated[
+            PreActionRecordContext,
+            Doc("The shared form record data."),
         ],
     ) -> Annotated[
-        GenericFormRecordModel,
+        None,
         RequiredVars(["DB_CONN_URL"]),
-        Doc("The updated form record data."),
+        Doc("The form record is only persisted, never modified."),
     ]:
         """
         This preaction processor will save the co-travellers into the co_travellers collection.
         """
 
-        logger.debug(f"Entering preaction with payload: {payload}")
+        logger.debug(f"Entering preaction with payload: {record_context.record}")
         if not context or not context.config:
             logger.error(
                 "No context or config found in context. Passing through PreactionSaveCoTravellers preaction."
             )
-            return payload
+            return
 
         try:
-            record = UniversalModel(**payload.model_dump())
+            record = record_context.view(self.model)
             traveller_type = record.visa_request_information.visa_request.traveller_type
             if not traveller_type:
                 logger.warning(
                     "Traveller type is missing in payload. Skipping PreactionSaveCoTravellers preaction."
                 )
-                return payload
+                return
 
             if traveller_type == CO_TRAVELLER:
                 config = context.config
@@ -182,13 +196,13 @@ class PreactionSaveCoTravellers(BaseUnifiedPreActionProcessor):
                     logger.error(
                         "Connection URL is missing in the config. Passing through PreactionSaveCoTravellers preaction."
                     )
-                    return payload
+                    return
                 org_id = context.org_id
                 if not org_id:
                     logger.error(
                         "No org_id found in the context. Passing through PreactionSaveCoTravellers preaction."
                     )
-                    return payload
+                    return
                 mongo = TTKStorage(db_conn_url=conn_url)
 
                 order_id = record.visa_request_information.visa_request.order_id
@@ -196,7 +210,7 @@ class PreactionSaveCoTravellers(BaseUnifiedPreActionProcessor):
                     logger.error(
                         "order_id missing in the payload. Passing through PreactionSaveCoTravellers preaction."
                     )
-                    return payload
+                    return
 
                 traveller_id = record.visa_request_information.visa_request.traveller_id
 
@@ -209,15 +223,15 @@ class PreactionSaveCoTravellers(BaseUnifiedPreActionProcessor):
                 )
                 if result_id:
                     logger.info("Saved the Co-traveller data.")
-                    return payload
+                    return
                 else:
                     logger.warning("Failed to save Co-traveller data.")
-                    return payload
+                    return
             else:
                 logger.info("Traveller is the primary traveller.")
-                return payload
+                return
         except Exception as e:
             logger.error(
                 f"Failed to perform PreactionSaveCoTravellers pre-action. Error: {str(e)}"
             )
-            return payload
+            return
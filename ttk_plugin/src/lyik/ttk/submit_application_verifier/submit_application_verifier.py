@@ -7,7 +7,7 @@ from lyikpluginmanager import (
     VerifyHandlerResponseModel,
     VERIFY_RESPONSE_STATUS,
 )
-from typing import Annotated, List
+from typing import Annotated, Sequence
 from typing_extensions import Doc
 
 from lyik.ttk.models.generated.universal_model_with_submission_requires_docket_status import (
@@ -17,7 +17,7 @@ from lyik.ttk.models.generated.universal_model_with_submission_requires_docket_s
 import logging
 from lyik.ttk.utils.verifier_util import check_if_verified, validate_pincode
 from lyik.ttk.utils.message import get_error_message
-from lyik.ttk.utils import get_form_indicator, FormConfig
+from lyik.ttk.utils import get_form_indicator, get_form_config
 
 logger = logging.getLogger(__name__)
 
@@ -40,7 +40,7 @@ def _get_nested_value(data: dict, path: str):
     return current
 
 
-def _all_requirements_satisfied(requirements: List[str], payload_dict: dict) -> bool:
+def _all_requirements_satisfied(requirements: Sequence[str], payload_dict: dict) -> bool:
     """
     Returns True only if all requirements specified by dotted paths
     are present and truthy in payload_dict.
@@ -73,8 +73,8 @@ class SumbitApplicationVerifier(VerifyHandlerSpec):
         This verifier verifies the Application Submission.
         Checks that the confirmation checkboxes are ticked before submitting.
         """
-        frm_config = FormConfig(form_indicator=get_form_indicator(context.record))
-        submit_requirement: List[str] | None = (
+        frm_config = get_form_config(form_indicator=get_form_indicator(context.record))
+        submit_requirement: Sequence[str] | None = (
             frm_config.get_submit_requirement_list()
         )
         try:
@@ -18,6 +18,7 @@ from datetime import datetime, date
 from lyik.ttk.utils.verifier_util import check_if_verified, validate_email
 from lyik.ttk.utils.message import get_error_message
 from lyik.ttk.utils.utils import format_date_to_string
+from lyik.ttk.utils.record_sections import RecordSections
 
 logger = logging.getLogger(__name__)
 
@@ -54,7 +55,9 @@ class TTKConsultantVerifier(VerifyHandlerSpec):
                 payload and payload.appointments and payload.appointments.scheduled_date
             )
             if appointment_date:
-                full_form_record = Schengentouristvisa.model_validate(context.record)
+                full_form_record = RecordSections(
+                    context.record, Schengentouristvisa
+                )
                 departure_date = (
                     full_form_record.visa_request_information
                     and full_form_record.visa_request_information.visa_request
@@ -0,0 +1,305 @@
+"""
+Storage layouts of the co-travellers of an order.
+
+EMBEDDED, the original layout: one document per order in the collection, with each
+traveller at `travellers.<traveller_id>`. A large group order grows one document, and
+every co-traveller save updates it.
+
+PER_TRAVELLER: one document per traveller in the `<collection>_per_traveller`
+collection, with `order_id`, `traveller_id` and the traveller record at `data`,
+indexed on (order_id, traveller_id).
+
+DUAL, for the cut-over: travellers are written to both layouts and read from the
+embedded one, which stays complete while processes still running the EMBEDDED layout
+write to it.
+
+TTKStorage uses the layout of the org in $TTK_CO_TRAVELLER_LAYOUT_ORGS, e.g.
+`org_a=per_traveller,org_b=dual`, else the one of $TTK_CO_TRAVELLER_LAYOUT. To move an
+org to PER_TRAVELLER:
+
+1. Switch it to DUAL and roll it out to every process.
+2. Copy its travellers with `migrate_to_per_traveller`. Travellers which differ from
+   the embedded ones, e.g. saved by a process which did not write both layouts yet,
+   are brought up to date, so it can be run again at any time in this step:
+
+    python -m lyik.ttk.ttk_storage_util.co_traveller_layout \\
+        --db-url mongodb://... --org-id <org_id> --collection co_travellers
+
+3. Switch it to PER_TRAVELLER. While this rolls out, the processes still on DUAL read
+   the embedded layout, which misses the saves of the processes already switched, but
+   no save is lost. Do not run the migration after this, the embedded documents are
+   no longer written.
+"""
+
+import argparse
+import asyncio
+import logging
+import os
+from enum import Enum
+from typing import Any, Dict, List, Tuple
+
+from motor.motor_asyncio import (
+    AsyncIOMotorClient,
+    AsyncIOMotorCollection,
+    AsyncIOMotorDatabase,
+)
+from pydantic import BaseModel, ConfigDict
+from pymongo import ASCENDING, UpdateOne
+
+from lyik.ttk.utils.record_sections import record_fingerprint
+
+logger = logging.getLogger(__name__)
+
+CO_TRAVELLER_LAYOUT_ENV = "TTK_CO_TRAVELLER_LAYOUT"
+CO_TRAVELLER_LAYOUT_ORGS_ENV = "TTK_CO_TRAVELLER_LAYOUT_ORGS"
+# Embedded layout
+TRAVELLERS_FIELD = "travellers"
+TRAVELLER_HASHES_FIELD = "traveller_hashes"
+# Per-traveller layout
+PER_TRAVELLER_COLLECTION_SUFFIX = "_per_traveller"
+ORDER_ID_FIELD = "order_id"
+TRAVELLER_ID_FIELD = "traveller_id"
+TRAVELLER_DATA_FIELD = "data"
+TRAVELLER_HASH_FIELD = "data_hash"
+PER_TRAVELLER_INDEX_NAME = "order_id_traveller_id"
+DEFAULT_MIGRATION_BATCH_SIZE = 500
+
+
+class CoTravellerLayout(str, Enum):
+    EMBEDDED = "embedded"
+    DUAL = "dual"
+    PER_TRAVELLER = "per_traveller"
+
+    @property
+    def writes_embedded(self) -> bool:
+        return self != CoTravellerLayout.PER_TRAVELLER
+
+    @property
+    def writes_per_traveller(self) -> bool:
+        return self != CoTravellerLayout.EMBEDDED
+
+    @property
+    def reads_per_traveller(self) -> bool:
+        return self == CoTravellerLayout.PER_TRAVELLER
+
+
+class CoTravellerLayouts(BaseModel):
+    """
+    The co-traveller layout of each org, `default` for the orgs not listed.
+    """
+
+    model_config = ConfigDict(frozen=True)
+
+    default: CoTravellerLayout = CoTravellerLayout.EMBEDDED
+    orgs: Dict[str, CoTravellerLayout] = {}
+
+    def for_org(self, org_id: str) -> CoTravellerLayout:
+        return self.orgs.get(org_id, self.default)
+
+
+def _parse_layout(value: str, source: str) -> CoTravellerLayout:
+    try:
+        return CoTravellerLayout(value.strip().lower())
+    except ValueError:
+        logger.warning(
+            "Unknown co-traveller layout '%s' in %s, using the '%s' layout.",
+            value,
+            source,
+            CoTravellerLayout.EMBEDDED.value,
+        )
+        return CoTravellerLayout.EMBEDDED
+
+
+def get_co_traveller_layouts() -> CoTravellerLayouts:
+    """
+    The layouts of $TTK_CO_TRAVELLER_LAYOUT and $TTK_CO_TRAVELLER_LAYOUT_ORGS.
+    """
+    orgs: Dict[str, CoTravellerLayout] = {}
+    for entry in os.getenv(CO_TRAVELLER_LAYOUT_ORGS_ENV, "").split(","):
+        if not entry.strip():
+            continue
+        org_id, separator, value = entry.partition("=")
+        if not separator or not org_id.strip():
+            logger.warning(
+                "Ignoring '%s' in %s, expected <org_id>=<layout>.",
+                entry,
+                CO_TRAVELLER_LAYOUT_ORGS_ENV,
+            )
+            continue
+        orgs[org_id.strip()] = _parse_layout(value, CO_TRAVELLER_LAYOUT_ORGS_ENV)
+    return CoTravellerLayouts(
+        default=_parse_layout(
+            os.getenv(CO_TRAVELLER_LAYOUT_ENV, CoTravellerLayout.EMBEDDED.value),
+            CO_TRAVELLER_LAYOUT_ENV,
+        ),
+        orgs=orgs,
+    )
+
+
+def per_traveller_collection_name(collection_name: str) -> str:
+    return f"{collection_name}{PER_TRAVELLER_COLLECTION_SUFFIX}"
+
+
+def traveller_filter(order_id: str, traveller_id: str) -> Dict[str, str]:
+    return {ORDER_ID_FIELD: order_id, TRAVELLER_ID_FIELD: traveller_id}
+
+
+async def ensure_per_traveller_index(collection: AsyncIOMotorCollection) -> None:
+    """
+    Creates the (order_id, traveller_id) index, a no-op when it exists. It is unique,
+    so concurrent first saves of a traveller cannot create two documents.
+    """
+    await collection.create_index(
+        [(ORDER_ID_FIELD, ASCENDING), (TRAVELLER_ID_FIELD, ASCENDING)],
+        name=PER_TRAVELLER_INDEX_NAME,
+        unique=True,
+    )
+
+
+class MigrationReport(BaseModel):
+    orders: int = 0
+    travellers: int = 0
+    # Travellers not yet in the per-traveller collection
+    copied: int = 0
+    # Travellers in the per-traveller collection which differed and were overwritten
+    updated: int = 0
+    # Travellers in the per-traveller collection which were already the same
+    unchanged: int = 0
+
+
+class _MigratedTraveller(BaseModel):
+    order_id: str
+    traveller_id: str
+    data: Dict[str, Any]
+    data_hash: str
+
+
+async def migrate_to_per_traveller(
+    db: AsyncIOMotorDatabase,
+    collection_name: str,
+    batch_size: int = DEFAULT_MIGRATION_BATCH_SIZE,
+) -> MigrationReport:
+    """
+    Copies the travellers of the embedded layout in `collection_name` to the
+    per-traveller collection, and overwrites the ones there which differ.
+
+    The orders are streamed from a cursor and the travellers handled in batches of
+    `batch_size`, so memory does not grow with the collection. For each batch the
+    hashes of the per-traveller documents are read and compared with the hashes of
+    the embedded travellers, computed from their data, as processes saving the
+    embedded layout only may not have kept the stored ones. Missing travellers are
+    inserted and differing ones overwritten, unless the document was saved again in
+    the meantime. The embedded documents are left in place.
+    """
+    source = db[collection_name]
+    target = db[per_traveller_collection_name(collection_name)]
+    await ensure_per_traveller_index(target)
+
+    report = MigrationReport()
+    pending: List[_MigratedTraveller] = []
+
+    async def flush() -> None:
+        if not pending:
+            return
+        stored: Dict[Tuple[str, str], str | None] = {}
+        cursor = target.find(
+            {ORDER_ID_FIELD: {"$in": list({t.order_id for t in pending})}},
+            {
+                "_id": 0,
+                ORDER_ID_FIELD: 1,
+                TRAVELLER_ID_FIELD: 1,
+                TRAVELLER_HASH_FIELD: 1,
+            },
+        )
+        async for document in cursor:
+            key = (document[ORDER_ID_FIELD], document[TRAVELLER_ID_FIELD])
+            stored[key] = document.get(TRAVELLER_HASH_FIELD)
+
+        writes: List[UpdateOne] = []
+        for traveller in pending:
+            document_filter = traveller_filter(
+                traveller.order_id, traveller.traveller_id
+            )
+            fields = {
+                TRAVELLER_DATA_FIELD: traveller.data,
+                TRAVELLER_HASH_FIELD: traveller.data_hash,
+            }
+            key = (traveller.order_id, traveller.traveller_id)
+            if key not in stored:
+                report.copied += 1
+                # Never overwrites a document created since it was read
+                writes.append(
+                    UpdateOne(document_filter, {"$setOnInsert": fields}, upsert=True)
+                )
+            elif stored[key] == traveller.data_hash:
+                report.unchanged += 1
+            else:
+                report.updated += 1
+                # Only the version which was compared
+                writes.append(
+                    UpdateOne(
+                        {**document_filter, TRAVELLER_HASH_FIELD: stored[key]},
+                        {"$set": fields},
+                    )
+                )
+        if writes:
+            await target.bulk_write(writes, ordered=False)
+        pending.clear()
+
+    cursor = source.find(
+        {TRAVELLERS_FIELD: {"$exists": True}},
+        {TRAVELLERS_FIELD: 1},
+        batch_size=batch_size,
+    )
+    async for order in cursor:
+        travellers = order.get(TRAVELLERS_FIELD) or {}
+        report.orders += 1
+        report.travellers += len(travellers)
+        pending.extend(
+            _MigratedTraveller(
+                order_id=order["_id"],
+                traveller_id=traveller_id,
+                data=data,
+                data_hash=record_fingerprint(data),
+            )
+            for traveller_id, data in travellers.items()
+        )
+        if len(pending) >= batch_size:
+            await flush()
+    await flush()
+
+    logger.info(
+        "Migrated %d travellers of %d orders from '%s' to '%s': "
+        "%d copied, %d updated, %d unchanged.",
+        report.travellers,
+        report.orders,
+        collection_name,
+        target.name,
+        report.copied,
+        report.updated,
+        report.unchanged,
+    )
+    return report
+
+
+async def _main(args: argparse.Namespace) -> None:
+    client = AsyncIOMotorClient(args.db_url)
+    try:
+        report = await migrate_to_per_traveller(
+            client[args.org_id], args.collection, batch_size=args.batch_size
+        )
+        print(report.model_dump_json())
+    finally:
+        client.close()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Copies the co-travellers of an org to the per-traveller layout"
+    )
+    parser.add_argument("--db-url", required=True)
+    parser.add_argument("--org-id", required=True, help="The database of the org")
+    parser.add_argument("--collection", default="co_travellers")
+    parser.add_argument("--batch-size", type=int, default=DEFAULT_MIGRATION_BATCH_SIZE)
+    logging.basicConfig(level=logging.INFO)
+    asyncio.run(_main(parser.parse_args()))
@@ -0,0 +1,74 @@
+from typing import Any, Dict, List
+
+from pydantic import BaseModel
+
+
+class UpdateDelta(BaseModel):
+    """
+    The changes between two versions of a document value, as Mongo update paths.
+    """
+
+    set_fields: Dict[str, Any] = {}
+    unset_fields: List[str] = []
+
+    @property
+    def is_empty(self) -> bool:
+        return not self.set_fields and not self.unset_fields
+
+    def to_update(self, extra_set: Dict[str, Any] | None = None) -> Dict[str, Any]:
+        update: Dict[str, Any] = {}
+        set_fields = {**self.set_fields, **(extra_set or {})}
+        if set_fields:
+            update["$set"] = set_fields
+        if self.unset_fields:
+            update["$unset"] = {path: "" for path in self.unset_fields}
+        return update
+
+
+def _is_path_key(key: Any) -> bool:
+    # Keys which can be a part of a dotted update path
+    return isinstance(key, str) and bool(key) and "." not in key and key[0] != "$"
+
+
+def compute_delta(old: Any, new: Any, path: str) -> UpdateDelta:
+    """
+    The $set and $unset paths which turn `old`, stored at `path`, into `new`.
+
+    Objects are compared key by key, down to the changed values; a list, a value of
+    another type, or an object with keys which cannot be used in a path is set whole.
+    """
+    delta = UpdateDelta()
+    _diff(old, new, path, delta)
+    return delta
+
+
+def _diff(old: Any, new: Any, path: str, delta: UpdateDelta) -> None:
+    if old == new and type(old) is type(new):
+        return
+    if (
+        not isinstance(old, dict)
+        or not isinstance(new, dict)
+        or not all(_is_path_key(key) for key in (*old, *new))
+    ):
+        delta.set_fields[path] = new
+        return
+    for key, value in new.items():
+        if key in old:
+            _diff(old[key], value, f"{path}.{key}", delta)
+        else:
+            delta.set_fields[f"{path}.{key}"] = value
+    for key in old:
+        if key not in new:
+            delta.unset_fields.append(f"{path}.{key}")
+
+
+def get_path(document: Dict[str, Any] | None, path: str) -> Any:
+    """
+    The value at a dotted path of a document, None if it is missing.
+    """
+    value: Any = document
+    for key in path.split("."):
+        if not isinstance(value, dict):
+            return None
+        value = value.get(key)
+    return value
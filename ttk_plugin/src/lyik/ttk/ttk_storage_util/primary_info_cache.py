@@ -0,0 +1,96 @@
+import logging
+import threading
+import time
+from collections import OrderedDict
+from typing import Callable, Generic, Hashable, Optional, Tuple, TypeVar
+
+from pydantic import BaseModel
+
+logger = logging.getLogger(__name__)
+
+ValueT = TypeVar("ValueT")
+
+PRIMARY_INFO_CACHE_TTL_ENV = "TTK_PRIMARY_INFO_CACHE_TTL_SECONDS"
+PRIMARY_INFO_CACHE_SIZE_ENV = "TTK_PRIMARY_INFO_CACHE_SIZE"
+# Disabled unless a TTL is configured: another worker process may save the primary
+# traveller, and this process would serve the old record until the entry expires.
+DEFAULT_PRIMARY_INFO_CACHE_TTL_SECONDS = 0.0
+DEFAULT_PRIMARY_INFO_CACHE_SIZE = 256
+
+
+class CacheStats(BaseModel):
+    hits: int = 0
+    misses: int = 0
+    # Entries found but older than the TTL, also counted as misses
+    expired: int = 0
+    size: int = 0
+
+
+class TTLCache(Generic[ValueT]):
+    """
+    Bounded in-memory cache whose entries expire `ttl_seconds` after they are put.
+    The least recently used entry is evicted when `maxsize` is reached. A TTL of 0
+    disables the cache: nothing is stored and nothing is counted.
+    """
+
+    def __init__(self, ttl_seconds: float, maxsize: int):
+        self._ttl = ttl_seconds
+        self._maxsize = maxsize
+        self._entries: OrderedDict[Hashable, Tuple[float, ValueT]] = OrderedDict()
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+        self._expired = 0
+
+    @property
+    def enabled(self) -> bool:
+        return self._ttl > 0 and self._maxsize > 0
+
+    def get(self, key: Hashable) -> Optional[ValueT]:
+        if not self.enabled:
+            return None
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self._misses += 1
+                return None
+            expires_at, value = entry
+            if expires_at <= time.monotonic():
+                del self._entries[key]
+                self._expired += 1
+                self._misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self._hits += 1
+            return value
+
+    def put(self, key: Hashable, value: ValueT) -> None:
+        if not self.enabled:
+            return
+        with self._lock:
+            self._entries[key] = (time.monotonic() + self._ttl, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self._maxsize:
+                self._entries.popitem(last=False)
+
+    def invalidate(self, key: Hashable) -> None:
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def invalidate_where(self, predicate: Callable[[Hashable], bool]) -> None:
+        with self._lock:
+            for key in [key for key in self._entries if predicate(key)]:
+                del self._entries[key]
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> CacheStats:
+        with self._lock:
+            return CacheStats(
+                hits=self._hits,
+                misses=self._misses,
+                expired=self._expired,
+                size=len(self._entries),
+            )
@@ -1,15 +1,87 @@
-from motor.motor_asyncio import AsyncIOMotorClient, AsyncIOMotorDatabase
-from typing import Dict, Any, Optional
+from motor.motor_asyncio import (
+    AsyncIOMotorClient,
+    AsyncIOMotorCollection,
+    AsyncIOMotorDatabase,
+)
+from typing import Dict, Any, List, Optional, Sequence, Set, Tuple
 import logging
+import os
 from lyikpluginmanager import GenericFormRecordModel
 
+from lyik.ttk.utils.record_sections import record_fingerprint
+from .co_traveller_layout import (
+    ORDER_ID_FIELD,
+    TRAVELLER_DATA_FIELD,
+    TRAVELLER_HASH_FIELD,
+    TRAVELLER_HASHES_FIELD,
+    TRAVELLER_ID_FIELD,
+    TRAVELLERS_FIELD,
+    CoTravellerLayout,
+    MigrationReport,
+    ensure_per_traveller_index,
+    get_co_traveller_layouts,
+    migrate_to_per_traveller,
+    per_traveller_collection_name,
+    traveller_filter,
+)
+from .delta import compute_delta, get_path
+from .primary_info_cache import (
+    DEFAULT_PRIMARY_INFO_CACHE_SIZE,
+    DEFAULT_PRIMARY_INFO_CACHE_TTL_SECONDS,
+    PRIMARY_INFO_CACHE_SIZE_ENV,
+    PRIMARY_INFO_CACHE_TTL_ENV,
+    CacheStats,
+    TTLCache,
+)
+
 logger = logging.getLogger(__name__)
 
+# The last version of each traveller written or read by this process, to compute the
+# changes of the next save. The stored fingerprint of the version guards the update,
+# so an outdated snapshot costs a full write, never a wrong one.
+PERSISTED_SNAPSHOT_TTL_SECONDS = 3600.0
+PERSISTED_SNAPSHOT_CACHE_SIZE = 256
+PRIMARY_DATA_FIELD = "data"
+PRIMARY_HASH_FIELD = "data_hash"
+
+# Dotted paths of record fields, e.g. ("itinerary_accomodation", "ticketing.flight_tickets")
+Projection = Sequence[str]
+
+
+def normalize_projection(projection: Projection | None) -> Tuple[str, ...] | None:
+    """
+    Sorted, de-duplicated paths of a projection, without the paths inside another one
+    (Mongo rejects 'a' together with 'a.b'). None or empty means the whole record.
+    """
+    if not projection:
+        return None
+    paths = sorted(set(projection))
+    for path in paths:
+        if path.startswith("$") or not all(path.split(".")):
+            raise ValueError(f"Invalid record path '{path}' in projection")
+    return tuple(
+        path
+        for path in paths
+        if not any(path.startswith(f"{other}.") for other in paths if other != path)
+    )
+
+
+def _mongo_projection(prefix: str, paths: Tuple[str, ...]) -> Dict[str, int]:
+    return {f"{prefix}.{path}": 1 for path in paths}
+
 
 class TTKStorage:
     """
     MongoDB manager: maintains one Motor client
     for the entire process, re-using its pool for every database request.
+
+    The co-travellers of an org are stored in its layout: embedded in one document
+    per order (default), one document per traveller, or both during the cut-over,
+    see `co_traveller_layout`.
+
+    The primary traveller records read by `query_primary_info` can be cached in
+    memory for $TTK_PRIMARY_INFO_CACHE_TTL_SECONDS (off by default), so that the
+    co-travellers of a group order do not fetch and validate the same record again.
     """
 
     _instance: Optional["TTKStorage"] = None
@@ -42,6 +114,27 @@ class TTKStorage:
         # logger.info("Initialising MongoDB client for URL '%s'.", db_conn_url)
         self._client: AsyncIOMotorClient = AsyncIOMotorClient(db_conn_url)
         self._default_db: Optional[str] = db_name
+        self._primary_info_cache: TTLCache[GenericFormRecordModel] = TTLCache(
+            ttl_seconds=float(
+                os.getenv(
+                    PRIMARY_INFO_CACHE_TTL_ENV,
+                    str(DEFAULT_PRIMARY_INFO_CACHE_TTL_SECONDS),
+                )
+            ),
+            maxsize=int(
+                os.getenv(
+                    PRIMARY_INFO_CACHE_SIZE_ENV, str(DEFAULT_PRIMARY_INFO_CACHE_SIZE)
+                )
+            ),
+        )
+        # Key -> (fingerprint, value) of the last persisted version
+        self._persisted: TTLCache[Tuple[str, Dict[str, Any]]] = TTLCache(
+            ttl_seconds=PERSISTED_SNAPSHOT_TTL_SECONDS,
+            maxsize=PERSISTED_SNAPSHOT_CACHE_SIZE,
+        )
+        self._co_traveller_layouts = get_co_traveller_layouts()
+        # (database, collection) of the per-traveller collections known to be indexed
+        self._indexed_collections: Set[Tuple[str, str]] = set()
         self._initialised = True
 
     # ------------------------------------------------------------------
@@ -58,6 +151,91 @@ class TTKStorage:
             raise ValueError("Database name not specified and no default set.")
         return self._client[name]
 
+    @staticmethod
+    def _primary_info_key(
+        org_id: str,
+        order_id: str,
+        collection_name: str,
+        projection: Tuple[str, ...] | None = None,
+    ) -> Tuple[str, str, str, Tuple[str, ...] | None]:
+        return (org_id, collection_name, order_id, projection)
+
+    @property
+    def primary_info_cache_stats(self) -> CacheStats:
+        """Hit and miss counters of the primary traveller cache."""
+        return self._primary_info_cache.stats()
+
+    def clear_primary_info_cache(self) -> None:
+        self._primary_info_cache.clear()
+
+    def co_traveller_layout(self, org_id: str) -> CoTravellerLayout:
+        return self._co_traveller_layouts.for_org(org_id)
+
+    async def _per_traveller_collection(
+        self, db: AsyncIOMotorDatabase, collection_name: str
+    ) -> AsyncIOMotorCollection:
+        collection = db[per_traveller_collection_name(collection_name)]
+        if (db.name, collection.name) not in self._indexed_collections:
+            await ensure_per_traveller_index(collection)
+            self._indexed_collections.add((db.name, collection.name))
+        return collection
+
+    async def _write_changes(
+        self,
+        collection: AsyncIOMotorCollection,
+        document_filter: Dict[str, Any],
+        path: str,
+        hash_path: str,
+        value: Dict[str, Any],
+        snapshot_key: Tuple[str, ...],
+    ) -> bool:
+        """
+        Writes `value` at `path` of the document as $set/$unset of the paths
+        which changed since the last persisted version, or nothing if none did.
+        Returns False, having written nothing, when that version is not known to this
+        process (another worker or a restart) or was changed by another writer; the
+        caller then writes the whole value.
+        """
+        new_hash = record_fingerprint(value)
+        snapshot = self._persisted.get(snapshot_key)
+        if snapshot is None:
+            # Nothing to diff against: only read the stored hash, to skip the write
+            # when the stored version is already this one
+            document = await collection.find_one(document_filter, {hash_path: 1})
+            if get_path(document, hash_path) != new_hash:
+                return False
+            self._persisted.put(snapshot_key, (new_hash, value))
+            logger.debug("No changes to save at '%s' of %s.", path, document_filter)
+            return True
+
+        old_hash, old_value = snapshot
+        if old_hash == new_hash:
+            if not await collection.find_one(
+                {**document_filter, hash_path: new_hash}, {"_id": 1}
+            ):
+                self._persisted.invalidate(snapshot_key)
+                return False
+            logger.debug("No changes to save at '%s' of %s.", path, document_filter)
+            return True
+
+        delta = compute_delta(old_value, value, path)
+        result = await collection.update_one(
+            {**document_filter, hash_path: old_hash},
+            delta.to_update(extra_set={hash_path: new_hash}),
+        )
+        if not result.matched_count:
+            self._persisted.invalidate(snapshot_key)
+            return False
+        logger.debug(
+            "Saved %d changed and %d removed paths at '%s' of %s.",
+            len(delta.set_fields),
+            len(delta.unset_fields),
+            path,
+            document_filter,
+        )
+        self._persisted.put(snapshot_key, (new_hash, value))
+        return True
+
     async def save_primary_info(
         self,
         org_id: str,
@@ -65,14 +243,40 @@ class TTKStorage:
         data: Dict[str, Any],
         collection_name: str,
     ):
+        """
+        Saves the primary traveller record of the order. Only the fields which changed
+        since the last save are written, and nothing if none did.
+        """
         db = self.get_db(org_id)
+        collection = db[collection_name]
+        snapshot_key = (org_id, collection_name, order_id)
         try:
-            document = {"_id": order_id, "data": data}
-            result = await db[collection_name].replace_one(
+            if await self._write_changes(
+                collection,
                 {"_id": order_id},
-                document,
-                upsert=True,
-            )
+                path=PRIMARY_DATA_FIELD,
+                hash_path=PRIMARY_HASH_FIELD,
+                value=data,
+                snapshot_key=snapshot_key,
+            ):
+                result_id = order_id
+            else:
+                data_hash = record_fingerprint(data)
+                document = {
+                    "_id": order_id,
+                    PRIMARY_DATA_FIELD: data,
+                    PRIMARY_HASH_FIELD: data_hash,
+                }
+                result = await collection.replace_one(
+                    {"_id": order_id},
+                    document,
+                    upsert=True,
+                )
+                self._persisted.put(snapshot_key, (data_hash, data))
+                result_id = str(result.upserted_id)
+            # The next queries, with any projection, validate the saved data again
+            saved = self._primary_info_key(org_id, order_id, collection_name)[:3]
+            self._primary_info_cache.invalidate_where(lambda key: key[:3] == saved)
             # logger.info(
             #     "%s document in '%s.%s'.",
             #     "Upserted" if result.upserted_id else "Updated",
@@ -80,7 +284,7 @@ class TTKStorage:
             #     db.name,
             #     collection_name,
             # )
-            return str(result.upserted_id)
+            return result_id
         except Exception as e:
             logger.error("Error upserting into '%s': %s", collection_name, e)
             raise Exception(
@@ -97,22 +301,38 @@ class TTKStorage:
     ):
         """
         Saves or updates a single traveller's data inside the 'travellers' object
-        of a MongoDB document identified by order_id.
+        of a MongoDB document identified by order_id, and/or in the traveller's own
+        document, as the layout of the org says. Only the fields which changed since
+        the last save are written, and nothing if none did.
         """
         db = self.get_db(org_id)
+        layout = self.co_traveller_layout(org_id)
         try:
-            update_query = {f"travellers.{traveller_id}": traveller_data}
-            result = await db[collection_name].update_one(
-                {"_id": order_id}, {"$set": update_query}, upsert=True
-            )
-            # logger.info(
-            #     "%s traveller '%s' in '%s.%s'.",
-            #     "Upserted" if result.upserted_id else "Updated",
-            #     traveller_id,
-            #     db.name,
-            #     collection_name,
-            # )
-            return str(result.upserted_id) if result.upserted_id else traveller_id
+            result_id = traveller_id
+            if layout.writes_embedded:
+                result_id = await self._save_traveller(
+                    db[collection_name],
+                    {"_id": order_id},
+                    path=f"{TRAVELLERS_FIELD}.{traveller_id}",
+                    hash_path=f"{TRAVELLER_HASHES_FIELD}.{traveller_id}",
+                    traveller_id=traveller_id,
+                    traveller_data=traveller_data,
+                    snapshot_key=(org_id, collection_name, order_id, traveller_id),
+                )
+            if layout.writes_per_traveller:
+                collection = await self._per_traveller_collection(db, collection_name)
+                per_traveller_id = await self._save_traveller(
+                    collection,
+                    traveller_filter(order_id, traveller_id),
+                    path=TRAVELLER_DATA_FIELD,
+                    hash_path=TRAVELLER_HASH_FIELD,
+                    traveller_id=traveller_id,
+                    traveller_data=traveller_data,
+                    snapshot_key=(org_id, collection.name, order_id, traveller_id),
+                )
+                if not layout.writes_embedded:
+                    result_id = per_traveller_id
+            return result_id
         except Exception as e:
             logger.error(
                 "Error updating traveller '%s' in '%s': %s",
@@ -124,19 +344,66 @@ class TTKStorage:
                 f"Failed to save traveller '{traveller_id}' in {collection_name}. Error: {e}"
             )
 
+    async def _save_traveller(
+        self,
+        collection: AsyncIOMotorCollection,
+        document_filter: Dict[str, Any],
+        path: str,
+        hash_path: str,
+        traveller_id: str,
+        traveller_data: Dict[str, Any],
+        snapshot_key: Tuple[str, ...],
+    ) -> str:
+        if await self._write_changes(
+            collection,
+            document_filter,
+            path=path,
+            hash_path=hash_path,
+            value=traveller_data,
+            snapshot_key=snapshot_key,
+        ):
+            return traveller_id
+
+        traveller_hash = record_fingerprint(traveller_data)
+        update_query = {path: traveller_data, hash_path: traveller_hash}
+        result = await collection.update_one(
+            document_filter, {"$set": update_query}, upsert=True
+        )
+        self._persisted.put(snapshot_key, (traveller_hash, traveller_data))
+        # logger.info(
+        #     "%s traveller '%s' in '%s'.",
+        #     "Upserted" if result.upserted_id else "Updated",
+        #     traveller_id,
+        #     collection.name,
+        # )
+        return str(result.upserted_id) if result.upserted_id else traveller_id
+
     async def query_primary_info(
         self,
         org_id: str,
         order_id: str,
         collection_name: str,
+        projection: Projection | None = None,
     ) -> Optional[GenericFormRecordModel]:
         """
         Fetches the document with _id = order_id from the given org_id's DB.
         Returns the 'data' field if the document is found, else None.
+        With a projection, Mongo only returns those record paths, and the record
+        contains nothing else.
+        A cached record is shared with the other callers and must not be modified.
         """
+        paths = normalize_projection(projection)
+        cache_key = self._primary_info_key(org_id, order_id, collection_name, paths)
+        cached = self._primary_info_cache.get(cache_key)
+        if cached is not None:
+            return cached
+
         db = self.get_db(org_id)
         try:
-            document = await db[collection_name].find_one({"_id": order_id})
+            document = await db[collection_name].find_one(
+                {"_id": order_id},
+                _mongo_projection("data", paths) if paths else None,
+            )
             if document:
                 # logger.info(
                 #     "Fetched primary info for _id '%s' from '%s.%s'.",
@@ -145,7 +412,9 @@ class TTKStorage:
                 #     collection_name,
                 # )
                 data = document.get("data")
-                return GenericFormRecordModel(**data)
+                record = GenericFormRecordModel(**data)
+                self._primary_info_cache.put(cache_key, record)
+                return record
             else:
                 logger.warning(
                     "No document found for _id '%s' in '%s.%s'.",
@@ -165,15 +434,30 @@ class TTKStorage:
         org_id: str,
         order_id: str,
         collection_name: str,
+        projection: Projection | None = None,
     ) -> Optional[Dict[str, Dict[str, Any]]]:
         """
         Fetches all travellers stored under the given order_id.
+        With a projection, each traveller only contains those record paths.
         """
+        paths = normalize_projection(projection)
         db = self.get_db(org_id)
         try:
-            document = await db[collection_name].find_one(
-                {"_id": order_id}, {"_id": 0, "travellers": 1}
-            )
+            if self.co_traveller_layout(org_id).reads_per_traveller:
+                return await self._get_per_traveller_documents(
+                    db, order_id, collection_name, paths
+                )
+            if paths:
+                documents = await (
+                    db[collection_name]
+                    .aggregate(self._co_travellers_pipeline(order_id, paths))
+                    .to_list(length=1)
+                )
+                document = documents[0] if documents else None
+            else:
+                document = await db[collection_name].find_one(
+                    {"_id": order_id}, {"_id": 0, "travellers": 1}
+                )
             if not document or "travellers" not in document:
                 # logger.info("No travellers found for order_id '%s'.", order_id)
                 return None
@@ -181,9 +465,62 @@ class TTKStorage:
             return document["travellers"]
 
         except Exception as e:
-            logger.error("Error fetching Co-travellers:", e)
+            logger.error("Error fetching Co-travellers: %s", e)
             raise Exception(f"Failed to fetch Co-travellers. Error: {e}")
 
+    async def _get_per_traveller_documents(
+        self,
+        db: AsyncIOMotorDatabase,
+        order_id: str,
+        collection_name: str,
+        paths: Tuple[str, ...] | None,
+    ) -> Optional[Dict[str, Dict[str, Any]]]:
+        collection = await self._per_traveller_collection(db, collection_name)
+        fields = (
+            _mongo_projection(TRAVELLER_DATA_FIELD, paths)
+            if paths
+            else {TRAVELLER_DATA_FIELD: 1}
+        )
+        cursor = collection.find(
+            {ORDER_ID_FIELD: order_id}, {"_id": 0, TRAVELLER_ID_FIELD: 1, **fields}
+        )
+        travellers = {
+            document[TRAVELLER_ID_FIELD]: document.get(TRAVELLER_DATA_FIELD, {})
+            async for document in cursor
+        }
+        return travellers or None
+
+    async def migrate_co_travellers(
+        self, org_id: str, collection_name: str
+    ) -> MigrationReport:
+        """
+        Copies the co-travellers of the org from the embedded to the per-traveller
+        layout, see `co_traveller_layout.migrate_to_per_traveller`.
+        """
+        return await migrate_to_per_traveller(self.get_db(org_id), collection_name)
+
+    @staticmethod
+    def _co_travellers_pipeline(
+        order_id: str, paths: Tuple[str, ...]
+    ) -> List[Dict[str, Any]]:
+        """
+        The travellers of the order, each projected to `paths`. The travellers object
+        is keyed by traveller id, so it is turned into a list of {k, v} to project
+        the same paths of every traveller, then back into an object. An order without
+        travellers matches nothing, like a missing order.
+        """
+        return [
+            {"$match": {"_id": order_id, "travellers": {"$type": "object"}}},
+            {"$project": {"_id": 0, "travellers": {"$objectToArray": "$travellers"}}},
+            {
+                "$project": {
+                    "travellers.k": 1,
+                    **_mongo_projection("travellers.v", paths),
+                }
+            },
+            {"$project": {"travellers": {"$arrayToObject": "$travellers"}}},
+        ]
+
     @property
     def client(self) -> AsyncIOMotorClient:
         """Expose the raw Motor client if advanced operations are needed."""
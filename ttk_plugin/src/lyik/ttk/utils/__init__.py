@@ -1,2 +1,2 @@
 from .form_indicator import get_form_indicator
-from .form_utils import FormConfig
\ No newline at end of file
+from .form_utils import FormConfig, get_form_config
\ No newline at end of file
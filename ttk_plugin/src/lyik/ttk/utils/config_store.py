@@ -0,0 +1,95 @@
+import json
+import logging
+import os
+import threading
+from typing import Any, Callable, Dict, Tuple, TypeVar
+
+from pydantic import BaseModel, ConfigDict
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+# Builds the structure kept in the store from the parsed JSON of a file
+CompileFn = Callable[[Any], Any]
+
+
+def _identity(data: Any) -> Any:
+    return data
+
+
+class _StoreEntry(BaseModel):
+    model_config = ConfigDict(frozen=True, arbitrary_types_allowed=True)
+
+    # (st_mtime_ns, st_size) of the file when it was parsed
+    file_stat: Tuple[int, int]
+    value: Any
+
+
+class ConfigStore:
+    """
+    Process wide store of the JSON plugin files under CRED_FILES_MOUNT_PATH.
+
+    Each file is parsed once and handed to a compile function, which turns it into the
+    structure the callers need, e.g. an already sorted mapping. The result is kept per
+    (file, compile function) and shared by all the requests, so callers must not modify
+    it. A lookup costs one `os.stat`; the file is parsed again only when it changes.
+    Errors are not cached.
+    """
+
+    def __init__(self):
+        self._entries: Dict[Tuple[str, CompileFn], _StoreEntry] = {}
+        self._lock = threading.Lock()
+
+    def get(self, file_path: str, compile: CompileFn = _identity) -> Any:
+        file_path = resolve_config_path(file_path)
+        file_stat = self._stat(file_path)
+        key = (file_path, compile)
+        entry = self._entries.get(key)
+        if entry is not None and entry.file_stat == file_stat:
+            return entry.value
+
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry.file_stat == file_stat:
+                return entry.value
+
+            logger.info("Loading config file %s", file_path)
+            with open(file_path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+            value = compile(data)
+            self._entries[key] = _StoreEntry(file_stat=file_stat, value=value)
+            return value
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    @staticmethod
+    def _stat(file_path: str) -> Tuple[int, int]:
+        stat = os.stat(file_path)
+        return stat.st_mtime_ns, stat.st_size
+
+
+def resolve_config_path(file_path: str) -> str:
+    """
+    Absolute path of a plugin file. Relative paths are taken from CRED_FILES_MOUNT_PATH.
+    """
+    if not os.path.isabs(file_path):
+        mount_path = os.getenv("CRED_FILES_MOUNT_PATH")
+        if not mount_path:
+            raise ValueError("Missing CRED_FILES_MOUNT_PATH")
+        file_path = os.path.join(mount_path, file_path)
+    return os.path.realpath(file_path)
+
+
+_CONFIG_STORE = ConfigStore()
+
+
+def get_json_config(file_path: str, compile: Callable[[Any], T] = _identity) -> T:
+    """
+    The parsed, compiled content of a JSON plugin file, shared and read-only.
+    Raises FileNotFoundError if the file is missing and json.JSONDecodeError if it is not
+    valid JSON.
+    """
+    return _CONFIG_STORE.get(file_path, compile)
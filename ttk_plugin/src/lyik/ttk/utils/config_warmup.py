@@ -0,0 +1,229 @@
+import csv
+import glob
+import logging
+import os
+import time
+from typing import Callable, List, Sequence, Tuple
+
+from pydantic import BaseModel
+
+from .csv_utils import load_csv_rows
+from .form_indicator import FormIndicator
+from .form_utils import FormConfig, FormConfigRow, get_form_config
+from .config_store import get_json_config
+from .loader_utils import AddonLoader, LinkRecordOrderedMappingLoader
+from .message_catalogue import (
+    MESSAGE_CODES_FILE,
+    MESSAGES_DIR,
+    get_message_catalogue,
+)
+
+logger = logging.getLogger(__name__)
+
+CONFIG_WARMUP_ENV = "TTK_CONFIG_WARMUP"
+
+FORM_CONFIG_DIR = "form_config"
+DOCKET_SEQUENCE_DIR = "docket_sequence"
+DEFAULT_ADDON_FILE = "add_ons.json"
+
+FORM_CONFIG_REQUIRED_COLUMNS = ("relevant_infopanes",)
+DOCKET_SEQUENCE_REQUIRED_COLUMNS = (
+    "order",
+    "Name of the Document",
+    "Upload Field Attribute",
+    "Type of Visa",
+    "Is this Field Repeatable?",
+    "Default Placeholder Name",
+)
+MESSAGE_CODES_REQUIRED_COLUMNS = ("MESSAGE CODE", "DESCRIPTION")
+
+
+class ConfigLoadReport(BaseModel):
+    """
+    Outcome of loading one plugin file during the warm-up.
+    """
+
+    kind: str
+    file_path: str
+    seconds: float
+    error: str | None = None
+
+
+class ConfigWarmupError(ValueError):
+    """
+    Raised by the warm-up when plugin files are missing columns or cannot be parsed.
+    """
+
+    def __init__(self, failures: Sequence[ConfigLoadReport]):
+        self.failures = list(failures)
+        super().__init__(
+            "Invalid plugin configuration: "
+            + "; ".join(f"{r.file_path}: {r.error}" for r in self.failures)
+        )
+
+
+# Raise ConfigWarmupError on broken files instead of only logging them
+CONFIG_WARMUP_STRICT = "strict"
+
+
+def _get_config_warmup_mode() -> str:
+    return os.getenv(CONFIG_WARMUP_ENV, "true").strip().lower()
+
+
+def is_config_warmup_enabled() -> bool:
+    return _get_config_warmup_mode() in ("1", "true", "yes", "on", CONFIG_WARMUP_STRICT)
+
+
+def is_config_warmup_strict() -> bool:
+    return _get_config_warmup_mode() == CONFIG_WARMUP_STRICT
+
+
+def get_configured_form_indicators() -> List[FormIndicator]:
+    """
+    The form indicators which have a form_config CSV in CRED_FILES_MOUNT_PATH.
+    """
+    mount_path = os.getenv("CRED_FILES_MOUNT_PATH")
+    if not mount_path:
+        return []
+    form_indicators = []
+    for file_path in sorted(
+        glob.glob(os.path.join(mount_path, FORM_CONFIG_DIR, "*.csv"))
+    ):
+        name = os.path.splitext(os.path.basename(file_path))[0]
+        if name in FormIndicator._value2member_map_:
+            form_indicators.append(FormIndicator(name))
+    return form_indicators
+
+
+def _read_csv_header(file_path: str) -> List[str]:
+    with open(file_path, newline="", encoding="utf-8-sig") as f:
+        return next(csv.reader(f), [])
+
+
+def _check_columns(file_path: str, required: Sequence[str]) -> None:
+    header = _read_csv_header(file_path)
+    if not header:
+        # Empty file, i.e. nothing configured
+        return
+    missing = [column for column in required if column not in header]
+    if missing:
+        raise ValueError(f"Missing columns {missing}")
+
+
+def _load_form_config(file_path: str) -> None:
+    name = os.path.splitext(os.path.basename(file_path))[0]
+    if name not in FormIndicator._value2member_map_:
+        raise ValueError(f"'{name}' is not a form indicator")
+    _check_columns(file_path, FORM_CONFIG_REQUIRED_COLUMNS)
+    unknown = set(_read_csv_header(file_path)) - set(FormConfigRow.model_fields)
+    if unknown:
+        logger.warning("Ignored columns %s in %s", sorted(unknown), file_path)
+    for row in load_csv_rows(file_path):
+        value = row.get("has_submission_docket_status_requirement")
+        if value and FormConfig._parse_bool(value) is None:
+            raise ValueError(
+                f"has_submission_docket_status_requirement is not a boolean: '{value}'"
+            )
+    get_form_config(FormIndicator(name))
+
+
+def _load_docket_sequence(file_path: str) -> None:
+    # Only the CSV is checked: compiling the docket plan imports the universal models,
+    # which the entry points not creating dockets never need. It is compiled on the
+    # first docket instead.
+    _check_columns(file_path, DOCKET_SEQUENCE_REQUIRED_COLUMNS)
+    for row in load_csv_rows(file_path):
+        try:
+            int(row.get("order") or 0)
+        except ValueError:
+            logger.warning(
+                "Invalid order '%s' in %s, it is sorted first",
+                row.get("order"),
+                file_path,
+            )
+
+
+def _load_message_codes(file_path: str) -> None:
+    _check_columns(file_path, MESSAGE_CODES_REQUIRED_COLUMNS)
+    # Compiling the catalogue of the locale directory checks its rows
+    get_message_catalogue(os.path.basename(os.path.dirname(file_path)))
+
+
+def _load_json(file_path: str) -> None:
+    file_name = os.path.basename(file_path)
+    if file_name == os.getenv("LINK_RECORD_ORDER_FILE"):
+        LinkRecordOrderedMappingLoader(
+            file_path=file_path
+        ).load_ordered_column_mapping()
+    elif file_name == os.getenv("ADDON_FILE", DEFAULT_ADDON_FILE):
+        AddonLoader(file_path=file_path).load_addons()
+    else:
+        get_json_config(file_path)
+
+
+def warm_up_plugin_config(fail_fast: bool = False) -> List[ConfigLoadReport]:
+    """
+    Loads and checks every plugin file under CRED_FILES_MOUNT_PATH, so the caches are
+    filled before the first request and broken files are found at startup:
+    the form_config CSVs, the docket_sequence CSVs (checked, not compiled), the
+    message catalogues and the JSON files.
+
+    Logs the load time of each file. A broken file is logged and skipped, the others
+    are still loaded; with `fail_fast` set, ConfigWarmupError listing all the broken
+    files is raised at the end.
+    """
+    mount_path = os.getenv("CRED_FILES_MOUNT_PATH")
+    if not mount_path or not os.path.isdir(mount_path):
+        logger.warning(
+            "Skipping the plugin config warm-up, CRED_FILES_MOUNT_PATH is not a directory: %s",
+            mount_path,
+        )
+        return []
+
+    loaders: List[Tuple[str, str, Callable[[str], None]]] = [
+        (FORM_CONFIG_DIR, os.path.join(FORM_CONFIG_DIR, "*.csv"), _load_form_config),
+        (
+            DOCKET_SEQUENCE_DIR,
+            os.path.join(DOCKET_SEQUENCE_DIR, "*.csv"),
+            _load_docket_sequence,
+        ),
+        (
+            MESSAGES_DIR,
+            os.path.join(MESSAGES_DIR, "*", MESSAGE_CODES_FILE),
+            _load_message_codes,
+        ),
+        ("json", "*.json", _load_json),
+    ]
+
+    reports: List[ConfigLoadReport] = []
+    started = time.perf_counter()
+    for kind, pattern, load in loaders:
+        for file_path in sorted(glob.glob(os.path.join(mount_path, pattern))):
+            start = time.perf_counter()
+            error = None
+            try:
+                load(file_path)
+            except Exception as e:
+                error = f"{type(e).__name__}: {e}"
+            report = ConfigLoadReport(
+                kind=kind,
+                file_path=file_path,
+                seconds=time.perf_counter() - start,
+                error=error,
+            )
+            reports.append(report)
+            if error:
+                logger.error("Failed to load %s: %s", file_path, error)
+            else:
+                logger.info("Loaded %s in %.1f ms", file_path, report.seconds * 1000)
+
+    failures = [report for report in reports if report.error]
+    logger.info(
+        "Plugin config warm-up: %d files in %.1f ms, %d failed",
+        len(reports),
+        (time.perf_counter() - started) * 1000,
+        len(failures),
+    )
+    if failures and fail_fast:
+        raise ConfigWarmupError(failures)
+    return reports
@@ -0,0 +1,123 @@
+import logging
+import re
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Mapping, Tuple
+
+from pydantic import BaseModel, ConfigDict
+
+from .country_index_data import ALIASES, COUNTRIES, NAME_PATTERNS
+
+logger = logging.getLogger(__name__)
+
+# Some Countries full name should be used, for example 'Czechia' should be 'Czech Republic' instead.
+USE_COUNTRY_FULL_NAME = frozenset({"CZE"})
+
+
+class Country(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
+    iso2: str
+    iso3: str
+    name_short: str
+    name_official: str
+
+    @property
+    def display_name(self) -> str:
+        """
+        The short name, or the official name for the countries in USE_COUNTRY_FULL_NAME.
+        """
+        if self.iso3 in USE_COUNTRY_FULL_NAME:
+            return self.name_official
+        return self.name_short
+
+
+def _normalize(value: str) -> str:
+    return " ".join(value.strip().casefold().split())
+
+
+def _build_index() -> Mapping[str, Country]:
+    countries = [
+        Country(
+            iso2=iso2, iso3=iso3, name_short=name_short, name_official=name_official
+        )
+        for iso2, iso3, name_short, name_official in COUNTRIES
+    ]
+    by_iso3 = {country.iso3: country for country in countries}
+    index = {}
+    # Later entries win: aliases, then names, then codes
+    for alias, iso3 in ALIASES.items():
+        index[alias] = by_iso3[iso3]
+    for country in countries:
+        index[_normalize(country.name_official)] = country
+        index[_normalize(country.name_short)] = country
+    for country in countries:
+        index[_normalize(country.iso2)] = country
+        index[_normalize(country.iso3)] = country
+    return MappingProxyType(index)
+
+
+# ISO2, ISO3, short and official names and aliases, normalized, to the country
+_COUNTRY_INDEX = _build_index()
+
+
+@lru_cache(maxsize=1)
+def _name_patterns() -> Tuple[Tuple[re.Pattern, Country], ...]:
+    """
+    The name patterns of country_converter, compiled on the first name not in the
+    index.
+    """
+    return tuple(
+        (re.compile(pattern, re.IGNORECASE), _COUNTRY_INDEX[iso3.casefold()])
+        for iso3, pattern in NAME_PATTERNS
+    )
+
+
+@lru_cache(maxsize=1024)
+def _match_name(name: str) -> Country | None:
+    """
+    The country whose name pattern matches, like country_converter does, e.g.
+    'Great Britain' or 'The Gambia'. None if no or more than one pattern matches.
+    """
+    matches = [country for pattern, country in _name_patterns() if pattern.search(name)]
+    return matches[0] if len(matches) == 1 else None
+
+
+def find_country(value: str | None) -> Country | None:
+    """
+    The country of an ISO2 or ISO3 code or a country name, case insensitive.
+    None if unknown.
+    """
+    if not value or not isinstance(value, str):
+        return None
+    normalized = _normalize(value)
+    country = _COUNTRY_INDEX.get(normalized)
+    # Shorter values are codes, which country_converter does not match by name
+    if country is None and len(normalized) > 3:
+        country = _match_name(normalized)
+    return country
+
+
+def to_iso3(value: str) -> str:
+    """
+    The ISO3 code of a country code or name, e.g. 'IN' or 'India' -> 'IND'.
+    Falls back to the input if the country is unknown.
+    """
+    country = find_country(value)
+    if country is None:
+        logger.debug("Unknown country '%s'", value)
+        return value
+    return country.iso3
+
+
+def country_name(value: str) -> str:
+    """
+    The display name of a country code, e.g. 'IND' -> 'India'.
+    Falls back to the input if the country is unknown.
+    """
+    country = find_country(value)
+    if country is None:
+        logger.debug("Unknown country '%s'", value)
+        return value
+    return country.display_name
+
@@ -0,0 +1,623 @@
+"""
+Static country table, generated by `generate_country_index.py`. Do not edit.
+"""
+
+from typing import Dict, Tuple
+
+# (ISO2, ISO3, short name, official name)
+COUNTRIES: Tuple[Tuple[str, str, str, str], ...] = (
+    ("AW", "ABW", "Aruba", "Aruba"),
+    ("AF", "AFG", "Afghanistan", "Islamic Republic of Afghanistan"),
+    ("AO", "AGO", "Angola", "Republic of Angola"),
+    ("AI", "AIA", "Anguilla", "Anguilla"),
+    ("AX", "ALA", "Aland Islands", "Åland Islands"),
+    ("AL", "ALB", "Albania", "Republic of Albania"),
+    ("AD", "AND", "Andorra", "Principality of Andorra"),
+    ("AE", "ARE", "United Arab Emirates", "United Arab Emirates"),
+    ("AR", "ARG", "Argentina", "Argentine Republic"),
+    ("AM", "ARM", "Armenia", "Republic of Armenia"),
+    ("AS", "ASM", "American Samoa", "American Samoa"),
+    ("AQ", "ATA", "Antarctica", "Antarctica"),
+    (
+        "TF",
+        "ATF",
+        "French Southern Territories",
+        "Territory of the French Southern and Antarctic Lands",
+    ),
+    ("AG", "ATG", "Antigua and Barbuda", "Antigua and Barbuda"),
+    ("AU", "AUS", "Australia", "Commonwealth of Australia"),
+    ("AT", "AUT", "Austria", "Republic of Austria"),
+    ("AZ", "AZE", "Azerbaijan", "Republic of Azerbaijan"),
+    ("BI", "BDI", "Burundi", "Republic of Burundi"),
+    ("BE", "BEL", "Belgium", "Kingdom of Belgium"),
+    ("BJ", "BEN", "Benin", "Republic of Benin"),
+    (
+        "BQ",
+        "BES",
+        "Bonaire, Saint Eustatius and Saba",
+        "Bonaire, Saint Eustatius and Saba",
+    ),
+    ("BF", "BFA", "Burkina Faso", "Burkina Faso"),
+    ("BD", "BGD", "Bangladesh", "People's Republic of Bangladesh"),
+    ("BG", "BGR", "Bulgaria", "Republic of Bulgaria"),
+    ("BH", "BHR", "Bahrain", "Kingdom of Bahrain"),
+    ("BS", "BHS", "Bahamas", "Commonwealth of the Bahamas"),
+    ("BA", "BIH", "Bosnia and Herzegovina", "Bosnia and Herzegovina"),
+    ("BL", "BLM", "St. Barths", "Territorial collectivity of Saint-Barthélemy"),
+    ("BY", "BLR", "Belarus", "Republic of Belarus"),
+    ("BZ", "BLZ", "Belize", "Belize"),
+    ("BM", "BMU", "Bermuda", "Bermuda"),
+    ("BO", "BOL", "Bolivia", "Plurinational State of Bolivia"),
+    ("BR", "BRA", "Brazil", "Federative Republic of Brazil"),
+    ("BB", "BRB", "Barbados", "Barbados"),
+    ("BN", "BRN", "Brunei Darussalam", "Nation of Brunei, Abode of Peace"),
+    ("BT", "BTN", "Bhutan", "Kingdom of Bhutan"),
+    ("BV", "BVT", "Bouvet Island", "Bouvet Island"),
+    ("BW", "BWA", "Botswana", "Republic of Botswana"),
+    ("CF", "CAF", "Central African Republic", "Central African Republic"),
+    ("CA", "CAN", "Canada", "Canada"),
+    (
+        "CC",
+        "CCK",
+        "Cocos (Keeling) Islands",
+        "Territory of the Cocos (Keeling) Islands",
+    ),
+    ("CH", "CHE", "Switzerland", "Swiss Confederation"),
+    ("CL", "CHL", "Chile", "Republic of Chile"),
+    ("CN", "CHN", "China", "People's Republic of China"),
+    ("CI", "CIV", "Cote d'Ivoire", "Republic of Côte d'Ivoire"),
+    ("CM", "CMR", "Cameroon", "Republic of Cameroon"),
+    ("CD", "COD", "DR Congo", "Democratic Republic of the Congo"),
+    ("CG", "COG", "Congo Republic", "Republic of the Congo"),
+    ("CK", "COK", "Cook Islands", "Cook Islands"),
+    ("CO", "COL", "Colombia", "Republic of Colombia"),
+    ("KM", "COM", "Comoros", "Union of the Comoros"),
+    ("CV", "CPV", "Cabo Verde", "Republic of Cabo Verde"),
+    ("CR", "CRI", "Costa Rica", "Republic of Costa Rica"),
+    ("CU", "CUB", "Cuba", "Republic of Cuba"),
+    ("CW", "CUW", "Curacao", "Country of Curaçao"),
+    ("CX", "CXR", "Christmas Island", "Christmas Island"),
+    ("KY", "CYM", "Cayman Islands", "Cayman Islands"),
+    ("CY", "CYP", "Cyprus", "Republic of Cyprus"),
+    ("CZ", "CZE", "Czechia", "Czech Republic"),
+    ("DE", "DEU", "Germany", "Federal Republic of Germany"),
+    ("DJ", "DJI", "Djibouti", "Republic of Djibouti"),
+    ("DM", "DMA", "Dominica", "Commonwealth of Dominica"),
+    ("DK", "DNK", "Denmark", "Kingdom of Denmark"),
+    ("DO", "DOM", "Dominican Republic", "Dominican Republic"),
+    ("DZ", "DZA", "Algeria", "People's Democratic Republic of Algeria"),
+    ("EC", "ECU", "Ecuador", "Republic of Ecuador"),
+    ("EG", "EGY", "Egypt", "Arab Republic of Egypt"),
+    ("ER", "ERI", "Eritrea", "State of Eritrea"),
+    ("EH", "ESH", "Western Sahara", "Western Sahara"),
+    ("ES", "ESP", "Spain", "Kingdom of Spain"),
+    ("EE", "EST", "Estonia", "Republic of Estonia"),
+    ("ET", "ETH", "Ethiopia", "Federal Democratic Republic of Ethiopia"),
+    ("FI", "FIN", "Finland", "Republic of Finland"),
+    ("FJ", "FJI", "Fiji", "Republic of Fiji"),
+    ("FK", "FLK", "Falkland Islands", "Falkland Islands (Malvinas)"),
+    ("FR", "FRA", "France", "French Republic"),
+    ("FO", "FRO", "Faroe Islands", "Faroe Islands"),
+    ("FM", "FSM", "Micronesia, Fed. Sts.", "Federated States of Micronesia"),
+    ("GA", "GAB", "Gabon", "Gabonese Republic"),
+    (
+        "GB",
+        "GBR",
+        "United Kingdom",
+        "United Kingdom of Great Britain and Northern Ireland",
+    ),
+    ("GE", "GEO", "Georgia", "Georgia"),
+    ("GG", "GGY", "Guernsey", "Guernsey"),
+    ("GH", "GHA", "Ghana", "Republic of Ghana"),
+    ("GI", "GIB", "Gibraltar", "Gibraltar"),
+    ("GN", "GIN", "Guinea", "Republic of Guinea"),
+    ("GP", "GLP", "Guadeloupe", "Guadeloupe"),
+    ("GM", "GMB", "Gambia", "Republic of the Gambia"),
+    ("GW", "GNB", "Guinea-Bissau", "Republic of Guinea-Bissau"),
+    ("GQ", "GNQ", "Equatorial Guinea", "Republic of Equatorial Guinea"),
+    ("GR", "GRC", "Greece", "Hellenic Republic"),
+    ("GD", "GRD", "Grenada", "Grenada"),
+    ("GL", "GRL", "Greenland", "Greenland"),
+    ("GT", "GTM", "Guatemala", "Republic of Guatemala"),
+    ("GF", "GUF", "French Guiana", "Guiana"),
+    ("GU", "GUM", "Guam", "Guam"),
+    ("GY", "GUY", "Guyana", "Co-operative Republic of Guyana"),
+    ("HK", "HKG", "Hong Kong", "Hong Kong SAR"),
+    (
+        "HM",
+        "HMD",
+        "Heard and McDonald Islands",
+        "Territory of Heard Island and McDonald Islands",
+    ),
+    ("HN", "HND", "Honduras", "Republic of Honduras"),
+    ("HR", "HRV", "Croatia", "Republic of Croatia"),
+    ("HT", "HTI", "Haiti", "Republic of Haiti"),
+    ("HU", "HUN", "Hungary", "Republic of Hungary"),
+    ("ID", "IDN", "Indonesia", "Republic of Indonesia"),
+    ("IM", "IMN", "Isle of Man", "Isle of Man"),
+    ("IN", "IND", "India", "Republic of India"),
+    ("IO", "IOT", "British Indian Ocean Territory", "British Indian Ocean Territory"),
+    ("IE", "IRL", "Ireland", "Ireland"),
+    ("IR", "IRN", "Iran", "Islamic Republic of Iran"),
+    ("IQ", "IRQ", "Iraq", "Republic of Iraq"),
+    ("IS", "ISL", "Iceland", "Republic of Iceland"),
+    ("IL", "ISR", "Israel", "State of Israel"),
+    ("IT", "ITA", "Italy", "Italian Republic"),
+    ("JM", "JAM", "Jamaica", "Jamaica"),
+    ("JE", "JEY", "Jersey", "Jersey"),
+    ("JO", "JOR", "Jordan", "Hashemite Kingdom of Jordan"),
+    ("JP", "JPN", "Japan", "Japan"),
+    ("KZ", "KAZ", "Kazakhstan", "Republic of Kazakhstan"),
+    ("KE", "KEN", "Kenya", "Republic of Kenya"),
+    ("KG", "KGZ", "Kyrgyz Republic", "Kyrgyz Republic"),
+    ("KH", "KHM", "Cambodia", "Kingdom of Cambodia"),
+    ("KI", "KIR", "Kiribati", "Republic of Kiribati"),
+    ("KN", "KNA", "St. Kitts and Nevis", "Saint Kitts and Nevis"),
+    ("KR", "KOR", "South Korea", "Republic of Korea"),
+    ("KW", "KWT", "Kuwait", "State of Kuwait"),
+    ("LA", "LAO", "Laos", "Lao People's Democratic Republic"),
+    ("LB", "LBN", "Lebanon", "Lebanese Republic"),
+    ("LR", "LBR", "Liberia", "Republic of Liberia"),
+    ("LY", "LBY", "Libya", "State of Libya"),
+    ("LC", "LCA", "St. Lucia", "Saint Lucia"),
+    ("LI", "LIE", "Liechtenstein", "Principality of Liechtenstein"),
+    ("LK", "LKA", "Sri Lanka", "Democratic Socialist Republic of Sri Lanka"),
+    ("LS", "LSO", "Lesotho", "Kingdom of Lesotho"),
+    ("LT", "LTU", "Lithuania", "Republic of Lithuania"),
+    ("LU", "LUX", "Luxembourg", "Grand Duchy of Luxembourg"),
+    ("LV", "LVA", "Latvia", "Republic of Latvia"),
+    ("MO", "MAC", "Macau", "Macau SAR"),
+    ("MF", "MAF", "Saint-Martin", "Saint-Martin (French part)"),
+    ("MA", "MAR", "Morocco", "Kingdom of Morocco"),
+    ("MC", "MCO", "Monaco", "Principality of Monaco"),
+    ("MD", "MDA", "Moldova", "Republic of Moldova"),
+    ("MG", "MDG", "Madagascar", "Republic of Madagascar"),
+    ("MV", "MDV", "Maldives", "Republic of Maldives"),
+    ("MX", "MEX", "Mexico", "United Mexican States"),
+    ("MH", "MHL", "Marshall Islands", "Republic of the Marshall Islands"),
+    ("MK", "MKD", "North Macedonia", "Republic of North Macedonia"),
+    ("ML", "MLI", "Mali", "Republic of Mali"),
+    ("MT", "MLT", "Malta", "Republic of Malta"),
+    ("MM", "MMR", "Myanmar", "Republic of the Union of Myanmar"),
+    ("ME", "MNE", "Montenegro", "Montenegro"),
+    ("MN", "MNG", "Mongolia", "Mongolia"),
+    ("MP", "MNP", "Northern Mariana Islands", "Northern Mariana Islands"),
+    ("MZ", "MOZ", "Mozambique", "Republic of Mozambique"),
+    ("MR", "MRT", "Mauritania", "Islamic Republic of Mauritania"),
+    ("MS", "MSR", "Montserrat", "Montserrat"),
+    ("MQ", "MTQ", "Martinique", "Martinique"),
+    ("MU", "MUS", "Mauritius", "Republic of Mauritius"),
+    ("MW", "MWI", "Malawi", "Republic of Malawi"),
+    ("MY", "MYS", "Malaysia", "Malaysia"),
+    ("YT", "MYT", "Mayotte", "Mayotte"),
+    ("NA", "NAM", "Namibia", "Republic of Namibia"),
+    ("NC", "NCL", "New Caledonia", "New Caledonia"),
+    ("NE", "NER", "Niger", "Republic of Niger"),
+    ("NF", "NFK", "Norfolk Island", "Norfolk Island"),
+    ("NG", "NGA", "Nigeria", "Federal Republic of Nigeria"),
+    ("NI", "NIC", "Nicaragua", "Republic of Nicaragua"),
+    ("NU", "NIU", "Niue", "Niue"),
+    ("NL", "NLD", "Netherlands", "Kingdom of the Netherlands"),
+    ("NO", "NOR", "Norway", "Kingdom of Norway"),
+    ("NP", "NPL", "Nepal", "Federal Democratic Republic of Nepal"),
+    ("NR", "NRU", "Nauru", "Republic of Nauru"),
+    ("NZ", "NZL", "New Zealand", "New Zealand"),
+    ("OM", "OMN", "Oman", "Sultanate of Oman"),
+    ("PK", "PAK", "Pakistan", "Islamic Republic of Pakistan"),
+    ("PA", "PAN", "Panama", "Republic of Panama"),
+    ("PN", "PCN", "Pitcairn", "Pitcairn"),
+    ("PE", "PER", "Peru", "Republic of Peru"),
+    ("PH", "PHL", "Philippines", "Republic of the Philippines"),
+    ("PW", "PLW", "Palau", "Republic of Palau"),
+    ("PG", "PNG", "Papua New Guinea", "Independent State of Papua New Guinea"),
+    ("PL", "POL", "Poland", "Republic of Poland"),
+    ("PR", "PRI", "Puerto Rico", "Puerto Rico"),
+    ("KP", "PRK", "North Korea", "Democratic People's Republic of Korea"),
+    ("PT", "PRT", "Portugal", "Portuguese Republic"),
+    ("PY", "PRY", "Paraguay", "Republic of Paraguay"),
+    ("PS", "PSE", "Palestine", "State of Palestine"),
+    ("PF", "PYF", "French Polynesia", "French Polynesia"),
+    ("QA", "QAT", "Qatar", "State of Qatar"),
+    ("RE", "REU", "Reunion", "Reunion"),
+    ("RO", "ROU", "Romania", "Romania"),
+    ("RU", "RUS", "Russia", "Russian Federation"),
+    ("RW", "RWA", "Rwanda", "Republic of Rwanda"),
+    ("SA", "SAU", "Saudi Arabia", "Kingdom of Saudi Arabia"),
+    ("SD", "SDN", "Sudan", "Republic of the Sudan"),
+    ("SN", "SEN", "Senegal", "Republic of Senegal"),
+    ("SG", "SGP", "Singapore", "Republic of Singapore"),
+    (
+        "GS",
+        "SGS",
+        "South Georgia and South Sandwich Is.",
+        "South Georgia and The South Sandwich Islands",
+    ),
+    ("SH", "SHN", "St. Helena", "Saint Helena, Ascension and Tristan da Cunha"),
+    ("SJ", "SJM", "Svalbard and Jan Mayen Islands", "Svalbard and Jan Mayen Islands"),
+    ("SB", "SLB", "Solomon Islands", "Solomon Islands"),
+    ("SL", "SLE", "Sierra Leone", "Republic of Sierra Leone"),
+    ("SV", "SLV", "El Salvador", "Republic of El Salvador"),
+    ("SM", "SMR", "San Marino", "Republic of San Marino"),
+    ("SO", "SOM", "Somalia", "Federal Republic of Somalia"),
+    ("PM", "SPM", "St. Pierre and Miquelon", "Saint Pierre and Miquelon"),
+    ("RS", "SRB", "Serbia", "Republic of Serbia"),
+    ("SS", "SSD", "South Sudan", "Republic of South Sudan"),
+    (
+        "ST",
+        "STP",
+        "Sao Tome and Principe",
+        "Democratic Republic of São Tomé and Príncipe",
+    ),
+    ("SR", "SUR", "Suriname", "Republic of Suriname"),
+    ("SK", "SVK", "Slovakia", "Slovak Republic"),
+    ("SI", "SVN", "Slovenia", "Republic of Slovenia"),
+    ("SE", "SWE", "Sweden", "Kingdom of Sweden"),
+    ("SZ", "SWZ", "Eswatini", "Kingdom of Eswatini"),
+    ("SX", "SXM", "Sint Maarten", "Sint Maarten (Dutch part)"),
+    ("SC", "SYC", "Seychelles", "Republic of Seychelles"),
+    ("SY", "SYR", "Syria", "Syrian Arab Republic"),
+    ("TC", "TCA", "Turks and Caicos Islands", "Turks and Caicos Islands"),
+    ("TD", "TCD", "Chad", "Republic of Chad"),
+    ("TG", "TGO", "Togo", "Togolese Republic"),
+    ("TH", "THA", "Thailand", "Kingdom of Thailand"),
+    ("TJ", "TJK", "Tajikistan", "Republic of Tajikistan"),
+    ("TK", "TKL", "Tokelau", "Tokelau"),
+    ("TM", "TKM", "Turkmenistan", "Turkmenistan"),
+    ("TL", "TLS", "Timor-Leste", "Democratic Republic of Timor-Leste"),
+    ("TO", "TON", "Tonga", "Kingdom of Tonga"),
+    ("TT", "TTO", "Trinidad and Tobago", "Republic of Trinidad and Tobago"),
+    ("TN", "TUN", "Tunisia", "Republic of Tunisia"),
+    ("TR", "TUR", "Türkiye", "Republic of Türkiye"),
+    ("TV", "TUV", "Tuvalu", "Tuvalu"),
+    ("TW", "TWN", "Taiwan", "Republic of China"),
+    ("TZ", "TZA", "Tanzania", "United Republic of Tanzania"),
+    ("UG", "UGA", "Uganda", "Republic of Uganda"),
+    ("UA", "UKR", "Ukraine", "Ukraine"),
+    (
+        "UM",
+        "UMI",
+        "United States Minor Outlying Islands",
+        "United States Minor Outlying Islands",
+    ),
+    ("UY", "URY", "Uruguay", "Oriental Republic of Uruguay"),
+    ("US", "USA", "United States", "United States of America"),
+    ("UZ", "UZB", "Uzbekistan", "Republic of Uzbekistan"),
+    ("VA", "VAT", "Vatican", "Vatican City State"),
+    ("VC", "VCT", "St. Vincent and the Grenadines", "Saint Vincent and the Grenadines"),
+    ("VE", "VEN", "Venezuela", "Bolivarian Republic of Venezuela"),
+    ("VG", "VGB", "British Virgin Islands", "British Virgin Islands"),
+    (
+        "VI",
+        "VIR",
+        "United States Virgin Islands",
+        "Virgin Islands of the United States",
+    ),
+    ("VN", "VNM", "Vietnam", "Socialist Republic of Vietnam"),
+    ("VU", "VUT", "Vanuatu", "Republic of Vanuatu"),
+    ("WF", "WLF", "Wallis and Futuna Islands", "Wallis and Futuna Islands"),
+    ("WS", "WSM", "Samoa", "Independent State of Samoa"),
+    ("XK", "XKX", "Kosovo", "Republic of Kosovo"),
+    ("YE", "YEM", "Yemen", "Republic of Yemen"),
+    ("ZA", "ZAF", "South Africa", "Republic of South Africa"),
+    ("ZM", "ZMB", "Zambia", "Republic of Zambia"),
+    ("ZW", "ZWE", "Zimbabwe", "Republic of Zimbabwe"),
+)
+
+# Other names and codes of the countries, normalized, to ISO3
+ALIASES: Dict[str, str] = {
+    "bolivia plurinational state of": "BOL",
+    "bonaire sint eustatius and saba": "BES",
+    "cocos keeling islands": "CCK",
+    "congo": "COG",
+    "congo democratic republic of the": "COD",
+    "cote divoire": "CIV",
+    "el": "GRC",
+    "falkland islands malvinas": "FLK",
+    "guinea bissau": "GNB",
+    "heard island and mcdonald islands": "HMD",
+    "holy see": "VAT",
+    "iran islamic republic of": "IRN",
+    "korea democratic peoples republic of": "PRK",
+    "korea republic of": "KOR",
+    "kyrgyzstan": "KGZ",
+    "lao peoples democratic republic": "LAO",
+    "macao": "MAC",
+    "macedonia the former yugoslav republic of": "MKD",
+    "micronesia federated states of": "FSM",
+    "moldova republic of": "MDA",
+    "palestine state of": "PSE",
+    "saint barthelemy": "BLM",
+    "saint helena ascension and tristan da cunha": "SHN",
+    "saint martin french part": "MAF",
+    "sint maarten dutch part": "SXM",
+    "svalbard and jan mayen": "SJM",
+    "swaziland": "SWZ",
+    "taiwan province of china": "TWN",
+    "tanzania united republic of": "TZA",
+    "timor leste": "TLS",
+    "turkey": "TUR",
+    "uk": "GBR",
+    "venezuela bolivarian republic of": "VEN",
+    "viet nam": "VNM",
+    "virgin islands british": "VGB",
+    "virgin islands us": "VIR",
+    "wallis and futuna": "WLF",
+}
+
+# (ISO3, pattern): country_converter's case insensitive name patterns
+NAME_PATTERNS: Tuple[Tuple[str, str], ...] = (
+    ("ABW", "^(?!.*bonaire).*\\baruba"),
+    ("AFG", "afghan"),
+    ("AGO", "angola"),
+    ("AIA", "anguill?a"),
+    ("ALA", "\\b(a|å)land"),
+    ("ALB", "albania"),
+    ("AND", "andorra"),
+    ("ARE", "emirates|^u\\.?a\\.?e\\.?$|united.?arab.?em"),
+    ("ARG", "argentin"),
+    ("ARM", "armenia"),
+    ("ASM", "^(?=.*americ).*samoa"),
+    ("ATA", "antarctica"),
+    ("ATF", "french.?southern|\\bfr.*\\bso.*\\ban.*\\b\\bt"),
+    ("ATG", "antigua"),
+    ("AUS", "australia"),
+    ("AUT", "austria"),
+    ("AZE", "azerbaijan"),
+    ("BDI", "burundi"),
+    ("BEL", "^(?!.*luxem).*belgium"),
+    ("BEN", "benin|dahome"),
+    (
+        "BES",
+        "^bonaire|(?=.*bonaire).*eustatius|^(?=.*carib).*netherlands|\\bbes.?islands",
+    ),
+    ("BFA", "burkina|\\bfaso|upper.?volta"),
+    ("BGD", "bangladesh|^(?=.*east).*paki?stan"),
+    ("BGR", "bulgaria"),
+    ("BHR", "bahrain"),
+    ("BHS", "bahamas"),
+    ("BIH", "herzegovina|bosnia"),
+    ("BLM", "barth|barts"),
+    ("BLR", "belarus|byelo"),
+    ("BLZ", "belize|^(?=.*british).*honduras"),
+    ("BMU", "bermuda"),
+    ("BOL", "bolivia"),
+    ("BRA", "brazil"),
+    ("BRB", "barbados"),
+    ("BRN", "brunei"),
+    ("BTN", "bhutan"),
+    ("BVT", "bouvet"),
+    ("BWA", "botswana|bechuana|botsuana"),
+    ("CAF", "central.?african.?rep.*"),
+    ("CAN", "canada"),
+    ("CCK", "\\bcocos|keeling"),
+    ("CHE", "switz|swiss"),
+    ("CHL", "\\bchile"),
+    (
+        "CHN",
+        "^(?!repub)(?!taiwan)(?!hong.*kong)(?!macao).*china(?!.*hong.*kong)(?!.*macao)|^PRC$",
+    ),
+    ("CIV", ".*(ivoire|ivory)"),
+    ("CMR", "cameroon"),
+    (
+        "COD",
+        "\\bdem.*congo|congo.*\\bdem|congo.*\\bdr|\\bdr.*congo|\\bd\\.?r\\.?c|\\bd\\.?r\\.?o\\.?c|\\br\\.?d\\.?c|belgian.?congo|congo.?free.?state|kinshasa|zaire|l\\w{1,2}opoldville|^the\\ congo$|^RDC$|^DROC$|\\bcongo.*dem.*",
+    ),
+    (
+        "COG",
+        "^(?!.*\\bdem)(?!.*\\bdr)(?!.*kinshasa)(?!.*zaire)(?!.*belg)(?!.*l\\w{1,2}opoldville)(?!.*free)(^rep.*).*\\bcongo.*(?!.*\\bdem)(?!.*\\bdr).*|\\bwest.*congo|^congo[,;\\s]*(?!.*dem)rep.*?$|^congo$|\\bcongo.*brazza.*",
+    ),
+    ("COK", "\\bcook"),
+    ("COL", "colombia"),
+    ("COM", "comoro"),
+    ("CPV", "(cabo|cape) *verde"),
+    ("CRI", "costa.?rica"),
+    ("CUB", "\\bcuba"),
+    ("CUW", "\\bcura(c|ç)ao"),
+    ("CXR", "christmas"),
+    ("CYM", "cayman"),
+    ("CYP", "cyprus"),
+    ("CZE", "^(?=.*rep).*czech.*|czechia|bohemia|.*czech.*"),
+    ("DEU", "^(?!e|w)(fed)?.*germany(?!,? *e|,? *w)(,? *)(\\bfed)?"),
+    ("DJI", "djibouti"),
+    ("DMA", "dominica(?!n)"),
+    ("DNK", "denmark"),
+    ("DOM", "dominican"),
+    ("DZA", "algeria"),
+    ("ECU", "ecuador"),
+    ("EGY", "egypt"),
+    ("ERI", "eritrea"),
+    ("ESH", "\\bw.*sahara"),
+    ("ESP", "spain"),
+    ("EST", "estonia"),
+    ("ETH", "ethiopia|abyssinia"),
+    ("FIN", "finland"),
+    ("FJI", "fiji"),
+    ("FLK", "falkland|malvinas"),
+    ("FRA", "^(?!.*\\bdep).*france|french.?republic|\\bgaul"),
+    ("FRO", "faroe|faeroe"),
+    ("FSM", "micronesia"),
+    ("GAB", "gab(o|u)n"),
+    ("GBR", ".*(united.?kingdom|britain|^u\\.?k\\.?$|gb)|england"),
+    ("GEO", "^(?!.*south).*georgia(?!.*US.*)"),
+    ("GGY", "guernsey"),
+    ("GHA", "ghana|gold.?coast"),
+    ("GIB", "gibraltar"),
+    ("GIN", "^(?!.*eq)(?!.*span)(?!.*bissau)(?!.*pap)(?!.*new)(?!p.*n.*).*guinea"),
+    ("GLP", "guadeloupe"),
+    ("GMB", "gambia"),
+    ("GNB", "^(.*portu).*gu(i|y)nea|gu(y|i)nea.*bissau"),
+    ("GNQ", "guine.*eq|eq.*guine|^(?=.*span).*guinea"),
+    ("GRC", "greece|hellenic|hellas"),
+    ("GRD", "grenada"),
+    ("GRL", "greenland"),
+    ("GTM", "guatemala"),
+    ("GUF", "^(?=.*french).*gu(i|y)ana|^(?!.*brit)(?!.*dut).*guiana"),
+    ("GUM", "\\bguam"),
+    ("GUY", "^(?!.*fren)(?!.*dut).*\\bguyana|^(.*brit).*gu(i|y)ana"),
+    ("HKG", ".*hong.*kong|hksar"),
+    ("HMD", "heard.*mc.*donald"),
+    ("HND", "^(?!.*brit).*honduras"),
+    ("HRV", "croatia|hrvatska"),
+    ("HTI", "(ha(i|\\xef|\\xc3\\xaf)ti)"),
+    ("HUN", "hungary"),
+    ("IDN", "indonesia"),
+    ("IMN", "^(?=.*isle).*\\bman"),
+    ("IND", "^(?!\\D*(?:bassas))\\D*india(?!.*ocea)(?!na)"),
+    ("IOT", "br.*indian.?ocean"),
+    ("IRL", "^(?!.*north.*).*ireland"),
+    ("IRN", "\\biran|persia"),
+    ("IRQ", "\\biraq|mesopotamia"),
+    ("ISL", "iceland"),
+    ("ISR", "israel"),
+    ("ITA", ".*italy|.*italia.*"),
+    ("JAM", "jamaica"),
+    ("JEY", "^(?!.*new).*jersey"),
+    ("JOR", "jordan"),
+    ("JPN", "japan"),
+    ("KAZ", "kazak"),
+    ("KEN", "kenya|british.?east.?africa|east.?africa.?prot"),
+    ("KGZ", "kyrgyz|kirghiz"),
+    ("KHM", "cambodia|kampuchea|khmer|^p\\.?r\\.?k\\.?$"),
+    ("KIR", "kiribati"),
+    ("KNA", "kitts|\\bnevis"),
+    (
+        "KOR",
+        "^(?!.*dem)(?!.*peo)(?!.*nor)(?!.*n)(?!.*dpr)(?!d\\.p\\.r).*\\bkorea|\\br\\.?o\\.?k\\b",
+    ),
+    ("KWT", "kuwait"),
+    ("LAO", "\\blaos?\\b"),
+    ("LBN", "lebanon|lebanese"),
+    ("LBR", "liberia"),
+    ("LBY", "libya"),
+    ("LCA", "\\blucia"),
+    ("LIE", "liechtenstein"),
+    ("LKA", "sri.?lanka|ceylon"),
+    ("LSO", "lesotho|basuto"),
+    ("LTU", "lithuania"),
+    ("LUX", "^(?!.*belg).*luxem"),
+    ("LVA", "latvia"),
+    ("MAC", ".*maca(o|u)"),
+    ("MAF", "^(?!.*maarten)(?!.*saba)(?!.*dutch).*martin\\b"),
+    ("MAR", "morocco|\\bmaroc"),
+    ("MCO", "monaco"),
+    ("MDA", "moldov|b(a|e)ssarabia"),
+    ("MDG", "madagascar|malagasy"),
+    ("MDV", "maldive"),
+    ("MEX", "^(?!.*new).*mexi(?!.*city)"),
+    ("MHL", "marshall"),
+    ("MKD", "macedonia|^f\\.?y\\.?r\\.?o\\.?m\\.?$"),
+    ("MLI", "\\bmali\\b"),
+    ("MLT", "\\bmalta"),
+    ("MMR", "myanmar|burma"),
+    ("MNE", "^(?!.*serbia).*montenegro"),
+    ("MNG", "mongolia"),
+    ("MNP", "mariana"),
+    ("MOZ", "mozambique"),
+    ("MRT", "mauritania"),
+    ("MSR", "montserrat"),
+    ("MTQ", "martinique"),
+    ("MUS", "mauritius"),
+    ("MWI", "malawi|nyasa"),
+    ("MYS", "malaysia"),
+    ("MYT", "mayotte"),
+    ("NAM", "namibia"),
+    ("NCL", "new.?caledonia"),
+    ("NER", "\\bniger(?!ia)"),
+    ("NFK", "norfolk.*is"),
+    ("NGA", "nigeria"),
+    ("NIC", "nicaragua"),
+    ("NIU", "niue"),
+    ("NLD", "^(?!.*\\bant)(?!.*\\bcarib).*netherlands"),
+    ("NOR", "norway"),
+    ("NPL", "nepal"),
+    ("NRU", "nauru"),
+    ("NZL", "(new|n).*zealand"),
+    ("OMN", "\\boman|trucial"),
+    ("PAK", "^(?!.*east).*paki?stan"),
+    ("PAN", "panama"),
+    ("PCN", "pitcairn"),
+    ("PER", "peru"),
+    ("PHL", "philippines"),
+    ("PLW", "palau"),
+    ("PNG", "\\bp.*\\bn.*\\bguin.*|^p\\.?n\\.?g\\.?$|new.?guinea"),
+    ("POL", "poland"),
+    ("PRI", "puerto.?rico"),
+    (
+        "PRK",
+        "^(?=.*dem).*\\bkorea|^(?=.*peo).*\\bkorea|^(?=.*nor).*\\bkorea|\\bd\\.?p\\.?r\\.|.*dpr.*|^n.*korea",
+    ),
+    ("PRT", "portugal|portuguese"),
+    ("PRY", "paraguay"),
+    ("PSE", "palestin|\\bgaza|west.?bank"),
+    ("PYF", "french.?polynesia"),
+    ("QAT", "qatar"),
+    ("REU", "reunion|réunion"),
+    ("ROU", "r(o|u|ou)mania"),
+    ("RUS", "\\brussia"),
+    ("RWA", "rwanda"),
+    ("SAU", "\\bsa\\w*.?arabia"),
+    ("SDN", "^(?!.*\\bs(?!u)).*sudan"),
+    ("SEN", "senegal"),
+    ("SGP", "singapore"),
+    ("SGS", "south.?georgia|sandwich"),
+    ("SHN", "helena"),
+    ("SJM", "^(?!norway).*svalbard"),
+    ("SLB", "solomon"),
+    ("SLE", "sierra"),
+    ("SLV", "el.?salvador"),
+    ("SMR", "san.?marino"),
+    ("SOM", "somali"),
+    ("SPM", "miquelon"),
+    ("SRB", "^(?!.*monte).*serbia.*"),
+    ("SSD", "\\bs\\w*.?sudan"),
+    ("STP", "tome|tomé"),
+    ("SUR", "surinam|dutch.?gu(i|y)ana"),
+    ("SVK", "^(?!.*cze).*slovak"),
+    ("SVN", "slovenia"),
+    ("SWE", "swedish|sweden(?!.*except)"),
+    ("SWZ", "swaziland|eswatini"),
+    ("SXM", "^(?!.*martin)(?!.*saba).*maarten|dutch.*martin|martin.*dutch"),
+    ("SYC", "seychell"),
+    ("SYR", "syria"),
+    ("TCA", "turks"),
+    ("TCD", "\\bchad"),
+    ("TGO", "togo"),
+    ("THA", "thailand|\\bsiam"),
+    ("TJK", "tajik"),
+    ("TKL", "tokelau"),
+    ("TKM", "turk-?men"),
+    ("TLS", "^(?=.*leste).*timor|^(?=.*east).*timor"),
+    ("TON", "tonga"),
+    ("TTO", "trinidad|tobago"),
+    ("TUN", "tunisia"),
+    ("TUR", "t[ü|u]rk[i|e]y"),
+    ("TUV", "tuvalu"),
+    (
+        "TWN",
+        ".*taiwan|.*taipei|.*formosa|^(?!.*\\bdem)(?!.*\\bpe)(?!.*\\bdr)(^rep.*).*\\bchina.*(?!.*\\bdem.*)(?!\\bpe.*)(?!.*\\bdr.*).*|^ROC$|^taiwan r\\.?o\\.?c\\.?$",
+    ),
+    ("TZA", "tanzania(?!: zan.*)"),
+    ("UGA", "uganda"),
+    ("UKR", "ukrain"),
+    ("UMI", "minor.?outlying.?is"),
+    ("URY", "uruguay"),
+    ("USA", "^(?!.*islands).*united.?states|^u\\.?s\\.?a\\.?$|^u\\.?s\\.?$"),
+    ("UZB", "uzbek"),
+    ("VAT", "holy.?see|vatican|papal.?st"),
+    ("VCT", "vincent"),
+    ("VEN", "venezuela"),
+    (
+        "VGB",
+        "^(?=.*\\bu\\.?\\s?k).*virgin|^(?=.*br.*).*virgin|^(?=.*kingdom).*virgin|BVI",
+    ),
+    ("VIR", "^(?=.*\\bu\\.?\\s?s).*virgin|^(?=.*states).*virgin"),
+    ("VNM", "^((?!n|s|.*republic)|(?=.*socialist)).*viet.?nam(?! *,? *n| *,? *s)"),
+    ("VUT", "vanuatu|new.?hebrides"),
+    ("WLF", "futuna|wallis"),
+    ("WSM", "^(?!.*amer.*)samoa|(\\bindep.*samoa)|^west.*samoa"),
+    ("XKX", "kosovo"),
+    ("YEM", "yemen"),
+    ("ZAF", "\\bs(\\.|outh)(?!.*sahar).*africa|^r\\.?s\\.?a\\.?$"),
+    ("ZMB", "zambia|northern.?rhodesia"),
+    ("ZWE", "zimbabwe|^(?!.*northern).*rhodesia"),
+)
@@ -1,18 +1,24 @@
 import csv
+import os
 from typing import List, Dict
 from functools import lru_cache
 
-@lru_cache(maxsize=32)
+
 def load_csv_rows(file_path: str) -> List[Dict[str, str]]:
     """
     Generic CSV loader.
 
-    - Reads CSV using utf-8 encoding
+    - Reads CSV using utf-8 encoding, ignoring a byte order mark
     - Returns a list of row dicts from csv.DictReader
     - Does NOT apply any domain-specific sorting or coercion
-    - Cached for repeated access to the same file_path
+    - Cached for repeated access to the same file_path, until the file is modified
     """
-    with open(file_path, newline="", encoding="utf-8") as f:
+    return _load_csv_rows(file_path, os.stat(file_path).st_mtime_ns)
+
+
+@lru_cache(maxsize=32)
+def _load_csv_rows(file_path: str, mtime_ns: int) -> List[Dict[str, str]]:
+    with open(file_path, newline="", encoding="utf-8-sig") as f:
         reader = csv.DictReader(f)
         # Materialize as list so the cached value is reusable
         return list(reader)
@@ -489,29 +489,40 @@ _INDIVIDUAL_COUNTRY_INDICATORS: dict[str, FormIndicator] = {
 }
 
 
-def get_form_indicator(form_rec: dict | BaseModel) -> FormIndicator | None:
-    # If it's a pydantic BaseModel (or similar), convert to dict
-    if isinstance(form_rec, BaseModel):
-        form_rec = form_rec.model_dump()
-    else:
-        form_rec = form_rec or {}
+# Path of the destination country in the form record
+TO_COUNTRY_PATH = ("visa_request_information", "visa_request", "to_country")
+
+
+def _get_field(obj: Any, name: str) -> Any:
+    if isinstance(obj, dict):
+        return obj.get(name)
+    if isinstance(obj, BaseModel):
+        if name in type(obj).model_fields:
+            return getattr(obj, name)
+        return (obj.__pydantic_extra__ or {}).get(name)
+    return None
 
-    if form_rec is None:
-        return None
 
-    # Derive from to_country if indicator is missing
-    to_country_code: str | None = None
-    try:
-        vri = form_rec.get("visa_request_information") or {}
-        vr = vri.get("visa_request") or {}
-        to_country_code = vr.get("to_country")
-    except AttributeError:
-        pass
+def get_to_country(form_rec: dict | BaseModel | None) -> str | None:
+    """
+    The to_country of the record, read from a model or a dict without serializing it.
+    """
+    obj: Any = form_rec
+    for name in TO_COUNTRY_PATH:
+        obj = _get_field(obj, name)
+        if obj is None:
+            return None
+    return obj
 
-    if not to_country_code:
+
+def form_indicator_of_country(country_code: str | None) -> FormIndicator | None:
+    """
+    The form indicator of an ISO3 country code, SCHENGEN for the Schengen countries.
+    """
+    if not country_code:
         return None
 
-    code = str(to_country_code).upper()
+    code = str(country_code).upper()
 
     # Schengen Country Forms
     if code in _SCHENGEN_COUNTRY_CODES:
@@ -523,3 +534,8 @@ def get_form_indicator(form_rec: dict | BaseModel) -> FormIndicator | None:
 
     # Fallback: unknown country type
     return None
+
+
+def get_form_indicator(form_rec: dict | BaseModel | None) -> FormIndicator | None:
+    # Derive from to_country of the visa request
+    return form_indicator_of_country(get_to_country(form_rec))
@@ -1,9 +1,14 @@
 from lyik.ttk.utils.form_indicator import FormIndicator
 from .csv_utils import load_csv_rows
+import hashlib
+import logging
 import os
-from typing import List, Dict, Optional, Literal
+import threading
+from typing import Any, List, Dict, Optional, Literal, Tuple
 
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict
+
+logger = logging.getLogger(__name__)
 
 
 class FormConfigRow(BaseModel):
@@ -30,13 +35,24 @@ COMMON_INFOPANES_VALUES = ("itinerary_accomodation", "accomodation", "ticketing"
 
 
 class FormConfig:
-    def __init__(self, form_indicator: FormIndicator):
+    """
+    The form config of a form indicator, read from its form_config CSV.
+
+    Immutable once built, the lists are returned as tuples. Use `get_form_config` to get
+    the shared instance of a form indicator instead of parsing the CSV again.
+    """
+
+    def __init__(self, form_indicator: FormIndicator, version: str | None = None):
         self.form_indicator = form_indicator
+        # Content hash of the CSV the config was built from, if known
+        self.version = version
 
         raw_rows = self.load_form_config_file()
 
         # parsed list
-        self._rows: List[FormConfigRow] = [FormConfigRow(**row) for row in raw_rows]
+        self._rows: Tuple[FormConfigRow, ...] = tuple(
+            FormConfigRow(**row) for row in raw_rows
+        )
 
         # derived fields
         self._relevant_infopanes: List[str] = []
@@ -47,8 +63,21 @@ class FormConfig:
         self._has_submission_docket_status_requirement: bool = False
 
         self._parse_rows()
+        self._frozen = True
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        if getattr(self, "_frozen", False):
+            raise AttributeError(f"FormConfig is immutable, cannot set {name}")
+        super().__setattr__(name, value)
 
     def load_form_config_file(self) -> List[Dict[str, str]]:
+        return load_csv_rows(self.get_form_config_file_path(self.form_indicator))
+
+    @staticmethod
+    def get_form_config_file_path(form_indicator: FormIndicator) -> str:
+        """
+        Path of the form_config CSV of the form indicator. Raises if it does not exist.
+        """
         mount_path = os.getenv("CRED_FILES_MOUNT_PATH")
 
         if not mount_path:
@@ -61,7 +90,7 @@ class FormConfig:
                 f"Form Config directory not found: {form_config_dir}"
             )
 
-        expected_filename = f"{self.form_indicator.value}.csv"
+        expected_filename = f"{form_indicator.value}.csv"
         form_config_csv_file_path = os.path.join(form_config_dir, expected_filename)
 
         if not os.path.isfile(form_config_csv_file_path):
@@ -69,7 +98,7 @@ class FormConfig:
                 f"Form Config CSV file not found: {form_config_csv_file_path}"
             )
 
-        return load_csv_rows(form_config_csv_file_path)
+        return form_config_csv_file_path
 
     @staticmethod
     def _parse_bool(value: Optional[str]) -> Optional[bool]:
@@ -116,27 +145,33 @@ class FormConfig:
         # derive has_appointment_section from relevant_infopanes
         self._has_appointment_section = APPOINTPENT_INFOPANE in self._relevant_infopanes
 
+        # shared between requests, so hand out immutable views only
+        self._relevant_infopanes = tuple(self._relevant_infopanes)
+        self._business_panes = tuple(self._business_panes)
+        self._common_infopanes = tuple(self._common_infopanes)
+        self._submit_requirement = tuple(self._submit_requirement)
+
     # ----- Public API -----
 
-    def get_relevant_infopane_list(self) -> List[str]:
+    def get_relevant_infopane_list(self) -> Tuple[str, ...]:
         """
         Get the list of infopanes which are relevant for percentage completion.
         """
         return self._relevant_infopanes
 
-    def get_business_panes_list(self) -> List[str]:
+    def get_business_panes_list(self) -> Tuple[str, ...]:
         """
         Get the infopanes which are business type, which are only used if the visa mode is business.
         """
         return self._business_panes
 
-    def get_common_infopanes_list(self) -> List[COMMON_INFOPANES]:
+    def get_common_infopanes_list(self) -> Tuple[COMMON_INFOPANES, ...]:
         """
         Get the shared common infopanes list (Shared between the primary and co-traveller).
         """
         return self._common_infopanes
 
-    def get_submit_requirement_list(self) -> List[str]:
+    def get_submit_requirement_list(self) -> Tuple[str, ...]:
         """
         Get the dot separated path of checkbox fields which must be checked before submitting the application
         """
@@ -149,3 +184,93 @@ class FormConfig:
     def has_submission_docket_status_requirement(self) -> bool:
         "True if the form can only be submit based on docket being enabled in submit infopane."
         return self._has_submission_docket_status_requirement
+
+
+class _RegistryEntry(BaseModel):
+    model_config = ConfigDict(frozen=True, arbitrary_types_allowed=True)
+
+    mount_path: str | None
+    file_path: str
+    # (st_mtime_ns, st_size) of the CSV when it was last checked
+    file_stat: Tuple[int, int]
+    version: str
+    config: FormConfig
+
+
+class FormConfigRegistry:
+    """
+    Shared FormConfig instances by form indicator.
+
+    A lookup costs one `os.stat` of the CSV. When its modification time or size changes
+    the file is hashed, and the config is built again only if the content changed.
+    """
+
+    def __init__(self):
+        self._entries: Dict[FormIndicator, _RegistryEntry] = {}
+        self._lock = threading.Lock()
+
+    def get(self, form_indicator: FormIndicator) -> FormConfig:
+        mount_path = os.getenv("CRED_FILES_MOUNT_PATH")
+        entry = self._entries.get(form_indicator)
+        if entry is not None and entry.mount_path == mount_path:
+            try:
+                if self._stat(entry.file_path) == entry.file_stat:
+                    return entry.config
+            except OSError:
+                # Gone, the full lookup below raises the usual error
+                pass
+
+        with self._lock:
+            file_path = FormConfig.get_form_config_file_path(form_indicator)
+            file_stat = self._stat(file_path)
+            entry = self._entries.get(form_indicator)
+            if (
+                entry is not None
+                and entry.file_path == file_path
+                and entry.file_stat == file_stat
+            ):
+                return entry.config
+
+            with open(file_path, "rb") as f:
+                version = hashlib.blake2b(f.read(), digest_size=16).hexdigest()
+            if (
+                entry is not None
+                and entry.file_path == file_path
+                and entry.version == version
+            ):
+                # Touched but not changed
+                config = entry.config
+            else:
+                logger.info(
+                    "Loading form config of %s from %s", form_indicator.value, file_path
+                )
+                config = FormConfig(form_indicator=form_indicator, version=version)
+
+            self._entries[form_indicator] = _RegistryEntry(
+                mount_path=mount_path,
+                file_path=file_path,
+                file_stat=file_stat,
+                version=version,
+                config=config,
+            )
+            return config
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    @staticmethod
+    def _stat(file_path: str) -> Tuple[int, int]:
+        stat = os.stat(file_path)
+        return stat.st_mtime_ns, stat.st_size
+
+
+_FORM_CONFIG_REGISTRY = FormConfigRegistry()
+
+
+def get_form_config(form_indicator: FormIndicator) -> FormConfig:
+    """
+    The shared, immutable FormConfig of the form indicator. Raises like `FormConfig` when
+    the form_config CSV is missing.
+    """
+    return _FORM_CONFIG_REGISTRY.get(form_indicator)
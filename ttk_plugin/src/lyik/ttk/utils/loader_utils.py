@@ -1,10 +1,12 @@
 import json
 import logging
-from functools import lru_cache
-from typing import List, Dict
+from collections import OrderedDict
+from typing import List, Dict, Tuple
 from pathlib import Path
 from lyikpluginmanager import PluginException
 
+from .config_store import get_json_config
+
 logger = logging.getLogger(__name__)
 
 
@@ -13,10 +15,10 @@ class AddonLoader:
     def __init__(self, file_path: str):
         self.addon_file_path = Path(file_path).resolve()
 
-    @lru_cache()
     def load_addons(self) -> List[Dict]:
         """
-        Loads add-on data from a JSON file and caches it using LRU.
+        Loads add-on data from the JSON file. The file is parsed once and shared
+        through the config store until it changes.
         Returns:
             List of add-on entries as dictionaries.
         """
@@ -28,18 +30,8 @@ class AddonLoader:
                     detailed_message=f"File not found: {self.addon_file_path}",
                 )
 
-            with open(self.addon_file_path, "r", encoding="utf-8") as f:
-                data = json.load(f)
-
-            if not data or not isinstance(data, list):
-                logging.warning("Expected list at root of JSON")
-                raise PluginException(
-                    message="Internal error occurred.",
-                    detailed_message="Invalid JSON structure. Expected list at root of JSON.",
-                )
-
-            logging.info(f"Loaded {len(data)} add-ons from {self.addon_file_path}")
-            return data
+            data = get_json_config(str(self.addon_file_path), _compile_addons)
+            return list(data)
 
         except json.JSONDecodeError as e:
             logging.error(f"JSON decode error in {self.addon_file_path}: {e}")
@@ -51,18 +43,40 @@ class AddonLoader:
             raise
 
 
+def _compile_addons(data) -> Tuple[Dict, ...]:
+    if not data or not isinstance(data, list):
+        logging.warning("Expected list at root of JSON")
+        raise PluginException(
+            message="Internal error occurred.",
+            detailed_message="Invalid JSON structure. Expected list at root of JSON.",
+        )
+
+    logging.info(f"Loaded {len(data)} add-ons")
+    return tuple(data)
+
 
 class LinkRecordOrderedMappingLoader:
 
     def __init__(self, file_path: str):
         self.order_file_path = Path(file_path).resolve()
 
-    @lru_cache()
     def load_link_record_mapping_config(self) -> Dict:
         """
         Loads and returns the full mapping config dict from the file.
         Expected keys: 'enable': bool, 'order': list of dicts.
+        The dict is shared through the config store and must not be modified.
+        """
+        return self._load(_compile_mapping_config)
+
+    def load_ordered_column_mapping(self) -> "OrderedDict[str, str] | None":
+        """
+        The enabled columns of the mapping config as link attribute -> title, sorted by
+        their order. None if the mapping is disabled or has no enabled columns.
+        Sorted once per file change; the result is shared and must not be modified.
         """
+        return self._load(_compile_ordered_column_mapping)
+
+    def _load(self, compile):
         try:
             if not self.order_file_path.exists():
                 logging.error(f"File not found: {self.order_file_path}")
@@ -71,17 +85,7 @@ class LinkRecordOrderedMappingLoader:
                     detailed_message=f"File not found: {self.order_file_path}",
                 )
 
-            with open(self.order_file_path, "r", encoding="utf-8") as f:
-                data = json.load(f)
-
-            if not isinstance(data, dict) or "order" not in data:
-                logging.warning("Invalid JSON structure. Expected dict with 'order'.")
-                raise PluginException(
-                    message="Internal error occurred.",
-                    detailed_message="Invalid JSON structure. Expected dict with 'order' list.",
-                )
-
-            return data
+            return get_json_config(str(self.order_file_path), compile)
 
         except json.JSONDecodeError as e:
             logging.error(f"JSON decode error in {self.order_file_path}: {e}")
@@ -90,4 +94,39 @@ class LinkRecordOrderedMappingLoader:
             logging.exception(
                 f"Unexpected error while loading mapping config from {self.order_file_path}"
             )
-            raise
\ No newline at end of file
+            raise
+
+
+def _compile_mapping_config(data) -> Dict:
+    if not isinstance(data, dict) or "order" not in data:
+        logging.warning("Invalid JSON structure. Expected dict with 'order'.")
+        raise PluginException(
+            message="Internal error occurred.",
+            detailed_message="Invalid JSON structure. Expected dict with 'order' list.",
+        )
+
+    return data
+
+
+def _compile_ordered_column_mapping(data) -> "OrderedDict[str, str] | None":
+    config_data = _compile_mapping_config(data)
+
+    if not config_data.get("enable", False):
+        logger.info("Link record column mapping is globally disabled.")
+        return None
+
+    ordered_fields = sorted(
+        [
+            (entry["order"], entry["link_attribute"], entry["title"])
+            for entry in config_data.get("order", [])
+            if entry.get("enable", False)
+            and not entry["link_attribute"].startswith("_")
+        ],
+        key=lambda x: x[0],
+    )
+
+    if not ordered_fields:
+        logger.info("No valid enabled fields found in the config.")
+        return None
+
+    return OrderedDict((field, title) for _, field, title in ordered_fields)
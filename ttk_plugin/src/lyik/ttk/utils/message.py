@@ -1,10 +1,23 @@
 from lyikpluginmanager import CustomMessage
 from typing import List
 
+from .message_catalogue import find_message_template
+
 
 def get_error_message(
-    error_message_code: str, parameters: List[str] | None = None
+    error_message_code: str,
+    parameters: List[str] | None = None,
+    locale: str | None = None,
 ) -> str:
+    """
+    The text of the message code with its %1, %2, ... parameters filled in, from the
+    message catalogue of the locale (TTK_MESSAGE_LOCALE or 'en' by default).
+    Falls back to CustomMessage when no catalogue has the code.
+    """
+    template = find_message_template(error_message_code, locale)
+    if template is not None:
+        return template.format(parameters)
+
     try:
         error_message = str(
             CustomMessage(message_code=error_message_code, parameters=parameters)
@@ -0,0 +1,137 @@
+import glob
+import logging
+import os
+import re
+from functools import lru_cache
+from typing import Dict, List, Sequence, Tuple
+
+from pydantic import BaseModel, ConfigDict
+
+from .csv_utils import load_csv_rows
+
+logger = logging.getLogger(__name__)
+
+MESSAGES_DIR = "messages"
+MESSAGE_CODES_FILE = "lyik_message_codes.csv"
+MESSAGE_LOCALE_ENV = "TTK_MESSAGE_LOCALE"
+DEFAULT_LOCALE = "en"
+
+# Positional parameters of the message texts: %1, %2, ...
+_PARAMETER = re.compile(r"%(\d+)")
+
+
+class MessageTemplate(BaseModel):
+    """
+    A message text split once into literal parts and parameter positions.
+    """
+
+    model_config = ConfigDict(frozen=True)
+
+    code: str
+    text: str
+    # Literal text, followed by the 0 based parameter index or None at the end
+    parts: Tuple[Tuple[str, int | None], ...] = ()
+
+    @classmethod
+    def parse(cls, code: str, text: str) -> "MessageTemplate":
+        parts: List[Tuple[str, int | None]] = []
+        position = 0
+        for match in _PARAMETER.finditer(text):
+            parts.append((text[position : match.start()], int(match.group(1)) - 1))
+            position = match.end()
+        parts.append((text[position:], None))
+        return cls(code=code, text=text, parts=tuple(parts))
+
+    def format(self, parameters: Sequence[str] | None = None) -> str:
+        """
+        The text with %N replaced by the Nth parameter. Placeholders without a
+        parameter are kept as they are.
+        """
+        if len(self.parts) == 1:
+            return self.text
+        parameters = parameters or ()
+        chunks: List[str] = []
+        for literal, index in self.parts:
+            chunks.append(literal)
+            if index is None:
+                continue
+            if 0 <= index < len(parameters):
+                chunks.append(str(parameters[index]))
+            else:
+                chunks.append(f"%{index + 1}")
+        return "".join(chunks)
+
+
+class MessageCatalogue(BaseModel):
+    """
+    The message templates of one locale, by message code.
+    """
+
+    model_config = ConfigDict(frozen=True)
+
+    locale: str
+    templates: Dict[str, MessageTemplate] = {}
+
+    def get(self, code: str) -> MessageTemplate | None:
+        return self.templates.get(code)
+
+
+def get_message_codes_file_path(locale: str) -> str:
+    mount_path = os.getenv("CRED_FILES_MOUNT_PATH")
+    if not mount_path:
+        raise ValueError("Missing CRED_FILES_MOUNT_PATH")
+    return os.path.join(mount_path, MESSAGES_DIR, locale, MESSAGE_CODES_FILE)
+
+
+def get_available_locales() -> List[str]:
+    mount_path = os.getenv("CRED_FILES_MOUNT_PATH")
+    if not mount_path:
+        return []
+    pattern = os.path.join(mount_path, MESSAGES_DIR, "*", MESSAGE_CODES_FILE)
+    return sorted(
+        os.path.basename(os.path.dirname(file_path)) for file_path in glob.glob(pattern)
+    )
+
+
+@lru_cache(maxsize=16)
+def _compile_catalogue(file_path: str, mtime_ns: int, locale: str) -> MessageCatalogue:
+    templates: Dict[str, MessageTemplate] = {}
+    for line, row in enumerate(load_csv_rows(file_path), start=2):
+        code = (row.get("MESSAGE CODE") or "").strip()
+        if not code:
+            raise ValueError(f"Missing MESSAGE CODE on line {line} of {file_path}")
+        if code in templates:
+            logger.warning("Duplicate message code %s in %s", code, file_path)
+        templates[code] = MessageTemplate.parse(code, row.get("DESCRIPTION") or "")
+    logger.info("Loaded %d message codes for locale %s", len(templates), locale)
+    return MessageCatalogue(locale=locale, templates=templates)
+
+
+def get_message_catalogue(locale: str | None = None) -> MessageCatalogue:
+    """
+    The message catalogue of the locale, TTK_MESSAGE_LOCALE or 'en' by default.
+    Loaded once, and again when the file changes. Raises if the file is missing or a
+    row has no message code.
+    """
+    locale = locale or os.getenv(MESSAGE_LOCALE_ENV, DEFAULT_LOCALE)
+    file_path = get_message_codes_file_path(locale)
+    return _compile_catalogue(file_path, os.stat(file_path).st_mtime_ns, locale)
+
+
+def find_message_template(
+    code: str, locale: str | None = None
+) -> MessageTemplate | None:
+    """
+    The template of the message code in the locale, else in the default locale.
+    None if neither catalogue has it or can be loaded.
+    """
+    locale = locale or os.getenv(MESSAGE_LOCALE_ENV, DEFAULT_LOCALE)
+    for candidate in dict.fromkeys((locale, DEFAULT_LOCALE)):
+        try:
+            template = get_message_catalogue(candidate).get(code)
+        except Exception as e:
+            logger.debug("Message catalogue of %s unavailable: %s", candidate, e)
+            continue
+        if template is not None:
+            return template
+    return None
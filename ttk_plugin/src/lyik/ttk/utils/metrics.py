@@ -0,0 +1,107 @@
+import math
+from abc import ABC, abstractmethod
+from collections import defaultdict
+from typing import Dict, List, Tuple
+
+# (metric name, sorted label pairs)
+MetricKey = Tuple[str, Tuple[Tuple[str, str], ...]]
+
+
+def _key(name: str, labels: Dict[str, str]) -> MetricKey:
+    return name, tuple(sorted(labels.items()))
+
+
+class MetricsSink(ABC):
+    """
+    Destination of the plugin metrics. Set the sink used by the plugin with `set_metrics_sink`.
+    """
+
+    @abstractmethod
+    def observe(self, name: str, value: float, labels: Dict[str, str]) -> None:
+        """
+        Record one observation of the histogram `name`.
+        """
+
+    @abstractmethod
+    def increment(self, name: str, labels: Dict[str, str], amount: int = 1) -> None:
+        """
+        Increase the counter `name`.
+        """
+
+
+class NoOpMetricsSink(MetricsSink):
+    """
+    Default sink, drops everything.
+    """
+
+    def observe(self, name: str, value: float, labels: Dict[str, str]) -> None:
+        pass
+
+    def increment(self, name: str, labels: Dict[str, str], amount: int = 1) -> None:
+        pass
+
+
+class InMemoryMetricsSink(MetricsSink):
+    """
+    Keeps every observation in memory. Meant for tests and benchmarks.
+    """
+
+    def __init__(self):
+        self.histograms: Dict[MetricKey, List[float]] = defaultdict(list)
+        self.counters: Dict[MetricKey, int] = defaultdict(int)
+
+    def observe(self, name: str, value: float, labels: Dict[str, str]) -> None:
+        self.histograms[_key(name, labels)].append(value)
+
+    def increment(self, name: str, labels: Dict[str, str], amount: int = 1) -> None:
+        self.counters[_key(name, labels)] += amount
+
+    def values(self, name: str, **labels: str) -> List[float]:
+        """
+        The observations of the histogram `name` over all the series matching the labels.
+        """
+        return [
+            value
+            for (metric, series), values in self.histograms.items()
+            if metric == name and labels.items() <= dict(series).items()
+            for value in values
+        ]
+
+    def count(self, name: str, **labels: str) -> int:
+        """
+        The total of the counter `name` over all the series matching the labels.
+        """
+        return sum(
+            total
+            for (metric, series), total in self.counters.items()
+            if metric == name and labels.items() <= dict(series).items()
+        )
+
+    def percentile(self, name: str, pct: float, **labels: str) -> float | None:
+        """
+        Nearest-rank percentile (0-100) of the histogram `name`, None if nothing was observed.
+        """
+        values = sorted(self.values(name, **labels))
+        if not values:
+            return None
+        rank = max(math.ceil(pct / 100 * len(values)), 1)
+        return values[rank - 1]
+
+    def clear(self) -> None:
+        self.histograms.clear()
+        self.counters.clear()
+
+
+_sink: MetricsSink = NoOpMetricsSink()
+
+
+def get_metrics_sink() -> MetricsSink:
+    return _sink
+
+
+def set_metrics_sink(sink: MetricsSink | None) -> None:
+    """
+    Replace the metrics sink. None restores the no-op default.
+    """
+    global _sink
+    _sink = sink if sink is not None else NoOpMetricsSink()
@@ -0,0 +1,96 @@
+import hashlib
+import json
+import logging
+from functools import lru_cache
+from typing import Any, Dict, Generic, Type, TypeVar
+
+from pydantic import BaseModel, TypeAdapter
+
+logger = logging.getLogger(__name__)
+
+ModelT = TypeVar("ModelT", bound=BaseModel)
+
+_MISSING = object()
+
+
+@lru_cache(maxsize=None)
+def get_field_adapter(model_cls: Type[BaseModel], name: str) -> TypeAdapter | None:
+    """
+    Returns a cached TypeAdapter for a field of the model, or None when the name
+    is not a declared field (it then lives in the model extras).
+    """
+    field = model_cls.model_fields.get(name)
+    if field is None:
+        return None
+    return TypeAdapter(field.annotation)
+
+
+def _get_raw(record: Any, key: str) -> Any:
+    if isinstance(record, dict):
+        return record.get(key, _MISSING)
+    if isinstance(record, BaseModel):
+        if key in type(record).model_fields:
+            return getattr(record, key)
+        return (record.__pydantic_extra__ or {}).get(key, _MISSING)
+    return _MISSING
+
+
+class RecordSections(Generic[ModelT]):
+    """
+    Sections of a raw form record, read as the fields of `model_cls`.
+
+    Only the sections asked for are validated, each with the TypeAdapter of its field
+    and the first time it is read, so reading one date of the visa request costs the
+    validation of that section instead of the whole record. The values are typed as on
+    `model_cls.model_validate(record)`; a missing section is the field default.
+
+        sections = RecordSections(context.record, UniversalModel)
+        visa_request = sections.visa_request_information.visa_request
+
+    Raises the pydantic ValidationError of the section if it cannot be parsed, and
+    AttributeError for names which are not fields of the model.
+    """
+
+    def __init__(
+        self, record: Dict[str, Any] | BaseModel | None, model_cls: Type[ModelT]
+    ):
+        self._record = record if record is not None else {}
+        self._model_cls = model_cls
+        self._sections: Dict[str, Any] = {}
+
+    def section(self, name: str) -> Any:
+        """
+        The validated section `name`, cached for the lifetime of this object.
+        """
+        if name in self._sections:
+            return self._sections[name]
+        adapter = get_field_adapter(self._model_cls, name)
+        if adapter is None:
+            raise AttributeError(
+                f"'{name}' is not a field of {self._model_cls.__name__}"
+            )
+        field = self._model_cls.model_fields[name]
+        raw = _get_raw(self._record, field.alias or name)
+        if raw is _MISSING:
+            value = field.get_default(call_default_factory=True)
+        else:
+            value = adapter.validate_python(raw)
+        self._sections[name] = value
+        return value
+
+    def __getattr__(self, name: str) -> Any:
+        if name.startswith("_"):
+            raise AttributeError(name)
+        return self.section(name)
+
+
+def record_fingerprint(record: Dict[str, Any] | BaseModel | None) -> str:
+    """
+    Content hash of a raw form record.
+    """
+    if isinstance(record, BaseModel):
+        record = record.model_dump()
+    serialized = json.dumps(
+        record or {}, sort_keys=True, separators=(",", ":"), default=str
+    ).encode()
+    return hashlib.blake2b(serialized, digest_size=16).hexdigest()
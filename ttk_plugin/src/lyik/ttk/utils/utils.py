@@ -1,10 +1,12 @@
 from typing import List, Optional, ClassVar
 from datetime import date
 import jwt
-import country_converter as coco
 from pydantic import BaseModel
 
+from .country_index import USE_COUNTRY_FULL_NAME, country_name
+
 import logging
+
 logger = logging.getLogger(__name__)
 
 
@@ -24,6 +26,7 @@ def get_personas_from_encoded_token(token: str) -> List[str] | None:
     except Exception as e:
         return None
 
+
 def format_date_to_string(d: Optional[date]) -> Optional[str]:
     try:
         return d.strftime("%d-%b-%Y")  # e.g. 02-Aug-1990
@@ -35,26 +38,13 @@ def format_date_to_string(d: Optional[date]) -> Optional[str]:
 # --- Country converter to get full name from ISO3 code ---
 class ISO3ToCountryModel(BaseModel):
     iso3_input: str
-    _cc: coco.CountryConverter = coco.CountryConverter()
 
     # Some Countries full name should be used, for example 'Czechia' should be 'Czech Republic' instead.
-    USE_COUNTRY_FULL_NAME: ClassVar[List[str]] = ["CZE"]
+    USE_COUNTRY_FULL_NAME: ClassVar[List[str]] = sorted(USE_COUNTRY_FULL_NAME)
 
     def country_name(self) -> str:
         """
         Converts ISO3 code (e.g., 'IND') to full country name (e.g., 'India').
         Falls back to original input on failure.
         """
-        iso = (self.iso3_input or "").strip().upper()
-        to_field = "name_official" if iso in self.USE_COUNTRY_FULL_NAME else "name_short"
-        try:
-            result = self._cc.convert(
-                names=iso, to=to_field, not_found=None
-            )
-            if result and isinstance(result, str):
-                return result
-        except Exception as e:
-            logger.warning(
-                f"ISO3 to country name conversion failed for '{self.iso3_input}': {e}"
-            )
-        return self.iso3_input  # Fallback to original
\ No newline at end of file
+        return country_name(self.iso3_input)
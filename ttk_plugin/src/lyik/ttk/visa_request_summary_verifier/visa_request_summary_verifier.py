@@ -20,7 +20,7 @@ from lyik.ttk.utils.verifier_util import (
 )
 from lyik.ttk.utils.message import get_error_message
 from lyik.ttk.utils.form_indicator import get_form_indicator, FormIndicator
-from lyik.ttk.utils.form_utils import FormConfig
+from lyik.ttk.utils.form_utils import get_form_config
 
 from lyik.ttk.models.generated.universal_model_with_appointment import RootAppointment
 
@@ -62,7 +62,7 @@ class VisaRequestVerifier(VerifyHandlerSpec):
 
         form_indicator = get_form_indicator(form_rec=context.record)
 
-        frm_config = FormConfig(form_indicator=form_indicator)
+        frm_config = get_form_config(form_indicator=form_indicator)
 
         has_appointment_section = frm_config.has_appointment_section()
 
@@ -0,0 +1,15 @@
+import os
+
+# Before the plugin is imported: the sample plugin files of the deployment templates,
+# and no config warm-up at import
+os.environ.setdefault(
+    "CRED_FILES_MOUNT_PATH",
+    os.path.join(
+        os.path.dirname(os.path.abspath(__file__)),
+        "..",
+        "..",
+        "deployment_templates",
+        "plugin_files",
+    ),
+)
+os.environ.setdefault("TTK_CONFIG_WARMUP", "false")
@@ -0,0 +1,141 @@
+import asyncio
+
+import pytest
+
+from lyik.ttk.ttk_storage_util.co_traveller_layout import (
+    CoTravellerLayout,
+    get_co_traveller_layouts,
+    migrate_to_per_traveller,
+)
+from lyik.ttk.ttk_storage_util.ttk_storage import TTKStorage
+from lyik.ttk.utils.record_sections import record_fingerprint
+
+mongomock_motor = pytest.importorskip("mongomock_motor")
+
+
+def test_layout_of_each_org(monkeypatch):
+    monkeypatch.setenv("TTK_CO_TRAVELLER_LAYOUT", "dual")
+    monkeypatch.setenv(
+        "TTK_CO_TRAVELLER_LAYOUT_ORGS",
+        " org_a = per_traveller ,org_b=EMBEDDED,org_c=unknown,broken,",
+    )
+
+    layouts = get_co_traveller_layouts()
+
+    assert layouts.for_org("org_a") == CoTravellerLayout.PER_TRAVELLER
+    assert layouts.for_org("org_b") == CoTravellerLayout.EMBEDDED
+    assert layouts.for_org("org_c") == CoTravellerLayout.EMBEDDED
+    assert layouts.for_org("other") == CoTravellerLayout.DUAL
+    assert "broken" not in layouts.orgs
+
+
+def test_default_layout_is_embedded(monkeypatch):
+    monkeypatch.delenv("TTK_CO_TRAVELLER_LAYOUT", raising=False)
+    monkeypatch.delenv("TTK_CO_TRAVELLER_LAYOUT_ORGS", raising=False)
+
+    assert get_co_traveller_layouts().for_org("org") == CoTravellerLayout.EMBEDDED
+
+
+@pytest.fixture
+def storage(monkeypatch):
+    monkeypatch.setattr(TTKStorage, "_instance", None)
+    monkeypatch.setenv(
+        "TTK_CO_TRAVELLER_LAYOUT_ORGS", "dual_org=dual,new_org=per_traveller"
+    )
+    storage = TTKStorage("mongodb://localhost:27017")
+    storage._client = mongomock_motor.AsyncMongoMockClient()
+    return storage
+
+
+def save(storage, org_id, traveller_id, data):
+    return storage.save_or_update_co_traveller(
+        org_id, "order", traveller_id, data, "co_travellers"
+    )
+
+
+async def per_traveller_data(db):
+    return {
+        document["traveller_id"]: document["data"]
+        async for document in db["co_travellers_per_traveller"].find({})
+    }
+
+
+def test_dual_layout_writes_both_and_reads_embedded(storage):
+    async def run():
+        await save(storage, "dual_org", "t1", {"name": "Ann"})
+        await save(storage, "dual_org", "t1", {"name": "Bo"})
+        db = storage.get_db("dual_org")
+        order = await db["co_travellers"].find_one({"_id": "order"})
+        assert order["travellers"] == {"t1": {"name": "Bo"}}
+        assert await per_traveller_data(db) == {"t1": {"name": "Bo"}}
+
+        # Only in the embedded layout, as saved by a process on the EMBEDDED layout
+        await db["co_travellers"].update_one(
+            {"_id": "order"}, {"$set": {"travellers.t2": {"name": "Cy"}}}
+        )
+        travellers = await storage.get_all_co_travellers(
+            "dual_org", "order", "co_travellers"
+        )
+        assert travellers == {"t1": {"name": "Bo"}, "t2": {"name": "Cy"}}
+
+    asyncio.run(run())
+
+
+def test_per_traveller_layout_does_not_write_embedded(storage):
+    async def run():
+        await save(storage, "new_org", "t1", {"name": "Ann"})
+        db = storage.get_db("new_org")
+        assert await db["co_travellers"].find_one({"_id": "order"}) is None
+        assert await storage.get_all_co_travellers(
+            "new_org", "order", "co_travellers"
+        ) == {"t1": {"name": "Ann"}}
+
+    asyncio.run(run())
+
+
+def test_migration_copies_missing_and_updates_stale_travellers():
+    async def run():
+        db = mongomock_motor.AsyncMongoMockClient()["org"]
+        await db["co_travellers"].insert_one(
+            {
+                "_id": "order",
+                "travellers": {
+                    "new": {"name": "Ann"},
+                    "stale": {"name": "Bo"},
+                    "same": {"name": "Cy"},
+                },
+                # Not kept by the processes on the EMBEDDED layout
+                "traveller_hashes": {"stale": record_fingerprint({"name": "Old"})},
+            }
+        )
+        await db["co_travellers_per_traveller"].insert_many(
+            [
+                {
+                    "order_id": "order",
+                    "traveller_id": "stale",
+                    "data": {"name": "Old"},
+                    "data_hash": record_fingerprint({"name": "Old"}),
+                },
+                {
+                    "order_id": "order",
+                    "traveller_id": "same",
+                    "data": {"name": "Cy"},
+                    "data_hash": record_fingerprint({"name": "Cy"}),
+                },
+            ]
+        )
+
+        report = await migrate_to_per_traveller(db, "co_travellers", batch_size=2)
+
+        assert (report.orders, report.travellers) == (1, 3)
+        assert (report.copied, report.updated, report.unchanged) == (1, 1, 1)
+        assert await per_traveller_data(db) == {
+            "new": {"name": "Ann"},
+            "stale": {"name": "Bo"},
+            "same": {"name": "Cy"},
+        }
+
+        again = await migrate_to_per_traveller(db, "co_travellers")
+        assert (again.copied, again.updated, again.unchanged) == (0, 0, 3)
+
+    asyncio.run(run())
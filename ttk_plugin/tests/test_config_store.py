@@ -0,0 +1,56 @@
+import json
+import os
+
+import pytest
+
+from lyik.ttk.utils.config_store import ConfigStore
+
+
+def write(path, content, mtime_ns):
+    path.write_text(content, encoding="utf-8")
+    os.utime(path, ns=(mtime_ns, mtime_ns))
+
+
+def test_config_store_parses_again_only_when_the_file_changes(tmp_path):
+    file_path = tmp_path / "mapping.json"
+    write(file_path, json.dumps({"b": 2, "a": 1}), 1_000_000_000)
+    compiled = []
+
+    def compile(data):
+        compiled.append(data)
+        return sorted(data)
+
+    store = ConfigStore()
+    assert store.get(str(file_path), compile) == ["a", "b"]
+    assert store.get(str(file_path), compile) is store.get(str(file_path), compile)
+    assert len(compiled) == 1
+    # Kept per compile function
+    assert store.get(str(file_path)) == {"b": 2, "a": 1}
+
+    write(file_path, json.dumps({"c": 3}), 2_000_000_000)
+    assert store.get(str(file_path), compile) == ["c"]
+    assert len(compiled) == 2
+
+    store.clear()
+    store.get(str(file_path), compile)
+    assert len(compiled) == 3
+
+
+def test_config_store_does_not_cache_errors(tmp_path):
+    file_path = tmp_path / "broken.json"
+    write(file_path, "{broken", 1_000_000_000)
+    store = ConfigStore()
+
+    with pytest.raises(json.JSONDecodeError):
+        store.get(str(file_path))
+    write(file_path, "{}", 2_000_000_000)
+    assert store.get(str(file_path)) == {}
+
+
+def test_config_store_resolves_relative_paths_from_the_mount_path(
+    tmp_path, monkeypatch
+):
+    write(tmp_path / "add_ons.json", "[]", 1_000_000_000)
+    monkeypatch.setenv("CRED_FILES_MOUNT_PATH", str(tmp_path))
+
+    assert ConfigStore().get("add_ons.json") == []
@@ -0,0 +1,41 @@
+import pytest
+
+from lyik.ttk.utils import message_catalogue
+from lyik.ttk.utils.config_warmup import ConfigWarmupError, warm_up_plugin_config
+
+MESSAGE_CODES = "MESSAGE CODE,DESCRIPTION\n{rows}\n"
+
+
+def write_messages(mount_path, locale, rows):
+    directory = mount_path / "messages" / locale
+    directory.mkdir(parents=True)
+    (directory / "lyik_message_codes.csv").write_text(
+        MESSAGE_CODES.format(rows=rows), encoding="utf-8"
+    )
+
+
+def test_warm_up_compiles_the_message_catalogues(tmp_path, monkeypatch):
+    monkeypatch.setenv("CRED_FILES_MOUNT_PATH", str(tmp_path))
+    write_messages(tmp_path, "en", "LYIK_OK,%1 of %2 done")
+    message_catalogue._compile_catalogue.cache_clear()
+
+    reports = warm_up_plugin_config()
+
+    assert [report.error for report in reports] == [None]
+    assert message_catalogue._compile_catalogue.cache_info().currsize == 1
+    catalogue = message_catalogue.get_message_catalogue("en")
+    assert message_catalogue._compile_catalogue.cache_info().hits == 1
+    assert catalogue.get("LYIK_OK").format(["1", "2"]) == "1 of 2 done"
+
+
+def test_warm_up_reports_a_row_without_a_message_code(tmp_path, monkeypatch):
+    monkeypatch.setenv("CRED_FILES_MOUNT_PATH", str(tmp_path))
+    write_messages(tmp_path, "en", "LYIK_OK,fine")
+    write_messages(tmp_path, "fr", ",sans code")
+
+    reports = warm_up_plugin_config()
+
+    assert [report.error is None for report in reports] == [True, False]
+    assert "Missing MESSAGE CODE on line 2" in reports[1].error
+    with pytest.raises(ConfigWarmupError):
+        warm_up_plugin_config(fail_fast=True)
@@ -0,0 +1,87 @@
+import pytest
+
+from lyik.ttk.utils import country_index_data
+from lyik.ttk.utils.country_index import country_name, find_country, to_iso3
+
+coco = pytest.importorskip("country_converter")
+
+COMMON_NAMES = [
+    "UK",
+    "Great Britain",
+    "England",
+    "U.S.A.",
+    "United States of America",
+    "Korea",
+    "South Korea",
+    "The Netherlands",
+    "Holland",
+    "Ivory Coast",
+    "Côte d'Ivoire",
+    "Macedonia",
+    "North Macedonia",
+    "Burma",
+    "Cape Verde",
+    "East Timor",
+    "The Gambia",
+    "Russia",
+    "Vietnam",
+    "Czechia",
+    "Iran",
+    "Laos",
+    "Türkiye",
+    "Swaziland",
+    "Kosovo",
+    "Holy See",
+    "UAE",
+    "DR Congo",
+    "Bosnia",
+    "St Lucia",
+]
+
+
+@pytest.fixture(scope="module")
+def converter():
+    return coco.CountryConverter()
+
+
+def coco_iso3(converter, value):
+    result = converter.convert(names=value, to="ISO3", not_found=None)
+    return result if isinstance(result, str) and len(result) == 3 else value
+
+
+def test_generated_table_is_up_to_date():
+    from generate_country_index import build
+
+    countries, aliases, patterns = build()
+
+    assert tuple(countries) == country_index_data.COUNTRIES
+    assert aliases == country_index_data.ALIASES
+    assert tuple(patterns) == country_index_data.NAME_PATTERNS
+
+
+def test_to_iso3_agrees_with_country_converter(converter):
+    values = set(COMMON_NAMES)
+    for column in ("ISO2", "ISO3", "name_short", "name_official"):
+        values.update(str(value) for value in converter.data[column])
+    values.update([value.lower() for value in values])
+
+    differences = {
+        value: (coco_iso3(converter, value), to_iso3(value))
+        for value in sorted(values)
+        if to_iso3(value) != coco_iso3(converter, value)
+    }
+
+    assert differences == {}
+
+
+def test_country_name_agrees_with_country_converter(converter):
+    for iso3 in converter.data["ISO3"]:
+        field = "name_official" if iso3 == "CZE" else "name_short"
+        assert country_name(iso3) == converter.convert(names=iso3, to=field)
+
+
+def test_unknown_values_fall_back_to_the_input():
+    assert to_iso3("Atlantis") == "Atlantis"
+    assert country_name("XYZ") == "XYZ"
+    assert find_country("") is None
+    assert find_country(None) is None
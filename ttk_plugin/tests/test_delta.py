@@ -0,0 +1,54 @@
+from lyik.ttk.ttk_storage_util.delta import compute_delta, get_path
+
+
+def test_unchanged_value_has_no_delta():
+    value = {"a": {"b": 1, "c": [1, 2]}}
+
+    assert compute_delta(value, {"a": {"b": 1, "c": [1, 2]}}, "data").is_empty
+
+
+def test_changed_fields_are_set_and_removed_ones_unset():
+    delta = compute_delta(
+        {"a": {"b": 1, "c": 2}, "d": "x"},
+        {"a": {"b": 5, "c": 2}, "e": {"f": None}},
+        "data",
+    )
+
+    assert delta.set_fields == {"data.a.b": 5, "data.e": {"f": None}}
+    assert delta.unset_fields == ["data.d"]
+    assert delta.to_update(extra_set={"data_hash": "h"}) == {
+        "$set": {"data.a.b": 5, "data.e": {"f": None}, "data_hash": "h"},
+        "$unset": {"data.d": ""},
+    }
+
+
+def test_lists_and_type_changes_are_set_whole():
+    delta = compute_delta(
+        {"a": [1, 2], "b": 1, "c": {"x": 1}},
+        {"a": [1, 3], "b": 1.0, "c": "text"},
+        "travellers.t1",
+    )
+
+    assert delta.set_fields == {
+        "travellers.t1.a": [1, 3],
+        "travellers.t1.b": 1.0,
+        "travellers.t1.c": "text",
+    }
+    assert delta.unset_fields == []
+
+
+def test_keys_which_cannot_be_paths_set_the_object_whole():
+    delta = compute_delta({"a": {"k.x": 1}}, {"a": {"k.x": 2}}, "data")
+    assert delta.set_fields == {"data.a": {"k.x": 2}}
+
+    delta = compute_delta({"a": {"$k": 1}}, {"a": {"$k": 2}}, "data")
+    assert delta.set_fields == {"data.a": {"$k": 2}}
+
+
+def test_get_path():
+    document = {"data": {"a": {"b": 1}}, "list": [1]}
+
+    assert get_path(document, "data.a.b") == 1
+    assert get_path(document, "data.a.missing") is None
+    assert get_path(document, "list.0") is None
+    assert get_path(None, "data") is None
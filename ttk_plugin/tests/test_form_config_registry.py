@@ -0,0 +1,54 @@
+import os
+
+from lyik.ttk.utils.form_indicator import FormIndicator
+from lyik.ttk.utils.form_utils import FormConfigRegistry
+
+
+def write(path, content, mtime_ns):
+    path.write_text(content, encoding="utf-8")
+    os.utime(path, ns=(mtime_ns, mtime_ns))
+
+
+FORM_CONFIG = "relevant_infopanes,business_panes\n{panes}\n"
+
+
+def test_form_config_registry_rebuilds_only_on_content_change(tmp_path, monkeypatch):
+    monkeypatch.setenv("CRED_FILES_MOUNT_PATH", str(tmp_path))
+    (tmp_path / "form_config").mkdir()
+    file_path = tmp_path / "form_config" / "GBR.csv"
+    write(file_path, FORM_CONFIG.format(panes="passport,"), 1_000_000_000)
+    registry = FormConfigRegistry()
+
+    config = registry.get(FormIndicator.GBR_UNITED_KINGDOM)
+    assert config.get_relevant_infopane_list() == ("passport",)
+    assert registry.get(FormIndicator.GBR_UNITED_KINGDOM) is config
+
+    # Touched but not changed
+    write(file_path, FORM_CONFIG.format(panes="passport,"), 2_000_000_000)
+    assert registry.get(FormIndicator.GBR_UNITED_KINGDOM) is config
+
+    write(file_path, FORM_CONFIG.format(panes="photograph,"), 3_000_000_000)
+    changed = registry.get(FormIndicator.GBR_UNITED_KINGDOM)
+    assert changed is not config
+    assert changed.version != config.version
+    assert changed.get_relevant_infopane_list() == ("photograph",)
+
+
+def test_form_config_registry_follows_the_mount_path(tmp_path, monkeypatch):
+    for name, pane in (("one", "passport"), ("two", "photograph")):
+        (tmp_path / name / "form_config").mkdir(parents=True)
+        write(
+            tmp_path / name / "form_config" / "GBR.csv",
+            FORM_CONFIG.format(panes=f"{pane},"),
+            1_000_000_000,
+        )
+    registry = FormConfigRegistry()
+
+    monkeypatch.setenv("CRED_FILES_MOUNT_PATH", str(tmp_path / "one"))
+    assert registry.get(
+        FormIndicator.GBR_UNITED_KINGDOM
+    ).get_relevant_infopane_list() == ("passport",)
+    monkeypatch.setenv("CRED_FILES_MOUNT_PATH", str(tmp_path / "two"))
+    assert registry.get(
+        FormIndicator.GBR_UNITED_KINGDOM
+    ).get_relevant_infopane_list() == ("photograph",)
@@ -0,0 +1,56 @@
+import glob
+import os
+import re
+
+import pytest
+
+from lyik.ttk.utils.message import get_error_message
+from lyik.ttk.utils.message_catalogue import (
+    MessageTemplate,
+    get_available_locales,
+    get_message_catalogue,
+)
+
+PACKAGE_DIR = os.path.join(
+    os.path.dirname(os.path.abspath(__file__)), "..", "src", "lyik", "ttk"
+)
+# Literal codes passed to get_error_message in the plugin sources
+USED_CODE = re.compile(r"error_message_code\s*=\s*[\"']([A-Za-z0-9_]+)[\"']")
+
+
+def find_used_message_codes():
+    codes = set()
+    for file_path in glob.glob(os.path.join(PACKAGE_DIR, "**", "*.py"), recursive=True):
+        if os.sep + "models" + os.sep in file_path:
+            continue
+        with open(file_path, encoding="utf-8") as f:
+            codes.update(USED_CODE.findall(f.read()))
+    return sorted(codes)
+
+
+def test_plugin_sources_use_message_codes():
+    assert find_used_message_codes()
+
+
+@pytest.mark.parametrize("locale", get_available_locales())
+def test_catalogue_has_every_message_code_used_by_the_plugin(locale):
+    catalogue = get_message_catalogue(locale)
+
+    missing = [
+        code for code in find_used_message_codes() if catalogue.get(code) is None
+    ]
+
+    assert missing == []
+
+
+def test_template_fills_positional_parameters():
+    template = MessageTemplate.parse("CODE", "%1 of %2 done, %3 left")
+
+    assert template.format(["3", "5"]) == "3 of 5 done, %3 left"
+    assert MessageTemplate.parse("CODE", "plain").format(["x"]) == "plain"
+
+
+def test_unknown_code_falls_back_at_runtime():
+    message = get_error_message(error_message_code="NOT_A_MESSAGE_CODE")
+
+    assert isinstance(message, str) and message
@@ -0,0 +1,248 @@
+import asyncio
+from typing import List
+
+import pytest
+from lyikpluginmanager import GenericFormRecordModel
+
+from lyik.ttk.preaction_unified import central_preaction
+from lyik.ttk.preaction_unified._base_preaction import BaseUnifiedPreActionProcessor
+from lyik.ttk.preaction_unified._pipeline_plan import PipelinePlan, PipelineStep
+from lyik.ttk.preaction_unified._record_context import PreActionRecordContext
+from lyik.ttk.preaction_unified._record_patch import RecordPatch
+from lyik.ttk.utils.metrics import InMemoryMetricsSink, set_metrics_sink
+
+
+class Processor(BaseUnifiedPreActionProcessor):
+    """
+    Writes `value` to its first write path after `delay` seconds, logging start and end.
+    """
+
+    delay = 0.0
+    value = None
+    events: List[str] = []
+
+    async def unified_pre_action_processor_impl(self, record_context, **kwargs):
+        name = type(self).__name__
+        self.events.append(f"start {name}")
+        await asyncio.sleep(self.delay)
+        self.events.append(f"end {name}")
+        if self.value is None:
+            return None
+        return [RecordPatch(path=self.writes[0], value=self.value)]
+
+
+class WritesA(Processor):
+    reads = ("a",)
+    writes = ("a.value",)
+    delay = 0.02
+    value = "A"
+
+
+class WritesB(Processor):
+    reads = ("b",)
+    writes = ("b.value",)
+    value = "B"
+
+
+class ReadsA(Processor):
+    reads = ("a.value",)
+    writes = ("c.value",)
+    value = "C"
+
+
+class Undeclared(Processor):
+    pass
+
+
+def make_plan(*processor_classes, timeout_seconds=None, step_timeouts=None):
+    dependencies = central_preaction._get_dependencies(list(processor_classes))
+    step_timeouts = step_timeouts or {}
+    return PipelinePlan(
+        timeout_seconds=timeout_seconds,
+        steps=tuple(
+            PipelineStep(
+                processor=processor_cls(),
+                dependencies=frozenset(dependencies[index]),
+                timeout_seconds=step_timeouts.get(processor_cls),
+            )
+            for index, processor_cls in enumerate(processor_classes)
+        ),
+    )
+
+
+def run_plan(plan, record=None, action="save"):
+    Processor.events = []
+    record_context = PreActionRecordContext(
+        GenericFormRecordModel.model_validate(record or {})
+    )
+    asyncio.run(
+        central_preaction._run_plan(
+            plan, record_context, action=action, form_indicator=None
+        )
+    )
+    return record_context
+
+
+def test_dependencies_follow_declared_paths():
+    assert central_preaction._get_dependencies(
+        [WritesA, WritesB, ReadsA, Undeclared]
+    ) == [set(), set(), {0}, {0, 1, 2}]
+
+
+def test_independent_processors_run_concurrently():
+    run_plan(make_plan(WritesA, WritesB))
+
+    assert Processor.events == [
+        "start WritesA",
+        "start WritesB",
+        "end WritesB",
+        "end WritesA",
+    ]
+
+
+def test_dependent_processor_sees_the_changes_of_the_earlier_one():
+    record_context = run_plan(make_plan(WritesA, WritesB, ReadsA))
+
+    assert Processor.events.index("end WritesA") < Processor.events.index(
+        "start ReadsA"
+    )
+    assert [source for source, _ in record_context.changes] == [
+        "WritesB",
+        "WritesA",
+        "ReadsA",
+    ]
+    record = record_context.to_payload().model_dump()
+    assert record["a"]["value"] == "A"
+    assert record["c"]["value"] == "C"
+
+
+class SlowOptional(Processor):
+    reads = ("a",)
+    writes = ("a.value",)
+    delay = 1.0
+    value = "late"
+    critical = False
+
+
+def test_non_critical_overrun_is_dropped_and_dependents_go_on():
+    record_context = run_plan(
+        make_plan(SlowOptional, ReadsA, step_timeouts={SlowOptional: 0.01})
+    )
+
+    assert "end SlowOptional" not in Processor.events
+    record = record_context.to_payload().model_dump()
+    assert "a" not in record
+    assert record["c"]["value"] == "C"
+
+
+class RaisesTimeout(Processor):
+    async def unified_pre_action_processor_impl(self, record_context, **kwargs):
+        raise asyncio.TimeoutError()
+
+
+def test_timeout_raised_by_a_critical_processor_is_an_error():
+    with pytest.raises(asyncio.TimeoutError):
+        run_plan(make_plan(RaisesTimeout, timeout_seconds=5.0))
+
+
+class Fails(Processor):
+    reads = ("b",)
+    writes = ("b.value",)
+
+    async def unified_pre_action_processor_impl(self, record_context, **kwargs):
+        raise ValueError("failed")
+
+
+def test_failure_cancels_the_remaining_processors():
+    with pytest.raises(ValueError, match="failed"):
+        run_plan(make_plan(WritesA, Fails))
+
+    assert "end WritesA" not in Processor.events
+
+
+class Skippable(Processor):
+    reads = ("a",)
+    writes = ("c.value",)
+    value = "C"
+    skip_if_unchanged = True
+
+
+def test_skip_if_unchanged_on_save_of_a_fingerprinted_record():
+    record_context = run_plan(make_plan(Skippable), record={"a": {"x": 1}})
+    saved = record_context.to_payload().model_dump()
+
+    run_plan(make_plan(Skippable), record=saved)
+    assert Processor.events == []
+
+    run_plan(make_plan(Skippable), record=saved, action="submit")
+    assert Processor.events == ["start Skippable", "end Skippable"]
+
+    saved["a"]["x"] = 2
+    run_plan(make_plan(Skippable), record=saved)
+    assert Processor.events == ["start Skippable", "end Skippable"]
+
+
+class Unchanged(Processor):
+    reads = ("d",)
+    writes = ("d.value",)
+
+
+class Overruns(Processor):
+    reads = ("e",)
+    writes = ("e.value",)
+    delay = 1.0
+    value = "late"
+    critical = False
+
+
+@pytest.fixture
+def metrics():
+    sink = InMemoryMetricsSink()
+    set_metrics_sink(sink)
+    yield sink
+    set_metrics_sink(None)
+
+
+def test_processor_outcomes_and_latencies_are_reported(metrics):
+    saved = run_plan(make_plan(Skippable), record={"a": {"x": 1}}).to_payload()
+    metrics.clear()
+
+    run_plan(
+        make_plan(
+            Skippable, WritesB, Unchanged, Overruns, step_timeouts={Overruns: 0.01}
+        ),
+        record=saved.model_dump(),
+    )
+    with pytest.raises(ValueError):
+        run_plan(make_plan(Fails))
+
+    outcomes = {
+        "Skippable": "skipped",
+        "WritesB": "modified",
+        "Unchanged": "unchanged",
+        "Overruns": "timeout",
+        "Fails": "error",
+    }
+    for processor, outcome in outcomes.items():
+        assert metrics.count("preaction_processor_total", processor=processor) == 1
+        assert (
+            metrics.count(
+                "preaction_processor_total",
+                processor=processor,
+                outcome=outcome,
+                action="save",
+            )
+            == 1
+        )
+    latencies = metrics.values("preaction_processor_latency_seconds")
+    assert len(latencies) == 4
+    assert not metrics.values(
+        "preaction_processor_latency_seconds", processor="Skippable"
+    )
+    assert (
+        metrics.values("preaction_processor_latency_seconds", processor="Overruns")[0]
+        < 0.5
+    )
+    # Known once the skip check has fingerprinted the sections
+    assert all(size > 0 for size in metrics.values("preaction_processor_payload_bytes"))
+    assert len(metrics.values("preaction_processor_payload_bytes")) == 3
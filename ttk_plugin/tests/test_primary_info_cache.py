@@ -0,0 +1,59 @@
+import pytest
+
+from lyik.ttk.ttk_storage_util import primary_info_cache
+from lyik.ttk.ttk_storage_util.primary_info_cache import TTLCache
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr(primary_info_cache.time, "monotonic", lambda: now[0])
+    return now
+
+
+def test_hit_miss_and_expiry(clock):
+    cache = TTLCache(ttl_seconds=10, maxsize=4)
+    assert cache.get("a") is None
+    cache.put("a", 1)
+    assert cache.get("a") == 1
+
+    clock[0] += 10
+    assert cache.get("a") is None
+
+    stats = cache.stats()
+    assert (stats.hits, stats.misses, stats.expired, stats.size) == (1, 2, 1, 0)
+
+
+def test_least_recently_used_entry_is_evicted(clock):
+    cache = TTLCache(ttl_seconds=10, maxsize=2)
+    cache.put("a", 1)
+    cache.put("b", 2)
+    cache.get("a")
+    cache.put("c", 3)
+
+    assert cache.get("b") is None
+    assert cache.get("a") == 1
+    assert cache.get("c") == 3
+
+
+def test_invalidation(clock):
+    cache = TTLCache(ttl_seconds=10, maxsize=8)
+    for key in [("org", "o1", None), ("org", "o1", ("data",)), ("org", "o2", None)]:
+        cache.put(key, key)
+
+    cache.invalidate(("org", "o2", None))
+    cache.invalidate_where(lambda key: key[:2] == ("org", "o1"))
+
+    assert cache.stats().size == 0
+    cache.put("a", 1)
+    cache.clear()
+    assert cache.get("a") is None
+
+
+def test_zero_ttl_disables_the_cache(clock):
+    cache = TTLCache(ttl_seconds=0, maxsize=8)
+    cache.put("a", 1)
+
+    assert not cache.enabled
+    assert cache.get("a") is None
+    assert cache.stats().misses == 0
@@ -0,0 +1,150 @@
+from typing import Optional
+
+from lyikpluginmanager import GenericFormRecordModel
+from pydantic import BaseModel, ConfigDict
+
+from lyik.ttk.preaction_unified._record_context import PreActionRecordContext
+from lyik.ttk.preaction_unified._record_patch import (
+    RecordPatch,
+    any_paths_overlap,
+    paths_overlap,
+)
+from lyik.ttk.preaction_unified._section_fingerprint import FINGERPRINT_KEY
+
+
+class PassportDetails(BaseModel):
+    first_name: Optional[str] = None
+    surname: Optional[str] = None
+
+
+class Passport(BaseModel):
+    passport_details: Optional[PassportDetails] = None
+
+
+class Record(BaseModel):
+    model_config = ConfigDict(extra="allow")
+
+    passport: Optional[Passport] = None
+
+
+def make_payload(**sections) -> GenericFormRecordModel:
+    return GenericFormRecordModel.model_validate(
+        {
+            "passport": {"passport_details": {"first_name": "Ann", "surname": "Lee"}},
+            "scratch_pad": {"form_title": "old"},
+            **sections,
+        }
+    )
+
+
+def test_views_are_parsed_once_and_shared():
+    context = PreActionRecordContext(make_payload())
+
+    view = context.view(Record)
+
+    assert context.view(Record) is view
+    assert view.passport.passport_details.first_name == "Ann"
+    assert context.record["scratch_pad"] == {"form_title": "old"}
+
+
+def test_staged_changes_are_seen_by_views_and_merged_in_order():
+    payload = make_payload()
+    context = PreActionRecordContext(payload)
+    view = context.view(Record)
+
+    context.stage(
+        "first",
+        [RecordPatch(path="passport.passport_details.first_name", value="Bo")],
+    )
+    context.stage("second", [RecordPatch(path="scratch_pad.form_title", value="A")])
+    context.stage("third", [RecordPatch(path="scratch_pad.form_title", value="B")])
+
+    assert view.passport.passport_details.first_name == "Bo"
+    assert [source for source, _ in context.changes] == ["first", "second", "third"]
+    assert context.is_modified(["passport.passport_details"])
+    assert not context.is_modified(["lets_get_started"])
+
+    record = context.to_payload().model_dump()
+    assert record["passport"]["passport_details"]["first_name"] == "Bo"
+    assert record["scratch_pad"]["form_title"] == "B"
+    assert context.changes == []
+
+
+def test_view_built_after_staging_replays_the_journal():
+    context = PreActionRecordContext(make_payload())
+    context.stage(
+        "p", [RecordPatch(path="passport.passport_details.surname", value="Kim")]
+    )
+
+    assert context.view(Record).passport.passport_details.surname == "Kim"
+
+
+def test_paths_overlap():
+    assert paths_overlap("passport", "passport.passport_details.first_name")
+    assert paths_overlap("*._ver_status", "passport._ver_status")
+    assert not paths_overlap("passport.a", "passport.b")
+    assert not any_paths_overlap(["scratch_pad"], ["passport", "lets_get_started"])
+
+
+def test_sections_without_fingerprints_count_as_changed():
+    context = PreActionRecordContext(make_payload())
+
+    assert not context.sections_unchanged(["passport"], allow_missing=False)
+    assert context.size > 0
+
+
+def test_saved_fingerprints_match_until_the_section_changes():
+    context = PreActionRecordContext(make_payload())
+    context.sections_unchanged(["*"], allow_missing=False)
+    saved = context.to_payload().model_dump()
+    assert FINGERPRINT_KEY in saved["passport"]
+
+    context = PreActionRecordContext(GenericFormRecordModel.model_validate(saved))
+    assert context.sections_unchanged(["*"], allow_missing=False)
+    # Sections are not removed from a saved record, so a missing one is unchanged
+    assert context.sections_unchanged(["visa_request_information"], allow_missing=True)
+    assert not context.sections_unchanged(
+        ["visa_request_information"], allow_missing=False
+    )
+
+    saved["passport"]["passport_details"]["first_name"] = "Bo"
+    context = PreActionRecordContext(GenericFormRecordModel.model_validate(saved))
+    assert not context.sections_unchanged(["passport"], allow_missing=False)
+    assert context.sections_unchanged(["scratch_pad"], allow_missing=False)
+
+
+def test_unverified_fingerprints_are_dropped():
+    context = PreActionRecordContext(make_payload())
+    context.sections_unchanged(["*"], allow_missing=False)
+    saved = context.to_payload().model_dump()
+
+    # Nothing asks whether the sections changed, e.g. on submit
+    context = PreActionRecordContext(GenericFormRecordModel.model_validate(saved))
+    submitted = context.to_payload().model_dump()
+
+    assert context.size is None
+    assert FINGERPRINT_KEY not in submitted["passport"]
+    assert FINGERPRINT_KEY not in submitted["scratch_pad"]
+
+
+def test_incoming_payload_is_not_modified():
+    payload = make_payload()
+    context = PreActionRecordContext(payload)
+    context.stage(
+        "p",
+        [
+            RecordPatch(path="passport.passport_details.first_name", value="Bo"),
+            RecordPatch(op="remove", path="scratch_pad.form_title"),
+            RecordPatch(path="lets_get_started.pct_completion", value="50%"),
+        ],
+    )
+
+    record = context.to_payload().model_dump()
+
+    assert record["passport"]["passport_details"]["first_name"] == "Bo"
+    assert "form_title" not in record["scratch_pad"]
+    assert record["lets_get_started"]["pct_completion"] == "50%"
+    original = payload.model_dump()
+    assert original["passport"]["passport_details"]["first_name"] == "Ann"
+    assert original["scratch_pad"] == {"form_title": "old"}
+    assert "lets_get_started" not in original
@@ -0,0 +1,93 @@
+from datetime import date
+from typing import List, Optional
+
+import pytest
+from lyikpluginmanager import GenericFormRecordModel
+from pydantic import BaseModel, Field, ValidationError, field_validator
+
+from lyik.ttk.utils.record_sections import RecordSections, record_fingerprint
+
+VALIDATED = []
+
+
+class Passport(BaseModel):
+    first_name: str
+    expiry: date
+
+    @field_validator("first_name")
+    @classmethod
+    def log(cls, value):
+        VALIDATED.append(value)
+        return value
+
+
+class VisaRequest(BaseModel):
+    arrival: date
+
+
+class Record(BaseModel):
+    passport: Optional[Passport] = None
+    visa_request: Optional[VisaRequest] = Field(default=None, alias="visa-request")
+    addons: List[str] = Field(default_factory=list)
+    title: str = "untitled"
+
+
+RECORD = {
+    "passport": {"first_name": "Ann", "expiry": "2030-01-31"},
+    "visa-request": {"arrival": "not a date"},
+    "notes": "x",
+}
+
+
+def test_sections_are_validated_on_first_read_only():
+    VALIDATED.clear()
+    sections = RecordSections(RECORD, Record)
+    assert VALIDATED == []
+
+    passport = sections.passport
+    assert passport.expiry == date(2030, 1, 31)
+    assert sections.section("passport") is passport
+    assert VALIDATED == ["Ann"]
+    # The broken section only fails once it is read
+    with pytest.raises(ValidationError):
+        sections.visa_request
+
+
+def test_sections_of_a_model_record():
+    record = GenericFormRecordModel(**RECORD)
+
+    assert RecordSections(record, Record).passport.first_name == "Ann"
+
+
+def test_section_is_read_under_its_alias():
+    sections = RecordSections({"visa-request": {"arrival": "2030-02-01"}}, Record)
+
+    assert sections.visa_request == VisaRequest(arrival=date(2030, 2, 1))
+    assert (
+        RecordSections({"visa_request": {"arrival": "x"}}, Record).visa_request is None
+    )
+
+
+def test_missing_sections_are_the_field_defaults():
+    sections = RecordSections(None, Record)
+
+    assert sections.passport is None
+    assert sections.title == "untitled"
+    assert sections.addons == []
+    assert RecordSections({}, Record).addons is not sections.addons
+
+
+@pytest.mark.parametrize("name", ["notes", "unknown", "_record_cache"])
+def test_names_which_are_not_fields_raise_attribute_error(name):
+    sections = RecordSections(RECORD, Record)
+
+    with pytest.raises(AttributeError):
+        getattr(sections, name)
+    assert not hasattr(sections, name)
+
+
+def test_fingerprint_ignores_key_order():
+    assert record_fingerprint({"a": 1, "b": {"c": 2}}) == record_fingerprint(
+        {"b": {"c": 2}, "a": 1}
+    )
+    assert record_fingerprint({"a": 1}) != record_fingerprint({"a": 2})
@@ -0,0 +1,261 @@
+import asyncio
+import copy
+from types import SimpleNamespace
+
+import pytest
+
+from lyik.ttk.ttk_storage_util.delta import get_path
+from lyik.ttk.ttk_storage_util.ttk_storage import TTKStorage, normalize_projection
+
+
+def _set_path(document, path, value):
+    *parents, leaf = path.split(".")
+    for key in parents:
+        document = document.setdefault(key, {})
+    document[leaf] = value
+
+
+def _unset_path(document, path):
+    *parents, leaf = path.split(".")
+    for key in parents:
+        document = document.get(key, {})
+    document.pop(leaf, None)
+
+
+def _matches(document, document_filter):
+    return document is not None and all(
+        get_path(document, key) == value for key, value in document_filter.items()
+    )
+
+
+class FakeCollection:
+    """
+    The part of a Motor collection TTKStorage writes documents with, keyed by `_id`.
+    Logs the operations and the fields they read.
+    """
+
+    def __init__(self):
+        self.documents = {}
+        self.operations = []
+
+    async def find_one(self, document_filter, projection=None):
+        self.operations.append(("find_one", sorted(projection or {})))
+        document = self.documents.get(document_filter["_id"])
+        if not _matches(document, document_filter):
+            return None
+        if projection:
+            document = {
+                key: get_path(document, key)
+                for key in projection
+                if get_path(document, key) is not None
+            }
+        return copy.deepcopy(document)
+
+    async def replace_one(self, document_filter, document, upsert=False):
+        self.operations.append(("replace_one", None))
+        created = document_filter["_id"] not in self.documents
+        self.documents[document_filter["_id"]] = copy.deepcopy(document)
+        return SimpleNamespace(
+            matched_count=int(not created),
+            upserted_id=document_filter["_id"] if created else None,
+        )
+
+    async def update_one(self, document_filter, update, upsert=False):
+        self.operations.append(("update_one", update))
+        document = self.documents.get(document_filter["_id"])
+        if not _matches(document, document_filter):
+            if not upsert:
+                return SimpleNamespace(matched_count=0, upserted_id=None)
+            document = self.documents.setdefault(
+                document_filter["_id"], {"_id": document_filter["_id"]}
+            )
+        for path, value in update.get("$set", {}).items():
+            _set_path(document, path, copy.deepcopy(value))
+        for path in update.get("$unset", {}):
+            _unset_path(document, path)
+        return SimpleNamespace(matched_count=1, upserted_id=None)
+
+
+@pytest.fixture
+def storage(monkeypatch):
+    monkeypatch.setattr(TTKStorage, "_instance", None)
+    storage = TTKStorage("mongodb://localhost:27017")
+    collection = FakeCollection()
+    storage._client = {"org": {"primary": collection}}
+    return storage, collection
+
+
+def save(storage, data):
+    return asyncio.run(
+        storage.save_primary_info("org", "order", copy.deepcopy(data), "primary")
+    )
+
+
+FIRST = {"passport": {"first_name": "Ann", "surname": "Lee"}, "notes": "x"}
+SECOND = {"passport": {"first_name": "Bo", "surname": "Lee"}}
+
+
+def test_second_save_writes_only_the_changes(storage):
+    storage, collection = storage
+    save(storage, FIRST)
+    collection.operations.clear()
+
+    save(storage, SECOND)
+
+    assert [name for name, _ in collection.operations] == ["update_one"]
+    update = collection.operations[0][1]
+    assert update["$set"]["data.passport.first_name"] == "Bo"
+    assert update["$unset"] == {"data.notes": ""}
+    assert collection.documents["order"]["data"] == SECOND
+
+
+def test_unchanged_save_writes_nothing(storage):
+    storage, collection = storage
+    save(storage, FIRST)
+    collection.operations.clear()
+
+    save(storage, FIRST)
+
+    assert [name for name, _ in collection.operations] == ["find_one"]
+
+
+def test_stale_snapshot_falls_back_to_a_full_write(storage):
+    storage, collection = storage
+    save(storage, FIRST)
+    # Another worker saves another version
+    collection.documents["order"]["data"] = {"other": True}
+    collection.documents["order"]["data_hash"] = "other"
+    collection.operations.clear()
+
+    save(storage, SECOND)
+
+    assert [name for name, _ in collection.operations] == [
+        "update_one",
+        "replace_one",
+    ]
+    assert collection.documents["order"]["data"] == SECOND
+
+
+def test_snapshot_miss_reads_only_the_stored_hash(storage):
+    storage, collection = storage
+    save(storage, FIRST)
+    # Another process, or a restart
+    storage._persisted.clear()
+    collection.operations.clear()
+
+    save(storage, SECOND)
+
+    assert collection.operations[0] == ("find_one", ["data_hash"])
+    assert [name for name, _ in collection.operations] == ["find_one", "replace_one"]
+    assert collection.documents["order"]["data"] == SECOND
+
+    storage._persisted.clear()
+    collection.operations.clear()
+    save(storage, SECOND)
+    assert collection.operations == [("find_one", ["data_hash"])]
+
+
+def test_document_saved_without_a_hash_is_replaced(storage):
+    storage, collection = storage
+    collection.documents["order"] = {"_id": "order", "data": FIRST}
+
+    save(storage, SECOND)
+
+    assert collection.documents["order"]["data"] == SECOND
+    assert collection.documents["order"]["data_hash"]
+
+
+def test_projection_is_sorted_without_duplicates_or_nested_paths():
+    assert normalize_projection(None) is None
+    assert normalize_projection([]) is None
+    assert normalize_projection(
+        ["visa", "passport.first_name", "passport", "visa", "photograph.url"]
+    ) == ("passport", "photograph.url", "visa")
+    # A shared prefix is not a parent path
+    assert normalize_projection(["pass", "passport.first_name"]) == (
+        "pass",
+        "passport.first_name",
+    )
+
+
+@pytest.mark.parametrize("path", ["", "$where", "passport..first_name", ".a", "a."])
+def test_projection_rejects_invalid_paths(path):
+    with pytest.raises(ValueError):
+        normalize_projection(["passport", path])
+
+
+@pytest.fixture
+def mongo_storage(monkeypatch):
+    mongomock_motor = pytest.importorskip("mongomock_motor")
+    monkeypatch.setattr(TTKStorage, "_instance", None)
+    monkeypatch.setenv("TTK_CO_TRAVELLER_LAYOUT_ORGS", "new_org=per_traveller")
+    storage = TTKStorage("mongodb://localhost:27017")
+    storage._client = mongomock_motor.AsyncMongoMockClient()
+    return storage
+
+
+TRAVELLER = {
+    "passport": {"first_name": "Ann", "surname": "Lee"},
+    "visa": {"type": "tourist"},
+    "notes": "x",
+}
+
+
+def test_projected_primary_read_returns_only_the_projected_paths(mongo_storage):
+    save(mongo_storage, TRAVELLER)
+
+    record = asyncio.run(
+        mongo_storage.query_primary_info(
+            "org", "order", "primary", projection=["visa", "passport.first_name"]
+        )
+    )
+
+    assert record.model_dump() == {
+        "passport": {"first_name": "Ann"},
+        "visa": {"type": "tourist"},
+    }
+    full = asyncio.run(mongo_storage.query_primary_info("org", "order", "primary"))
+    assert full.model_dump() == TRAVELLER
+
+
+@pytest.mark.parametrize("org_id", ["org", "new_org"])
+def test_projected_co_traveller_reads(mongo_storage, org_id):
+    for traveller_id, first_name in (("t1", "Ann"), ("t2", "Bo")):
+        asyncio.run(
+            mongo_storage.save_or_update_co_traveller(
+                org_id,
+                "order",
+                traveller_id,
+                {**TRAVELLER, "passport": {"first_name": first_name}},
+                "co_travellers",
+            )
+        )
+
+    travellers = asyncio.run(
+        mongo_storage.get_all_co_travellers(
+            org_id, "order", "co_travellers", projection=["passport.first_name"]
+        )
+    )
+
+    assert travellers == {
+        "t1": {"passport": {"first_name": "Ann"}},
+        "t2": {"passport": {"first_name": "Bo"}},
+    }
+
+
+@pytest.mark.parametrize("projection", [None, ["passport"]])
+def test_order_without_travellers_has_no_co_travellers(mongo_storage, projection):
+    db = mongo_storage.get_db("org")
+    asyncio.run(db["co_travellers"].insert_one({"_id": "order"}))
+    pipeline = TTKStorage._co_travellers_pipeline("order", ("passport",))
+    assert asyncio.run(db["co_travellers"].aggregate(pipeline).to_list(length=1)) == []
+
+    for order_id in ("order", "missing"):
+        assert (
+            asyncio.run(
+                mongo_storage.get_all_co_travellers(
+                    "org", order_id, "co_travellers", projection=projection
+                )
+            )
+            is None
+        )
@@ -0,0 +1,124 @@
+"""
+Generates `country_index_data.py`, the static country table of `country_index`.
+
+The countries, their codes, names and name patterns come from country_converter, which
+is only needed to run this script and the tests (the `dev` extra). Run from the
+ttk_plugin directory, with the plugin installed:
+
+    pip install country_converter==1.3
+    python tools/generate_country_index.py
+    black src/lyik/ttk/utils/country_index_data.py
+"""
+
+import json
+import os
+from typing import Dict, List, Tuple
+
+import country_converter as coco
+
+from lyik.ttk.utils.form_indicator import FormIndicator
+
+OUTPUT_FILE = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+    "src",
+    "lyik",
+    "ttk",
+    "utils",
+    "country_index_data.py",
+)
+
+HEADER = '''"""
+Static country table, generated by `generate_country_index.py`. Do not edit.
+"""
+
+from typing import Dict, Tuple
+
+# (ISO2, ISO3, short name, official name)
+COUNTRIES: Tuple[Tuple[str, str, str, str], ...] = (
+'''
+
+
+def _normalize(value: str) -> str:
+    return " ".join(value.strip().casefold().split())
+
+
+def _indicator_name(member_name: str) -> str:
+    """
+    The country name of a FormIndicator member, e.g. VNM_VIET_NAM -> 'viet nam'.
+    """
+    return _normalize(member_name.split("_", 1)[1].replace("_", " "))
+
+
+def _code(pattern: str) -> str:
+    """
+    The first code of a country_converter code pattern, e.g. '^GB$|^UK$' -> 'GB'.
+    """
+    return "".join(c for c in pattern.split("|")[0] if c.isalnum()).upper()
+
+
+def build() -> (
+    Tuple[List[Tuple[str, str, str, str]], Dict[str, str], List[Tuple[str, str]]]
+):
+    cc = coco.CountryConverter()
+    rows = cc.data[["ISO2", "ISO3", "name_short", "name_official", "regex"]]
+    rows = rows.sort_values("ISO3")
+
+    countries = []
+    patterns = []
+    aliases = {}
+    for iso2_pattern, iso3, name_short, name_official, regex in rows.itertuples(
+        index=False
+    ):
+        iso2 = _code(iso2_pattern)
+        countries.append((iso2, iso3, name_short, name_official))
+        patterns.append((iso3, regex))
+        # Other ISO2 codes of the country, e.g. UK for GB
+        for other in iso2_pattern.split("|")[1:]:
+            aliases[_normalize(_code(other))] = iso3
+
+    # Names of the FormIndicator members, where country_converter agrees on the country
+    known = {_normalize(value) for country in countries for value in country}
+    for member in FormIndicator:
+        if member == FormIndicator.SCHENGEN:
+            continue
+        alias = _indicator_name(member.name)
+        if alias in known or alias in aliases:
+            continue
+        if cc.convert(names=alias, to="ISO3", not_found=None) == member.value:
+            aliases[alias] = member.value
+    return countries, aliases, patterns
+
+
+def _literal(value: str) -> str:
+    # JSON strings are valid Python literals, with double quotes
+    return json.dumps(value, ensure_ascii=False)
+
+
+def render(countries, aliases, patterns) -> str:
+    lines = [HEADER]
+    for country in countries:
+        lines.append(f"    ({', '.join(_literal(value) for value in country)}),\n")
+    lines.append(")\n\n")
+    lines.append("# Other names and codes of the countries, normalized, to ISO3\n")
+    lines.append("ALIASES: Dict[str, str] = {\n")
+    for alias, iso3 in sorted(aliases.items()):
+        lines.append(f"    {_literal(alias)}: {_literal(iso3)},\n")
+    lines.append("}\n\n")
+    lines.append(
+        "# (ISO3, pattern): country_converter's case insensitive name patterns\n"
+    )
+    lines.append("NAME_PATTERNS: Tuple[Tuple[str, str], ...] = (\n")
+    for iso3, pattern in patterns:
+        lines.append(f"    ({_literal(iso3)}, {_literal(pattern)}),\n")
+    lines.append(")\n")
+    return "".join(lines)
+
+
+if __name__ == "__main__":
+    countries, aliases, patterns = build()
+    with open(OUTPUT_FILE, "w", encoding="utf-8") as f:
+        f.write(render(countries, aliases, patterns))
+    print(
+        f"Wrote {len(countries)} countries, {len(aliases)} aliases and "
+        f"{len(patterns)} name patterns to {OUTPUT_FILE}"
+    )